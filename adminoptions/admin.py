@@ -4,6 +4,7 @@ from django.contrib import admin
 from django.utils.html import format_html
 
 from adminoptions.models import AdminOptions, AdminTask, ContentField, GuideSection
+from adminoptions.services import AdminOptionsService
 
 
 # Inline admin for content fields
@@ -80,11 +81,11 @@ class ContentFieldAdmin(admin.ModelAdmin):
     def content_preview(self, obj):
         """Show a preview of the field's content from AdminOptions guide_content"""
         try:
-            admin_options = AdminOptions.objects.first()
-            if not admin_options or not admin_options.guide_content:
+            guide_content = AdminOptionsService.get_guide_content()
+            if not guide_content:
                 return "No content"
 
-            content = admin_options.guide_content.get(obj.field_key, "")
+            content = guide_content.get(obj.field_key, "")
             if not content:
                 return "Empty"
 
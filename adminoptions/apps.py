@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class AdminoptionsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "adminoptions"
+
+    def ready(self):
+        """Import signals when the app is ready."""
+        import adminoptions.signals  # noqa: F401
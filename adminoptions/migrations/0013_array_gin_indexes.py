@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:25
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("adminoptions", "0012_remove_old_id_fields"),
+        ("projects", "0015_project_search_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="admintask",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["secondary_users"],
+                name="admintask_secondary_users_gin",
+                opclasses=["jsonb_path_ops"],
+            ),
+        ),
+    ]
@@ -1,6 +1,7 @@
 # region Imports ====================================================================================================
 import uuid
 
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.forms import ValidationError
 
@@ -280,6 +281,14 @@ class AdminTask(CommonModel):
     class Meta:
         verbose_name = "Admin Task"
         verbose_name_plural = "Admin Tasks"
+        indexes = [
+            # JSON containment (secondary_users__contains=[pk])
+            GinIndex(
+                fields=["secondary_users"],
+                opclasses=["jsonb_path_ops"],
+                name="admintask_secondary_users_gin",
+            ),
+        ]
 
 
 # endregion  =================================================================================================
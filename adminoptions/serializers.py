@@ -1,7 +1,9 @@
 # region IMPORTS ====================================================================================================
+from django.db.models import Manager
 from rest_framework import serializers
 
 from adminoptions.models import AdminOptions, AdminTask, ContentField, GuideSection
+from adminoptions.services import AdminOptionsService
 from medias.serializers import UserAvatarSerializer
 from projects.models import Project
 from users.models import User
@@ -198,8 +200,7 @@ class AdminOptionsSerializer(serializers.ModelSerializer):
 
     def get_guide_sections(self, obj):
         """Return active guide sections with their content fields"""
-        sections = GuideSection.objects.filter(is_active=True).order_by("order")
-        return GuideSectionSerializer(sections, many=True).data
+        return AdminOptionsService.get_guide_sections()
 
 
 # endregion  =================================================================================================
@@ -242,6 +243,29 @@ class SecondaryUserSerializer(serializers.ModelSerializer):
         fields = ["id", "display_first_name", "display_last_name", "email", "image"]
 
 
+# Joins needed to serialize admin tasks without a query per task
+ADMIN_TASK_RELATED = ["requester__avatar", "primary_user__avatar", "project"]
+
+
+class AdminTaskListSerializer(serializers.ListSerializer):
+    """Loads the secondary users of every task in one query"""
+
+    def to_representation(self, data):
+        tasks = list(data.all() if isinstance(data, Manager) else data)
+        user_ids = {pk for task in tasks for pk in task.secondary_users or []}
+        self.child.secondary_users_by_id = (
+            {
+                user.pk: user
+                for user in User.objects.filter(pk__in=user_ids).select_related(
+                    "avatar"
+                )
+            }
+            if user_ids
+            else {}
+        )
+        return super().to_representation(tasks)
+
+
 class AdminTaskSerializer(serializers.ModelSerializer):
     id = serializers.IntegerField(
         source="pk", read_only=True
@@ -254,12 +278,21 @@ class AdminTaskSerializer(serializers.ModelSerializer):
     class Meta:
         model = AdminTask
         fields = "__all__"
+        list_serializer_class = AdminTaskListSerializer
 
     def get_secondary_users(self, obj):
-        if obj.secondary_users:
-            users = User.objects.filter(pk__in=obj.secondary_users)
-            return SecondaryUserSerializer(users, many=True).data
-        return []
+        if not obj.secondary_users:
+            return []
+
+        users_by_id = getattr(self, "secondary_users_by_id", None)
+        if users_by_id is None:
+            users = User.objects.filter(pk__in=obj.secondary_users).select_related(
+                "avatar"
+            )
+        else:
+            wanted = set(obj.secondary_users)
+            users = [user for pk, user in users_by_id.items() if pk in wanted]
+        return SecondaryUserSerializer(users, many=True).data
 
 
 # Import CaretakerSerializer from the new caretakers app
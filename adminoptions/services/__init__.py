@@ -0,0 +1,9 @@
+"""
+Admin options services
+"""
+
+from .admin_options_service import AdminOptionsService
+
+__all__ = [
+    "AdminOptionsService",
+]
@@ -0,0 +1,165 @@
+"""
+Admin options service - Process-wide cache of the AdminOptions singleton
+"""
+
+import threading
+import time
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+
+from adminoptions.models import AdminOptions, GuideSection
+
+ADMIN_OPTIONS_VERSION_KEY = "admin_options_version"
+
+# Snapshot shared by every thread in this process, replaced wholesale on reload
+_snapshot = {"version": None, "loaded_at": 0.0, "checked_at": 0.0}
+_lock = threading.Lock()
+
+
+class AdminOptionsService:
+    """Business logic for reading admin options without per-call queries"""
+
+    @staticmethod
+    def get_options():
+        """
+        Get the AdminOptions row, with its maintainer
+
+        The row is kept in memory until its version changes (see
+        adminoptions.signals) or ADMIN_OPTIONS_CACHE_TIMEOUT passes. The
+        version lives in the shared cache and is checked at most every
+        ADMIN_OPTIONS_VERSION_CHECK_INTERVAL seconds, so a save in one worker
+        reloads the row in the others within that interval. Treat the
+        instance as read only; writes must fetch a fresh row.
+
+        Returns:
+            AdminOptions instance, or None if none has been created
+        """
+        return AdminOptionsService._get_snapshot()["options"]
+
+    @staticmethod
+    def get_maintainer_id():
+        """
+        Get the maintainer chosen in admin options
+
+        Returns:
+            User primary key, or None if no maintainer is set
+        """
+        options = AdminOptionsService.get_options()
+        return options.maintainer_id if options else None
+
+    @staticmethod
+    def is_cached_maintainer(user_id):
+        """
+        Check whether a user is the maintainer held in this process's cache
+
+        Never queries, so it is safe to call from user save signals.
+
+        Args:
+            user_id: User primary key
+
+        Returns:
+            Boolean
+        """
+        options = _snapshot.get("options")
+        return options is not None and options.maintainer_id == user_id
+
+    @staticmethod
+    def get_guide_content():
+        """
+        Get the guide content, keyed by content field key
+
+        Returns:
+            Dict of field key to rich text (do not mutate)
+        """
+        options = AdminOptionsService.get_options()
+        return (options.guide_content or {}) if options else {}
+
+    @staticmethod
+    def get_guide_sections():
+        """
+        Get the active guide sections with their content fields
+
+        Returns:
+            List of serialized guide section dicts, ordered for display
+        """
+        return AdminOptionsService._get_snapshot()["guide_sections"]
+
+    @staticmethod
+    def get_version():
+        """
+        Get the current admin options cache version
+
+        Returns:
+            Version string
+        """
+        version = cache.get(ADMIN_OPTIONS_VERSION_KEY)
+        if version is None:
+            version = uuid4().hex
+            if not cache.add(ADMIN_OPTIONS_VERSION_KEY, version, None):
+                version = cache.get(ADMIN_OPTIONS_VERSION_KEY, version)
+        return version
+
+    @staticmethod
+    def invalidate():
+        """
+        Start a new version
+
+        This process reloads on its next read, other workers once they next
+        check the version.
+        """
+        cache.set(ADMIN_OPTIONS_VERSION_KEY, uuid4().hex, None)
+        _snapshot["checked_at"] = 0.0
+
+    @staticmethod
+    def _get_snapshot():
+        """
+        Get the in-process snapshot, reloading it if it is stale
+
+        Returns:
+            Dict with version, loaded_at, options and guide_sections
+        """
+        snapshot = _snapshot
+        now = time.monotonic()
+        current = (
+            snapshot["version"] is not None
+            and now - snapshot["loaded_at"] < settings.ADMIN_OPTIONS_CACHE_TIMEOUT
+        )
+        checked = now - snapshot["checked_at"]
+        if current and checked < settings.ADMIN_OPTIONS_VERSION_CHECK_INTERVAL:
+            return snapshot
+
+        version = AdminOptionsService.get_version()
+        if current and snapshot["version"] == version:
+            snapshot["checked_at"] = now
+            return snapshot
+
+        with _lock:
+            if _snapshot["version"] == version and _snapshot is not snapshot:
+                return _snapshot
+            return AdminOptionsService._load(version)
+
+    @staticmethod
+    def _load(version):
+        """Read admin options and guide sections into a new snapshot"""
+        from adminoptions.serializers import GuideSectionSerializer
+
+        options = (
+            AdminOptions.objects.select_related("maintainer").order_by("pk").first()
+        )
+        sections = GuideSection.objects.filter(is_active=True).order_by("order")
+        guide_sections = GuideSectionSerializer(
+            sections.prefetch_related("content_fields"), many=True
+        ).data
+
+        global _snapshot
+        now = time.monotonic()
+        _snapshot = {
+            "version": version,
+            "loaded_at": now,
+            "checked_at": now,
+            "options": options,
+            "guide_sections": guide_sections,
+        }
+        return _snapshot
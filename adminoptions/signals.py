@@ -0,0 +1,34 @@
+"""
+Django signals for the adminoptions app.
+
+Moves the cached admin options to a new version whenever the options, the
+guide sections or the maintainer change, so every worker reloads them.
+"""
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import AdminOptions, ContentField, GuideSection
+from .services.admin_options_service import AdminOptionsService
+
+
+@receiver(post_save, sender=AdminOptions)
+@receiver(post_delete, sender=AdminOptions)
+@receiver(post_save, sender=GuideSection)
+@receiver(post_delete, sender=GuideSection)
+@receiver(post_save, sender=ContentField)
+@receiver(post_delete, sender=ContentField)
+def invalidate_admin_options(sender, instance, **kwargs):
+    """Options and guide changes start a new admin options version"""
+    AdminOptionsService.invalidate()
+    # A worker reading before commit caches the old row under the new version
+    transaction.on_commit(AdminOptionsService.invalidate)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def invalidate_admin_options_on_maintainer_change(sender, instance, **kwargs):
+    """The cached options carry the maintainer's user row"""
+    if AdminOptionsService.is_cached_maintainer(instance.pk):
+        AdminOptionsService.invalidate()
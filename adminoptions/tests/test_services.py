@@ -0,0 +1,141 @@
+"""
+Tests for adminoptions services
+"""
+
+from django.core.cache import cache
+
+from adminoptions.models import AdminOptions, ContentField, GuideSection
+from adminoptions.services import AdminOptionsService
+from adminoptions.services.admin_options_service import ADMIN_OPTIONS_VERSION_KEY
+from common.tests.test_helpers import assert_query_budget
+
+
+class TestAdminOptionsService:
+    """Tests for AdminOptionsService"""
+
+    def test_get_options_none(self, db):
+        """Test reading options before any are created"""
+        # Act & Assert
+        assert AdminOptionsService.get_options() is None
+        assert AdminOptionsService.get_maintainer_id() is None
+        assert AdminOptionsService.get_guide_content() == {}
+
+    def test_cached_reads_need_no_queries(self, admin_options, guide_section, db):
+        """Test repeated reads are served from memory"""
+        # Arrange
+        AdminOptionsService.get_options()
+
+        # Act & Assert
+        with assert_query_budget(max_queries=0):
+            options = AdminOptionsService.get_options()
+            maintainer_id = AdminOptionsService.get_maintainer_id()
+            guide_content = AdminOptionsService.get_guide_content()
+            sections = AdminOptionsService.get_guide_sections()
+            maintainer = options.maintainer
+
+        assert options.pk == admin_options.pk
+        assert maintainer_id == admin_options.maintainer_id == maintainer.pk
+        assert options.email_options == AdminOptions.EmailOptions.ENABLED
+        assert guide_content["test_field"] == "Test content"
+        assert [section["id"] for section in sections] == [guide_section.id]
+
+    def test_save_invalidates(self, admin_options, db):
+        """Test saving options reloads them on the next read"""
+        # Arrange
+        AdminOptionsService.get_options()
+        options = AdminOptions.objects.get(pk=admin_options.pk)
+        options.email_options = AdminOptions.EmailOptions.ADMIN
+        options.guide_content = {"test_field": "Updated"}
+
+        # Act
+        options.save()
+
+        # Assert
+        options = AdminOptionsService.get_options()
+        assert options.email_options == AdminOptions.EmailOptions.ADMIN
+        assert AdminOptionsService.get_guide_content() == {"test_field": "Updated"}
+
+    def test_version_change_from_other_worker(self, admin_options, settings, db):
+        """Test a version bumped elsewhere reloads the snapshot"""
+        # Arrange
+        settings.ADMIN_OPTIONS_VERSION_CHECK_INTERVAL = 0
+        AdminOptionsService.get_options()
+        AdminOptions.objects.filter(pk=admin_options.pk).update(
+            email_options=AdminOptions.EmailOptions.DISABLED
+        )
+
+        # Act
+        stale = AdminOptionsService.get_options().email_options
+        cache.set(ADMIN_OPTIONS_VERSION_KEY, "bumped-by-another-worker", None)
+        fresh = AdminOptionsService.get_options().email_options
+
+        # Assert
+        assert stale == AdminOptions.EmailOptions.ENABLED
+        assert fresh == AdminOptions.EmailOptions.DISABLED
+
+    def test_version_checked_once_per_interval(self, admin_options, mocker, db):
+        """Test the shared version is not read on every call"""
+        # Arrange
+        AdminOptionsService.get_options()
+        get_version = mocker.spy(AdminOptionsService, "get_version")
+
+        # Act
+        for _ in range(3):
+            AdminOptionsService.get_options()
+
+        # Assert
+        assert get_version.call_count == 0
+
+    def test_expires_after_timeout(self, admin_options, settings, db):
+        """Test the snapshot is reloaded once it times out"""
+        # Arrange
+        settings.ADMIN_OPTIONS_CACHE_TIMEOUT = 0
+        AdminOptionsService.get_options()
+
+        # Act & Assert
+        with assert_query_budget(max_queries=3):
+            AdminOptionsService.get_options()
+        AdminOptions.objects.filter(pk=admin_options.pk).update(
+            email_options=AdminOptions.EmailOptions.ADMIN
+        )
+        options = AdminOptionsService.get_options()
+        assert options.email_options == AdminOptions.EmailOptions.ADMIN
+
+    def test_guide_section_change_invalidates(self, admin_options, guide_section, db):
+        """Test guide section and content field changes reload the sections"""
+        # Arrange
+        AdminOptionsService.get_guide_sections()
+
+        # Act
+        ContentField.objects.create(
+            section=guide_section, field_key="new_field", title="New", order=1
+        )
+        GuideSection.objects.create(id="second", title="Second", order=2)
+
+        # Assert
+        sections = AdminOptionsService.get_guide_sections()
+        assert [section["id"] for section in sections] == [guide_section.id, "second"]
+        assert sections[0]["content_fields"][0]["field_key"] == "new_field"
+
+    def test_maintainer_change_invalidates(self, admin_options, admin_user, db):
+        """Test saving the maintainer reloads the cached row"""
+        # Arrange
+        AdminOptionsService.get_options()
+        admin_user.first_name = "Renamed"
+
+        # Act
+        admin_user.save()
+
+        # Assert
+        assert AdminOptionsService.get_options().maintainer.first_name == "Renamed"
+
+    def test_other_user_change_keeps_cache(self, admin_options, user, db):
+        """Test saving other users does not reload the options"""
+        # Arrange
+        AdminOptionsService.get_options()
+        user.first_name = "Renamed"
+        user.save()
+
+        # Act & Assert
+        with assert_query_budget(max_queries=0):
+            AdminOptionsService.get_options()
@@ -788,8 +788,65 @@ class TestPendingTasks:
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data) == 1
 
-    def test_get_pending_tasks_auto_cancels_expired(self, api_client, user, db):
-        """Test pending tasks auto-cancels expired caretaker requests"""
+    def test_get_pending_tasks_constant_queries(self, api_client, user, db):
+        """Test the listing costs the same number of queries for any task count"""
+        # Arrange
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        from common.tests.factories import ProjectFactory, UserFactory
+        from medias.models import UserAvatar
+
+        api_client.force_authenticate(user=user)
+
+        def add_tasks(count):
+            for _ in range(count):
+                requester, first, second = UserFactory.create_batch(3)
+                UserAvatar.objects.create(
+                    user=first,
+                    file=SimpleUploadedFile(
+                        "a.jpg", b"file_content", content_type="image/jpeg"
+                    ),
+                )
+                AdminTask.objects.create(
+                    action=AdminTask.ActionTypes.MERGEUSER,
+                    status=AdminTask.TaskStatus.PENDING,
+                    requester=requester,
+                    primary_user=requester,
+                    project=ProjectFactory(),
+                    secondary_users=[first.pk, second.pk],
+                    reason="Test",
+                )
+
+        def count_queries():
+            with CaptureQueriesContext(connection) as queries:
+                response = api_client.get(adminoptions_urls.path("tasks", "pending"))
+            assert response.status_code == status.HTTP_200_OK
+            return len(queries), response.data
+
+        add_tasks(1)
+        single, _ = count_queries()
+        add_tasks(4)
+
+        # Act
+        many, data = count_queries()
+
+        # Assert
+        assert many == single
+        assert len(data) == 5
+        assert all(len(task["secondary_users"]) == 2 for task in data)
+        assert (
+            sum(
+                task["image"] is not None
+                for item in data
+                for task in item["secondary_users"]
+            )
+            == 5
+        )
+
+    def test_get_pending_tasks_hides_expired(self, api_client, user, db):
+        """Test pending tasks leaves out expired caretaker requests without writing"""
         # Arrange
         api_client.force_authenticate(user=user)
         past_date = timezone.now() - timedelta(days=1)
@@ -808,9 +865,9 @@ class TestPendingTasks:
 
         # Assert
         assert response.status_code == status.HTTP_200_OK
+        assert task.pk not in [item["id"] for item in response.data]
         task.refresh_from_db()
-        assert task.status == AdminTask.TaskStatus.CANCELLED
-        assert "Auto-cancelled" in task.notes
+        assert task.status == AdminTask.TaskStatus.PENDING
 
 
 class TestCheckPendingCaretakerRequestForUser:
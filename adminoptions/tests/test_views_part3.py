@@ -397,6 +397,38 @@ class TestMergeUsers:
         assert response.status_code == status.HTTP_200_OK
         assert ProjectMember.objects.filter(project=project, user=user).exists()
 
+    def test_merge_users_dry_run(
+        self, api_client, admin_user, user, secondary_user, project, db
+    ):
+        """Test dry run reports affected rows without merging"""
+        # Arrange
+        api_client.force_authenticate(user=admin_user)
+        ProjectMember.objects.create(
+            project=project,
+            user=secondary_user,
+            is_leader=False,
+            role=ProjectMember.RoleChoices.RESEARCH,
+        )
+        data = {
+            "primaryUser": user.id,
+            "secondaryUsers": [secondary_user.id],
+            "dryRun": True,
+        }
+
+        # Act
+        response = api_client.post(
+            adminoptions_urls.path("mergeusers"), data, format="json"
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["dry_run"] is True
+        assert response.data["tables"]["projects.ProjectMember.user"] == {
+            "reassigned": 1,
+            "removed": 0,
+        }
+        assert User.objects.filter(id=secondary_user.id).exists()
+
     def test_merge_users_missing_data(self, api_client, admin_user, db):
         """Test merging users with missing data"""
         # Arrange
@@ -20,6 +20,7 @@ from rest_framework.views import APIView
 
 from adminoptions.models import AdminOptions, AdminTask, ContentField, GuideSection
 from adminoptions.serializers import (
+    ADMIN_TASK_RELATED,
     AdminOptionsCreateSerializer,
     AdminOptionsMaintainerSerializer,
     AdminOptionsSerializer,
@@ -29,11 +30,11 @@ from adminoptions.serializers import (
     GuideSectionCreateUpdateSerializer,
     GuideSectionSerializer,
 )
+from adminoptions.services import AdminOptionsService
 from caretakers.models import Caretaker
-from communications.models import Comment
-from documents.models import ProjectDocument
-from projects.models import Project, ProjectMember
+from projects.models import Project
 from users.models import User
+from users.services import UserMergeService
 
 # endregion  =================================================================================================
 
@@ -44,9 +45,9 @@ class AdminControls(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, req):
-        all = AdminOptions.objects.all()
+        options = AdminOptionsService.get_options()
         ser = AdminOptionsSerializer(
-            all,
+            [options] if options else [],
             many=True,
         )
         return Response(
@@ -77,9 +78,8 @@ class GetMaintainer(APIView):
     permission_classes = [IsAuthenticated]
 
     def go(self, pk):
-        try:
-            obj = AdminOptions.objects.get(pk=pk)
-        except AdminOptions.DoesNotExist:
+        obj = AdminOptionsService.get_options()
+        if obj is None or obj.pk != pk:
             raise NotFound
         return obj
 
@@ -106,7 +106,9 @@ class AdminControlsDetail(APIView):
         return obj
 
     def get(self, req, pk):
-        AdminControl = self.go(pk)
+        AdminControl = AdminOptionsService.get_options()
+        if AdminControl is None or AdminControl.pk != pk:
+            raise NotFound
         ser = AdminOptionsSerializer(AdminControl)
         return Response(
             ser.data,
@@ -372,7 +374,9 @@ class AdminTasks(APIView):
     def get(self, req):
         settings.LOGGER.info(msg=f"{req.user} is getting all admin tasks")
         # Only return pending tasks (filter out cancelled, rejected, fulfilled)
-        pending_tasks = AdminTask.objects.filter(status=AdminTask.TaskStatus.PENDING)
+        pending_tasks = AdminTask.objects.filter(
+            status=AdminTask.TaskStatus.PENDING
+        ).select_related(*ADMIN_TASK_RELATED)
         ser = AdminTaskSerializer(
             pending_tasks,
             many=True,
@@ -539,29 +543,17 @@ class PendingTasks(APIView):
     def get(self, req):
         settings.LOGGER.info(msg=f"{req.user} is getting all pending admin tasks")
 
-        # Auto-cancel expired pending caretaker requests before returning
+        # Expired caretaker requests are cancelled by the housekeeping job
         from django.utils import timezone
 
-        expired_caretaker_requests = AdminTask.objects.filter(
-            status=AdminTask.TaskStatus.PENDING,
-            action=AdminTask.ActionTypes.SETCARETAKER,
-            end_date__lt=timezone.now(),  # Compare datetime to datetime
-        )
-
-        if expired_caretaker_requests.exists():
-            count = expired_caretaker_requests.count()
-            settings.LOGGER.info(
-                msg=f"Auto-cancelling {count} expired caretaker request(s)"
+        all = (
+            AdminTask.objects.filter(status=AdminTask.TaskStatus.PENDING)
+            .exclude(
+                action=AdminTask.ActionTypes.SETCARETAKER,
+                end_date__lt=timezone.now(),
             )
-            for request in expired_caretaker_requests:
-                request.status = AdminTask.TaskStatus.CANCELLED
-                request.notes = (
-                    request.notes or ""
-                ) + "\n[Auto-cancelled: end date passed while request was pending]"
-                request.save()
-
-        # Get all remaining pending tasks
-        all = AdminTask.objects.filter(status=AdminTask.TaskStatus.PENDING)
+            .select_related(*ADMIN_TASK_RELATED)
+        )
         ser = AdminTaskSerializer(
             all,
             many=True,
@@ -620,7 +612,7 @@ class GetPendingCaretakerRequestsForUser(APIView):
             secondary_users__contains=[
                 int(user_id)
             ],  # User is in the secondary_users array
-        )
+        ).select_related(*ADMIN_TASK_RELATED)
 
         # Serialize the requests
         serializer = AdminTaskSerializer(pending_requests, many=True)
@@ -701,20 +693,6 @@ class ApproveTask(APIView):
             raise NotFound
         return obj
 
-    def get_memberships(self, user):
-        try:
-            obj = ProjectMember.objects.filter(user=user)
-        except ProjectMember.DoesNotExist:
-            raise NotFound
-        return obj
-
-    def get_projects(self, user):
-        try:
-            obj = Project.objects.filter(members__user=user)
-        except Project.DoesNotExist:
-            raise NotFound
-        return obj
-
     def post(self, req, pk):
         task = self.go(pk)
         settings.LOGGER.info(msg=f"{req.user} is approving task {task}")
@@ -742,94 +720,9 @@ class ApproveTask(APIView):
                         raise ValueError(
                             "Primary and single secondary users must be set to merge"
                         )
-                    # Get the primary user
-                    user_to_merge_into = self.get_user(task.primary_user.pk)
-                    # Get the secondary user/s
-                    users_to_merge = [self.get_user(u) for u in task.secondary_users]
-                    primary_is_staff = user_to_merge_into.is_staff
-                    for merging_user in users_to_merge:
-                        # ========= HANDLE THE PROJECT MEMBERSHIPS =========
-                        # Merge the users projects and memberships into the primary user
-                        for membership in self.get_memberships(merging_user):
-                            # First check if a membership already exists for the primary user
-                            existing_membership = ProjectMember.objects.filter(
-                                project=membership.project, user=user_to_merge_into
-                            ).exists()
-                            if existing_membership:
-                                # If it does and they are leader, retain the leader status
-                                if (
-                                    membership.role
-                                    == ProjectMember.RoleChoices.SUPERVISING
-                                    or existing_membership.role
-                                    == ProjectMember.RoleChoices.SUPERVISING
-                                ):
-                                    existing_membership.role = (
-                                        ProjectMember.RoleChoices.SUPERVISING
-                                    )
-                                else:
-                                    if primary_is_staff:
-                                        if membership.role in [
-                                            ProjectMember.RoleChoices.RESEARCH,
-                                            ProjectMember.RoleChoices.TECHNICAL,
-                                        ]:
-                                            existing_membership.role = membership.role
-                                    else:
-                                        if membership.role in [
-                                            ProjectMember.RoleChoices.EXTERNALCOL,
-                                            ProjectMember.RoleChoices.EXTERNALPEER,
-                                            ProjectMember.RoleChoices.ACADEMICSUPER,
-                                            ProjectMember.RoleChoices.STUDENT,
-                                            ProjectMember.RoleChoices.CONSULTED,
-                                            ProjectMember.RoleChoices.GROUP,
-                                        ]:
-                                            existing_membership.role = membership.role
-                                # Save the existing membership
-                                existing_membership.save()
-                                # Remove the old membership
-                                membership.delete()
-                            # If no existing membership with the same user, change the secondary users membership to the primary user
-                            else:
-                                membership.user = user_to_merge_into
-                                # Ensure that the role is appropriate for the primary user
-                                if primary_is_staff:
-                                    if membership.role in [
-                                        ProjectMember.RoleChoices.RESEARCH,
-                                        ProjectMember.RoleChoices.TECHNICAL,
-                                    ]:
-                                        membership.role = membership.role
-                                else:
-                                    if membership.role in [
-                                        ProjectMember.RoleChoices.EXTERNALCOL,
-                                        ProjectMember.RoleChoices.EXTERNALPEER,
-                                        ProjectMember.RoleChoices.ACADEMICSUPER,
-                                        ProjectMember.RoleChoices.STUDENT,
-                                        ProjectMember.RoleChoices.CONSULTED,
-                                        ProjectMember.RoleChoices.GROUP,
-                                    ]:
-                                        membership.role = membership.role
-                                membership.save()
-
-                        # ========= HANDLE DOCUMENTS AND COMMENTS =========
-                        # Update documents created by merging user
-                        user_created_documents = ProjectDocument.objects.filter(
-                            creator=merging_user
-                        )
-                        user_created_documents.update(creator=user_to_merge_into)
-
-                        # Update documents modified by merging user
-                        user_modified_documents = ProjectDocument.objects.filter(
-                            modifier=merging_user
-                        )
-                        user_modified_documents.update(modifier=user_to_merge_into)
-
-                        # Update comments by merging user
-                        user_comments = Comment.objects.filter(user=merging_user)
-                        user_comments.update(user=user_to_merge_into)
-
-                        # ========= HANDLE DELETION =========
-                        # Delete the user
-                        merging_user.delete()
-
+                    UserMergeService.merge_users(
+                        task.primary_user.pk, task.secondary_users
+                    )
                 elif task.action == AdminTask.ActionTypes.SETCARETAKER:
                     # Set the caretaker
                     # Get the primary user
@@ -963,18 +856,13 @@ class CancelTask(APIView):
 class MergeUsers(APIView):
     """
     Merges a list of users into a primary user.
-    For each user in the list, the project members, comments, documents are updated to the primary user.
+    Every row referencing a secondary user (project memberships, comments, documents etc.) is reassigned to the primary user.
     The primary user's data is not overwritten, higher privelleges take priority, and the secondary users are deleted.
+    Pass dryRun to get the affected row counts per table without merging.
     """
 
     permission_classes = [IsAdminUser]
 
-    def get_user(self, pk):
-        try:
-            return User.objects.get(pk=pk)
-        except User.DoesNotExist:
-            raise NotFound
-
     def post(self, req):
         settings.LOGGER.info(msg=f"{req.user} is merging users")
         if not req.user.is_superuser:
@@ -985,6 +873,7 @@ class MergeUsers(APIView):
 
         primary_user_id = req.data.get("primaryUser")
         secondary_user_ids = req.data.get("secondaryUsers")
+        dry_run = req.data.get("dryRun") in [True, "true", "1", 1]
 
         if not primary_user_id or not secondary_user_ids:
             return Response(
@@ -1000,93 +889,11 @@ class MergeUsers(APIView):
                 status=HTTP_400_BAD_REQUEST,
             )
 
-        primary_user = self.get_user(primary_user_id)
-        secondary_users = User.objects.filter(pk__in=secondary_user_ids)
-        print({"primaryUser": primary_user, "secondaryUsers": secondary_users})
-
-        with transaction.atomic():
-
-            for u in secondary_users:
-                # Inherit the projects of the secondary user
-                user_projects = ProjectMember.objects.filter(user=u)
-                user_projects.update(user=primary_user)
-
-                # Inherit the roles of the secondary user
-                for project in user_projects:
-                    # Handle if the primary user is also in the project
-                    primary_user_in_project = ProjectMember.objects.filter(
-                        project=project.project, user=primary_user
-                    ).exists()
-                    if primary_user_in_project:
-                        # If the primary user is also in the project and they have a higher role, do not overwrite their role, otherwise overwrite
-                        primary_users_membership = ProjectMember.objects.get(
-                            project=project.project, user=primary_user
-                        )
+        report = UserMergeService.merge_users(
+            primary_user_id, secondary_user_ids, dry_run=dry_run
+        )
 
-                        # First check if they are leading the project, if so, retain the primary user role
-                        if (
-                            primary_users_membership.role
-                            in [
-                                ProjectMember.RoleChoices.SUPERVISING,
-                            ]
-                            and primary_user.is_staff
-                        ):
-                            primary_users_membership.role = (
-                                primary_users_membership.role
-                            )
-                        # If not leading, set to the secondary user role
-                        elif (
-                            project.role
-                            in [
-                                ProjectMember.RoleChoices.SUPERVISING,
-                                ProjectMember.RoleChoices.RESEARCH,
-                                ProjectMember.RoleChoices.TECHNICAL,
-                            ]
-                            and primary_user.is_staff
-                        ):
-                            primary_users_membership.role = project.role
-
-                    # Handle if the primary user is not in the project
-                    else:
-                        # If staff, must have staff role
-                        if primary_user.is_staff:
-                            if project.role in [
-                                ProjectMember.RoleChoices.SUPERVISING,
-                                ProjectMember.RoleChoices.RESEARCH,
-                                ProjectMember.RoleChoices.TECHNICAL,
-                            ]:
-                                project.role = project.role
-                            else:
-                                project.role = ProjectMember.RoleChoices.RESEARCH
-                        # If not staff, cannot have staff roles
-                        else:
-                            if project.role in [
-                                ProjectMember.RoleChoices.EXTERNALCOL,
-                                ProjectMember.RoleChoices.EXTERNALPEER,
-                                ProjectMember.RoleChoices.ACADEMICSUPER,
-                                ProjectMember.RoleChoices.STUDENT,
-                                ProjectMember.RoleChoices.CONSULTED,
-                                ProjectMember.RoleChoices.GROUP,
-                            ]:
-                                project.role = project.role
-                            else:
-                                project.role = ProjectMember.RoleChoices.EXTERNALCOL
-                    project.save()
-
-                # Inherit the documents of the secondary user
-                user_created_documents = ProjectDocument.objects.filter(creator=u)
-                user_created_documents.update(creator=primary_user)
-                user_modified_documents = ProjectDocument.objects.filter(modifier=u)
-                user_modified_documents.update(modifier=primary_user)
-
-                # Inherit the comments of the secondary user
-                user_comments = Comment.objects.filter(user=u)
-                user_comments.update(user=primary_user)
-
-                # Delete the user (associated fields will cascade delete on deletion of the user)
-                u.delete()
-
-        return Response(status=HTTP_200_OK)
+        return Response(report, status=HTTP_200_OK)
 
 
 # NOTE: AdminSetCaretaker and SetCaretaker views removed - duplicates of caretakers app functionality
@@ -15,6 +15,7 @@ from .models import (
     DepartmentalService,
     Division,
 )
+from .services.agency_service import AgencyService
 
 # endregion  =================================================================================================
 
@@ -380,25 +381,9 @@ def fix_affiliations_and_migrate_delimiters(model_admin, req, selected):
                             f"  Merging duplicate: '{aff_with_semi.name}' → '{clean_aff.name}'"
                         )
 
-                        # Update projects using the semicolon version
-                        for ext in ExternalProjectDetails.objects.filter(
-                            collaboration_with__icontains=aff_with_semi.name
-                        ):
-                            ext.collaboration_with = ext.collaboration_with.replace(
-                                aff_with_semi.name, clean_aff.name
-                            )
-                            ext.save()
-
-                        for student in StudentProjectDetails.objects.filter(
-                            organisation__icontains=aff_with_semi.name
-                        ):
-                            student.organisation = student.organisation.replace(
-                                aff_with_semi.name, clean_aff.name
-                            )
-                            student.save()
-
-                        # Delete the duplicate
-                        aff_with_semi.delete()
+                        # Point linked projects at the clean version and
+                        # delete the duplicate
+                        AgencyService.merge_affiliation(aff_with_semi, clean_aff)
                         merged_count += 1
 
                     except Affiliation.DoesNotExist:
@@ -582,7 +567,10 @@ def migrate_comma_to_semicolon_delimiter(model_admin, req, selected):
 
     Uses smart matching to avoid breaking affiliations that contain commas.
     """
+    from django.db import transaction
+
     from projects.models import ExternalProjectDetails, StudentProjectDetails
+    from projects.services.page_service import ProjectPageService
 
     external_count = 0
     student_count = 0
@@ -637,28 +625,44 @@ def migrate_comma_to_semicolon_delimiter(model_admin, req, selected):
             collaboration_with__isnull=True
         ).exclude(collaboration_with="")
 
-        for ext in external_projects:
+        changed_externals = []
+        for ext in external_projects.only("pk", "project_id", "collaboration_with"):
             new_value, changed = smart_migrate_field(
                 ext.collaboration_with, all_affiliation_names
             )
             if changed:
                 ext.collaboration_with = new_value
-                ext.save()
-                external_count += 1
+                changed_externals.append(ext)
+        external_count = len(changed_externals)
 
         # Update StudentProjectDetails organisation fields
         student_projects = StudentProjectDetails.objects.exclude(
             organisation__isnull=True
         ).exclude(organisation="")
 
-        for student in student_projects:
+        changed_students = []
+        for student in student_projects.only("pk", "project_id", "organisation"):
             new_value, changed = smart_migrate_field(
                 student.organisation, all_affiliation_names
             )
             if changed:
                 student.organisation = new_value
-                student.save()
-                student_count += 1
+                changed_students.append(student)
+        student_count = len(changed_students)
+
+        # Write in batches, then relink from the new names (bulk updates
+        # skip the save signals that keep links and project pages current)
+        with transaction.atomic():
+            ExternalProjectDetails.objects.bulk_update(
+                changed_externals, ["collaboration_with"], batch_size=500
+            )
+            StudentProjectDetails.objects.bulk_update(
+                changed_students, ["organisation"], batch_size=500
+            )
+            AgencyService.backfill_affiliation_links()
+        ProjectPageService.bump_versions(
+            [details.project_id for details in changed_externals + changed_students]
+        )
 
         total_count = external_count + student_count
 
@@ -0,0 +1,37 @@
+"""
+Management command to link project details to the affiliations they name.
+
+Student and external project details keep their affiliations as a
+semicolon separated string, which is a cache of their affiliation links.
+Run this once after migrating, and again after any bulk edit of the
+strings that bypassed save(), to rebuild the links from the strings.
+
+Usage:
+    python manage.py backfill_affiliation_links
+    python manage.py backfill_affiliation_links --batch-size 5000
+"""
+
+from django.core.management.base import BaseCommand
+
+from agencies.services import AgencyService
+
+
+class Command(BaseCommand):
+    help = "Rebuild project detail affiliation links from their affiliation names"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Link rows inserted per query",
+        )
+
+    def handle(self, *args, **options):
+        created = AgencyService.backfill_affiliation_links(
+            batch_size=options["batch_size"]
+        )
+        for kind, count in created.items():
+            self.stdout.write(
+                self.style.SUCCESS(f"Linked {count} {kind} project affiliation(s)")
+            )
@@ -3,7 +3,9 @@ Agency service - Business logic for agency, branch, division, business area, and
 """
 
 from django.conf import settings
-from django.db.models import Q
+from django.contrib.postgres.fields import ArrayField
+from django.db import transaction
+from django.db.models import F, Func, Q, TextField, Value
 from rest_framework.exceptions import NotFound
 
 from agencies.models import (
@@ -15,6 +17,61 @@ from agencies.models import (
     Division,
 )
 
+# Separator between affiliation names in project detail fields
+AFFILIATION_SEPARATOR = "; "
+
+# Splits a field as split_affiliation_names does: on the separator, with
+# the whitespace around each name, and around the whole value, left out
+AFFILIATION_SPLIT_PATTERN = r"^\s+|\s*; \s*|\s+$"
+
+
+def _names_array(field_name):
+    """
+    The affiliation names of a project detail field as a text array,
+    trimmed and without blanks like split_affiliation_names
+    """
+    return Func(
+        Func(
+            F(field_name),
+            Value(AFFILIATION_SPLIT_PATTERN),
+            function="regexp_split_to_array",
+            output_field=ArrayField(TextField()),
+        ),
+        Value(""),
+        function="array_remove",
+        output_field=ArrayField(TextField()),
+    )
+
+
+def _joined_names(names_array):
+    """A text array of affiliation names joined back into a field value"""
+    return Func(
+        names_array,
+        Value(AFFILIATION_SEPARATOR),
+        function="array_to_string",
+        output_field=TextField(),
+    )
+
+
+def _rewrite_names(queryset, field_name, function, *args):
+    """
+    Apply a Postgres array function to the affiliation names of each row,
+    in a single UPDATE
+
+    The names are those split_affiliation_names finds, so the field is
+    written back trimmed and joined with AFFILIATION_SEPARATOR.
+
+    Returns:
+        Number of rows updated
+    """
+    names = Func(
+        _names_array(field_name),
+        *[Value(arg) for arg in args],
+        function=function,
+        output_field=ArrayField(TextField()),
+    )
+    return queryset.update(**{field_name: _joined_names(names)})
+
 
 class AgencyService:
     """Business logic for agency-related operations"""
@@ -307,42 +364,16 @@ class AgencyService:
         Raises:
             NotFound: If affiliation not found
         """
-        from projects.models import ExternalProjectDetails, StudentProjectDetails
-
         affiliation = AgencyService.get_affiliation(pk)
 
-        # Find and clean external projects
-        external_projects = ExternalProjectDetails.objects.filter(
-            collaboration_with__icontains=affiliation.name
-        )
-
-        external_count = 0
-        for ext in external_projects:
-            if ext.collaboration_with:
-                affiliations = [
-                    a.strip() for a in ext.collaboration_with.split("; ") if a.strip()
-                ]
-                affiliations = [a for a in affiliations if a != affiliation.name]
-                ext.collaboration_with = "; ".join(affiliations) if affiliations else ""
-                ext.save()
-                external_count += 1
-
-        # Find and clean student projects
-        student_projects = StudentProjectDetails.objects.filter(
-            organisation__icontains=affiliation.name
-        )
-
-        student_count = 0
-        for student in student_projects:
-            if student.organisation:
-                affiliations = [
-                    a.strip() for a in student.organisation.split("; ") if a.strip()
-                ]
-                affiliations = [a for a in affiliations if a != affiliation.name]
-                student.organisation = "; ".join(affiliations) if affiliations else ""
-                student.save()
-                student_count += 1
+        with transaction.atomic():
+            counts = AgencyService.update_affiliation_references(
+                affiliation.pk, "array_remove", affiliation.name
+            )
+            affiliation.delete()
 
+        external_count = counts["external"]
+        student_count = counts["student"]
         project_count = external_count + student_count
 
         settings.LOGGER.info(
@@ -351,8 +382,6 @@ class AgencyService:
             f"({external_count} external, {student_count} student)"
         )
 
-        affiliation.delete()
-
         return {
             "message": f"Affiliation deleted and removed from {project_count} project(s)",
             "external_projects_updated": external_count,
@@ -424,3 +453,235 @@ class AgencyService:
             "total_count": total_count,
             "deleted_names": deleted_names[:10],
         }
+
+    # Affiliation links
+    @staticmethod
+    def get_affiliation_fields():
+        """
+        Get the project detail models that name affiliations
+
+        Returns:
+            Dict of kind ("student" or "external") to a (model, field name)
+            tuple, the field holding the names of the linked affiliations
+        """
+        from projects.models import ExternalProjectDetails, StudentProjectDetails
+
+        return {
+            "student": (StudentProjectDetails, "organisation"),
+            "external": (ExternalProjectDetails, "collaboration_with"),
+        }
+
+    @staticmethod
+    def split_affiliation_names(value):
+        """
+        Split a project detail field into affiliation names
+
+        Args:
+            value: Separated affiliation names, or None
+
+        Returns:
+            List of names, without blanks
+        """
+        if not value:
+            return []
+        return [
+            name.strip() for name in value.split(AFFILIATION_SEPARATOR) if name.strip()
+        ]
+
+    @staticmethod
+    def sync_affiliation_links(details, field_name):
+        """
+        Link project details to the affiliations named in one of its fields
+
+        Names with no matching affiliation are left unlinked.
+
+        Args:
+            details: StudentProjectDetails or ExternalProjectDetails instance
+            field_name: Field holding the affiliation names
+        """
+        names = AgencyService.split_affiliation_names(getattr(details, field_name))
+        details.affiliations.set(
+            Affiliation.objects.filter(name__in=names) if names else []
+        )
+
+    @staticmethod
+    def update_affiliation_references(affiliation_id, function, *args):
+        """
+        Rewrite the names in every project detail linked to an affiliation
+
+        Each detail model is rewritten with a single UPDATE over its linked
+        rows, and the project pages showing them move to a new version.
+
+        Args:
+            affiliation_id: Affiliation primary key
+            function: Postgres array function applied to the names, e.g.
+                "array_replace"
+            *args: Further arguments to the function
+
+        Returns:
+            Dict of student and external project counts updated
+        """
+        from projects.services.page_service import ProjectPageService
+
+        counts = {}
+        project_ids = []
+        for kind, (model, field_name) in AgencyService.get_affiliation_fields().items():
+            linked = model.objects.filter(affiliations=affiliation_id)
+            project_ids += linked.values_list("project_id", flat=True)
+            counts[kind] = _rewrite_names(linked, field_name, function, *args)
+        ProjectPageService.bump_versions(project_ids)
+        return counts
+
+    @staticmethod
+    def rename_affiliation_references(affiliation_id, old_name, new_name):
+        """
+        Replace an affiliation's old name in every project detail naming it
+
+        Args:
+            affiliation_id: Affiliation primary key
+            old_name: Name before the rename
+            new_name: Name after the rename
+
+        Returns:
+            Dict of student and external project counts updated
+        """
+        return AgencyService.update_affiliation_references(
+            affiliation_id, "array_replace", old_name, new_name
+        )
+
+    @staticmethod
+    def merge_affiliation(source, target):
+        """
+        Merge one affiliation into another and delete it
+
+        Project details naming the source name the target instead, once.
+
+        Args:
+            source: Affiliation to remove
+            target: Affiliation to keep
+
+        Returns:
+            Dict of student and external project counts updated
+        """
+        from projects.services.page_service import ProjectPageService
+
+        counts = {}
+        project_ids = []
+        with transaction.atomic():
+            for kind, (
+                model,
+                field_name,
+            ) in AgencyService.get_affiliation_fields().items():
+                linked = model.objects.filter(affiliations=source.pk)
+                project_ids += linked.values_list("project_id", flat=True)
+                counts[kind] = _rewrite_names(
+                    linked.filter(affiliations=target.pk),
+                    field_name,
+                    "array_remove",
+                    source.name,
+                ) + _rewrite_names(
+                    linked.exclude(affiliations=target.pk),
+                    field_name,
+                    "array_replace",
+                    source.name,
+                    target.name,
+                )
+
+                # Move the links not already held by the target
+                through = model.affiliations.through
+                details_column = f"{model._meta.model_name}_id"
+                through.objects.filter(affiliation=source).exclude(
+                    **{
+                        f"{details_column}__in": through.objects.filter(
+                            affiliation=target
+                        ).values(details_column)
+                    }
+                ).update(affiliation=target)
+
+            source.delete()
+        ProjectPageService.bump_versions(project_ids)
+        return counts
+
+    @staticmethod
+    def backfill_affiliation_links(batch_size=1000):
+        """
+        Rebuild the affiliation links of every project detail from its names
+
+        Args:
+            batch_size: Link rows inserted per query
+
+        Returns:
+            Dict of student and external link counts created
+        """
+        affiliation_ids = dict(Affiliation.objects.values_list("name", "pk"))
+        created = {}
+
+        for kind, (model, field_name) in AgencyService.get_affiliation_fields().items():
+            through = model.affiliations.through
+            rows = (
+                model.objects.exclude(**{f"{field_name}__isnull": True})
+                .exclude(**{field_name: ""})
+                .values_list("pk", field_name)
+            )
+            links = AgencyService._build_affiliation_links(
+                model, rows.iterator(chunk_size=batch_size), affiliation_ids
+            )
+
+            with transaction.atomic():
+                through.objects.all().delete()
+                through.objects.bulk_create(links, batch_size=batch_size)
+            created[kind] = len(links)
+
+        return created
+
+    @staticmethod
+    def link_affiliations(kind, details, batch_size=1000):
+        """
+        Link newly created project details to the affiliations they name
+
+        For details written with bulk_create, which skips the save signal.
+
+        Args:
+            kind: "student" or "external"
+            details: Saved StudentProjectDetails or ExternalProjectDetails
+            batch_size: Link rows inserted per query
+
+        Returns:
+            Number of links created
+        """
+        model, field_name = AgencyService.get_affiliation_fields()[kind]
+        rows = [(item.pk, getattr(item, field_name)) for item in details]
+        names = {
+            name
+            for _, value in rows
+            for name in AgencyService.split_affiliation_names(value)
+        }
+        if not names:
+            return 0
+
+        affiliation_ids = dict(
+            Affiliation.objects.filter(name__in=names).values_list("name", "pk")
+        )
+        links = AgencyService._build_affiliation_links(model, rows, affiliation_ids)
+        model.affiliations.through.objects.bulk_create(
+            links, batch_size=batch_size, ignore_conflicts=True
+        )
+        return len(links)
+
+    @staticmethod
+    def _build_affiliation_links(model, rows, affiliation_ids):
+        """Unsaved link rows for (details pk, names) pairs of a details model"""
+        through = model.affiliations.through
+        details_column = f"{model._meta.model_name}_id"
+        links = []
+        for pk, value in rows:
+            linked = {
+                affiliation_ids[name]
+                for name in AgencyService.split_affiliation_names(value)
+                if name in affiliation_ids
+            }
+            links += [
+                through(**{details_column: pk}, affiliation_id=affiliation_id)
+                for affiliation_id in linked
+            ]
+        return links
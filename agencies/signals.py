@@ -6,10 +6,11 @@ data consistency across related models.
 """
 
 from django.conf import settings
-from django.db.models.signals import pre_save
+from django.db.models.signals import post_save, pre_save
 from django.dispatch import receiver
 
 from .models import Affiliation
+from .services.agency_service import AgencyService
 
 
 @receiver(pre_save, sender=Affiliation)
@@ -19,7 +20,8 @@ def update_project_affiliations_on_name_change(sender, instance, **kwargs):
     and ExternalProjectDetails that reference the old name.
 
     This ensures that when an affiliation is renamed (e.g., adding a comma),
-    all projects using that affiliation are automatically updated.
+    all projects using that affiliation are automatically updated. Only
+    projects linked to the affiliation are updated, one UPDATE per model.
     """
     # Only proceed if this is an update (not a new instance)
     if instance.pk is None:
@@ -35,54 +37,16 @@ def update_project_affiliations_on_name_change(sender, instance, **kwargs):
         if old_name == new_name:
             return
 
-        # Import here to avoid circular imports
-        from projects.models import ExternalProjectDetails, StudentProjectDetails
-
-        updated_student_count = 0
-        updated_external_count = 0
-
-        # Update StudentProjectDetails
-        student_projects = StudentProjectDetails.objects.filter(
-            organisation__icontains=old_name
+        counts = AgencyService.rename_affiliation_references(
+            instance.pk, old_name, new_name
         )
 
-        for student_project in student_projects:
-            if student_project.organisation:
-                # Split by semicolon, update matching names, rejoin
-                affiliations = [
-                    a.strip() for a in student_project.organisation.split("; ")
-                ]
-                updated_affiliations = [
-                    new_name if a == old_name else a for a in affiliations
-                ]
-                student_project.organisation = "; ".join(updated_affiliations)
-                student_project.save()
-                updated_student_count += 1
-
-        # Update ExternalProjectDetails
-        external_projects = ExternalProjectDetails.objects.filter(
-            collaboration_with__icontains=old_name
-        )
-
-        for external_project in external_projects:
-            if external_project.collaboration_with:
-                # Split by semicolon, update matching names, rejoin
-                affiliations = [
-                    a.strip() for a in external_project.collaboration_with.split("; ")
-                ]
-                updated_affiliations = [
-                    new_name if a == old_name else a for a in affiliations
-                ]
-                external_project.collaboration_with = "; ".join(updated_affiliations)
-                external_project.save()
-                updated_external_count += 1
-
         # Log the updates
-        if updated_student_count > 0 or updated_external_count > 0:
+        if counts["student"] > 0 or counts["external"] > 0:
             settings.LOGGER.info(
                 f"Affiliation name changed from '{old_name}' to '{new_name}'. "
-                f"Updated {updated_student_count} student project(s) and "
-                f"{updated_external_count} external project(s)."
+                f"Updated {counts['student']} student project(s) and "
+                f"{counts['external']} external project(s)."
             )
 
     except Affiliation.DoesNotExist:
@@ -90,3 +54,24 @@ def update_project_affiliations_on_name_change(sender, instance, **kwargs):
         pass
     except Exception as e:
         settings.LOGGER.error(f"Error updating project affiliations: {str(e)}")
+
+
+@receiver(post_save, sender="projects.StudentProjectDetails")
+@receiver(post_save, sender="projects.ExternalProjectDetails")
+def link_project_affiliations_on_save(sender, instance, raw=False, **kwargs):
+    """
+    Link saved project details to the affiliations their names field lists,
+    so renames and deletions can find them without scanning the names.
+    """
+    if raw:
+        return
+
+    field_name = {
+        model: field_name
+        for model, field_name in AgencyService.get_affiliation_fields().values()
+    }[sender]
+    update_fields = kwargs.get("update_fields")
+    if update_fields and field_name not in update_fields:
+        return
+
+    AgencyService.sync_affiliation_links(instance, field_name)
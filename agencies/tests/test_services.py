@@ -13,7 +13,7 @@ from agencies.models import (
     DepartmentalService,
     Division,
 )
-from agencies.services.agency_service import AgencyService
+from agencies.services.agency_service import AgencyService, _names_array
 
 
 class TestAffiliationService:
@@ -247,6 +247,134 @@ class TestAffiliationService:
         assert Affiliation.objects.filter(id=affiliation.id).exists()
         assert result["deleted_count"] == 0
 
+    def test_saving_details_links_named_affiliations(self, affiliation, db):
+        """Test project details are linked to the affiliations they name"""
+        from common.tests.factories import ProjectFactory
+        from projects.models import StudentProjectDetails
+
+        # Arrange
+        other = Affiliation.objects.create(name="Other Org")
+        details = StudentProjectDetails.objects.create(
+            project=ProjectFactory(),
+            organisation=f"{affiliation.name}; Unknown Org",
+        )
+
+        # Act
+        details.organisation = f"{other.name}; {affiliation.name}"
+        details.save()
+
+        # Assert
+        assert set(details.affiliations.all()) == {affiliation, other}
+        assert set(other.student_projects.all()) == {details}
+
+    def test_merge_affiliation(self, affiliation, db):
+        """Test merging names the target once and moves the links"""
+        from common.tests.factories import ProjectFactory
+        from projects.models import ExternalProjectDetails
+
+        # Arrange
+        duplicate = Affiliation.objects.create(name=f"{affiliation.name};")
+        both = ExternalProjectDetails.objects.create(
+            project=ProjectFactory(),
+            collaboration_with=f"{duplicate.name}; Other Org; {affiliation.name}",
+        )
+        only_duplicate = ExternalProjectDetails.objects.create(
+            project=ProjectFactory(),
+            collaboration_with=f"Other Org; {duplicate.name}",
+        )
+
+        # Act
+        result = AgencyService.merge_affiliation(duplicate, affiliation)
+
+        # Assert
+        both.refresh_from_db()
+        only_duplicate.refresh_from_db()
+        assert not Affiliation.objects.filter(pk=duplicate.pk).exists()
+        assert both.collaboration_with == f"Other Org; {affiliation.name}"
+        assert only_duplicate.collaboration_with == f"Other Org; {affiliation.name}"
+        assert set(affiliation.external_projects.all()) == {both, only_duplicate}
+        assert result == {"student": 0, "external": 2}
+
+    def test_rename_matches_irregularly_spaced_names(self, affiliation, db):
+        """Test a rename reaches names stored with extra whitespace"""
+        from common.tests.factories import ProjectFactory
+        from projects.models import StudentProjectDetails
+
+        # Arrange
+        details = StudentProjectDetails.objects.create(
+            project=ProjectFactory(),
+            organisation=f"Other Org;  {affiliation.name} ",
+        )
+        assert list(details.affiliations.all()) == [affiliation]
+
+        # Act
+        affiliation.name = "Renamed Org"
+        affiliation.save()
+
+        # Assert
+        details.refresh_from_db()
+        assert details.organisation == "Other Org; Renamed Org"
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "A; B",
+            "A;  B",
+            " A ; B ",
+            "A; ; B; ",
+            "A;; B",
+            "A;B",
+            "",
+        ],
+    )
+    def test_sql_names_match_split_affiliation_names(self, value, db):
+        """Test the names rewritten in SQL are those the links are made from"""
+        from common.tests.factories import ProjectFactory
+        from projects.models import StudentProjectDetails
+
+        # Arrange
+        details = StudentProjectDetails.objects.create(project=ProjectFactory())
+        StudentProjectDetails.objects.filter(pk=details.pk).update(organisation=value)
+
+        # Act
+        names = (
+            StudentProjectDetails.objects.filter(pk=details.pk)
+            .annotate(names=_names_array("organisation"))
+            .values_list("names", flat=True)
+            .get()
+        )
+
+        # Assert
+        assert names == AgencyService.split_affiliation_names(value)
+
+    def test_backfill_affiliation_links_command(self, affiliation, db):
+        """Test the backfill command links details written without save()"""
+        from io import StringIO
+
+        from django.core.management import call_command
+
+        from common.tests.factories import ProjectFactory
+        from projects.models import ExternalProjectDetails, StudentProjectDetails
+
+        # Arrange
+        student = StudentProjectDetails.objects.create(project=ProjectFactory())
+        external = ExternalProjectDetails.objects.create(project=ProjectFactory())
+        StudentProjectDetails.objects.filter(pk=student.pk).update(
+            organisation=f" {affiliation.name} ; Unknown Org"
+        )
+        ExternalProjectDetails.objects.filter(pk=external.pk).update(
+            collaboration_with=affiliation.name
+        )
+
+        # Act
+        out = StringIO()
+        call_command("backfill_affiliation_links", stdout=out)
+
+        # Assert
+        assert list(student.affiliations.all()) == [affiliation]
+        assert list(external.affiliations.all()) == [affiliation]
+        assert "Linked 1 student project affiliation(s)" in out.getvalue()
+
 
 class TestAgencyService:
     """Tests for agency service operations"""
@@ -5,6 +5,8 @@ Tests for agencies signals
 from unittest.mock import patch
 
 from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from agencies.models import Affiliation
 from common.tests.factories import AffiliationFactory, ProjectFactory
@@ -272,3 +274,43 @@ class TestUpdateProjectAffiliationsOnNameChange:
         # Should handle whitespace correctly
         assert "New Org" in student_project.organisation
         assert student_project.organisation == "Other Org; New Org; Another Org"
+
+    def test_affiliation_name_change_is_one_update_per_model(self, db):
+        """Test a rename updates linked projects without saving each one"""
+        # Arrange
+        affiliation = AffiliationFactory(name="Old Name")
+        unlinked = StudentProjectDetails.objects.create(
+            project=ProjectFactory(), organisation="Other Org"
+        )
+        for _ in range(5):
+            StudentProjectDetails.objects.create(
+                project=ProjectFactory(), organisation="Other Org; Old Name"
+            )
+            ExternalProjectDetails.objects.create(
+                project=ProjectFactory(), collaboration_with="Old Name"
+            )
+
+        # Act
+        affiliation.name = "New Name"
+        with CaptureQueriesContext(connection) as queries:
+            affiliation.save()
+
+        # Assert
+        updates = [
+            query["sql"]
+            for query in queries
+            if query["sql"].startswith('UPDATE "projects_')
+        ]
+        assert len(updates) == 2
+        assert (
+            StudentProjectDetails.objects.filter(
+                organisation="Other Org; New Name"
+            ).count()
+            == 5
+        )
+        assert (
+            ExternalProjectDetails.objects.filter(collaboration_with="New Name").count()
+            == 5
+        )
+        unlinked.refresh_from_db()
+        assert unlinked.organisation == "Other Org"
@@ -668,6 +668,110 @@ class TestMyBusinessAreas:
         assert len(response.data) == 0
 
 
+class TestBusinessAreasProblematicProjects:
+    """Tests for BusinessAreasProblematicProjects view"""
+
+    @pytest.fixture(autouse=True)
+    def clear_project_health(self):
+        from projects.services import ProjectAnalyticsService
+
+        ProjectAnalyticsService.invalidate_project_health()
+
+    def test_get_problematic_projects(self, api_client, user, business_area, db):
+        """Test getting problematic projects for one business area"""
+        # Arrange
+        from common.tests.factories import ProjectFactory
+
+        project = ProjectFactory(business_area=business_area, members=[])
+        api_client.force_authenticate(user=user)
+
+        # Act
+        response = api_client.get(
+            agencies_urls.path("business_areas", "problematic_projects"),
+            {"business_area_id": business_area.id},
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert [p["id"] for p in response.data["no_members"]] == [project.id]
+        assert response.data["no_leader"] == []
+        assert response.data["external_leader"] == []
+        assert response.data["multiple_leads"] == []
+
+    def test_get_problematic_projects_requires_business_area(
+        self, api_client, user, db
+    ):
+        """Test business_area_id parameter is required"""
+        # Arrange
+        api_client.force_authenticate(user=user)
+
+        # Act
+        response = api_client.get(
+            agencies_urls.path("business_areas", "problematic_projects")
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_post_problematic_projects_batched(
+        self, api_client, user, business_area, django_assert_max_num_queries, db
+    ):
+        """Test several business areas are classified with constant queries"""
+        # Arrange
+        from common.tests.factories import ProjectFactory, UserFactory
+
+        external = UserFactory(is_staff=False)
+        for _ in range(3):
+            ProjectFactory(business_area=business_area, members=[])
+            externally_led = ProjectFactory(business_area=business_area, members=[])
+            externally_led.members.create(
+                user=external, is_leader=True, role="supervising"
+            )
+        api_client.force_authenticate(user=user)
+
+        # Act
+        with django_assert_max_num_queries(2):
+            response = api_client.post(
+                agencies_urls.path("business_areas", "problematic_projects"),
+                {"baArray": [business_area.id, 999]},
+                format="json",
+            )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data[business_area.id]["no_members"]) == 3
+        assert len(response.data[business_area.id]["external_leader"]) == 3
+        assert response.data[999]["no_members"] == []
+
+
+class TestBusinessAreasUnapprovedDocs:
+    """Tests for BusinessAreasUnapprovedDocs view"""
+
+    def test_post_unapproved_docs(self, api_client, user, business_area, db):
+        """Test unapproved documents are split into linked and unlinked"""
+        # Arrange
+        from common.tests.factories import ProjectFactory
+        from documents.tests.factories import ConceptPlanFactory, ProjectDocumentFactory
+
+        project = ProjectFactory(business_area=business_area)
+        linked = ConceptPlanFactory(document__project=project).document
+        unlinked = ProjectDocumentFactory(project=project, kind="projectplan")
+        api_client.force_authenticate(user=user)
+
+        # Act
+        response = api_client.post(
+            agencies_urls.path("business_areas", "unapproved_docs"),
+            {"baArray": [business_area.id]},
+            format="json",
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        data = response.data[business_area.id]
+        assert [d["id"] for d in data["linked"]] == [linked.id]
+        assert [d["id"] for d in data["unlinked"]] == [unlinked.id]
+
+
 class TestSetBusinessAreaActive:
     """Tests for SetBusinessAreaActive view"""
 
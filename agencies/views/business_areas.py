@@ -1,11 +1,6 @@
 # region IMPORTS ====================================================================================================
-import os
-
 from django.conf import settings
-from django.core.files.base import ContentFile
-from django.core.files.storage import default_storage
 from django.db import transaction
-from rest_framework.exceptions import NotFound
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.status import (
@@ -18,11 +13,12 @@ from rest_framework.status import (
 )
 from rest_framework.views import APIView
 
-from documents.models import ProjectDocument
 from documents.serializers import ProjectDocumentSerializer
+from documents.services import DocumentService
 from medias.models import BusinessAreaPhoto
-from projects.models import Project, ProjectMember
+from medias.services.content_store_service import ContentStoreService
 from projects.serializers import ProblematicProjectSerializer
+from projects.services import ProjectAnalyticsService
 
 from ..models import BusinessArea
 from ..serializers import BusinessAreaSerializer, TinyBusinessAreaSerializer
@@ -42,25 +38,11 @@ class BusinessAreas(APIView):
         return Response(serializer.data, status=HTTP_200_OK)
 
     def handle_ba_image(self, image):
-        """Handle business area image upload"""
+        """Handle business area image upload (deduplicated by content)"""
         if isinstance(image, str):
             return image
         elif image is not None:
-            original_filename = image.name
-            subfolder = "business_areas"
-            file_path = f"{subfolder}/{original_filename}"
-
-            if default_storage.exists(file_path):
-                full_file_path = default_storage.path(file_path)
-                if os.path.exists(full_file_path):
-                    existing_file_size = os.path.getsize(full_file_path)
-                    new_file_size = image.size
-                    if existing_file_size == new_file_size:
-                        return file_path
-
-            content = ContentFile(image.read())
-            file_path = default_storage.save(file_path, content)
-            return file_path
+            return ContentStoreService.store(image, "business_areas")
 
     def post(self, request):
         settings.LOGGER.info(f"{request.user} is posting a business area")
@@ -135,25 +117,11 @@ class BusinessAreaDetail(APIView):
     permission_classes = [IsAuthenticated]
 
     def handle_ba_image(self, image):
-        """Handle business area image upload"""
+        """Handle business area image upload (deduplicated by content)"""
         if isinstance(image, str):
             return image
         elif image is not None:
-            original_filename = image.name
-            subfolder = "business_areas"
-            file_path = f"{subfolder}/{original_filename}"
-
-            if default_storage.exists(file_path):
-                full_file_path = default_storage.path(file_path)
-                if os.path.exists(full_file_path):
-                    existing_file_size = os.path.getsize(full_file_path)
-                    new_file_size = image.size
-                    if existing_file_size == new_file_size:
-                        return file_path
-
-            content = ContentFile(image.read())
-            file_path = default_storage.save(file_path, content)
-            return file_path
+            return ContentStoreService.store(image, "business_areas")
 
     def get(self, request, pk):
         ba = AgencyService.get_business_area(pk)
@@ -223,8 +191,10 @@ class BusinessAreaDetail(APIView):
                         }
                         BusinessAreaPhoto.objects.create(**image_data)
                     else:
+                        previous = currentphoto.file.name
                         currentphoto.file = self.handle_ba_image(image)
                         currentphoto.save()
+                        ContentStoreService.release(previous)
 
                 return Response(
                     TinyBusinessAreaSerializer(uba).data,
@@ -255,18 +225,6 @@ class MyBusinessAreas(APIView):
 class BusinessAreasUnapprovedDocs(APIView):
     """Get unapproved documents for business areas"""
 
-    def get_unapproved_docs_for_ba(self, pk):
-        try:
-            docs = ProjectDocument.objects.filter(
-                project__business_area=pk, project_lead_approval_granted=False
-            ).distinct()
-        except ProjectDocument.DoesNotExist:
-            raise NotFound
-        except Exception as e:
-            settings.LOGGER.error(f"Error: {e}")
-            docs = ProjectDocument.objects.none()
-        return docs
-
     def post(self, request):
         try:
             pks_array = request.data.get("baArray")
@@ -274,41 +232,29 @@ class BusinessAreasUnapprovedDocs(APIView):
                 f"{request.user} is Getting My BA Unapproved Docs: {pks_array}"
             )
 
-            data = {}
-            for ba_pk in pks_array:
-                unapproved = self.get_unapproved_docs_for_ba(ba_pk)
-                processed_unapproved = []
-                seen_ids = set()
-                unlinked_docs = []
-
-                for item in unapproved:
-                    if item.pk not in seen_ids:
-                        if item.has_project_document_data() is False:
-                            unlinked_docs.append(item)
-                        else:
-                            processed_unapproved.append(item)
-                            seen_ids.add(item.pk)
-
-                serializer = ProjectDocumentSerializer(processed_unapproved, many=True)
-                serializer2 = ProjectDocumentSerializer(unlinked_docs, many=True)
+            unapproved = DocumentService.get_unapproved_documents_by_business_area(
+                pks_array
+            )
 
+            data = {}
+            for ba_pk, docs in unapproved.items():
                 data[ba_pk] = {
-                    "linked": serializer.data,
-                    "unlinked": serializer2.data,
+                    "linked": ProjectDocumentSerializer(docs["linked"], many=True).data,
+                    "unlinked": ProjectDocumentSerializer(
+                        docs["unlinked"], many=True
+                    ).data,
                 }
 
-                if data[ba_pk]["linked"]:
-                    ba_name = data[ba_pk]["linked"][0]["project"]["business_area"][
-                        "name"
-                    ]
+                if docs["linked"]:
+                    ba_name = docs["linked"][0].project.business_area.name
                     settings.LOGGER.warning(
                         f"Unapproved Doc Count for BA '{ba_name}' ({ba_pk}): "
-                        f"{len(processed_unapproved)}\nUnlinked Doc Count for BA {len(unlinked_docs)}"
+                        f"{len(docs['linked'])}\nUnlinked Doc Count for BA {len(docs['unlinked'])}"
                     )
                 else:
                     settings.LOGGER.warning(
-                        f"Unapproved Doc Count for BA {ba_pk}: {len(processed_unapproved)}\n"
-                        f"Unlinked Doc Count for BA: {len(unlinked_docs)}"
+                        f"Unapproved Doc Count for BA {ba_pk}: {len(docs['linked'])}\n"
+                        f"Unlinked Doc Count for BA: {len(docs['unlinked'])}"
                     )
 
             return Response(data=data, status=HTTP_200_OK)
@@ -320,18 +266,11 @@ class BusinessAreasUnapprovedDocs(APIView):
 class BusinessAreasProblematicProjects(APIView):
     """Get problematic projects for business areas"""
 
-    def get_projects_in_ba_array(self, ba_array):
-        try:
-            projects = (
-                Project.objects.filter(business_area__in=ba_array)
-                .select_related("business_area", "image")
-                .prefetch_related("members", "members__user")
-            )
-        except Project.DoesNotExist:
-            raise NotFound
-        except Exception:
-            return Project.objects.none()
-        return projects
+    def serialize_problems(self, groups):
+        return {
+            name: ProblematicProjectSerializer(projects, many=True).data
+            for name, projects in groups.items()
+        }
 
     def get(self, request):
         try:
@@ -346,47 +285,10 @@ class BusinessAreasProblematicProjects(APIView):
                 f"{request.user} is Getting Problematic Projects for Business Area {business_area_id}"
             )
 
-            all_projects = self.get_projects_in_ba_array([business_area_id])
-            memberless_projects = []
-            no_leader_tag_projects = []
-            multiple_leader_tag_projects = []
-            externally_led_projects = []
-
-            for p in all_projects:
-                members = p.members.all()
-                leader_tag_count = 0
-                external_leader = False
-
-                for mem in members:
-                    if mem.role == ProjectMember.RoleChoices.SUPERVISING:
-                        leader_tag_count += 1
-                    if mem.is_leader is True and mem.user.is_staff is False:
-                        external_leader = True
-
-                if len(members) < 1:
-                    memberless_projects.append(p)
-                else:
-                    if external_leader:
-                        externally_led_projects.append(p)
-                    if leader_tag_count == 0:
-                        no_leader_tag_projects.append(p)
-                    elif leader_tag_count > 1:
-                        multiple_leader_tag_projects.append(p)
-
-            data = {
-                "no_members": ProblematicProjectSerializer(
-                    memberless_projects, many=True
-                ).data,
-                "no_leader": ProblematicProjectSerializer(
-                    no_leader_tag_projects, many=True
-                ).data,
-                "external_leader": ProblematicProjectSerializer(
-                    externally_led_projects, many=True
-                ).data,
-                "multiple_leads": ProblematicProjectSerializer(
-                    multiple_leader_tag_projects, many=True
-                ).data,
-            }
+            problems = ProjectAnalyticsService.get_business_area_problems(
+                [business_area_id]
+            )
+            data = self.serialize_problems(problems[business_area_id])
 
             return Response(data=data, status=HTTP_200_OK)
 
@@ -400,53 +302,12 @@ class BusinessAreasProblematicProjects(APIView):
             settings.LOGGER.info(
                 f"{request.user} is Getting My BA Problem Projects: {pks_array}"
             )
-            data = {}
 
-            for ba_pk in pks_array:
-                projects_in_ba = Project.objects.filter(
-                    business_area=ba_pk
-                ).prefetch_related("members", "members__user")
-
-                memberless_projects = []
-                no_leader_tag_projects = []
-                multiple_leader_tag_projects = []
-                externally_led_projects = []
-
-                for p in projects_in_ba:
-                    members = p.members.all()
-                    leader_tag_count = 0
-                    external_leader = False
-
-                    for mem in members:
-                        if mem.role == ProjectMember.RoleChoices.SUPERVISING:
-                            leader_tag_count += 1
-                        if mem.is_leader is True and mem.user.is_staff is False:
-                            external_leader = True
-
-                    if len(members) < 1:
-                        memberless_projects.append(p)
-                    else:
-                        if external_leader:
-                            externally_led_projects.append(p)
-                        if leader_tag_count == 0:
-                            no_leader_tag_projects.append(p)
-                        elif leader_tag_count > 1:
-                            multiple_leader_tag_projects.append(p)
-
-                data[ba_pk] = {
-                    "no_members": ProblematicProjectSerializer(
-                        memberless_projects, many=True
-                    ).data,
-                    "no_leader": ProblematicProjectSerializer(
-                        no_leader_tag_projects, many=True
-                    ).data,
-                    "external_leader": ProblematicProjectSerializer(
-                        externally_led_projects, many=True
-                    ).data,
-                    "multiple_leads": ProblematicProjectSerializer(
-                        multiple_leader_tag_projects, many=True
-                    ).data,
-                }
+            problems = ProjectAnalyticsService.get_business_area_problems(pks_array)
+            data = {
+                ba_pk: self.serialize_problems(groups)
+                for ba_pk, groups in problems.items()
+            }
 
             return Response(data=data, status=HTTP_200_OK)
 
@@ -5,3 +5,7 @@ class CaretakersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "caretakers"
     verbose_name = "Caretakers"
+
+    def ready(self):
+        """Register event subscribers when the app is ready."""
+        import caretakers.subscribers  # noqa: F401
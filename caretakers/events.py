@@ -0,0 +1,15 @@
+"""
+Domain events for caretakers (see common.events)
+"""
+
+from dataclasses import dataclass
+
+from common.events import Event
+
+
+@dataclass(frozen=True)
+class CaretakerChanged(Event):
+    """A caretaker relationship was created, updated or removed"""
+
+    user_id: int
+    caretaker_id: int
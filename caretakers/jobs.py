@@ -0,0 +1,22 @@
+"""
+Housekeeping jobs for caretakers (see common.scheduler)
+"""
+
+from datetime import timedelta
+
+from common.scheduler import job
+
+from .services.caretaker_service import CaretakerService
+from .services.request_service import CaretakerRequestService
+
+
+@job("expire_caretaker_requests", interval=timedelta(minutes=15))
+def expire_caretaker_requests(since):
+    """Cancel pending caretaker requests whose end date has passed"""
+    return {"cancelled": CaretakerRequestService.cancel_expired_requests()}
+
+
+@job("expire_caretakers", interval=timedelta(minutes=15), shared_cache=True)
+def expire_caretakers(since):
+    """Clear shared cached chains and pages for caretakers that ended"""
+    return {"expired": CaretakerService.expire_caretakers(since=since)}
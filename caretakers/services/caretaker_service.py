@@ -3,11 +3,15 @@ Business logic for caretaker relationship operations
 """
 
 from django.conf import settings
+from django.core.cache import cache
 from django.db import transaction
+from django.utils import timezone
 from rest_framework.exceptions import NotFound, ValidationError
 
+from common.events import publish
 from users.models import User
 
+from ..events import CaretakerChanged
 from ..models import Caretaker
 
 
@@ -102,13 +106,15 @@ class CaretakerService:
 
         settings.LOGGER.info(f"Creating caretaker relationship: {caretaker} for {user}")
 
-        return Caretaker.objects.create(
+        caretaker_obj = Caretaker.objects.create(
             user=user,
             caretaker=caretaker,
             reason=reason,
             end_date=end_date,
             notes=notes,
         )
+        publish(CaretakerChanged(user.pk, caretaker.pk))
+        return caretaker_obj
 
     @staticmethod
     @transaction.atomic
@@ -132,6 +138,7 @@ class CaretakerService:
                 setattr(caretaker, field, value)
 
         caretaker.save()
+        publish(CaretakerChanged(caretaker.user_id, caretaker.caretaker_id))
         return caretaker
 
     @staticmethod
@@ -149,6 +156,65 @@ class CaretakerService:
         settings.LOGGER.info(f"{user} is deleting caretaker {caretaker}")
 
         caretaker.delete()
+        publish(CaretakerChanged(caretaker.user_id, caretaker.caretaker_id))
+
+    @staticmethod
+    def expire_caretakers(since=None, now=None):
+        """
+        Invalidate caches for caretaker relationships that have just ended
+
+        Expired rows are kept for auditing and already left out of reads,
+        but nothing is saved when an end date passes, so the cached
+        caretaker chains and project pages of the users involved are
+        cleared here instead. This reaches the web workers only through
+        the shared default cache.
+
+        Args:
+            since: Only relationships that ended after this time (default: all)
+            now: Cut-off time (default: now)
+
+        Returns:
+            Number of relationships that ended
+        """
+        now = now or timezone.now()
+        expired = Caretaker.objects.filter(end_date__lte=now)
+        if since is not None:
+            expired = expired.filter(end_date__gt=since)
+
+        pairs = list(expired.values_list("user_id", "caretaker_id"))
+        if not pairs:
+            return 0
+
+        CaretakerService.invalidate_users({pk for pair in pairs for pk in pair})
+
+        settings.LOGGER.info(f"Expired {len(pairs)} caretaker relationships")
+        return len(pairs)
+
+    @staticmethod
+    def invalidate_users(user_ids):
+        """
+        Clear the cached caretaker chains and project pages of users
+
+        Args:
+            user_ids: Iterable of user primary keys
+        """
+        from projects.models import ProjectMember
+        from projects.services.page_service import ProjectPageService
+
+        user_ids = set(user_ids)
+        cache.delete_many(
+            [
+                f"{prefix}_{pk}"
+                for pk in user_ids
+                for prefix in ("caretakers", "caretaking")
+            ]
+        )
+        # Members are shown with their active caretakers
+        ProjectPageService.bump_versions(
+            ProjectMember.objects.filter(user_id__in=user_ids)
+            .values_list("project_id", flat=True)
+            .distinct()
+        )
 
     @staticmethod
     def get_user_caretaker(user):
@@ -6,14 +6,20 @@ from datetime import datetime
 
 from django.conf import settings
 from django.db import transaction
+from django.db.models import Case, Q, TextField, Value, When
+from django.db.models.functions import Concat
 from django.utils import timezone
 from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
 
 from adminoptions.models import AdminTask
+from common.events import publish
 from users.models import User
 
+from ..events import CaretakerChanged
 from ..models import Caretaker
 
+EXPIRED_REQUEST_NOTE = "[Auto-cancelled: end date passed while request was pending]"
+
 
 class CaretakerRequestService:
     """Service for managing caretaker requests via AdminTask"""
@@ -70,37 +76,40 @@ class CaretakerRequestService:
             raise PermissionDenied("You are not authorized to respond to this request")
 
     @staticmethod
-    @transaction.atomic
-    def auto_cancel_expired_request(task):
+    def cancel_expired_requests(now=None):
         """
-        Auto-cancel a caretaker request if it has expired
+        Cancel pending caretaker requests whose end date has passed
+
+        Runs as a single UPDATE from the housekeeping scheduler, so reads
+        never have to write.
 
         Args:
-            task: AdminTask instance
+            now: Cut-off time (default: now)
 
         Returns:
-            bool: True if cancelled, False if not expired
+            Number of requests cancelled
         """
-        # Only cancel if task has end_date and it's in the past
-        if not task.end_date:
-            return False
-
-        # Convert end_date to date if it's a datetime
-        end_date = task.end_date
-        if isinstance(end_date, datetime):
-            end_date = end_date.date()
-
-        if end_date >= timezone.now().date():
-            return False
-
-        # Cancel the task
-        task.status = AdminTask.TaskStatus.CANCELLED
-        task.notes = f"Auto-cancelled: Request expired on {end_date}"
-        task.save()
+        now = now or timezone.now()
+        note = Value(EXPIRED_REQUEST_NOTE, output_field=TextField())
+        cancelled = AdminTask.objects.filter(
+            action=AdminTask.ActionTypes.SETCARETAKER,
+            status=AdminTask.TaskStatus.PENDING,
+            end_date__lt=now,
+        ).update(
+            status=AdminTask.TaskStatus.CANCELLED,
+            notes=Case(
+                When(Q(notes__isnull=True) | Q(notes=""), then=note),
+                default=Concat("notes", Value("\n"), note, output_field=TextField()),
+            ),
+            updated_at=now,
+        )
 
-        settings.LOGGER.info(f"Auto-cancelled expired caretaker request {task.pk}")
+        if cancelled:
+            settings.LOGGER.info(
+                f"Auto-cancelled {cancelled} expired caretaker requests"
+            )
 
-        return True
+        return cancelled
 
     @staticmethod
     def get_user_requests(user):
@@ -111,7 +120,7 @@ class CaretakerRequestService:
         - caretaker_request: Request where user is primary_user (wants someone to be THEIR caretaker)
         - become_caretaker_request: Request where user is in secondary_users (someone wants THEM to be caretaker)
 
-        Auto-cancels any expired requests.
+        Expired requests are left out; cancel_expired_requests closes them.
 
         Args:
             user: User instance
@@ -119,49 +128,22 @@ class CaretakerRequestService:
         Returns:
             dict with 'caretaker_request' and 'become_caretaker_request' keys
         """
-        # Get caretaker request (user wants someone to be their caretaker)
-        caretaker_request = (
-            AdminTask.objects.filter(
-                action=AdminTask.ActionTypes.SETCARETAKER,
-                status=AdminTask.TaskStatus.PENDING,
-                primary_user=user,
-            )
-            .select_related(
-                "requester",
-                "primary_user",
-            )
-            .first()
+        pending = AdminTask.objects.filter(
+            Q(end_date__isnull=True) | Q(end_date__gte=timezone.now()),
+            action=AdminTask.ActionTypes.SETCARETAKER,
+            status=AdminTask.TaskStatus.PENDING,
+        ).select_related(
+            "requester",
+            "primary_user",
         )
 
-        # Auto-cancel if expired
-        if caretaker_request:
-            cancelled = CaretakerRequestService.auto_cancel_expired_request(
-                caretaker_request
-            )
-            if cancelled:
-                caretaker_request = None
+        # Get caretaker request (user wants someone to be their caretaker)
+        caretaker_request = pending.filter(primary_user=user).first()
 
         # Get become caretaker request (someone wants user to be their caretaker)
-        become_caretaker_request = (
-            AdminTask.objects.filter(
-                action=AdminTask.ActionTypes.SETCARETAKER,
-                status=AdminTask.TaskStatus.PENDING,
-                secondary_users__contains=[user.pk],
-            )
-            .select_related(
-                "requester",
-                "primary_user",
-            )
-            .first()
-        )
-
-        # Auto-cancel if expired
-        if become_caretaker_request:
-            cancelled = CaretakerRequestService.auto_cancel_expired_request(
-                become_caretaker_request
-            )
-            if cancelled:
-                become_caretaker_request = None
+        become_caretaker_request = pending.filter(
+            secondary_users__contains=[user.pk]
+        ).first()
 
         return {
             "caretaker_request": caretaker_request,
@@ -270,8 +252,9 @@ class CaretakerRequestService:
                 secondary_users__contains=[int(user_id)],
             )
             .select_related(
-                "requester",
-                "primary_user",
+                "requester__avatar",
+                "primary_user__avatar",
+                "project",
             )
             .order_by("-created_at")
         )
@@ -295,8 +278,9 @@ class CaretakerRequestService:
                 primary_user_id=user_id,
             )
             .select_related(
-                "requester",
-                "primary_user",
+                "requester__avatar",
+                "primary_user__avatar",
+                "project",
             )
             .order_by("-created_at")
         )
@@ -367,6 +351,7 @@ class CaretakerRequestService:
         # Update task status to FULFILLED (request approved AND caretaker created)
         task.status = AdminTask.TaskStatus.FULFILLED
         task.save()
+        publish(CaretakerChanged(task.primary_user_id, caretaker.pk))
 
         settings.LOGGER.info(
             f"{approver} approved caretaker request {task_id}: "
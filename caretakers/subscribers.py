@@ -0,0 +1,20 @@
+"""
+Event subscribers for the caretakers app.
+
+Caretaker saves clear the cached caretaker chains inside the writing
+transaction, so a read in between can cache the old chain again. Once
+the change is committed they are cleared once more (see common.events).
+"""
+
+from common.events import subscribe
+
+from .events import CaretakerChanged
+from .services.caretaker_service import CaretakerService
+
+
+@subscribe(CaretakerChanged, batch=True)
+def refresh_caretaker_caches(events):
+    """Clear caretaker chains and project pages of the users involved"""
+    CaretakerService.invalidate_users(
+        {pk for event in events for pk in (event.user_id, event.caretaker_id)}
+    )
@@ -9,17 +9,22 @@ from unittest.mock import patch
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.utils import timezone
 from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
 
 from adminoptions.models import AdminTask
 from caretakers.models import Caretaker
 from caretakers.services.caretaker_service import CaretakerService
-from caretakers.services.request_service import CaretakerRequestService
+from caretakers.services.request_service import (
+    EXPIRED_REQUEST_NOTE,
+    CaretakerRequestService,
+)
 from caretakers.services.task_service import CaretakerTaskService
 from common.tests.factories import BusinessAreaFactory, ProjectFactory, UserFactory
 from documents.models import ProjectDocument
 from projects.models import Project, ProjectMember
+from projects.services.page_service import ProjectPageService
 
 User = get_user_model()
 
@@ -876,6 +881,75 @@ class TestCaretakerService:
         # Assert
         assert caretaker is None
 
+    @pytest.mark.django_db
+    def test_create_caretaker_clears_caches_after_commit(
+        self, caretaker_user, caretakee_user, django_capture_on_commit_callbacks
+    ):
+        """Test cached chains are cleared again once the change commits"""
+        # Arrange
+        with django_capture_on_commit_callbacks() as callbacks:
+            CaretakerService.create_caretaker(
+                caretakee_user, caretaker_user, "Leave cover"
+            )
+        # A read between the save and the commit re-caches the old chain
+        cache.set(f"caretakers_{caretakee_user.pk}", "stale")
+
+        # Act
+        for callback in callbacks:
+            callback()
+
+        # Assert
+        assert cache.get(f"caretakers_{caretakee_user.pk}") is None
+
+    @pytest.mark.django_db
+    def test_expire_caretakers_clears_caches(
+        self, caretaker_user, caretakee_user, caretaker_assignment
+    ):
+        """Test expire_caretakers clears cached chains and project pages"""
+        # Arrange
+        project = ProjectFactory()
+        ProjectMember.objects.create(
+            project=project, user=caretakee_user, role="supervising", is_leader=True
+        )
+        Caretaker.objects.filter(pk=caretaker_assignment.pk).update(
+            end_date=timezone.now() - timedelta(minutes=5)
+        )
+        cache.set(f"caretakers_{caretakee_user.pk}", "stale")
+        cache.set(f"caretaking_{caretaker_user.pk}", "stale")
+        version = ProjectPageService.get_version(project.pk)
+
+        # Act
+        result = CaretakerService.expire_caretakers(
+            since=timezone.now() - timedelta(hours=1)
+        )
+
+        # Assert
+        assert result == 1
+        assert cache.get(f"caretakers_{caretakee_user.pk}") is None
+        assert cache.get(f"caretaking_{caretaker_user.pk}") is None
+        assert ProjectPageService.get_version(project.pk) != version
+        assert Caretaker.objects.filter(pk=caretaker_assignment.pk).exists()
+
+    @pytest.mark.django_db
+    def test_expire_caretakers_skips_already_handled(
+        self, caretakee_user, caretaker_assignment
+    ):
+        """Test relationships that ended before the last run are left alone"""
+        # Arrange
+        Caretaker.objects.filter(pk=caretaker_assignment.pk).update(
+            end_date=timezone.now() - timedelta(days=2)
+        )
+        cache.set(f"caretakers_{caretakee_user.pk}", "cached")
+
+        # Act
+        result = CaretakerService.expire_caretakers(
+            since=timezone.now() - timedelta(days=1)
+        )
+
+        # Assert
+        assert result == 0
+        assert cache.get(f"caretakers_{caretakee_user.pk}") == "cached"
+
 
 class TestCaretakerRequestService:
     """Test CaretakerRequestService business logic"""
@@ -1137,78 +1211,69 @@ class TestCaretakerRequestService:
         assert task.status == AdminTask.TaskStatus.REJECTED
 
     @pytest.mark.django_db
-    def test_auto_cancel_expired_request_expired(self, db):
-        """Test auto_cancel_expired_request cancels expired request"""
+    def test_cancel_expired_requests(self, db):
+        """Test cancel_expired_requests cancels only expired pending requests"""
         # Arrange
         user = UserFactory()
         caretakee = UserFactory()
-
-        # Create task with end_date in the past
-        past_date = timezone.now() - timedelta(days=1)
-        task = AdminTask.objects.create(
+        expired = AdminTask.objects.create(
             action=AdminTask.ActionTypes.SETCARETAKER,
             status=AdminTask.TaskStatus.PENDING,
             primary_user=caretakee,
             secondary_users=[user.pk],
-            end_date=past_date,
+            end_date=timezone.now() - timedelta(days=1),
         )
-
-        # Act
-        result = CaretakerRequestService.auto_cancel_expired_request(task)
-
-        # Assert
-        assert result is True
-        task.refresh_from_db()
-        assert task.status == AdminTask.TaskStatus.CANCELLED
-        assert "Auto-cancelled" in task.notes
-
-    @pytest.mark.django_db
-    def test_auto_cancel_expired_request_not_expired(self, db):
-        """Test auto_cancel_expired_request does not cancel non-expired request"""
-        # Arrange
-        user = UserFactory()
-        caretakee = UserFactory()
-
-        # Create task with end_date in the future
-        future_date = timezone.now() + timedelta(days=1)
-        task = AdminTask.objects.create(
+        current = AdminTask.objects.create(
+            action=AdminTask.ActionTypes.SETCARETAKER,
+            status=AdminTask.TaskStatus.PENDING,
+            primary_user=user,
+            secondary_users=[caretakee.pk],
+            end_date=timezone.now() + timedelta(days=1),
+        )
+        open_ended = AdminTask.objects.create(
             action=AdminTask.ActionTypes.SETCARETAKER,
             status=AdminTask.TaskStatus.PENDING,
             primary_user=caretakee,
-            secondary_users=[user.pk],
-            end_date=future_date,
+            secondary_users=[caretakee.pk],
+            end_date=None,
         )
 
         # Act
-        result = CaretakerRequestService.auto_cancel_expired_request(task)
+        result = CaretakerRequestService.cancel_expired_requests()
 
         # Assert
-        assert result is False
-        task.refresh_from_db()
-        assert task.status == AdminTask.TaskStatus.PENDING
+        assert result == 1
+        expired.refresh_from_db()
+        current.refresh_from_db()
+        open_ended.refresh_from_db()
+        assert expired.status == AdminTask.TaskStatus.CANCELLED
+        assert expired.notes == EXPIRED_REQUEST_NOTE
+        assert current.status == AdminTask.TaskStatus.PENDING
+        assert open_ended.status == AdminTask.TaskStatus.PENDING
 
     @pytest.mark.django_db
-    def test_auto_cancel_expired_request_no_end_date(self, db):
-        """Test auto_cancel_expired_request does not cancel request without end_date"""
+    def test_cancel_expired_requests_keeps_notes(self, db):
+        """Test cancel_expired_requests appends to existing notes"""
         # Arrange
         user = UserFactory()
         caretakee = UserFactory()
-
         task = AdminTask.objects.create(
             action=AdminTask.ActionTypes.SETCARETAKER,
             status=AdminTask.TaskStatus.PENDING,
             primary_user=caretakee,
             secondary_users=[user.pk],
-            end_date=None,
+            end_date=timezone.now() - timedelta(days=1),
+            notes="Covering leave",
         )
 
         # Act
-        result = CaretakerRequestService.auto_cancel_expired_request(task)
+        CaretakerRequestService.cancel_expired_requests()
+        second_run = CaretakerRequestService.cancel_expired_requests()
 
         # Assert
-        assert result is False
+        assert second_run == 0
         task.refresh_from_db()
-        assert task.status == AdminTask.TaskStatus.PENDING
+        assert task.notes == f"Covering leave\n{EXPIRED_REQUEST_NOTE}"
 
     @pytest.mark.django_db
     def test_get_user_requests_caretaker_request(self, db):
@@ -1257,8 +1322,8 @@ class TestCaretakerRequestService:
         assert requests["become_caretaker_request"].pk == task.pk
 
     @pytest.mark.django_db
-    def test_get_user_requests_auto_cancels_expired(self, db):
-        """Test get_user_requests auto-cancels expired requests"""
+    def test_get_user_requests_hides_expired(self, db):
+        """Test get_user_requests leaves out expired requests without writing"""
         # Arrange
         user = UserFactory()
         caretaker = UserFactory()
@@ -1279,7 +1344,7 @@ class TestCaretakerRequestService:
         # Assert
         assert requests["caretaker_request"] is None
         task.refresh_from_db()
-        assert task.status == AdminTask.TaskStatus.CANCELLED
+        assert task.status == AdminTask.TaskStatus.PENDING
 
     @pytest.mark.django_db
     def test_get_user_requests_no_requests(self, db):
@@ -0,0 +1,230 @@
+"""
+In-process domain event bus.
+
+Services publish typed events describing what happened; subscribers react
+to them with email, cache invalidation or read model updates. Events are
+only delivered once the surrounding transaction commits, and are dropped
+if it rolls back, so slow work such as SMTP never runs while row locks are
+held.
+
+    @dataclass(frozen=True)
+    class DocumentApproved(Event):
+        document: object
+        approver: object
+        stage: int
+
+    @subscribe(DocumentApproved)
+    def send_approval_email(event):
+        ...
+
+    publish(DocumentApproved(document, approver, stage=1))
+
+Subscribers registered with batch=True receive a list of events instead,
+so they can merge repeated work (e.g. one cache bump for many projects).
+
+How events are delivered after commit is set by EVENT_DELIVERY:
+
+    sync     In the committing thread, before the request returns
+    queued   One at a time by a background worker thread
+    batched  By the worker, in groups of up to EVENT_BATCH_SIZE collected
+             over EVENT_BATCH_WINDOW seconds
+
+Subscriber failures are logged and never reach the publisher; the data
+they react to is already committed.
+"""
+
+import atexit
+import queue
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import partial
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+DELIVERY_MODES = ("sync", "queued", "batched")
+
+_subscribers = defaultdict(list)
+_worker = None
+_worker_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class Event:
+    """Base class for domain events"""
+
+
+@dataclass(frozen=True)
+class Subscriber:
+    func: object
+    batch: bool = False
+
+    @property
+    def name(self):
+        return f"{self.func.__module__}.{self.func.__qualname__}"
+
+
+def subscribe(*event_types, batch=False):
+    """
+    Register a function to receive events of the given types
+
+    Args:
+        *event_types: Event classes to receive (subclasses included)
+        batch: Call the function once with a list of events
+
+    Returns:
+        Decorator returning the function unchanged
+    """
+
+    def register(func):
+        for event_type in event_types:
+            subscriber = Subscriber(func, batch)
+            if subscriber not in _subscribers[event_type]:
+                _subscribers[event_type].append(subscriber)
+        return func
+
+    return register
+
+
+def publish(event, using=None):
+    """
+    Deliver an event to its subscribers once the transaction commits
+
+    Outside a transaction the event is delivered straight away.
+
+    Args:
+        event: Event instance
+        using: Database alias whose transaction to wait for
+    """
+    transaction.on_commit(partial(_dispatch, event), using=using)
+
+
+def deliver(events):
+    """
+    Call the subscribers of each event, in publish order
+
+    Args:
+        events: List of Event instances
+    """
+    calls = {}
+    for event in events:
+        for subscriber in get_subscribers(type(event)):
+            calls.setdefault(subscriber, []).append(event)
+
+    for subscriber, received in calls.items():
+        if subscriber.batch:
+            _call(subscriber, received)
+        else:
+            for event in received:
+                _call(subscriber, event)
+
+
+def get_subscribers(event_type):
+    """
+    Get the subscribers for an event type and its base classes
+
+    Returns:
+        List of Subscriber, without duplicates
+    """
+    found = []
+    for cls in event_type.__mro__:
+        for subscriber in _subscribers.get(cls, []):
+            if subscriber not in found:
+                found.append(subscriber)
+    return found
+
+
+def flush(timeout=None):
+    """
+    Wait until the background worker has delivered every queued event
+
+    Args:
+        timeout: Seconds to wait at most (default: no limit)
+
+    Returns:
+        Boolean, False if events were still pending at the timeout
+    """
+    if _worker is None:
+        return True
+    return _worker.drain(timeout)
+
+
+def _dispatch(event):
+    mode = settings.EVENT_DELIVERY
+    if mode not in DELIVERY_MODES:
+        raise ValueError(f"Unknown EVENT_DELIVERY: {mode}")
+    if mode == "sync":
+        deliver([event])
+    else:
+        _get_worker().put(event)
+
+
+def _call(subscriber, payload):
+    try:
+        subscriber.func(payload)
+    except Exception:
+        settings.LOGGER.exception(f"Event subscriber {subscriber.name} failed")
+
+
+def _get_worker():
+    global _worker
+    if _worker is None:
+        with _worker_lock:
+            if _worker is None:
+                _worker = EventWorker()
+                _worker.start()
+                atexit.register(flush, timeout=5)
+    return _worker
+
+
+class EventWorker(threading.Thread):
+    """Background thread delivering queued and batched events"""
+
+    def __init__(self):
+        super().__init__(name="event-worker", daemon=True)
+        self.events = queue.Queue()
+        self._idle = threading.Condition()
+        self._pending = 0
+
+    def put(self, event):
+        with self._idle:
+            self._pending += 1
+        self.events.put(event)
+
+    def run(self):
+        while True:
+            events = self._next_batch()
+            try:
+                deliver(events)
+            finally:
+                # Subscribers query on this thread's own connection
+                close_old_connections()
+                with self._idle:
+                    self._pending -= len(events)
+                    self._idle.notify_all()
+
+    def drain(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._idle:
+            while self._pending:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+        return True
+
+    def _next_batch(self):
+        events = [self.events.get()]
+        if settings.EVENT_DELIVERY == "batched":
+            deadline = time.monotonic() + settings.EVENT_BATCH_WINDOW
+            while len(events) < settings.EVENT_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    events.append(self.events.get(timeout=remaining))
+                except queue.Empty:
+                    break
+        return events
@@ -0,0 +1,42 @@
+"""
+Housekeeping jobs shared by all apps (see common.scheduler)
+"""
+
+import os
+import tempfile
+import time
+from datetime import timedelta
+from glob import glob
+
+from django.conf import settings
+
+from .scheduler import job
+
+
+@job("prune_temp_files", interval=timedelta(hours=1))
+def prune_temp_files(since):
+    """Delete stale temp files left behind by exports and PDF generation"""
+    temp_dir = tempfile.gettempdir()
+    patterns = [
+        os.path.join(temp_dir, f"{settings.TEMP_FILE_PREFIX}*"),
+        os.path.join(temp_dir, "affiliation_exports", "*"),
+    ]
+    cutoff = time.time() - settings.TEMP_FILE_MAX_AGE
+
+    deleted = 0
+    freed = 0
+    for pattern in patterns:
+        for path in glob(pattern):
+            try:
+                stat = os.stat(path)
+                if not os.path.isfile(path) or stat.st_mtime >= cutoff:
+                    continue
+                os.remove(path)
+            except FileNotFoundError:
+                # Removed by its owner in the meantime
+                continue
+            deleted += 1
+            freed += stat.st_size
+
+    settings.LOGGER.info(f"Pruned {deleted} stale temp files ({freed} bytes)")
+    return {"deleted": deleted, "freed": freed}
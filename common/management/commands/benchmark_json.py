@@ -0,0 +1,133 @@
+"""
+Management command to benchmark JSON serialization of large payloads.
+
+Times the project map and users directory payloads through DRF serializers
+and through the values() fast path, each rendered with the standard
+library JSONRenderer and with ORJSONRenderer. Reports the best of several
+runs against the current database.
+
+Usage:
+    python manage.py benchmark_json
+    python manage.py benchmark_json --repeat 10
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+from rest_framework.serializers import ModelSerializer
+
+from common.renderers import ORJSONRenderer
+from common.serializers import ValuesSerializerMixin
+from projects.models import Project
+from projects.serializers import ProjectSerializer
+from projects.services.project_service import ProjectService
+from users.models import User
+from users.serializers import TinyUserSerializer
+from users.services.user_service import UserService
+
+
+class MapProjectRowSerializer(ValuesSerializerMixin, ModelSerializer):
+    """Project columns of the map payload, without nested relations"""
+
+    class Meta:
+        model = Project
+        fields = [
+            "id",
+            "created_at",
+            "updated_at",
+            "kind",
+            "status",
+            "year",
+            "number",
+            "title",
+            "description",
+            "tagline",
+            "keywords",
+            "start_date",
+            "end_date",
+            "business_area",
+        ]
+
+
+class UserRowSerializer(ValuesSerializerMixin, ModelSerializer):
+    """Flat columns of the users directory payload"""
+
+    class Meta:
+        model = User
+        fields = [
+            "id",
+            "first_name",
+            "last_name",
+            "display_first_name",
+            "display_last_name",
+            "username",
+            "email",
+            "is_active",
+            "is_staff",
+            "is_superuser",
+        ]
+
+
+class Command(BaseCommand):
+    help = "Benchmark serializer and renderer paths for large JSON payloads"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Number of runs per measurement (the best is reported)",
+        )
+
+    def handle(self, *args, **options):
+        repeat = max(1, options["repeat"])
+        payloads = {
+            "map": (
+                lambda: ProjectSerializer(
+                    ProjectService.list_projects(user=None), many=True
+                ).data,
+                lambda: MapProjectRowSerializer.values_data(
+                    ProjectService.list_projects(user=None)
+                ),
+            ),
+            "users": (
+                lambda: TinyUserSerializer(UserService.list_users(), many=True).data,
+                lambda: UserRowSerializer.values_data(UserService.list_users()),
+            ),
+        }
+        renderers = {"json": JSONRenderer(), "orjson": ORJSONRenderer()}
+
+        self.stdout.write(
+            f"{'payload':<8} {'serializer':<10} {'rows':>6} {'serialize ms':>13} "
+            + " ".join(f"{name + ' ms':>10}" for name in renderers)
+            + f" {'bytes':>10}"
+        )
+        for payload_name, builders in payloads.items():
+            for path, build in zip(("drf", "values"), builders):
+                data, serialize_ms = self.best_of(repeat, build)
+                render_ms = []
+                for renderer in renderers.values():
+                    body, ms = self.best_of(repeat, lambda: renderer.render(data))
+                    render_ms.append(ms)
+                self.stdout.write(
+                    f"{payload_name:<8} {path:<10} {len(data):>6} {serialize_ms:>13.1f} "
+                    + " ".join(f"{ms:>10.1f}" for ms in render_ms)
+                    + f" {len(body):>10}"
+                )
+
+    @staticmethod
+    def best_of(repeat, func):
+        """
+        Run a function several times and keep the fastest
+
+        Returns:
+            Tuple of (last result, best time in milliseconds)
+        """
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = func()
+            elapsed = (time.perf_counter() - start) * 1000
+            best = elapsed if best is None else min(best, elapsed)
+        return result, best
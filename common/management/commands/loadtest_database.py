@@ -0,0 +1,146 @@
+"""
+Management command to compare database latency with and without pooling.
+
+Simulates concurrent requests against the default database. Each simulated
+request takes a connection, runs a query and gives the connection back the
+way Django does at the end of a request. Three setups are compared:
+
+    direct      CONN_MAX_AGE=0, a new connection per request
+    persistent  CONN_MAX_AGE>0, one connection kept per thread
+    pooled      psycopg pool (DATABASE_POOL_* settings)
+
+Latency is measured per request, including connection setup.
+
+Usage:
+    python manage.py loadtest_database
+    python manage.py loadtest_database --threads 16 --requests 200
+    python manage.py loadtest_database --modes direct pooled --query "SELECT 1"
+"""
+
+import statistics
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.backends.postgresql.base import DatabaseWrapper
+
+MODES = ("direct", "persistent", "pooled")
+
+
+class Command(BaseCommand):
+    help = "Compare query latency with and without database connection pooling"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--threads", type=int, default=8, help="Concurrent simulated clients"
+        )
+        parser.add_argument(
+            "--requests", type=int, default=100, help="Requests per thread"
+        )
+        parser.add_argument(
+            "--query",
+            default="SELECT id FROM users_user ORDER BY id LIMIT 10",
+            help="SQL run by each request",
+        )
+        parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            f"{'mode':<11} {'requests':>9} {'mean ms':>9} {'p50 ms':>9} "
+            f"{'p95 ms':>9} {'max ms':>9} {'req/s':>9}"
+        )
+        for mode in options["modes"]:
+            latencies, elapsed = self.run_mode(
+                mode, options["threads"], options["requests"], options["query"]
+            )
+            self.stdout.write(
+                f"{mode:<11} {len(latencies):>9} "
+                f"{statistics.fmean(latencies) * 1000:>9.2f} "
+                f"{percentile(latencies, 50) * 1000:>9.2f} "
+                f"{percentile(latencies, 95) * 1000:>9.2f} "
+                f"{max(latencies) * 1000:>9.2f} "
+                f"{len(latencies) / elapsed:>9.1f}"
+            )
+
+    def run_mode(self, mode, threads, requests, query):
+        """
+        Run the simulated requests for one connection setup
+
+        Returns:
+            Tuple of (list of request latencies in seconds, wall time)
+        """
+        settings_dict = self.settings_for(mode, threads)
+        alias = f"loadtest_{mode}"
+        latencies = []
+        errors = []
+        lock = threading.Lock()
+
+        def client():
+            # Django connections are per thread; pooled ones share the pool
+            database = DatabaseWrapper(settings_dict, alias)
+            timings = []
+            try:
+                for _ in range(requests):
+                    start = time.perf_counter()
+                    with database.cursor() as cursor:
+                        cursor.execute(query)
+                        cursor.fetchall()
+                    # What request_finished does with CONN_MAX_AGE
+                    database.close_if_unusable_or_obsolete()
+                    timings.append(time.perf_counter() - start)
+            except Exception as exc:
+                with lock:
+                    errors.append(exc)
+            finally:
+                database.close()
+            with lock:
+                latencies.extend(timings)
+
+        workers = [threading.Thread(target=client) for _ in range(threads)]
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - start
+
+        if mode == "pooled":
+            DatabaseWrapper(settings_dict, alias).close_pool()
+        if errors:
+            raise CommandError(f"{mode} run failed: {errors[0]}")
+        return latencies, elapsed
+
+    @staticmethod
+    def settings_for(mode, threads):
+        """Copy the default database settings for one connection setup"""
+        settings_dict = {
+            **connections["default"].settings_dict,
+            "CONN_MAX_AGE": 0,
+            "CONN_HEALTH_CHECKS": False,
+        }
+        options = {
+            key: value
+            for key, value in settings_dict.get("OPTIONS", {}).items()
+            if key != "pool"
+        }
+        if mode == "persistent":
+            settings_dict["CONN_MAX_AGE"] = 60
+        elif mode == "pooled":
+            settings_dict["CONN_HEALTH_CHECKS"] = True
+            options["pool"] = {
+                "min_size": settings.DATABASE_POOL_MIN_SIZE,
+                # Enough for every thread, so waiting is not measured
+                "max_size": max(settings.DATABASE_POOL_MAX_SIZE, threads),
+                "timeout": settings.DATABASE_POOL_TIMEOUT,
+            }
+        settings_dict["OPTIONS"] = options
+        return settings_dict
+
+
+def percentile(values, percent):
+    """Nearest-rank percentile of a list of numbers"""
+    ordered = sorted(values)
+    index = max(0, round(percent / 100 * len(ordered)) - 1)
+    return ordered[index]
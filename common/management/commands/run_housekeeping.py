@@ -0,0 +1,118 @@
+"""
+Management command to run the housekeeping jobs that are due.
+
+Jobs are registered in each app's jobs.py (see common.scheduler). Run it
+from cron every few minutes, or leave it running with --loop.
+
+Usage:
+    python manage.py run_housekeeping
+    python manage.py run_housekeeping --list
+    python manage.py run_housekeeping --job expire_caretakers --job prune_temp_files
+    python manage.py run_housekeeping --force
+    python manage.py run_housekeeping --loop --interval 60
+"""
+
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+from django.utils import timezone
+
+from common.models import JobRun
+from common.scheduler import get_jobs, is_cache_shared, run_due_jobs
+
+
+class Command(BaseCommand):
+    help = "Run due housekeeping jobs (expiry, derived data, temp files)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--job",
+            action="append",
+            dest="jobs",
+            metavar="NAME",
+            help="Run this job now, whether due or not (repeatable)",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Run every job now, whether due or not",
+        )
+        parser.add_argument(
+            "--list",
+            action="store_true",
+            help="Show each job with its last run and duration",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep running, checking for due jobs every --interval seconds",
+        )
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=settings.HOUSEKEEPING_INTERVAL,
+            help="Seconds between passes with --loop",
+        )
+
+    def handle(self, *args, **options):
+        jobs = get_jobs()
+        unknown = set(options["jobs"] or []) - set(jobs)
+        if unknown:
+            raise CommandError(f"Unknown jobs: {', '.join(sorted(unknown))}")
+
+        if options["list"]:
+            self.list_jobs(jobs)
+            return
+
+        selected = [jobs[name] for name in options["jobs"] or jobs]
+        cache_jobs = [job.name for job in selected if job.shared_cache]
+        if cache_jobs and not is_cache_shared():
+            self.stderr.write(
+                self.style.WARNING(
+                    "The default cache is process local (see CACHE_URL), so "
+                    f"these jobs are skipped: {', '.join(cache_jobs)}"
+                )
+            )
+
+        while True:
+            runs = run_due_jobs(
+                names=options["jobs"],
+                force=options["force"] or bool(options["jobs"]),
+            )
+            for run in runs:
+                style = (
+                    self.style.SUCCESS
+                    if run.last_status == JobRun.RunStatus.SUCCEEDED
+                    else self.style.ERROR
+                )
+                self.stdout.write(
+                    style(
+                        f"{run.name}: {run.last_status} in {run.last_duration_ms}ms "
+                        f"{run.last_error or run.last_result}"
+                    )
+                )
+            if not options["loop"]:
+                return
+            # Long running, so don't hold on to broken or stale connections
+            close_old_connections()
+            time.sleep(options["interval"])
+
+    def list_jobs(self, jobs):
+        runs = {run.name: run for run in JobRun.objects.filter(name__in=jobs)}
+        self.stdout.write(
+            f"{'job':<28} {'every':>10} {'last run':<20} {'status':<10} {'ms':>9}"
+        )
+        for name, scheduled in jobs.items():
+            run = runs.get(name)
+            started = (
+                timezone.localtime(run.last_started_at).strftime("%Y-%m-%d %H:%M:%S")
+                if run and run.last_started_at
+                else "never"
+            )
+            self.stdout.write(
+                f"{name:<28} {str(scheduled.interval):>10} {started:<20} "
+                f"{(run and run.last_status) or '-':<10} "
+                f"{(run and run.last_duration_ms) or '-':>9}"
+            )
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="JobRun",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("name", models.CharField(max_length=100, unique=True)),
+                ("last_started_at", models.DateTimeField(blank=True, null=True)),
+                ("last_finished_at", models.DateTimeField(blank=True, null=True)),
+                ("last_duration_ms", models.FloatField(blank=True, null=True)),
+                (
+                    "last_status",
+                    models.CharField(
+                        blank=True,
+                        choices=[("succeeded", "Succeeded"), ("failed", "Failed")],
+                        default="",
+                        max_length=20,
+                    ),
+                ),
+                ("last_result", models.JSONField(blank=True, null=True)),
+                ("last_error", models.TextField(blank=True, default="")),
+                ("last_succeeded_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "verbose_name": "Job Run",
+                "verbose_name_plural": "Job Runs",
+            },
+        ),
+    ]
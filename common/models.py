@@ -7,3 +7,30 @@ class CommonModel(models.Model):
 
     class Meta:
         abstract = True
+
+
+class JobRun(CommonModel):
+    """Last run of a housekeeping job (see common.scheduler)"""
+
+    class RunStatus(models.TextChoices):
+        SUCCEEDED = "succeeded", "Succeeded"
+        FAILED = "failed", "Failed"
+
+    name = models.CharField(max_length=100, unique=True)
+    last_started_at = models.DateTimeField(null=True, blank=True)
+    last_finished_at = models.DateTimeField(null=True, blank=True)
+    last_duration_ms = models.FloatField(null=True, blank=True)
+    last_status = models.CharField(
+        max_length=20, choices=RunStatus.choices, blank=True, default=""
+    )
+    last_result = models.JSONField(null=True, blank=True)
+    last_error = models.TextField(blank=True, default="")
+    # Start of the last successful run; jobs pick up changes since then
+    last_succeeded_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Job Run"
+        verbose_name_plural = "Job Runs"
+
+    def __str__(self):
+        return f"{self.name} ({self.last_status or 'never run'})"
@@ -0,0 +1,33 @@
+"""
+Fast JSON parsing for API requests
+"""
+
+import orjson
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from .renderers import ORJSONRenderer
+
+
+class ORJSONParser(JSONParser):
+    """
+    Drop-in JSONParser that decodes with orjson
+
+    orjson only reads UTF-8, which is what JSON bodies are required to be
+    (RFC 8259); other declared charsets go through the standard library.
+    """
+
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Parses the incoming bytestream as JSON and returns the resulting data.
+        """
+        encoding = (parser_context or {}).get("encoding", "utf-8")
+        if encoding.lower().replace("-", "") != "utf8":
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError("JSON parse error - %s" % str(exc))
@@ -25,7 +25,7 @@ class IsAdminUser(BasePermission):
         Returns:
             Boolean indicating if user is admin
         """
-        return request.user and request.user.is_superuser
+        return bool(request.user and request.user.is_superuser)
 
     def has_object_permission(self, request, view, obj):
         """
@@ -39,7 +39,7 @@ class IsAdminUser(BasePermission):
         Returns:
             Boolean indicating if user is admin
         """
-        return request.user and request.user.is_superuser
+        return bool(request.user and request.user.is_superuser)
 
 
 class IsOwnerOrAdmin(BasePermission):
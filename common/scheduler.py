@@ -0,0 +1,214 @@
+"""
+Housekeeping job scheduler.
+
+Apps register idempotent jobs in a ``jobs.py`` module, each with the
+interval it should run at:
+
+    from common.scheduler import job
+
+    @job("expire_caretakers", interval=timedelta(minutes=15))
+    def expire_caretakers(since):
+        ...
+        return {"expired": count}
+
+``since`` is the start of the job's last successful run (None on the first
+run), so a job can limit itself to what changed in between. Whatever the
+job returns is stored as its result.
+
+Jobs registered with ``shared_cache=True`` only clear or rebuild cached
+data. They reach the web workers through the shared default cache, so
+they are skipped when that cache is process local (CACHE_URL set to
+locmem:// or dummy://), where they would only touch the scheduler's own
+memory.
+
+Due jobs are run by the ``run_housekeeping`` management command, from
+cron or as a long running loop. The start, finish, duration and outcome
+of every run are recorded in JobRun. A PostgreSQL advisory lock stops
+two schedulers from running the same job at once.
+"""
+
+import time
+import zlib
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import connection, transaction
+from django.utils import timezone
+from django.utils.module_loading import autodiscover_modules
+
+from .models import JobRun
+
+_jobs = {}
+_discovered = False
+
+
+@dataclass(frozen=True)
+class Job:
+    name: str
+    func: object
+    interval: timedelta
+    description: str = ""
+    shared_cache: bool = False
+
+    def is_due(self, run, now):
+        """
+        Check whether the job should run
+
+        Args:
+            run: JobRun for the job, or None if it has never run
+            now: Current time
+
+        Returns:
+            Boolean
+        """
+        if run is None or run.last_started_at is None:
+            return True
+        return now - run.last_started_at >= self.interval
+
+
+def job(name, interval, shared_cache=False):
+    """
+    Register a function as a housekeeping job
+
+    Args:
+        name: Unique job name
+        interval: timedelta between runs
+        shared_cache: The job only works on the default cache, so it is
+            skipped when that cache is process local
+
+    Returns:
+        Decorator returning the function unchanged
+    """
+
+    def register(func):
+        description = (func.__doc__ or "").strip().splitlines()
+        _jobs[name] = Job(
+            name,
+            func,
+            interval,
+            description[0] if description else "",
+            shared_cache,
+        )
+        return func
+
+    return register
+
+
+def get_jobs():
+    """
+    Get every registered job, importing each app's jobs module first
+
+    Returns:
+        Dict of job name to Job, in name order
+    """
+    global _discovered
+    if not _discovered:
+        autodiscover_modules("jobs")
+        _discovered = True
+    return dict(sorted(_jobs.items()))
+
+
+def is_cache_shared():
+    """
+    Check whether the default cache is shared with other processes
+
+    Returns:
+        False for in-memory and dummy backends, True otherwise
+    """
+    return not isinstance(caches["default"], (LocMemCache, DummyCache))
+
+
+def run_due_jobs(names=None, force=False):
+    """
+    Run the jobs that are due
+
+    Jobs registered with shared_cache are skipped while the default cache
+    is process local.
+
+    Args:
+        names: Only consider these job names (default: all)
+        force: Run regardless of when the jobs last ran
+
+    Returns:
+        List of JobRun records for the jobs that ran
+    """
+    jobs = get_jobs()
+    if names:
+        jobs = {name: jobs[name] for name in names}
+
+    runs = {run.name: run for run in JobRun.objects.filter(name__in=jobs)}
+    now = timezone.now()
+    cache_shared = is_cache_shared()
+    results = []
+    for name, scheduled in jobs.items():
+        if scheduled.shared_cache and not cache_shared:
+            # Not recorded, so the job catches up once the cache is shared
+            settings.LOGGER.warning(
+                f"Job {name} skipped: the default cache is process local"
+            )
+            continue
+        if force or scheduled.is_due(runs.get(name), now):
+            run = run_job(scheduled)
+            if run is not None:
+                results.append(run)
+    return results
+
+
+def run_job(scheduled):
+    """
+    Run one job and record the outcome
+
+    Failures are logged and recorded rather than raised, so one broken job
+    does not stop the others.
+
+    Args:
+        scheduled: Job to run
+
+    Returns:
+        JobRun record, or None if another process is running the job
+    """
+    # Session level, so it is held across the job's own transactions
+    lock_id = zlib.crc32(f"housekeeping:{scheduled.name}".encode())
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_try_advisory_lock(%s)", [lock_id])
+        if not cursor.fetchone()[0]:
+            settings.LOGGER.info(f"Job {scheduled.name} is already running, skipped")
+            return None
+
+    try:
+        run, _ = JobRun.objects.get_or_create(name=scheduled.name)
+        started_at = timezone.now()
+        run.last_started_at = started_at
+        run.save(update_fields=["last_started_at", "updated_at"])
+
+        start = time.perf_counter()
+        try:
+            # A failed job leaves nothing half done
+            with transaction.atomic():
+                result = scheduled.func(since=run.last_succeeded_at)
+        except Exception as e:
+            settings.LOGGER.exception(f"Job {scheduled.name} failed")
+            run.last_status = JobRun.RunStatus.FAILED
+            run.last_error = str(e)
+            run.last_result = None
+        else:
+            run.last_status = JobRun.RunStatus.SUCCEEDED
+            run.last_error = ""
+            run.last_result = result
+            run.last_succeeded_at = started_at
+        run.last_duration_ms = round((time.perf_counter() - start) * 1000, 2)
+        run.last_finished_at = timezone.now()
+        run.save()
+
+        settings.LOGGER.info(
+            f"Job {scheduled.name} {run.last_status} in {run.last_duration_ms}ms: "
+            f"{run.last_error or run.last_result}"
+        )
+        return run
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_unlock(%s)", [lock_id])
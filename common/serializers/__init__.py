@@ -2,9 +2,10 @@
 Common serializer classes and mixins for DRY backend architecture
 """
 
-from .base import BaseModelSerializer, TimestampedSerializer
+from .base import BaseModelSerializer, TimestampedSerializer, ValuesSerializerMixin
 
 __all__ = [
     "BaseModelSerializer",
     "TimestampedSerializer",
+    "ValuesSerializerMixin",
 ]
@@ -2,6 +2,7 @@
 Base serializer classes for consistent data transformation
 """
 
+from django.core.exceptions import ImproperlyConfigured
 from rest_framework import serializers
 
 
@@ -41,3 +42,121 @@ class TimestampedSerializer(BaseModelSerializer):
 
     created_at = serializers.DateTimeField(read_only=True)
     updated_at = serializers.DateTimeField(read_only=True)
+
+
+class ValuesSerializerMixin:
+    """
+    Optional fast path for read-only list serializers
+
+    values_data() reads rows with QuerySet.values() and converts each column
+    the way the serializer's own field would, without building model
+    instances or walking attributes per field. Plain model fields and
+    foreign keys (rendered as primary keys) are supported; anything else
+    must be given as a query expression in ``Meta.values_fields``, whose
+    value is passed through unchanged.
+
+    Example:
+        class ProjectRowSerializer(ValuesSerializerMixin, ModelSerializer):
+            class Meta:
+                model = Project
+                fields = ["id", "title", "year", "business_area"]
+
+        data = ProjectRowSerializer.values_data(Project.objects.all())
+    """
+
+    # Fields whose representation of a database value is the value itself
+    PASSTHROUGH_FIELDS = (
+        serializers.BooleanField,
+        serializers.CharField,
+        serializers.ChoiceField,
+        serializers.FloatField,
+        serializers.IntegerField,
+        serializers.PrimaryKeyRelatedField,
+    )
+    # Fields that need a model instance or more than one column (primary
+    # key relations excepted)
+    UNSUPPORTED_FIELDS = (
+        serializers.BaseSerializer,
+        serializers.FileField,
+        serializers.ManyRelatedField,
+        serializers.RelatedField,
+    )
+
+    @classmethod
+    def values_data(cls, queryset):
+        """
+        Serialize a queryset through values()
+
+        Args:
+            queryset: QuerySet of the serializer's model
+
+        Returns:
+            List of dicts in the serializer's field order
+        """
+        columns, lookups, expressions = cls._get_values_plan()
+        rows = (
+            queryset.select_related(None)
+            .prefetch_related(None)
+            .values(*lookups, **expressions)
+        )
+        return [
+            {
+                name: (
+                    row[key]
+                    if convert is None or row[key] is None
+                    else convert(row[key])
+                )
+                for name, key, convert in columns
+            }
+            for row in rows
+        ]
+
+    @classmethod
+    def _get_values_plan(cls):
+        """
+        Work out the values() arguments and per-column converters once
+
+        Returns:
+            Tuple of ([(name, values key, converter or None)], lookups,
+            expressions)
+
+        Raises:
+            ImproperlyConfigured: If a field cannot be read from a column
+        """
+        plan = cls.__dict__.get("_values_plan")
+        if plan is not None:
+            return plan
+
+        values_fields = getattr(cls.Meta, "values_fields", {})
+        pk_name = cls.Meta.model._meta.pk.name
+        columns = []
+        lookups = []
+        expressions = {}
+        for name, field in cls().fields.items():
+            if field.write_only:
+                continue
+            if name in values_fields:
+                # Aliased, as annotations may not shadow model fields
+                key = f"values_{name}"
+                expressions[key] = values_fields[name]
+                columns.append((name, key, None))
+                continue
+
+            source = pk_name if field.source == "pk" else field.source
+            unsupported = isinstance(field, cls.UNSUPPORTED_FIELDS)
+            if isinstance(field, serializers.PrimaryKeyRelatedField):
+                unsupported = False
+            if source != name or unsupported:
+                raise ImproperlyConfigured(
+                    f"{cls.__name__}.{name} cannot be read with values(); "
+                    f"add an expression for it to Meta.values_fields"
+                )
+            lookups.append(name)
+            passthrough = isinstance(field, cls.PASSTHROUGH_FIELDS)
+            columns.append(
+                (name, name, None if passthrough else field.to_representation)
+            )
+
+        plan = (columns, lookups, expressions)
+        cls._values_plan = plan
+        return plan
@@ -6,11 +6,72 @@ Provides shared fixtures that can be used across all test files.
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.test import override_settings
 from rest_framework.test import APIClient
 
+from common.tests.test_helpers import StubServer
+from common.utils.http import reset_clients
+
 User = get_user_model()
 
 
+@pytest.fixture(autouse=True, scope="session")
+def process_caches():
+    """
+    Keep every cache in process for the test run.
+
+    The shared database cache would need database access in every test and
+    add its own queries to the query count assertions.
+    """
+    local = "django.core.cache.backends.locmem.LocMemCache"
+    with override_settings(
+        CACHES={
+            "default": {"BACKEND": local, "LOCATION": "test-default"},
+            "local": {"BACKEND": local, "LOCATION": "test-local"},
+        }
+    ):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def clear_cache(process_caches):
+    """
+    Start every test with an empty cache.
+
+    Rolled back rows never fire delete signals, so cached versions (and the
+    in-process snapshots keyed by them) would otherwise outlive their test.
+    """
+    for cache in caches.all():
+        cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_integration_clients():
+    """
+    Start every test with fresh integration clients.
+
+    Clients are shared per process, so an open circuit or pointed-at stub
+    server would otherwise carry over into later tests.
+    """
+    reset_clients()
+    yield
+    reset_clients()
+
+
+@pytest.fixture
+def stub_server():
+    """
+    Provide a local HTTP server for integration tests.
+
+    Returns:
+        StubServer: Running server, stopped after the test
+    """
+    server = StubServer().start()
+    yield server
+    server.stop()
+
+
 @pytest.fixture
 def api_client():
     """
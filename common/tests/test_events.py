@@ -0,0 +1,171 @@
+"""
+Tests for the post-commit domain event bus
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+
+import pytest
+from django.db import transaction
+
+from common import events
+from common.events import Event, deliver, flush, publish, subscribe
+
+
+@dataclass(frozen=True)
+class ThingHappened(Event):
+    value: int
+
+
+@dataclass(frozen=True)
+class SpecialThingHappened(ThingHappened):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def subscribers(monkeypatch):
+    """Give every test its own subscriber registry and worker"""
+    monkeypatch.setattr(events, "_subscribers", defaultdict(list))
+    monkeypatch.setattr(events, "_worker", None)
+
+
+@pytest.fixture
+def received():
+    """Subscribe to ThingHappened, recording each event"""
+    received = []
+
+    @subscribe(ThingHappened)
+    def record(event):
+        received.append(event.value)
+
+    return received
+
+
+class TestDeliver:
+    """Tests for calling subscribers"""
+
+    def test_calls_subscribers_in_order(self, received):
+        """Test each event reaches its subscribers in publish order"""
+        # Act
+        deliver([ThingHappened(1), ThingHappened(2)])
+
+        # Assert
+        assert received == [1, 2]
+
+    def test_subclass_events_reach_base_subscribers(self, received):
+        """Test subscribers receive subclasses of their event type"""
+        # Act
+        deliver([SpecialThingHappened(3)])
+
+        # Assert
+        assert received == [3]
+
+    def test_batch_subscriber_called_once(self):
+        """Test batch subscribers get every event in one call"""
+        # Arrange
+        calls = []
+
+        @subscribe(ThingHappened, batch=True)
+        def record(batch):
+            calls.append([event.value for event in batch])
+
+        # Act
+        deliver([ThingHappened(1), SpecialThingHappened(2)])
+
+        # Assert
+        assert calls == [[1, 2]]
+
+    def test_failing_subscriber_does_not_stop_others(self, received):
+        """Test a subscriber error is logged and not raised"""
+
+        # Arrange
+        @subscribe(ThingHappened)
+        def broken(event):
+            raise RuntimeError("SMTP down")
+
+        # Act
+        deliver([ThingHappened(1)])
+
+        # Assert
+        assert received == [1]
+
+
+class TestPublish:
+    """Tests for post-commit delivery"""
+
+    def test_delivered_after_commit(
+        self, received, settings, django_capture_on_commit_callbacks, db
+    ):
+        """Test events wait for the transaction to commit"""
+        # Arrange
+        settings.EVENT_DELIVERY = "sync"
+
+        # Act
+        with django_capture_on_commit_callbacks() as callbacks:
+            publish(ThingHappened(1))
+        before_commit = list(received)
+        for callback in callbacks:
+            callback()
+
+        # Assert
+        assert before_commit == []
+        assert received == [1]
+
+    def test_dropped_on_rollback(
+        self, received, settings, django_capture_on_commit_callbacks, db
+    ):
+        """Test events from a rolled back transaction are never delivered"""
+        # Arrange
+        settings.EVENT_DELIVERY = "sync"
+
+        # Act
+        with django_capture_on_commit_callbacks(execute=True):
+            with pytest.raises(RuntimeError):
+                with transaction.atomic():
+                    publish(ThingHappened(1))
+                    raise RuntimeError("rolled back")
+
+        # Assert
+        assert received == []
+
+    def test_queued_delivery(self, received, settings, transactional_db):
+        """Test queued events are delivered by the background worker"""
+        # Arrange
+        settings.EVENT_DELIVERY = "queued"
+
+        # Act
+        publish(ThingHappened(1))
+        publish(ThingHappened(2))
+        drained = flush(timeout=5)
+
+        # Assert
+        assert drained is True
+        assert received == [1, 2]
+
+    def test_batched_delivery(self, settings, transactional_db):
+        """Test batched events reach batch subscribers together"""
+        # Arrange
+        settings.EVENT_DELIVERY = "batched"
+        settings.EVENT_BATCH_WINDOW = 0.2
+        calls = []
+
+        @subscribe(ThingHappened, batch=True)
+        def record(batch):
+            calls.append([event.value for event in batch])
+
+        # Act
+        for value in range(3):
+            publish(ThingHappened(value))
+        flush(timeout=5)
+
+        # Assert
+        assert calls == [[0, 1, 2]]
+
+    def test_unknown_delivery_mode(self, received, settings, transactional_db):
+        """Test a misconfigured delivery mode is reported"""
+        # Arrange
+        settings.EVENT_DELIVERY = "carrier-pigeon"
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            publish(ThingHappened(1))
@@ -4,6 +4,16 @@ Test helper utilities for DRY test writing.
 Provides utilities to reduce repetition in view tests.
 """
 
+import json
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from config.query_budget import get_query_budget, track_queries
+
 
 def api_url(app_name: str, path: str = "", versioned: bool = True) -> str:
     """
@@ -170,3 +180,134 @@ medias_urls = APIUrlBuilder("medias")
 projects_urls = APIUrlBuilder("projects")
 quotes_urls = APIUrlBuilder("quotes")
 users_urls = APIUrlBuilder("users")
+
+
+def response_json(response):
+    """
+    Decode a JSON response body, consuming it if it is streamed.
+
+    Args:
+        response: Test client response (plain or streaming)
+
+    Returns:
+        Decoded JSON data
+
+    Examples:
+        >>> response = api_client.get(medias_urls.path("project_photos"))
+        >>> response_json(response)
+        [{'id': 1, ...}]
+    """
+    if response.streaming:
+        return json.loads(b"".join(response.streaming_content))
+    return json.loads(response.content)
+
+
+@contextmanager
+def assert_query_budget(view_class=None, method="GET", max_queries=None):
+    """
+    Fail the test if the enclosed block runs more queries than allowed.
+
+    The limit is taken from ``max_queries`` or from the view's declared
+    ``query_budget`` for the given method.
+
+    Args:
+        view_class: View class declaring a query_budget (optional)
+        method: HTTP method used to look up a per-method budget
+        max_queries: Explicit query limit (overrides the view budget)
+
+    Yields:
+        QueryMetrics collected for the block
+
+    Examples:
+        >>> with assert_query_budget(Projects, "GET"):
+        ...     api_client.get(projects_urls.list())
+    """
+    budget = max_queries
+    if budget is None:
+        budget = get_query_budget(view_class, method)
+    if budget is None:
+        pytest.fail(f"{view_class} declares no query budget for {method}")
+
+    with track_queries() as metrics:
+        yield metrics
+
+    if metrics.query_count > budget:
+        duplicated = "\n".join(
+            f"  {count}x {sql}" for sql, count in metrics.most_duplicated()
+        )
+        pytest.fail(
+            f"Query budget exceeded: {metrics.query_count} queries "
+            f"(budget {budget}, {metrics.duplicate_queries} duplicates)\n"
+            f"{duplicated}"
+        )
+
+
+class StubServer:
+    """
+    Local HTTP server standing in for an upstream integration.
+
+    Replies are queued as (status, body) pairs or (status, body, delay)
+    triples; once the queue is empty every request gets ``default``. Each
+    request is recorded as (method, path, client port), so tests can check
+    retries and connection reuse.
+
+    Examples:
+        >>> stub_server.replies.extend([(503, b""), (200, b"[]")])
+        >>> get_client("it_assets").get(stub_server.url("/users/"))
+        <Response [200]>
+    """
+
+    def __init__(self):
+        self.replies = []
+        self.default = (200, b"[]")
+        self.requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def handle_one_request(self):
+                # Unlike do_GET, runs for any method
+                try:
+                    super().handle_one_request()
+                except ConnectionError:
+                    self.close_connection = True
+
+            def do_GET(self):
+                stub._reply(self)
+
+            do_POST = do_GET
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+
+    def _reply(self, handler):
+        self.requests.append((handler.command, handler.path, handler.client_address[1]))
+        length = int(handler.headers.get("Content-Length") or 0)
+        if length:
+            handler.rfile.read(length)
+        status, body, *delay = self.replies.pop(0) if self.replies else self.default
+        if delay:
+            time.sleep(delay[0])
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def url(self, path=""):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}{path}"
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
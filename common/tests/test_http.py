@@ -0,0 +1,175 @@
+"""
+Tests for pooled integration clients
+"""
+
+import pytest
+import requests
+
+from common.utils.http import (
+    CircuitBreaker,
+    CircuitOpenError,
+    IntegrationClient,
+    get_client,
+    get_client_stats,
+)
+
+
+@pytest.fixture
+def client():
+    """Client with fast retries and a low failure threshold"""
+    client = IntegrationClient(
+        "stub", retries=2, backoff=0.001, failure_threshold=3, reset_timeout=60
+    )
+    yield client
+    client.session.close()
+
+
+class TestIntegrationClient:
+    """Tests for IntegrationClient against a local stub server"""
+
+    def test_reuses_connections(self, client, stub_server):
+        """Test consecutive requests share one keep-alive connection"""
+        # Act
+        responses = [client.get(stub_server.url("/users/")) for _ in range(3)]
+
+        # Assert
+        assert [response.status_code for response in responses] == [200] * 3
+        assert len({port for _, _, port in stub_server.requests}) == 1
+
+    def test_retries_unavailable_upstream(self, client, stub_server):
+        """Test 503 replies are retried until the upstream recovers"""
+        # Arrange
+        stub_server.replies.extend([(503, b""), (503, b""), (200, b'{"ok": true}')])
+
+        # Act
+        response = client.get(stub_server.url("/users/"))
+
+        # Assert
+        assert response.json() == {"ok": True}
+        assert len(stub_server.requests) == 3
+        assert client.stats()["retries"] == 2
+
+    def test_returns_last_response_when_retries_run_out(self, client, stub_server):
+        """Test the final failing response is returned to the caller"""
+        # Arrange
+        stub_server.default = (503, b"down")
+
+        # Act
+        response = client.get(stub_server.url("/users/"))
+
+        # Assert
+        assert response.status_code == 503
+        assert len(stub_server.requests) == 3
+
+    def test_does_not_retry_post(self, client, stub_server):
+        """Test non-idempotent requests are sent once"""
+        # Arrange
+        stub_server.replies.append((503, b""))
+
+        # Act
+        response = client.post(stub_server.url("/users/"), json={"a": 1})
+
+        # Assert
+        assert response.status_code == 503
+        assert len(stub_server.requests) == 1
+
+    def test_client_errors_not_retried(self, client, stub_server):
+        """Test 4xx replies are returned without retrying or failing"""
+        # Arrange
+        stub_server.replies.append((404, b""))
+
+        # Act
+        response = client.get(stub_server.url("/users/"))
+
+        # Assert
+        assert response.status_code == 404
+        assert len(stub_server.requests) == 1
+        assert client.stats()["errors"] == 0
+
+    def test_timeout_raises_after_retries(self, client, stub_server):
+        """Test a slow upstream raises Timeout once retries are used up"""
+        # Arrange
+        stub_server.default = (200, b"[]", 0.5)
+
+        # Act & Assert
+        with pytest.raises(requests.Timeout):
+            client.get(stub_server.url("/users/"), timeout=0.1, retries=1)
+        assert client.stats()["errors"] == 2
+
+    def test_circuit_opens_after_repeated_failures(self, client, stub_server):
+        """Test calls fail fast without reaching a failing upstream"""
+        # Arrange
+        stub_server.default = (500, b"error")
+        client.get(stub_server.url("/users/"))
+        client.get(stub_server.url("/users/"))
+        client.get(stub_server.url("/users/"))
+        calls = len(stub_server.requests)
+
+        # Act & Assert
+        with pytest.raises(CircuitOpenError):
+            client.get(stub_server.url("/users/"))
+        assert len(stub_server.requests) == calls
+        assert client.stats()["circuit"] == CircuitBreaker.OPEN
+        assert client.stats()["rejected"] == 1
+
+    def test_circuit_closes_after_successful_trial(self, client, stub_server):
+        """Test one trial call is let through once the reset timeout passes"""
+        # Arrange
+        client.breaker.reset_timeout = 0
+        for _ in range(3):
+            client.breaker.record_failure()
+
+        # Act
+        response = client.get(stub_server.url("/users/"))
+
+        # Assert
+        assert response.status_code == 200
+        assert client.stats()["circuit"] == CircuitBreaker.CLOSED
+
+    def test_unreachable_upstream_raises_connection_error(self, client):
+        """Test connection failures surface as requests exceptions"""
+        # Act & Assert
+        with pytest.raises(requests.ConnectionError):
+            client.get("http://127.0.0.1:9/users/", retries=0)
+
+    def test_metrics(self, client, stub_server):
+        """Test latency and error rate are recorded per request"""
+        # Arrange
+        stub_server.replies.extend([(200, b"[]"), (500, b"")])
+
+        # Act
+        client.get(stub_server.url("/users/"))
+        client.post(stub_server.url("/users/"))
+        stats = client.stats()
+
+        # Assert
+        assert stats["requests"] == 2
+        assert stats["errors"] == 1
+        assert stats["error_rate"] == 0.5
+        assert stats["max_ms"] >= stats["avg_ms"] > 0
+
+
+class TestGetClient:
+    """Tests for the shared client registry"""
+
+    def test_returns_shared_client(self):
+        """Test one client is created per integration name"""
+        # Act
+        first = get_client("it_assets")
+        second = get_client("it_assets")
+
+        # Assert
+        assert first is second
+        assert get_client("library") is not first
+
+    def test_client_stats(self):
+        """Test stats are reported for every created client"""
+        # Arrange
+        get_client("it_assets")
+
+        # Act
+        stats = get_client_stats()
+
+        # Assert
+        assert stats["it_assets"]["requests"] == 0
+        assert stats["it_assets"]["circuit"] == CircuitBreaker.CLOSED
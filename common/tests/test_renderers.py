@@ -0,0 +1,159 @@
+"""
+Tests for common renderers and parsers
+"""
+
+import datetime
+import io
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+from django.core.management import call_command
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from common.parsers import ORJSONParser
+from common.renderers import ORJSONRenderer
+
+
+class TestORJSONRenderer:
+    """Tests for ORJSONRenderer"""
+
+    def test_matches_json_renderer_for_django_types(self):
+        """Test output is byte-for-byte what JSONRenderer gives"""
+        # Arrange
+        data = {
+            "datetime": datetime.datetime(
+                2024, 3, 1, 8, 30, 15, 123456, tzinfo=datetime.timezone.utc
+            ),
+            "naive": datetime.datetime(2024, 3, 1, 8, 30),
+            "date": datetime.date(2024, 3, 1),
+            "time": datetime.time(8, 30),
+            "decimal": Decimal("12.50"),
+            "uuid": UUID("12345678-1234-5678-1234-567812345678"),
+            "lazy": gettext_lazy("Project"),
+            "text": "Line break  – ünïcode",
+            "nested": [{1: True, 2: None}, 1.5, (1, 2)],
+        }
+
+        # Act
+        expected = JSONRenderer().render(data)
+        result = ORJSONRenderer().render(data)
+
+        # Assert
+        assert result == expected
+
+    def test_render_none_returns_empty_bytes(self):
+        """Test None renders as an empty body"""
+        # Act
+        result = ORJSONRenderer().render(None)
+
+        # Assert
+        assert result == b""
+
+    def test_indented_output_falls_back(self):
+        """Test indent requests are rendered by the standard library"""
+        # Arrange
+        data = {"a": [1, 2]}
+        media_type = "application/json; indent=2"
+
+        # Act
+        result = ORJSONRenderer().render(data, media_type)
+
+        # Assert
+        assert result == JSONRenderer().render(data, media_type)
+        assert b"\n" in result
+
+    def test_big_integers_fall_back(self):
+        """Test values orjson cannot encode still render"""
+        # Arrange
+        data = {"big": 2**70}
+
+        # Act
+        result = ORJSONRenderer().render(data)
+
+        # Assert
+        assert result == JSONRenderer().render(data)
+
+
+class TestORJSONParser:
+    """Tests for ORJSONParser"""
+
+    def test_parses_utf8_body(self):
+        """Test a UTF-8 body parses the same as with JSONParser"""
+        # Arrange
+        body = '{"title": "Über", "ids": [1, 2], "ok": true}'.encode()
+
+        # Act
+        result = ORJSONParser().parse(io.BytesIO(body))
+
+        # Assert
+        assert result == JSONParser().parse(io.BytesIO(body))
+
+    def test_invalid_body_raises_parse_error(self):
+        """Test malformed JSON raises ParseError"""
+        # Act & Assert
+        with pytest.raises(ParseError):
+            ORJSONParser().parse(io.BytesIO(b'{"title": '))
+
+    def test_other_encodings_fall_back(self):
+        """Test non UTF-8 bodies are decoded by JSONParser"""
+        # Arrange
+        body = '{"title": "Über"}'.encode("latin-1")
+
+        # Act
+        result = ORJSONParser().parse(
+            io.BytesIO(body), parser_context={"encoding": "latin-1"}
+        )
+
+        # Assert
+        assert result == {"title": "Über"}
+
+    def test_api_views_use_orjson_parser(self):
+        """Test API views parse JSON bodies with the configured parser"""
+
+        # Arrange
+        class EchoView(APIView):
+            permission_classes = []
+
+            def post(self, request):
+                return Response(request.data)
+
+        request = APIRequestFactory().post(
+            "/echo", data=b"{not json", content_type="application/json"
+        )
+
+        # Act
+        view = EchoView()
+        response = EchoView.as_view()(request)
+
+        # Assert
+        assert isinstance(view.get_parsers()[0], ORJSONParser)
+        assert response.status_code == 400
+
+
+class TestBenchmarkJSONCommand:
+    """Tests for the benchmark_json management command"""
+
+    def test_reports_each_payload_and_path(self, user, db):
+        """Test the command prints a row per payload and serializer path"""
+        # Arrange
+        out = io.StringIO()
+
+        # Act
+        call_command("benchmark_json", "--repeat", "1", stdout=out)
+
+        # Assert
+        lines = out.getvalue().splitlines()
+        assert lines[0].split()[:2] == ["payload", "serializer"]
+        assert [line.split()[:2] for line in lines[1:]] == [
+            ["map", "drf"],
+            ["map", "values"],
+            ["users", "drf"],
+            ["users", "values"],
+        ]
@@ -0,0 +1,293 @@
+"""
+Tests for the housekeeping job scheduler
+"""
+
+import io
+import os
+import tempfile
+import time
+from datetime import timedelta
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.utils import timezone
+
+from common import scheduler
+from common.jobs import prune_temp_files
+from common.models import JobRun
+from common.scheduler import Job, get_jobs, job, run_due_jobs, run_job
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Register a test job, recording the since value of each call"""
+    calls = []
+    monkeypatch.setitem(scheduler._jobs, "test_job", None)
+
+    @job("test_job", interval=timedelta(hours=1))
+    def test_job(since):
+        """Record the call"""
+        calls.append(since)
+        return {"calls": len(calls)}
+
+    return calls
+
+
+@pytest.fixture
+def cache_calls(monkeypatch):
+    """Register a test job that only works on the shared cache"""
+    calls = []
+    monkeypatch.setitem(scheduler._jobs, "cache_job", None)
+
+    @job("cache_job", interval=timedelta(hours=1), shared_cache=True)
+    def cache_job(since):
+        """Record the call"""
+        calls.append(since)
+
+    return calls
+
+
+@pytest.fixture
+def failing_job(monkeypatch):
+    """Register a job that always raises"""
+    monkeypatch.setitem(scheduler._jobs, "failing_job", None)
+
+    @job("failing_job", interval=timedelta(hours=1))
+    def failing_job(since):
+        JobRun.objects.create(name="written_before_failure")
+        raise RuntimeError("upstream unavailable")
+
+    return scheduler._jobs["failing_job"]
+
+
+class TestRegistration:
+    """Tests for job registration and discovery"""
+
+    def test_discovers_app_jobs(self):
+        """Test jobs modules of installed apps are imported"""
+        # Act
+        jobs = get_jobs()
+
+        # Assert
+        assert {
+            "collect_content_blobs",
+            "expire_caretaker_requests",
+            "expire_caretakers",
+            "prune_temp_files",
+            "refresh_project_health",
+        } <= set(jobs)
+
+    def test_description_from_docstring(self, calls):
+        """Test the first docstring line describes the job"""
+        # Act
+        registered = get_jobs()["test_job"]
+
+        # Assert
+        assert registered.description == "Record the call"
+        assert registered.interval == timedelta(hours=1)
+
+    def test_is_due(self):
+        """Test a job is due when never run or its interval has passed"""
+        # Arrange
+        scheduled = Job("due", lambda since: None, timedelta(minutes=15))
+        now = timezone.now()
+
+        # Act & Assert
+        assert scheduled.is_due(None, now)
+        assert scheduled.is_due(JobRun(name="due"), now)
+        assert scheduled.is_due(
+            JobRun(name="due", last_started_at=now - timedelta(minutes=15)), now
+        )
+        assert not scheduled.is_due(
+            JobRun(name="due", last_started_at=now - timedelta(minutes=5)), now
+        )
+
+
+class TestRunJob:
+    """Tests for running jobs and recording their runs"""
+
+    def test_records_successful_run(self, calls, db):
+        """Test start, duration, status and result are stored"""
+        # Act
+        run = run_job(get_jobs()["test_job"])
+
+        # Assert
+        run.refresh_from_db()
+        assert run.last_status == JobRun.RunStatus.SUCCEEDED
+        assert run.last_result == {"calls": 1}
+        assert run.last_duration_ms >= 0
+        assert run.last_finished_at >= run.last_started_at
+        assert run.last_succeeded_at == run.last_started_at
+        assert calls == [None]
+
+    def test_passes_last_success_as_since(self, calls, db):
+        """Test a job is told when it last succeeded"""
+        # Arrange
+        first = run_job(get_jobs()["test_job"])
+
+        # Act
+        run_job(get_jobs()["test_job"])
+
+        # Assert
+        assert calls == [None, first.last_started_at]
+
+    def test_records_failure(self, failing_job, db):
+        """Test failures are stored, not raised, and their writes rolled back"""
+        # Act
+        run = run_job(failing_job)
+
+        # Assert
+        run.refresh_from_db()
+        assert run.last_status == JobRun.RunStatus.FAILED
+        assert run.last_error == "upstream unavailable"
+        assert run.last_succeeded_at is None
+        assert not JobRun.objects.filter(name="written_before_failure").exists()
+
+    def test_runs_only_due_jobs(self, calls, db):
+        """Test jobs are skipped until their interval has passed"""
+        # Arrange
+        run_due_jobs(names=["test_job"])
+
+        # Act
+        runs = run_due_jobs(names=["test_job"])
+        forced = run_due_jobs(names=["test_job"], force=True)
+
+        # Assert
+        assert runs == []
+        assert [run.name for run in forced] == ["test_job"]
+        assert len(calls) == 2
+
+    def test_skips_cache_jobs_without_shared_cache(self, cache_calls, db):
+        """Test cache jobs are not run or recorded with a process local cache"""
+        # Act
+        runs = run_due_jobs(names=["cache_job"], force=True)
+
+        # Assert
+        assert runs == []
+        assert cache_calls == []
+        assert not JobRun.objects.filter(name="cache_job").exists()
+
+    def test_runs_cache_jobs_with_shared_cache(self, cache_calls, monkeypatch, db):
+        """Test cache jobs run when the default cache is shared"""
+        # Arrange
+        monkeypatch.setattr(scheduler, "is_cache_shared", lambda: True)
+
+        # Act
+        runs = run_due_jobs(names=["cache_job"])
+
+        # Assert
+        assert [run.name for run in runs] == ["cache_job"]
+        assert cache_calls == [None]
+
+    @pytest.mark.parametrize(
+        "backend, shared",
+        [
+            ("django.core.cache.backends.locmem.LocMemCache", False),
+            ("django.core.cache.backends.dummy.DummyCache", False),
+            ("django.core.cache.backends.filebased.FileBasedCache", True),
+        ],
+    )
+    def test_is_cache_shared(self, backend, shared, settings, tmp_path):
+        """Test in-memory and dummy caches are treated as process local"""
+        # Arrange
+        settings.CACHES = {
+            **settings.CACHES,
+            "default": {"BACKEND": backend, "LOCATION": str(tmp_path)},
+        }
+
+        # Act & Assert
+        assert scheduler.is_cache_shared() is shared
+
+    def test_cache_jobs_are_marked(self):
+        """Test the jobs that only clear or rebuild cached data are marked"""
+        # Act
+        jobs = get_jobs()
+
+        # Assert
+        assert jobs["expire_caretakers"].shared_cache
+        assert jobs["refresh_project_health"].shared_cache
+        assert not jobs["expire_caretaker_requests"].shared_cache
+
+
+class TestPruneTempFiles:
+    """Tests for the prune_temp_files job"""
+
+    def test_deletes_only_stale_app_files(self, settings):
+        """Test old prefixed temp files are removed and others kept"""
+        # Arrange
+        settings.TEMP_FILE_PREFIX = "spms-test-"
+        settings.TEMP_FILE_MAX_AGE = 60
+        paths = {}
+        for name, prefix, age in [
+            ("stale", "spms-test-", 120),
+            ("fresh", "spms-test-", 0),
+            ("other", "other-test-", 120),
+        ]:
+            handle, paths[name] = tempfile.mkstemp(prefix=prefix)
+            os.close(handle)
+            mtime = time.time() - age
+            os.utime(paths[name], (mtime, mtime))
+
+        # Act
+        try:
+            result = prune_temp_files(since=None)
+            exists = {name: os.path.exists(path) for name, path in paths.items()}
+        finally:
+            for path in paths.values():
+                if os.path.exists(path):
+                    os.remove(path)
+
+        # Assert
+        assert result["deleted"] == 1
+        assert exists == {"stale": False, "fresh": True, "other": True}
+
+
+class TestRunHousekeepingCommand:
+    """Tests for the run_housekeeping management command"""
+
+    def test_runs_named_job(self, calls, db):
+        """Test --job runs the job even when not due"""
+        # Arrange
+        out = io.StringIO()
+        run_job(get_jobs()["test_job"])
+
+        # Act
+        call_command("run_housekeeping", "--job", "test_job", stdout=out)
+
+        # Assert
+        assert len(calls) == 2
+        assert "test_job: succeeded" in out.getvalue()
+
+    def test_lists_jobs(self, calls, db):
+        """Test --list shows each job's last run"""
+        # Arrange
+        out = io.StringIO()
+        run_job(get_jobs()["test_job"])
+
+        # Act
+        call_command("run_housekeeping", "--list", stdout=out)
+
+        # Assert
+        rows = {line.split()[0]: line.split() for line in out.getvalue().splitlines()}
+        assert "succeeded" in rows["test_job"]
+        assert "never" in rows["prune_temp_files"]
+        assert calls == [None]
+
+    def test_warns_when_cache_jobs_are_skipped(self, cache_calls, db):
+        """Test the skipped cache jobs are named on stderr"""
+        # Arrange
+        out = io.StringIO()
+        err = io.StringIO()
+
+        # Act
+        call_command("run_housekeeping", "--job", "cache_job", stdout=out, stderr=err)
+
+        # Assert
+        assert "cache_job" in err.getvalue()
+        assert cache_calls == []
+
+    def test_unknown_job(self, db):
+        """Test an unknown job name is rejected"""
+        # Act & Assert
+        with pytest.raises(CommandError):
+            call_command("run_housekeeping", "--job", "missing")
@@ -4,7 +4,6 @@ Tests for common serializer mixins
 
 from unittest.mock import Mock
 
-import pytest
 from rest_framework import serializers
 
 from common.utils.mixins import ProjectTeamMemberMixin, TeamMemberMixin
@@ -13,7 +12,9 @@ from common.utils.mixins import ProjectTeamMemberMixin, TeamMemberMixin
 class TestTeamMemberMixin:
     """Tests for TeamMemberMixin"""
 
-    def test_get_team_members_with_prefetched_cache(self, db):
+    def test_get_team_members_with_prefetched_cache(
+        self, db, django_assert_num_queries
+    ):
         """Test get_team_members with prefetched cache"""
 
         # Arrange
@@ -33,9 +34,11 @@ class TestTeamMemberMixin:
         serializer = TestSerializer()
 
         # Act
-        with pytest.raises(AttributeError):
-            # This will fail because we're mocking, but it tests the prefetch path
-            serializer.get_team_members(mock_obj)
+        with django_assert_num_queries(0):
+            result = serializer.get_team_members(mock_obj)
+
+        # Assert
+        assert result == []
 
     def test_get_team_members_without_prefetch(self, db):
         """Test get_team_members without prefetched cache"""
@@ -46,7 +49,7 @@ class TestTeamMemberMixin:
 
         # Create real objects
         user = UserFactory()
-        project = ProjectFactory()
+        project = ProjectFactory(members=[])
         ProjectMember.objects.create(project=project, user=user, is_leader=True)
 
         # Create document
@@ -77,7 +80,7 @@ class TestTeamMemberMixin:
         from projects.models import ProjectMember
 
         user = UserFactory()
-        project = ProjectFactory()
+        project = ProjectFactory(members=[])
         ProjectMember.objects.create(project=project, user=user, is_leader=True)
 
         document = ProjectDocument.objects.create(
@@ -104,7 +107,9 @@ class TestTeamMemberMixin:
 class TestProjectTeamMemberMixin:
     """Tests for ProjectTeamMemberMixin"""
 
-    def test_get_team_members_with_prefetched_cache(self, db):
+    def test_get_team_members_with_prefetched_cache(
+        self, db, django_assert_num_queries
+    ):
         """Test get_team_members with prefetched cache"""
 
         # Arrange
@@ -119,9 +124,11 @@ class TestProjectTeamMemberMixin:
         serializer = TestSerializer()
 
         # Act
-        with pytest.raises(AttributeError):
-            # This will fail because we're mocking, but it tests the prefetch path
-            serializer.get_team_members(mock_project)
+        with django_assert_num_queries(0):
+            result = serializer.get_team_members(mock_project)
+
+        # Assert
+        assert result == []
 
     def test_get_team_members_without_prefetch(self, db):
         """Test get_team_members without prefetched cache"""
@@ -131,7 +138,7 @@ class TestProjectTeamMemberMixin:
 
         # Create real objects
         user = UserFactory()
-        project = ProjectFactory()
+        project = ProjectFactory(members=[])
         ProjectMember.objects.create(project=project, user=user, is_leader=True)
 
         class TestSerializer(ProjectTeamMemberMixin, serializers.Serializer):
@@ -153,7 +160,7 @@ class TestProjectTeamMemberMixin:
         from projects.models import ProjectMember
 
         user = UserFactory()
-        project = ProjectFactory()
+        project = ProjectFactory(members=[])
         ProjectMember.objects.create(project=project, user=user, is_leader=True)
 
         class TestSerializer(ProjectTeamMemberMixin, serializers.Serializer):
@@ -175,7 +182,7 @@ class TestProjectTeamMemberMixin:
         from common.tests.factories import ProjectFactory, UserFactory
         from projects.models import ProjectMember
 
-        project = ProjectFactory()
+        project = ProjectFactory(members=[])
         users = [UserFactory() for _ in range(3)]
 
         for user in users:
@@ -198,7 +205,7 @@ class TestProjectTeamMemberMixin:
         # Arrange
         from common.tests.factories import ProjectFactory
 
-        project = ProjectFactory()
+        project = ProjectFactory(members=[])
 
         class TestSerializer(ProjectTeamMemberMixin, serializers.Serializer):
             pass
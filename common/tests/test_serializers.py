@@ -2,9 +2,19 @@
 Tests for common serializer classes
 """
 
+import pytest
 from django.contrib.auth import get_user_model
-
-from common.serializers.base import BaseModelSerializer, TimestampedSerializer
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Value
+from django.db.models.functions import Concat
+from rest_framework import serializers
+from rest_framework.serializers import ModelSerializer
+
+from common.serializers.base import (
+    BaseModelSerializer,
+    TimestampedSerializer,
+    ValuesSerializerMixin,
+)
 
 User = get_user_model()
 
@@ -149,17 +159,21 @@ class TestTimestampedSerializer:
         # Assert
         assert serializer.fields["updated_at"].read_only is True
 
-    def test_serialization_includes_timestamps(self, user, db):
+    def test_serialization_includes_timestamps(self, db):
         """Test serialization includes timestamp fields"""
-
         # Arrange
+        from common.tests.factories import ProjectFactory
+        from projects.models import Project
+
+        project = ProjectFactory()
+
         class TestSerializer(TimestampedSerializer):
             class Meta:
-                model = User
-                fields = ["id", "username", "created_at", "updated_at"]
+                model = Project
+                fields = ["id", "title", "created_at", "updated_at"]
 
         # Act
-        serializer = TestSerializer(user)
+        serializer = TestSerializer(project)
 
         # Assert
         assert "created_at" in serializer.data
@@ -208,3 +222,80 @@ class TestTimestampedSerializer:
         # Should inherit pk → id replacement from BaseModelSerializer
         assert "id" in serializer.Meta.fields
         assert "pk" not in serializer.Meta.fields
+
+
+class TestValuesSerializerMixin:
+    """Tests for ValuesSerializerMixin"""
+
+    def test_values_data_matches_serializer_data(self, user, superuser, db):
+        """Test the values() path gives the same output as the serializer"""
+
+        # Arrange
+        class UserRowSerializer(ValuesSerializerMixin, ModelSerializer):
+            class Meta:
+                model = User
+                fields = ["id", "username", "email", "is_staff", "date_joined"]
+
+        users = User.objects.order_by("pk")
+
+        # Act
+        result = UserRowSerializer.values_data(users)
+
+        # Assert
+        assert result == UserRowSerializer(users, many=True).data
+        assert isinstance(result[0]["date_joined"], str)
+
+    def test_values_data_renders_foreign_keys_as_pk(self, db):
+        """Test primary key relations read the id column"""
+        # Arrange
+        from common.tests.factories import ProjectFactory
+        from projects.models import Project
+
+        class ProjectRowSerializer(ValuesSerializerMixin, ModelSerializer):
+            class Meta:
+                model = Project
+                fields = ["id", "title", "business_area", "start_date"]
+
+        ProjectFactory()
+        projects = Project.objects.select_related("business_area")
+
+        # Act
+        result = ProjectRowSerializer.values_data(projects)
+
+        # Assert
+        assert result == ProjectRowSerializer(projects, many=True).data
+
+    def test_values_fields_expressions(self, user, db):
+        """Test Meta.values_fields expressions are passed through"""
+
+        # Arrange
+        class UserRowSerializer(ValuesSerializerMixin, ModelSerializer):
+            name = serializers.SerializerMethodField()
+
+            class Meta:
+                model = User
+                fields = ["id", "name"]
+                values_fields = {"name": Concat("first_name", Value(" "), "last_name")}
+
+        # Act
+        result = UserRowSerializer.values_data(User.objects.filter(pk=user.pk))
+
+        # Assert
+        assert result == [
+            {"id": user.pk, "name": f"{user.first_name} {user.last_name}"}
+        ]
+
+    def test_unsupported_fields_raise(self, db):
+        """Test fields that need model instances are rejected"""
+
+        # Arrange
+        class UserRowSerializer(ValuesSerializerMixin, ModelSerializer):
+            full_name = serializers.SerializerMethodField()
+
+            class Meta:
+                model = User
+                fields = ["id", "full_name"]
+
+        # Act & Assert
+        with pytest.raises(ImproperlyConfigured, match="full_name"):
+            UserRowSerializer.values_data(User.objects.all())
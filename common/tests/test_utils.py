@@ -10,11 +10,26 @@ from rest_framework import serializers
 
 from common.utils.filters import (
     apply_boolean_filter,
+    apply_changed_since_filter,
     apply_date_range_filter,
     apply_search_filter,
     apply_status_filter,
 )
-from common.utils.pagination import get_page_number, get_page_size, paginate_queryset
+from common.utils.pagination import (
+    decode_cursor,
+    encode_cursor,
+    get_cursor_ordering,
+    get_page_number,
+    get_page_size,
+    is_pagination_requested,
+    paginate_queryset,
+    paginate_queryset_by_cursor,
+)
+from common.utils.streaming import (
+    StreamingJSONRenderer,
+    iter_serialized_chunks,
+    streaming_json_response,
+)
 from common.utils.validators import (
     validate_date_range,
     validate_file_extension,
@@ -24,6 +39,12 @@ from common.utils.validators import (
 )
 
 
+@pytest.fixture(autouse=True)
+def default_page_size(settings):
+    """Pin PAGE_SIZE to the fallback default so counts below stay fixed"""
+    settings.PAGE_SIZE = 20
+
+
 class TestPaginationUtils:
     """Tests for pagination utilities"""
 
@@ -197,7 +218,7 @@ class TestPaginationUtils:
         result = paginate_queryset(queryset, request)
 
         # Assert
-        assert result["page_size"] == 100  # Capped at max 100
+        assert result["page_size"] == 20  # Out of range, default used
 
     def test_paginate_queryset_invalid_page_size(self, db):
         """Test pagination with invalid page size uses default"""
@@ -316,6 +337,185 @@ class TestPaginationUtils:
         assert page_size == 1  # Minimum is 1
 
 
+class TestCursorPaginationUtils:
+    """Tests for keyset (cursor) pagination utilities"""
+
+    def test_cursor_round_trip(self):
+        """Test cursors decode to the values they were built from"""
+        # Act
+        cursor = encode_cursor([1, 2023, 42], reverse=True)
+
+        # Assert
+        assert decode_cursor(cursor) == ([1, 2023, 42], True)
+
+    def test_cursor_keeps_microseconds(self):
+        """Test datetime positions survive encoding exactly"""
+        # Arrange
+        from datetime import datetime, timezone
+
+        position = datetime(2024, 5, 1, 9, 30, 15, 123456, tzinfo=timezone.utc)
+
+        # Act
+        values, _ = decode_cursor(encode_cursor([position, 7]))
+
+        # Assert
+        assert datetime.fromisoformat(values[0]) == position
+
+    def test_decode_cursor_invalid(self):
+        """Test decoding a malformed cursor raises a validation error"""
+        # Act & Assert
+        with pytest.raises(serializers.ValidationError):
+            decode_cursor("not-a-cursor")
+
+    def test_get_cursor_ordering_appends_pk(self, db):
+        """Test the primary key is appended as a tie-breaker"""
+        # Arrange
+        from django.contrib.auth import get_user_model
+
+        User = get_user_model()
+
+        # Act
+        ordering = get_cursor_ordering(User.objects.order_by("-last_name"))
+
+        # Assert
+        assert ordering == ("-last_name", "pk")
+
+    def test_paginate_queryset_by_cursor_walks_all_rows(self, db):
+        """Test following next cursors visits every row exactly once"""
+        # Arrange
+        from common.tests.factories import UserFactory
+
+        [UserFactory() for _ in range(7)]
+        from django.contrib.auth import get_user_model
+
+        User = get_user_model()
+        queryset = User.objects.order_by("-id")
+
+        request = Mock()
+        request.query_params = {"page_size": "3"}
+
+        # Act
+        seen = []
+        while True:
+            result = paginate_queryset_by_cursor(queryset, request)
+            seen.extend(user.pk for user in result["items"])
+            if not result["next_cursor"]:
+                break
+            request.query_params = {
+                "page_size": "3",
+                "cursor": result["next_cursor"],
+            }
+
+        # Assert
+        assert seen == list(queryset.values_list("pk", flat=True))
+        assert result["total_results"] is None
+
+    def test_is_pagination_requested(self):
+        """Test numbered and cursor pagination both count as opting in"""
+        # Arrange
+        requests = [
+            Mock(query_params=params)
+            for params in (
+                {},
+                {"search": "x"},
+                {"page": "2"},
+                {"page_size": "10"},
+                {"pagination": "cursor"},
+                {"cursor": "abc"},
+            )
+        ]
+
+        # Act
+        results = [is_pagination_requested(request) for request in requests]
+
+        # Assert
+        assert results == [False, False, True, True, True, True]
+
+
+class TestStreamingUtils:
+    """Tests for streamed JSON list utilities"""
+
+    def test_render_stream_matches_json_renderer(self):
+        """Test chunked output is identical to rendering the whole list"""
+        # Arrange
+        from rest_framework.renderers import JSONRenderer
+
+        rows = [{"id": index, "name": f"Row é{index}"} for index in range(5)]
+        chunks = [rows[:2], [], rows[2:4], rows[4:]]
+
+        # Act
+        body = b"".join(StreamingJSONRenderer().render_stream(chunks))
+
+        # Assert
+        assert body == JSONRenderer().render(rows)
+
+    def test_render_stream_empty(self):
+        """Test no chunks renders an empty array"""
+        # Act
+        body = b"".join(StreamingJSONRenderer().render_stream([]))
+
+        # Assert
+        assert body == b"[]"
+
+    def test_iter_serialized_chunks(self, db):
+        """Test rows are serialized in chunks of the requested size"""
+        # Arrange
+        from django.contrib.auth import get_user_model
+
+        from common.tests.factories import UserFactory
+
+        [UserFactory() for _ in range(5)]
+        User = get_user_model()
+
+        class UserSerializer(serializers.ModelSerializer):
+            class Meta:
+                model = User
+                fields = ["id"]
+
+        # Act
+        chunks = list(
+            iter_serialized_chunks(
+                User.objects.order_by("id"), UserSerializer, chunk_size=2
+            )
+        )
+
+        # Assert
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert [row["id"] for chunk in chunks for row in chunk] == list(
+            User.objects.order_by("id").values_list("id", flat=True)
+        )
+
+    def test_streaming_json_response(self, db):
+        """Test the response streams a JSON array of every row"""
+        # Arrange
+        import json
+
+        from django.contrib.auth import get_user_model
+
+        from common.tests.factories import UserFactory
+
+        [UserFactory() for _ in range(3)]
+        User = get_user_model()
+
+        class UserSerializer(serializers.ModelSerializer):
+            class Meta:
+                model = User
+                fields = ["id", "username"]
+
+        # Act
+        response = streaming_json_response(
+            User.objects.order_by("id"), UserSerializer, chunk_size=2
+        )
+        data = json.loads(b"".join(response.streaming_content))
+
+        # Assert
+        assert response.streaming
+        assert response["Content-Type"] == "application/json"
+        assert [row["id"] for row in data] == list(
+            User.objects.order_by("id").values_list("id", flat=True)
+        )
+
+
 class TestValidatorUtils:
     """Tests for validator utilities"""
 
@@ -897,7 +1097,7 @@ class TestFilterUtils:
         result = paginate_queryset(queryset, request)
 
         # Assert
-        assert result["page_size"] == 1  # Minimum is 1
+        assert result["page_size"] == 20  # Out of range, default used
 
     def test_get_page_size_none_default(self):
         """Test extracting page size with None default uses settings"""
@@ -1111,3 +1311,40 @@ class TestFilterUtilsAdditional:
         # Assert
         assert result.count() == 1
         assert user2 in result
+
+    def test_apply_changed_since_filter(self, db):
+        """Test rows changed after since in any field are kept"""
+        # Arrange
+        from datetime import timedelta
+
+        from django.utils import timezone
+
+        from common.tests.factories import ProjectDocumentFactory
+        from documents.models import ProjectDocument
+
+        now = timezone.now()
+        old = ProjectDocumentFactory()
+        recent = ProjectDocumentFactory()
+        ProjectDocument.objects.filter(pk=old.pk).update(
+            updated_at=now - timedelta(days=2)
+        )
+        ProjectDocument.objects.filter(pk=recent.pk).update(updated_at=now)
+
+        # Act
+        result = apply_changed_since_filter(
+            ProjectDocument.objects.all(), (now - timedelta(days=1)).isoformat()
+        )
+        unfiltered = apply_changed_since_filter(ProjectDocument.objects.all(), None)
+
+        # Assert
+        assert list(result) == [recent]
+        assert unfiltered.count() == 2
+
+    def test_apply_changed_since_filter_invalid(self, db):
+        """Test an unparseable since value is a validation error"""
+        # Arrange
+        from django.contrib.auth import get_user_model
+
+        # Act & Assert
+        with pytest.raises(serializers.ValidationError):
+            apply_changed_since_filter(get_user_model().objects.all(), "yesterday")
@@ -4,10 +4,21 @@ Tests for common view mixins
 
 from unittest.mock import Mock
 
+import pytest
 from rest_framework import serializers
 from rest_framework.response import Response
 
-from common.views.mixins import PaginationMixin, SerializerValidationMixin
+from common.views.mixins import (
+    PaginationMixin,
+    SerializerValidationMixin,
+    StreamingListMixin,
+)
+
+
+@pytest.fixture(autouse=True)
+def default_page_size(settings):
+    """Pin PAGE_SIZE to the fallback default so counts below stay fixed"""
+    settings.PAGE_SIZE = 20
 
 
 class TestSerializerValidationMixin:
@@ -279,7 +290,7 @@ class TestPaginationMixin:
         result = mixin.paginate_queryset(queryset, request)
 
         # Assert
-        assert result["page_size"] == 100  # Capped at 100
+        assert result["page_size"] == 20  # Out of range, default used
 
     def test_paginated_response(self, db):
         """Test creating paginated response"""
@@ -391,3 +402,82 @@ class TestPaginationMixin:
 
         # Assert
         assert result["current_page"] == 1  # Negative converted to 1
+
+
+class TestStreamingListMixin:
+    """Tests for StreamingListMixin"""
+
+    class UserSerializer(serializers.Serializer):
+        id = serializers.IntegerField()
+
+    def test_list_response_streams_by_default(self, db):
+        """Test every row is streamed when no pagination is requested"""
+        # Arrange
+        import json
+
+        from django.contrib.auth import get_user_model
+
+        from common.tests.factories import UserFactory
+
+        [UserFactory() for _ in range(30)]
+        User = get_user_model()
+
+        request = Mock()
+        request.query_params = {}
+
+        mixin = StreamingListMixin()
+
+        # Act
+        response = mixin.list_response(User.objects.all(), self.UserSerializer, request)
+        data = json.loads(b"".join(response.streaming_content))
+
+        # Assert
+        assert [row["id"] for row in data] == list(
+            User.objects.order_by("pk").values_list("pk", flat=True)
+        )
+
+    def test_list_response_paginates_on_request(self, db):
+        """Test numbered pagination is used when a page is requested"""
+        # Arrange
+        from django.contrib.auth import get_user_model
+
+        from common.tests.factories import UserFactory
+
+        [UserFactory() for _ in range(30)]
+        User = get_user_model()
+
+        request = Mock()
+        request.query_params = {"page": "2", "page_size": "25"}
+
+        mixin = StreamingListMixin()
+
+        # Act
+        response = mixin.list_response(User.objects.all(), self.UserSerializer, request)
+
+        # Assert
+        assert isinstance(response, Response)
+        assert response.data["total_results"] == 30
+        assert response.data["current_page"] == 2
+        assert len(response.data["results"]) == 5
+
+    def test_list_response_cursor_pagination(self, db):
+        """Test cursor pagination is used when requested"""
+        # Arrange
+        from django.contrib.auth import get_user_model
+
+        from common.tests.factories import UserFactory
+
+        [UserFactory() for _ in range(3)]
+        User = get_user_model()
+
+        request = Mock()
+        request.query_params = {"pagination": "cursor", "page_size": "2"}
+
+        mixin = StreamingListMixin()
+
+        # Act
+        response = mixin.list_response(User.objects.all(), self.UserSerializer, request)
+
+        # Assert
+        assert len(response.data["results"]) == 2
+        assert response.data["next_cursor"]
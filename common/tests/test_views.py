@@ -2,6 +2,7 @@
 Tests for common view classes
 """
 
+import pytest
 from rest_framework import status
 from rest_framework.exceptions import NotFound, PermissionDenied
 from rest_framework.permissions import IsAuthenticated
@@ -54,11 +55,10 @@ class TestBaseAPIView:
         view = BaseAPIView()
         exc = Exception("Generic error")
 
-        # Act
-        response = view.handle_exception(exc)
-
-        # Assert
-        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        # Act & Assert
+        # DRF re-raises unhandled exceptions so Django returns its own 500
+        with pytest.raises(Exception, match="Generic error"):
+            view.handle_exception(exc)
 
     def test_can_be_subclassed(self):
         """Test BaseAPIView can be subclassed"""
@@ -4,12 +4,27 @@ Common utilities for DRY backend architecture
 
 from .filters import (
     apply_boolean_filter,
+    apply_changed_since_filter,
     apply_date_range_filter,
     apply_search_filter,
     apply_status_filter,
 )
+from .http import CircuitOpenError, IntegrationClient, get_client
 from .mixins import ProjectTeamMemberMixin, TeamMemberMixin
-from .pagination import get_page_number, get_page_size, paginate_queryset
+from .pagination import (
+    get_approximate_count,
+    get_page_number,
+    get_page_size,
+    is_cursor_pagination_requested,
+    is_pagination_requested,
+    paginate_queryset,
+    paginate_queryset_by_cursor,
+)
+from .streaming import (
+    StreamingJSONRenderer,
+    iter_serialized_chunks,
+    streaming_json_response,
+)
 from .validators import (
     validate_date_range,
     validate_file_extension,
@@ -23,11 +38,24 @@ __all__ = [
     "paginate_queryset",
     "get_page_number",
     "get_page_size",
+    "paginate_queryset_by_cursor",
+    "is_cursor_pagination_requested",
+    "get_approximate_count",
+    "is_pagination_requested",
+    # Streaming
+    "StreamingJSONRenderer",
+    "iter_serialized_chunks",
+    "streaming_json_response",
+    # HTTP
+    "IntegrationClient",
+    "CircuitOpenError",
+    "get_client",
     # Filters
     "apply_search_filter",
     "apply_date_range_filter",
     "apply_status_filter",
     "apply_boolean_filter",
+    "apply_changed_since_filter",
     # Validators
     "validate_not_empty",
     "validate_date_range",
@@ -3,6 +3,9 @@ Common filtering utilities for QuerySet filtering
 """
 
 from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework import serializers
 
 
 def apply_search_filter(queryset, search_term, fields):
@@ -118,3 +121,53 @@ def apply_boolean_filter(queryset, param_value, field_name):
         param_value = param_value.lower() in ("true", "1", "yes")
 
     return queryset.filter(**{field_name: param_value})
+
+
+def apply_changed_since_filter(queryset, since, fields=("updated_at",)):
+    """
+    Apply "changed since" filter to queryset, for incremental polling
+
+    Rows match if any of the fields is later than since, so a row can be
+    counted as changed when a related row (e.g. its document) changes.
+
+    Args:
+        queryset: Base QuerySet
+        since: ISO 8601 datetime string or datetime (naive values are
+            taken as local time)
+        fields: Names of timestamp fields to compare
+
+    Returns:
+        Filtered QuerySet
+
+    Raises:
+        ValidationError: If since is not a valid datetime
+
+    Example:
+        queryset = apply_changed_since_filter(
+            ProgressReport.objects.all(),
+            request.query_params.get("since"),
+            ["updated_at", "document__updated_at"]
+        )
+    """
+    if not since:
+        return queryset
+
+    if isinstance(since, str):
+        try:
+            parsed = parse_datetime(since)
+        except ValueError:
+            parsed = None
+        if parsed is None:
+            raise serializers.ValidationError(
+                {"since": "Since must be an ISO 8601 datetime"}
+            )
+        since = parsed
+
+    if timezone.is_naive(since):
+        since = timezone.make_aware(since)
+
+    q_objects = Q()
+    for field in fields:
+        q_objects |= Q(**{f"{field}__gt": since})
+
+    return queryset.filter(q_objects)
@@ -0,0 +1,293 @@
+"""
+Pooled HTTP clients for outbound integrations (IT Assets, library API)
+"""
+
+import threading
+import time
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+# Upstream statuses worth retrying; anything else is returned to the caller
+RETRY_STATUSES = frozenset({502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """Raised without calling the upstream while its circuit is open"""
+
+
+class CircuitBreaker:
+    """
+    Stops calling an upstream after repeated failures
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    calls fail fast for `reset_timeout` seconds. The next call is then let
+    through as a trial: success closes the circuit, failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold, reset_timeout):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow_request(self):
+        """
+        Check whether a call may go to the upstream
+
+        Returns:
+            Boolean; only one trial call is allowed while half open
+        """
+        with self._lock:
+            state = self.state
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._trial_running:
+                self._trial_running = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._trial_running = False
+            if self.opened_at is not None or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+class ClientMetrics:
+    """Latency and error counts for one integration client"""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.rejected = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, duration, error):
+        with self._lock:
+            self.requests += 1
+            self.total_time += duration
+            self.max_time = max(self.max_time, duration)
+            if error:
+                self.errors += 1
+
+    def record_retry(self):
+        with self._lock:
+            self.retries += 1
+
+    def record_rejected(self):
+        with self._lock:
+            self.rejected += 1
+
+    def as_dict(self):
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "errors": self.errors,
+                "error_rate": (
+                    round(self.errors / self.requests, 4) if self.requests else 0.0
+                ),
+                "retries": self.retries,
+                "rejected": self.rejected,
+                "avg_ms": (
+                    round(self.total_time * 1000 / self.requests, 2)
+                    if self.requests
+                    else 0.0
+                ),
+                "max_ms": round(self.max_time * 1000, 2),
+            }
+
+
+class IntegrationClient:
+    """
+    HTTP client for one upstream service
+
+    Keeps a pooled keep-alive session, applies default timeouts, retries
+    idempotent requests on connection errors, timeouts and 502/503/504 with
+    exponential backoff, and stops calling the upstream while its circuit
+    is open. Responses are returned as they are, so callers keep checking
+    status codes themselves.
+
+    Use get_client() rather than creating clients directly, so connections
+    are shared across the process.
+    """
+
+    def __init__(
+        self,
+        name,
+        timeout=None,
+        retries=None,
+        backoff=None,
+        pool_size=None,
+        failure_threshold=None,
+        reset_timeout=None,
+    ):
+        self.name = name
+        self.timeout = timeout or (
+            settings.INTEGRATION_CONNECT_TIMEOUT,
+            settings.INTEGRATION_READ_TIMEOUT,
+        )
+        self.retries = settings.INTEGRATION_RETRIES if retries is None else retries
+        self.backoff = (
+            settings.INTEGRATION_RETRY_BACKOFF if backoff is None else backoff
+        )
+        self.breaker = CircuitBreaker(
+            failure_threshold or settings.INTEGRATION_CIRCUIT_FAILURES,
+            reset_timeout or settings.INTEGRATION_CIRCUIT_RESET,
+        )
+        self.metrics = ClientMetrics()
+
+        pool_size = pool_size or settings.INTEGRATION_POOL_SIZE
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def request(self, method, url, retries=None, **kwargs):
+        """
+        Send a request through the pooled session
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            retries: Override the client's retry count for this call
+            **kwargs: Passed to requests (auth, headers, params, timeout...)
+
+        Returns:
+            requests.Response
+
+        Raises:
+            CircuitOpenError: If the upstream is failing and was not called
+            requests.RequestException: If the last attempt failed to connect
+                or timed out
+        """
+        method = method.upper()
+        kwargs.setdefault("timeout", self.timeout)
+        retries = self.retries if retries is None else retries
+        if method not in IDEMPOTENT_METHODS:
+            retries = 0
+
+        for attempt in range(retries + 1):
+            if not self.breaker.allow_request():
+                self.metrics.record_rejected()
+                raise CircuitOpenError(
+                    f"{self.name} circuit is open after repeated failures"
+                )
+
+            start = time.perf_counter()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                self._record(start, failed=True)
+                if attempt < retries:
+                    self._wait(attempt, exc)
+                    continue
+                raise
+
+            failed = response.status_code >= 500
+            self._record(start, failed=failed)
+            if response.status_code in RETRY_STATUSES and attempt < retries:
+                response.close()
+                self._wait(attempt, f"status {response.status_code}")
+                continue
+            return response
+
+    def stats(self):
+        """
+        Get the client's metrics and circuit state
+
+        Returns:
+            Dict of counters, latencies (ms) and circuit state
+        """
+        return {**self.metrics.as_dict(), "circuit": self.breaker.state}
+
+    def _record(self, start, failed):
+        self.metrics.record(time.perf_counter() - start, failed)
+        if failed:
+            self.breaker.record_failure()
+            if self.breaker.state == CircuitBreaker.OPEN:
+                settings.LOGGER.warning(f"{self.name} circuit opened")
+        else:
+            self.breaker.record_success()
+
+    def _wait(self, attempt, reason):
+        delay = self.backoff * (2**attempt)
+        settings.LOGGER.warning(
+            f"{self.name} request failed ({reason}), retrying in {delay:.2f}s"
+        )
+        self.metrics.record_retry()
+        time.sleep(delay)
+
+
+def get_client(name, **options):
+    """
+    Get the shared client for an integration, creating it on first use
+
+    Args:
+        name: Integration name, e.g. "it_assets" or "library"
+        **options: IntegrationClient options, used only on creation
+
+    Returns:
+        IntegrationClient
+    """
+    client = _clients.get(name)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(name)
+            if client is None:
+                client = IntegrationClient(name, **options)
+                _clients[name] = client
+    return client
+
+
+def get_client_stats():
+    """
+    Get metrics for every client created in this process
+
+    Returns:
+        Dict of client name to stats
+    """
+    return {name: client.stats() for name, client in list(_clients.items())}
+
+
+def reset_clients():
+    """Close and forget all clients (used by tests)"""
+    with _clients_lock:
+        for client in _clients.values():
+            client.session.close()
+        _clients.clear()
@@ -2,9 +2,26 @@
 Pagination utilities for consistent list view pagination
 """
 
+import binascii
+import datetime
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
 from math import ceil
 
 from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+
+
+class _CursorEncoder(DjangoJSONEncoder):
+    """Keeps the microseconds DjangoJSONEncoder drops, so positions are exact"""
+
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
 
 
 def paginate_queryset(queryset, request):
@@ -106,3 +123,251 @@ def get_page_size(request, default=None):
         return max(1, min(100, page_size))
     except (ValueError, TypeError):
         return default
+
+
+def is_cursor_pagination_requested(request):
+    """
+    Check whether the client opted in to cursor (keyset) pagination
+
+    Cursor mode is used when a ``cursor`` is supplied or when the first page
+    is requested with ``pagination=cursor``.
+
+    Args:
+        request: HTTP request
+
+    Returns:
+        Boolean
+    """
+    params = request.query_params
+    return "cursor" in params or params.get("pagination") == "cursor"
+
+
+def is_pagination_requested(request):
+    """
+    Check whether the client opted in to any pagination
+
+    Numbered pages are requested with ``page`` or ``page_size``, keyset
+    pages as in is_cursor_pagination_requested.
+
+    Args:
+        request: HTTP request
+
+    Returns:
+        Boolean
+    """
+    params = request.query_params
+    return (
+        "page" in params
+        or "page_size" in params
+        or is_cursor_pagination_requested(request)
+    )
+
+
+def encode_cursor(values, reverse=False):
+    """
+    Encode an ordering position as an opaque cursor string
+
+    Args:
+        values: Ordering field values of the boundary row
+        reverse: Whether the cursor walks backwards from the position
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps({"v": list(values), "r": reverse}, cls=_CursorEncoder)
+    return urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor):
+    """
+    Decode a cursor string produced by encode_cursor
+
+    Args:
+        cursor: Cursor string (None or empty for the first page)
+
+    Returns:
+        Tuple of (values, reverse), or (None, False) for the first page
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    if not cursor:
+        return None, False
+
+    try:
+        payload = json.loads(urlsafe_b64decode(cursor.encode("ascii")))
+        values = payload["v"]
+        reverse = bool(payload.get("r", False))
+    except (ValueError, TypeError, KeyError, binascii.Error):
+        raise ValidationError({"cursor": "Invalid cursor"})
+
+    if not isinstance(values, list):
+        raise ValidationError({"cursor": "Invalid cursor"})
+
+    return values, reverse
+
+
+def get_cursor_ordering(queryset):
+    """
+    Get a deterministic ordering for keyset pagination
+
+    Uses the queryset's ordering (or the model's default ordering) and
+    appends the primary key as a tie-breaker when it is not already present.
+
+    Args:
+        queryset: QuerySet to paginate
+
+    Returns:
+        Tuple of ordering field names (e.g. ("custom_ordering", "-year", "id"))
+    """
+    ordering = list(queryset.query.order_by) or list(queryset.model._meta.ordering)
+    ordering = [field for field in ordering if isinstance(field, str)]
+
+    pk_names = {"pk", queryset.model._meta.pk.name}
+    if not any(field.lstrip("-") in pk_names for field in ordering):
+        ordering.append("pk")
+
+    return tuple(ordering)
+
+
+def get_approximate_count(queryset):
+    """
+    Estimate the row count of a queryset from the query planner
+
+    Avoids running COUNT(*) over large joined querysets. Falls back to an
+    exact count on databases other than PostgreSQL.
+
+    Args:
+        queryset: QuerySet to estimate
+
+    Returns:
+        Integer estimated row count
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return queryset.count()
+
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def paginate_queryset_by_cursor(queryset, request, ordering=None):
+    """
+    Paginate queryset by keyset (cursor) instead of OFFSET
+
+    Skips the full COUNT query and seeks directly to the requested position
+    using the ordering values of the boundary row, so deep pages cost the
+    same as the first page. Ordering fields should be non-nullable.
+
+    Args:
+        queryset: QuerySet to paginate
+        request: HTTP request with query parameters
+        ordering: Ordering field names (defaults to get_cursor_ordering)
+
+    Returns:
+        Dict with pagination data:
+        {
+            'items': list of objects for this page,
+            'next_cursor': cursor for the next page or None,
+            'previous_cursor': cursor for the previous page or None,
+            'page_size': page_size,
+            'total_results': estimated count or None,
+        }
+
+    Example:
+        from common.utils.pagination import paginate_queryset_by_cursor
+
+        paginated = paginate_queryset_by_cursor(projects, request)
+        serializer = ProjectSerializer(paginated['items'], many=True)
+        return Response({
+            'results': serializer.data,
+            'next_cursor': paginated['next_cursor'],
+            'previous_cursor': paginated['previous_cursor'],
+        })
+    """
+    page_size = get_page_size(request)
+    values, reverse = decode_cursor(request.query_params.get("cursor"))
+    ordering = tuple(ordering or get_cursor_ordering(queryset))
+
+    if values is not None and len(values) != len(ordering):
+        raise ValidationError({"cursor": "Invalid cursor"})
+
+    total_results = None
+    if request.query_params.get("approximate_count") in ("true", "1"):
+        total_results = get_approximate_count(queryset)
+
+    if reverse:
+        page_queryset = queryset.order_by(*_invert_ordering(ordering))
+    else:
+        page_queryset = queryset.order_by(*ordering)
+
+    if values is not None:
+        page_queryset = page_queryset.filter(_keyset_filter(ordering, values, reverse))
+
+    # Fetch one extra row to find out whether another page exists
+    rows = list(page_queryset[: page_size + 1])
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    if reverse:
+        rows.reverse()
+
+    next_cursor = None
+    previous_cursor = None
+    if rows:
+        if has_more or reverse:
+            next_cursor = encode_cursor(_ordering_values(rows[-1], ordering))
+        if values is not None and (has_more or not reverse):
+            previous_cursor = encode_cursor(
+                _ordering_values(rows[0], ordering), reverse=True
+            )
+
+    return {
+        "items": rows,
+        "next_cursor": next_cursor,
+        "previous_cursor": previous_cursor,
+        "page_size": page_size,
+        "total_results": total_results,
+    }
+
+
+def _invert_ordering(ordering):
+    """Flip the direction of every ordering field"""
+    return tuple(
+        field[1:] if field.startswith("-") else f"-{field}" for field in ordering
+    )
+
+
+def _keyset_filter(ordering, values, reverse):
+    """
+    Build the row-comparison filter for rows after (or before) a position
+
+    For ordering (a, -b, id) and position (1, 2, 3) this produces:
+    a > 1 OR (a = 1 AND b < 2) OR (a = 1 AND b = 2 AND id > 3)
+    """
+    condition = Q()
+    for index, field in enumerate(ordering):
+        descending = field.startswith("-") != reverse
+        lookup = "lt" if descending else "gt"
+        clause = Q(**{f"{field.lstrip('-')}__{lookup}": values[index]})
+        for previous_field, previous_value in zip(ordering[:index], values[:index]):
+            clause &= Q(**{previous_field.lstrip("-"): previous_value})
+        condition |= clause
+    return condition
+
+
+def _ordering_values(obj, ordering):
+    """Read the ordering field values (following __ relations) from an object"""
+    values = []
+    for field in ordering:
+        value = obj
+        for attr in field.lstrip("-").split("__"):
+            value = getattr(value, attr)
+        values.append(value)
+    return values
@@ -0,0 +1,95 @@
+"""
+Streaming utilities for large list responses
+"""
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+
+from common.renderers import ORJSONRenderer
+
+
+class StreamingJSONRenderer(ORJSONRenderer):
+    """
+    JSON renderer that writes a list one chunk of rows at a time
+
+    Output is byte-for-byte what ORJSONRenderer gives for the whole list, but
+    only one chunk of serialized rows is held in memory.
+    """
+
+    def render_stream(self, chunks):
+        """
+        Render chunks of serialized rows as a single JSON array
+
+        Args:
+            chunks: Iterable of lists of serialized rows
+
+        Yields:
+            Bytes of the JSON array
+        """
+        yield b"["
+        first = True
+        for chunk in chunks:
+            if not chunk:
+                continue
+            # Drop the brackets JSONRenderer puts around each chunk
+            body = self.render(chunk)[1:-1]
+            yield body if first else b"," + body
+            first = False
+        yield b"]"
+
+
+def iter_serialized_chunks(queryset, serializer_class, chunk_size=None, **kwargs):
+    """
+    Serialize a queryset in chunks read from a server-side cursor
+
+    select_related and prefetch_related are honoured per chunk.
+
+    Args:
+        queryset: QuerySet to serialize
+        serializer_class: Serializer class to use
+        chunk_size: Rows per chunk (defaults to settings.STREAMING_CHUNK_SIZE)
+        **kwargs: Additional kwargs for the serializer (e.g. context)
+
+    Yields:
+        Lists of serialized rows
+    """
+    chunk_size = chunk_size or settings.STREAMING_CHUNK_SIZE
+    chunk = []
+    for obj in queryset.iterator(chunk_size=chunk_size):
+        chunk.append(obj)
+        if len(chunk) >= chunk_size:
+            yield serializer_class(chunk, many=True, **kwargs).data
+            chunk = []
+    if chunk:
+        yield serializer_class(chunk, many=True, **kwargs).data
+
+
+def streaming_json_response(queryset, serializer_class, chunk_size=None, **kwargs):
+    """
+    Stream a serialized queryset as a JSON array
+
+    Rows are fetched, serialized and sent in chunks, so the first bytes go
+    out after the first chunk and memory stays flat however large the
+    table grows.
+
+    Args:
+        queryset: QuerySet to serialize
+        serializer_class: Serializer class to use
+        chunk_size: Rows per chunk (defaults to settings.STREAMING_CHUNK_SIZE)
+        **kwargs: Additional kwargs for the serializer (e.g. context)
+
+    Returns:
+        StreamingHttpResponse with a JSON array body
+
+    Example:
+        from common.utils.streaming import streaming_json_response
+
+        return streaming_json_response(
+            projects, TinyProjectSerializer, context={'request': request}
+        )
+    """
+    renderer = StreamingJSONRenderer()
+    chunks = iter_serialized_chunks(queryset, serializer_class, chunk_size, **kwargs)
+    return StreamingHttpResponse(
+        renderer.render_stream(chunks), content_type=renderer.media_type
+    )
@@ -3,10 +3,11 @@ Common view classes and mixins for DRY backend architecture
 """
 
 from .base import BaseAPIView
-from .mixins import PaginationMixin, SerializerValidationMixin
+from .mixins import PaginationMixin, SerializerValidationMixin, StreamingListMixin
 
 __all__ = [
     "BaseAPIView",
     "SerializerValidationMixin",
     "PaginationMixin",
+    "StreamingListMixin",
 ]
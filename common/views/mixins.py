@@ -7,6 +7,13 @@ from math import ceil
 from django.conf import settings
 from rest_framework.response import Response
 
+from common.utils.pagination import (
+    is_cursor_pagination_requested,
+    is_pagination_requested,
+    paginate_queryset_by_cursor,
+)
+from common.utils.streaming import streaming_json_response
+
 
 class SerializerValidationMixin:
     """
@@ -133,6 +140,27 @@ class PaginationMixin:
             "page_size": page_size,
         }
 
+    def paginate_queryset_by_cursor(self, queryset, request, ordering=None):
+        """
+        Paginate queryset by keyset (cursor) without counting the full result
+
+        Args:
+            queryset: QuerySet to paginate
+            request: HTTP request with query parameters
+            ordering: Ordering field names (defaults to the queryset ordering)
+
+        Returns:
+            Dict with pagination data:
+            {
+                'items': list of objects for this page,
+                'next_cursor': cursor for the next page or None,
+                'previous_cursor': cursor for the previous page or None,
+                'page_size': page_size,
+                'total_results': estimated count or None,
+            }
+        """
+        return paginate_queryset_by_cursor(queryset, request, ordering=ordering)
+
     def paginated_response(
         self, queryset, serializer_class, request, **serializer_kwargs
     ):
@@ -146,7 +174,8 @@ class PaginationMixin:
             **serializer_kwargs: Additional kwargs for serializer
 
         Returns:
-            Response with paginated data
+            Response with paginated data (cursor metadata when the request
+            opts in with ``cursor`` or ``pagination=cursor``)
 
         Example:
             return self.paginated_response(
@@ -156,6 +185,21 @@ class PaginationMixin:
                 context={'request': request}
             )
         """
+        if is_cursor_pagination_requested(request):
+            paginated = self.paginate_queryset_by_cursor(queryset, request)
+            serializer = serializer_class(
+                paginated["items"], many=True, **serializer_kwargs
+            )
+            return Response(
+                {
+                    "results": serializer.data,
+                    "next_cursor": paginated["next_cursor"],
+                    "previous_cursor": paginated["previous_cursor"],
+                    "total_results": paginated["total_results"],
+                    "page_size": paginated["page_size"],
+                }
+            )
+
         paginated = self.paginate_queryset(queryset, request)
         serializer = serializer_class(
             paginated["items"], many=True, **serializer_kwargs
@@ -170,3 +214,46 @@ class PaginationMixin:
                 "page_size": paginated["page_size"],
             }
         )
+
+
+class StreamingListMixin(PaginationMixin):
+    """
+    Mixin for list views over tables that grow without bound
+
+    Returns every row as a streamed JSON array, as these views always have,
+    unless the client opts in to pagination
+    """
+
+    def list_response(self, queryset, serializer_class, request, **serializer_kwargs):
+        """
+        Create a streamed or paginated list response
+
+        Args:
+            queryset: QuerySet to serialize
+            serializer_class: Serializer class to use
+            request: HTTP request
+            **serializer_kwargs: Additional kwargs for serializer
+
+        Returns:
+            Paginated Response when the request has ``page``, ``page_size``,
+            ``cursor`` or ``pagination=cursor``; otherwise a
+            StreamingHttpResponse with the full JSON array
+
+        Example:
+            return self.list_response(
+                photos,
+                TinyProjectPhotoSerializer,
+                request,
+                context={'request': request}
+            )
+        """
+        if not queryset.ordered:
+            # Pages and cursors need a stable order
+            queryset = queryset.order_by("pk")
+
+        if is_pagination_requested(request):
+            return self.paginated_response(
+                queryset, serializer_class, request, **serializer_kwargs
+            )
+
+        return streaming_json_response(queryset, serializer_class, **serializer_kwargs)
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:42
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("communications", "0002_initial"),
+        ("documents", "0011_report_updated_at"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(
+                fields=["document", "created_at"], name="comment_document_created_idx"
+            ),
+        ),
+    ]
@@ -93,12 +93,27 @@ class Comment(CommonModel):
             settings.LOGGER.error(f"Error getting reactions: {e}")
             return None
 
+    @property
+    def text_content(self):
+        """Comment text without bold tags, extracted once per text value"""
+        cached = self.__dict__.get("_text_content")
+        if cached is None or cached[0] != self.text:
+            cached = (self.text, extract_text_content(self.text))
+            self._text_content = cached
+        return cached[1]
+
     def __str__(self) -> str:
-        return f"'{extract_text_content(self.text)}'"
+        return f"'{self.text_content}'"
 
     class Meta:
         verbose_name = "Comment"
         verbose_name_plural = "Comments"
+        indexes = [
+            # Document comment threads, oldest first (and since polling)
+            models.Index(
+                fields=["document", "created_at"], name="comment_document_created_idx"
+            ),
+        ]
 
 
 class Reaction(CommonModel):
@@ -1,6 +1,6 @@
 # region Imports ================================================================================================
 
-from rest_framework.serializers import ModelSerializer
+from rest_framework.serializers import ModelSerializer, SerializerMethodField
 
 from documents.serializers import TinyProjectDocumentSerializer
 from users.serializers import TinyUserSerializer
@@ -63,6 +63,50 @@ class TinyCommentSerializer(ModelSerializer):
         ]
 
 
+# Joins needed to serialize a comment thread without a query per comment
+COMMENT_THREAD_RELATED = [
+    "user__avatar",
+    "user__work__affiliation",
+    "user__work__business_area__image",
+    "user__work__business_area__division",
+]
+COMMENT_THREAD_PREFETCH = [
+    "user__work__business_area__division__directorate_email_list",
+]
+
+
+class CommentThreadSerializer(ModelSerializer):
+    """
+    Comment in a document thread
+
+    Reaction counts come from a "reactions" dict in the context, as made by
+    CommunicationService.get_reaction_counts for the whole page.
+    """
+
+    user = TinyUserSerializer(read_only=True)
+    reactions = SerializerMethodField()
+    my_reactions = SerializerMethodField()
+
+    class Meta:
+        model = Comment
+        fields = [
+            "id",
+            "user",
+            "document",
+            "text",
+            "created_at",
+            "updated_at",
+            "reactions",
+            "my_reactions",
+        ]
+
+    def get_reactions(self, obj):
+        return self.context["reactions"].get(obj.pk, {}).get("counts", {})
+
+    def get_my_reactions(self, obj):
+        return self.context["reactions"].get(obj.pk, {}).get("mine", [])
+
+
 class TinyCommentCreateSerializer(ModelSerializer):
 
     class Meta:
@@ -3,9 +3,12 @@ Communication service - Business logic for communication operations
 """
 
 from django.conf import settings
+from django.db.models import Count, Q, Value
 from rest_framework.exceptions import NotFound, PermissionDenied
 
+from common.utils import apply_changed_since_filter
 from communications.models import ChatRoom, Comment, DirectMessage, Reaction
+from documents.models import ProjectDocument
 from documents.templatetags.custom_filters import extract_text_content
 
 
@@ -96,6 +99,59 @@ class CommunicationService:
         """List all comments"""
         return Comment.objects.all()
 
+    @staticmethod
+    def get_document_comments(document_id, since=None):
+        """
+        Get the comment thread of a document, oldest first
+
+        Args:
+            document_id: ProjectDocument primary key
+            since: Only comments posted after this ISO 8601 datetime
+
+        Returns:
+            QuerySet of Comment objects
+
+        Raises:
+            NotFound: If the document does not exist
+        """
+        if not ProjectDocument.objects.filter(pk=document_id).exists():
+            raise NotFound(f"Document {document_id} not found")
+
+        comments = Comment.objects.filter(
+            document_id=document_id, is_removed=False
+        ).order_by("created_at", "id")
+        return apply_changed_since_filter(comments, since, ["created_at"])
+
+    @staticmethod
+    def get_reaction_counts(comment_ids, user=None):
+        """
+        Count the reactions to each comment in one grouped query
+
+        Args:
+            comment_ids: Iterable of Comment primary keys
+            user: Also list the reactions this user made
+
+        Returns:
+            Dict of comment ID to {"counts": {reaction: count},
+            "mine": [reaction]}
+        """
+        rows = (
+            Reaction.objects.filter(comment_id__in=comment_ids)
+            .values("comment_id", "reaction")
+            .annotate(
+                count=Count("id"),
+                mine=Count("id", filter=Q(user=user)) if user else Value(0),
+            )
+            .order_by()
+        )
+        reactions = {}
+        for row in rows:
+            entry = reactions.setdefault(row["comment_id"], {"counts": {}, "mine": []})
+            entry["counts"][row["reaction"]] = row["count"]
+            if row["mine"]:
+                entry["mine"].append(row["reaction"])
+        return reactions
+
     @staticmethod
     def get_comment(pk):
         """Get comment by ID"""
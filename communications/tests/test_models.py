@@ -202,6 +202,18 @@ class TestComment:
         # Assert
         assert "Test comment" in result
 
+    def test_comment_str_follows_text_changes(self, comment, db):
+        """Test the extracted text is refreshed when the text is edited"""
+        # Arrange
+        str(comment)
+        comment.text = "<p><b>Edited</b> comment</p>"
+
+        # Act
+        result = str(comment)
+
+        # Assert
+        assert result == "'<p>Edited comment</p>'"
+
     def test_comment_str_with_html(self, user, project_document, db):
         """Test comment string representation with HTML content"""
         # Arrange
@@ -234,6 +234,70 @@ class TestCommentService:
             CommunicationService.delete_comment(comment.id, other_user)
 
 
+class TestDocumentCommentThread:
+    """Tests for document comment thread operations"""
+
+    def test_get_document_comments(self, user, project_document, comment, db):
+        """Test the thread is the document's visible comments, oldest first"""
+        # Arrange
+        later = Comment.objects.create(
+            user=user, document=project_document, text="Later comment"
+        )
+        Comment.objects.create(
+            user=user, document=project_document, text="Removed", is_removed=True
+        )
+
+        # Act
+        comments = CommunicationService.get_document_comments(project_document.pk)
+
+        # Assert
+        assert list(comments) == [comment, later]
+
+    def test_get_document_comments_since(self, user, project_document, comment, db):
+        """Test since only returns comments posted after it"""
+        # Arrange
+        later = Comment.objects.create(
+            user=user, document=project_document, text="Later comment"
+        )
+
+        # Act
+        comments = CommunicationService.get_document_comments(
+            project_document.pk, since=comment.created_at.isoformat()
+        )
+
+        # Assert
+        assert list(comments) == [later]
+
+    def test_get_document_comments_not_found(self, db):
+        """Test a missing document raises NotFound"""
+        # Act & Assert
+        with pytest.raises(NotFound):
+            CommunicationService.get_document_comments(999)
+
+    def test_get_reaction_counts(
+        self, user, other_user, comment, django_assert_num_queries, db
+    ):
+        """Test reactions are counted per comment and kind in one query"""
+        # Arrange
+        for reactor, reaction in [
+            (user, Reaction.ReactionChoices.THUMBUP),
+            (other_user, Reaction.ReactionChoices.THUMBUP),
+            (other_user, Reaction.ReactionChoices.HEART),
+        ]:
+            Reaction.objects.create(user=reactor, comment=comment, reaction=reaction)
+
+        # Act
+        with django_assert_num_queries(1):
+            reactions = CommunicationService.get_reaction_counts(
+                [comment.pk], user=user
+            )
+
+        # Assert
+        assert reactions == {
+            comment.pk: {"counts": {"thumbup": 2, "heart": 1}, "mine": ["thumbup"]}
+        }
+
+
 class TestReactionService:
     """Tests for Reaction service operations"""
 
@@ -384,6 +384,79 @@ class TestCommentDetailView:
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
 
+class TestDocumentCommentsView:
+    """Tests for DocumentComments view"""
+
+    def test_get_thread_pages(self, api_client, user, project_document, db):
+        """Test the thread is walked a page at a time with a cursor"""
+        # Arrange
+        api_client.force_authenticate(user=user)
+        comments = [
+            Comment.objects.create(
+                user=user, document=project_document, text=f"Comment {n}"
+            )
+            for n in range(3)
+        ]
+        url = communications_urls.path("documents", project_document.pk, "comments")
+
+        # Act
+        first = api_client.get(url, {"page_size": 2})
+        second = api_client.get(
+            url, {"page_size": 2, "cursor": first.data["next_cursor"]}
+        )
+
+        # Assert
+        assert first.status_code == status.HTTP_200_OK
+        assert [c["id"] for c in first.data["comments"]] == [
+            comments[0].pk,
+            comments[1].pk,
+        ]
+        assert [c["id"] for c in second.data["comments"]] == [comments[2].pk]
+        assert second.data["next_cursor"] is None
+
+    def test_get_thread_reactions(
+        self,
+        api_client,
+        user,
+        project_document,
+        comment,
+        reaction_on_comment,
+        django_assert_max_num_queries,
+        db,
+    ):
+        """Test reaction counts are included with a fixed query count"""
+        # Arrange
+        api_client.force_authenticate(user=user)
+        for n in range(5):
+            Comment.objects.create(
+                user=user, document=project_document, text=f"Comment {n}"
+            )
+        url = communications_urls.path("documents", project_document.pk, "comments")
+
+        # Act
+        with django_assert_max_num_queries(6):
+            response = api_client.get(url)
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["comments"][0]["reactions"] == {"thumbup": 1}
+        assert response.data["comments"][0]["my_reactions"] == ["thumbup"]
+        assert response.data["comments"][1]["reactions"] == {}
+
+    def test_get_thread_document_not_found(self, api_client, user, db):
+        """Test the thread of a missing document"""
+        # Arrange
+        api_client.force_authenticate(user=user)
+
+        # Act
+        response = api_client.get(
+            communications_urls.path("documents", 999, "comments")
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
 class TestReactionsView:
     """Tests for Reactions view"""
 
@@ -5,6 +5,7 @@ from . import views
 urlpatterns = [
     path("comments", views.Comments.as_view()),
     path("comments/<int:pk>", views.CommentDetail.as_view()),
+    path("documents/<int:document_id>/comments", views.DocumentComments.as_view()),
     path("direct_messages", views.DirectMessages.as_view()),
     path("direct_messages/<int:pk>", views.DirectMessageDetail.as_view()),
     path("chat_rooms", views.ChatRooms.as_view()),
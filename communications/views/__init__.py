@@ -9,6 +9,7 @@ from .crud import (
     Comments,
     DirectMessageDetail,
     DirectMessages,
+    DocumentComments,
     ReactionDetail,
     Reactions,
 )
@@ -20,6 +21,7 @@ __all__ = [
     "DirectMessageDetail",
     "Comments",
     "CommentDetail",
+    "DocumentComments",
     "Reactions",
     "ReactionDetail",
 ]
@@ -14,10 +14,14 @@ from rest_framework.status import (
 )
 from rest_framework.views import APIView
 
+from common.utils import paginate_queryset_by_cursor
 from communications.serializers import (
+    COMMENT_THREAD_PREFETCH,
+    COMMENT_THREAD_RELATED,
     ChatRoomSerializer,
     CommentCreateSerializer,
     CommentSerializer,
+    CommentThreadSerializer,
     DirectMessageCreateSerializer,
     DirectMessageSerializer,
     ReactionSerializer,
@@ -191,6 +195,46 @@ class CommentDetail(APIView):
             return Response({"detail": str(e)}, status=HTTP_403_FORBIDDEN)
 
 
+class DocumentComments(APIView):
+    """Comment thread of a document"""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, document_id):
+        """
+        Get a page of a document's comments, oldest first
+
+        Query params:
+            cursor: next_cursor/previous_cursor of a previous page
+            page_size: Comments per page
+            since: Only comments posted after this ISO 8601 datetime
+        """
+        comments = (
+            CommunicationService.get_document_comments(
+                document_id, since=request.query_params.get("since")
+            )
+            .select_related(*COMMENT_THREAD_RELATED)
+            .prefetch_related(*COMMENT_THREAD_PREFETCH)
+        )
+        paginated = paginate_queryset_by_cursor(
+            comments, request, ordering=("created_at", "id")
+        )
+        reactions = CommunicationService.get_reaction_counts(
+            [comment.pk for comment in paginated["items"]], user=request.user
+        )
+        serializer = CommentThreadSerializer(
+            paginated["items"], many=True, context={"reactions": reactions}
+        )
+        return Response(
+            {
+                "comments": serializer.data,
+                "next_cursor": paginated["next_cursor"],
+                "previous_cursor": paginated["previous_cursor"],
+            },
+            status=HTTP_200_OK,
+        )
+
+
 class Reactions(APIView):
     """List and toggle reactions"""
 
@@ -0,0 +1,235 @@
+"""
+Content-negotiated compression of API responses.
+
+JSON payloads such as the project map and user lists are large and highly
+repetitive, so they are sent with Brotli (``br``) when the client accepts it
+and gzip otherwise. Static files are left to WhiteNoise, which serves its own
+precompressed copies.
+
+Responses smaller than ``COMPRESSION_MIN_LENGTH`` are sent as they are.
+Streaming responses are compressed chunk by chunk and flushed after each
+chunk, so rows keep reaching the client as they are produced. When a
+response carries an ETag (set by the view or by ConditionalGetMiddleware),
+the compressed body is cached against it in the per-process "local" cache, so
+identical payloads are only compressed once per encoding:
+
+    COMPRESSION_CACHE_TIMEOUT = 60 * 10
+"""
+
+import gzip
+import hashlib
+import zlib
+
+import brotli
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils.cache import patch_vary_headers
+
+# Preferred first when a client accepts both at the same quality
+ENCODINGS = ("br", "gzip")
+
+
+def parse_accept_encoding(header):
+    """
+    Pick the response encoding a client prefers
+
+    Args:
+        header: Accept-Encoding header value, e.g. "gzip, deflate, br;q=0.9"
+
+    Returns:
+        "br", "gzip", or None if neither is acceptable
+    """
+    qualities = {}
+    for item in header.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding:
+            qualities[coding] = quality
+
+    wildcard = qualities.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for encoding in ENCODINGS:
+        quality = qualities.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(data, encoding):
+    """
+    Compress a whole response body
+
+    Args:
+        data: Body bytes
+        encoding: "br" or "gzip"
+
+    Returns:
+        Compressed bytes
+    """
+    if encoding == "br":
+        return brotli.compress(
+            data, mode=brotli.MODE_TEXT, quality=settings.COMPRESSION_BROTLI_QUALITY
+        )
+    return gzip.compress(data, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+class _StreamCompressor:
+    """Incremental compressor that flushes after every chunk"""
+
+    def __init__(self, encoding):
+        if encoding == "br":
+            self._compressor = brotli.Compressor(
+                mode=brotli.MODE_TEXT, quality=settings.COMPRESSION_BROTLI_QUALITY
+            )
+        else:
+            # wbits 31 writes a gzip header and trailer
+            self._compressor = zlib.compressobj(
+                settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31
+            )
+        self._brotli = encoding == "br"
+
+    def compress(self, chunk):
+        if self._brotli:
+            return self._compressor.process(chunk) + self._compressor.flush()
+        return self._compressor.compress(chunk) + self._compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self):
+        if self._brotli:
+            return self._compressor.finish()
+        return self._compressor.flush()
+
+
+def compress_sequence(sequence, encoding):
+    """
+    Compress an iterable of body chunks
+
+    Args:
+        sequence: Iterable of bytes
+        encoding: "br" or "gzip"
+
+    Yields:
+        Compressed bytes, one piece per non-empty input chunk
+    """
+    compressor = _StreamCompressor(encoding)
+    for chunk in sequence:
+        if chunk:
+            yield compressor.compress(chunk)
+    yield compressor.finish()
+
+
+async def acompress_sequence(sequence, encoding):
+    """Async version of compress_sequence for async streaming responses"""
+    compressor = _StreamCompressor(encoding)
+    async for chunk in sequence:
+        if chunk:
+            yield compressor.compress(chunk)
+    yield compressor.finish()
+
+
+class CompressionMiddleware:
+    """
+    Middleware compressing JSON responses with Brotli or gzip.
+
+    Enabled with the COMPRESSION_ENABLED setting. Should sit above any
+    middleware that reads or changes the response body (including
+    ConditionalGetMiddleware), so it compresses the final body.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "COMPRESSION_ENABLED", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if not self._is_compressible(response):
+            return response
+
+        # Responses differ by Accept-Encoding even when left uncompressed
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = parse_accept_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = acompress_sequence(
+                    response.streaming_content, encoding
+                )
+            else:
+                response.streaming_content = compress_sequence(
+                    response.streaming_content, encoding
+                )
+            del response["Content-Length"]
+        else:
+            if len(response.content) < settings.COMPRESSION_MIN_LENGTH:
+                return response
+            compressed = self._compress_content(request, response, encoding)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response["Content-Length"] = str(len(compressed))
+
+        # The compressed bytes differ from the original, so a strong ETag
+        # may only be kept as a weak one
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response["ETag"] = "W/" + etag
+        response["Content-Encoding"] = encoding
+        return response
+
+    @staticmethod
+    def _is_compressible(response):
+        """Check whether a response is a JSON body nothing else has encoded"""
+        if response.has_header("Content-Encoding"):
+            return False
+        # Ranges are offsets into the uncompressed body
+        if response.status_code == 206 or response.has_header("Content-Range"):
+            return False
+        if "no-transform" in response.get("Cache-Control", ""):
+            return False
+        content_type = response.get("Content-Type", "").split(";")[0].strip().lower()
+        return content_type in settings.COMPRESSION_CONTENT_TYPES
+
+    @staticmethod
+    def _compress_content(request, response, encoding):
+        """
+        Compress a response body, reusing an earlier result for its ETag
+
+        Args:
+            request: HTTP request
+            response: Non-streaming response
+            encoding: "br" or "gzip"
+
+        Returns:
+            Compressed bytes
+        """
+        etag = response.get("ETag")
+        if not etag or not settings.COMPRESSION_CACHE_TIMEOUT:
+            return compress(response.content, encoding)
+
+        key = (
+            "compressed:"
+            + hashlib.md5(
+                f"{encoding}:{request.get_full_path()}:{etag}".encode(),
+                usedforsecurity=False,
+            ).hexdigest()
+        )
+        cache = caches["local"]
+        compressed = cache.get(key)
+        if compressed is None:
+            compressed = compress(response.content, encoding)
+            if len(compressed) <= settings.COMPRESSION_CACHE_MAX_LENGTH:
+                cache.set(key, compressed, settings.COMPRESSION_CACHE_TIMEOUT)
+        return compressed
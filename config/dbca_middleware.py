@@ -11,6 +11,7 @@ from django.utils.deprecation import MiddlewareMixin
 from rest_framework.exceptions import ParseError
 
 from agencies.models import Agency
+from common.utils.http import get_client
 from contacts.models import UserContact
 from users.models import PublicStaffProfile, UserProfile, UserWork
 
@@ -84,14 +85,15 @@ class DBCAMiddleware(MiddlewareMixin):
                 # Try to get IT Assets data, but don't fail if unavailable
                 if hasattr(settings, "IT_ASSETS_URL") and settings.IT_ASSETS_URL:
                     try:
-                        # Add timeout to prevent long waits
-                        response = requests.get(
+                        # Short timeout and no retries to keep logins fast
+                        response = get_client("it_assets").get(
                             settings.IT_ASSETS_URL,
                             auth=(
                                 settings.IT_ASSETS_USER or "",
                                 settings.IT_ASSETS_ACCESS_TOKEN or "",
                             ),
                             timeout=5,  # 5 seconds timeout
+                            retries=0,
                         )
 
                         if response.status_code == 200:
@@ -0,0 +1,279 @@
+"""
+Per-request SQL instrumentation and query budgets.
+
+This module counts the SQL queries, database time, duplicate query shapes and
+serializer time spent handling each request, so N+1 regressions show up in
+headers and logs instead of in production latency.
+
+Views declare a budget with a ``query_budget`` attribute (an int, or a dict
+keyed by HTTP method). Budgets cover queries made from the start of the view,
+including the session and user lookups of authentication:
+
+    class Projects(APIView):
+        query_budget = {"GET": 12, "POST": 40}
+
+The numbers are emitted as a ``Server-Timing`` header and a structured log
+line. When a view exceeds its budget a warning is logged, or
+``QueryBudgetExceeded`` is raised if ``QUERY_BUDGET_RAISE`` is enabled.
+
+The same tracking is available outside requests:
+
+    with track_queries() as metrics:
+        ...
+    print(metrics.query_count, metrics.db_time_ms)
+"""
+
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from rest_framework.serializers import BaseSerializer
+
+_current_metrics = ContextVar("query_metrics", default=None)
+
+# Collapses literals and IN lists so queries differing only by value share
+# a fingerprint (e.g. "IN (%s, %s, %s)" -> "IN (?)")
+_IN_LIST = re.compile(r"\bIN\s*\((?:\s*(?:%s|\?)\s*,?)+\)", re.IGNORECASE)
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+\b|%s")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class QueryBudgetExceeded(Exception):
+    """Raised when a view runs more queries than its declared budget"""
+
+
+def fingerprint_sql(sql):
+    """
+    Normalise SQL so repeated executions of the same statement match
+
+    Args:
+        sql: Raw SQL string (with placeholders or literals)
+
+    Returns:
+        Normalised SQL string
+    """
+    normalised = _IN_LIST.sub("IN (?)", sql)
+    normalised = _LITERALS.sub("?", normalised)
+    return _WHITESPACE.sub(" ", normalised).strip()
+
+
+class QueryMetrics:
+    """SQL and serializer measurements collected while tracking is active"""
+
+    def __init__(self):
+        self.query_count = 0
+        self.db_time = 0.0
+        self.fingerprints = Counter()
+        self.serializer_time = 0.0
+        self.serializer_queries = 0
+        self._serializer_depth = 0
+
+    @property
+    def db_time_ms(self):
+        return self.db_time * 1000
+
+    @property
+    def serializer_time_ms(self):
+        return self.serializer_time * 1000
+
+    @property
+    def duplicate_queries(self):
+        """Number of executions that repeated an earlier query shape"""
+        return sum(count - 1 for count in self.fingerprints.values() if count > 1)
+
+    def most_duplicated(self, limit=3):
+        """Most repeated query shapes as (fingerprint, count) pairs"""
+        return [
+            (sql, count)
+            for sql, count in self.fingerprints.most_common(limit)
+            if count > 1
+        ]
+
+    def record_query(self, sql, duration):
+        self.query_count += 1
+        self.db_time += duration
+        self.fingerprints[fingerprint_sql(sql)] += 1
+        if self._serializer_depth:
+            self.serializer_queries += 1
+
+    @contextmanager
+    def serializing(self):
+        """Attribute time (and queries) to serialization, outermost call only"""
+        self._serializer_depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._serializer_depth -= 1
+            if not self._serializer_depth:
+                self.serializer_time += time.perf_counter() - start
+
+    def as_dict(self):
+        return {
+            "queries": self.query_count,
+            "db_ms": round(self.db_time_ms, 2),
+            "duplicate_queries": self.duplicate_queries,
+            "serializer_ms": round(self.serializer_time_ms, 2),
+            "serializer_queries": self.serializer_queries,
+        }
+
+    def server_timing(self, total_time=None):
+        """
+        Format the metrics as a Server-Timing header value
+
+        Args:
+            total_time: Optional total request time in seconds
+
+        Returns:
+            Header string, e.g. 'db;dur=12.4;desc="14 queries", ...'
+        """
+        entries = [
+            f'db;dur={self.db_time_ms:.2f};desc="{self.query_count} queries"',
+            f'dup;desc="{self.duplicate_queries} duplicate queries"',
+            f"serializer;dur={self.serializer_time_ms:.2f}",
+        ]
+        if total_time is not None:
+            entries.append(f"total;dur={total_time * 1000:.2f}")
+        return ", ".join(entries)
+
+
+class _QueryRecorder:
+    """Database execute wrapper that feeds QueryMetrics"""
+
+    def __init__(self, metrics):
+        self.metrics = metrics
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.metrics.record_query(sql, time.perf_counter() - start)
+
+
+@contextmanager
+def track_queries(using=None):
+    """
+    Track queries and serializer time for the enclosed block
+
+    Args:
+        using: Database alias to track (defaults to every configured alias)
+
+    Yields:
+        QueryMetrics populated as the block runs
+    """
+    metrics = QueryMetrics()
+    aliases = [using] if using else list(connections)
+    token = _current_metrics.set(metrics)
+    try:
+        with ExitStack() as stack:
+            for alias in aliases:
+                stack.enter_context(
+                    connections[alias].execute_wrapper(_QueryRecorder(metrics))
+                )
+            yield metrics
+    finally:
+        _current_metrics.reset(token)
+
+
+def instrument_serializers():
+    """
+    Time serializer output while query tracking is active
+
+    Wraps ``BaseSerializer.data`` once per process. Outside ``track_queries``
+    the wrapper only performs a context variable lookup.
+    """
+    if getattr(BaseSerializer, "_query_metrics_instrumented", False):
+        return
+
+    original_data = BaseSerializer.data.fget
+
+    def data(self):
+        metrics = _current_metrics.get()
+        if metrics is None:
+            return original_data(self)
+        with metrics.serializing():
+            return original_data(self)
+
+    BaseSerializer.data = property(data)
+    BaseSerializer._query_metrics_instrumented = True
+
+
+def get_query_budget(view_class, method):
+    """
+    Get the query budget a view declares for an HTTP method
+
+    Args:
+        view_class: View class (or None)
+        method: HTTP method, e.g. "GET"
+
+    Returns:
+        Integer budget, or None if the view declares none
+    """
+    budget = getattr(view_class, "query_budget", None)
+    if isinstance(budget, dict):
+        return budget.get(method.upper(), budget.get(method.lower()))
+    return budget
+
+
+class QueryBudgetMiddleware:
+    """
+    Middleware reporting per-request SQL usage and enforcing view budgets.
+
+    Enabled with the QUERY_INSTRUMENTATION setting. Should sit near the top
+    of MIDDLEWARE so queries made by later middleware are included.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "QUERY_INSTRUMENTATION", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        instrument_serializers()
+
+    def __call__(self, request):
+        start = time.perf_counter()
+        with track_queries() as metrics:
+            response = self.get_response(request)
+        total_time = time.perf_counter() - start
+
+        view_class = getattr(request, "_query_budget_view", None)
+        view_name = view_class.__name__ if view_class else "-"
+        budget = get_query_budget(view_class, request.method)
+        view_queries = metrics.query_count - getattr(request, "_query_budget_offset", 0)
+
+        response["Server-Timing"] = metrics.server_timing(total_time)
+
+        details = metrics.as_dict()
+        settings.LOGGER.info(
+            f"{request.method} {request.path} view={view_name} "
+            + " ".join(f"{key}={value}" for key, value in details.items())
+            + f" total_ms={total_time * 1000:.2f}",
+            extra={"query_metrics": {"view": view_name, **details}},
+        )
+
+        if budget is not None and view_queries > budget:
+            message = (
+                f"{view_name} ran {view_queries} queries on "
+                f"{request.method} {request.path} (budget {budget}); "
+                f"most duplicated: {metrics.most_duplicated()}"
+            )
+            if getattr(settings, "QUERY_BUDGET_RAISE", False):
+                raise QueryBudgetExceeded(message)
+            settings.LOGGER.warning(message)
+
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        # DRF's as_view() exposes the class as .cls, Django's as .view_class
+        request._query_budget_view = getattr(view_func, "cls", None) or getattr(
+            view_func, "view_class", None
+        )
+        # Budgets cover the view only, not queries made by earlier middleware
+        metrics = _current_metrics.get()
+        request._query_budget_offset = metrics.query_count if metrics else 0
+        return None
@@ -39,6 +39,15 @@ IT_ASSETS_URLS = {
 }
 IT_ASSETS_URL = IT_ASSETS_URLS[ENVIRONMENT]
 
+# Outbound integration clients (common.utils.http)
+INTEGRATION_CONNECT_TIMEOUT = 5  # Seconds to establish a connection
+INTEGRATION_READ_TIMEOUT = 30  # Seconds to wait for a response
+INTEGRATION_RETRIES = 2  # Extra attempts for idempotent requests
+INTEGRATION_RETRY_BACKOFF = 0.5  # Seconds before the first retry, doubled each time
+INTEGRATION_POOL_SIZE = 10  # Keep-alive connections per host
+INTEGRATION_CIRCUIT_FAILURES = 5  # Consecutive failures before calls fail fast
+INTEGRATION_CIRCUIT_RESET = 30  # Seconds before a failing upstream is tried again
+
 # Domain configuration
 DOMAINS = {
     "production": {
@@ -78,12 +87,69 @@ if not DEBUG and not PRINCE_SERVER_URL:
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 DATA_UPLOAD_MAX_NUMBER_FIELDS = 2500
 PAGE_SIZE = 24
+PROJECT_TYPEAHEAD_CACHE_TIMEOUT = 30  # Seconds to cache per-user autocomplete results
+PROJECT_HEALTH_CACHE_TIMEOUT = (
+    60 * 5
+)  # Problematic project analysis, also signal-invalidated
+PROJECT_PAGE_CACHE_TIMEOUT = 60 * 5  # Project detail pages, also versioned by signals
+ADMIN_OPTIONS_CACHE_TIMEOUT = (
+    60 * 5
+)  # In-process admin options, also versioned by signals
+ADMIN_OPTIONS_VERSION_CHECK_INTERVAL = 5  # Seconds between admin options version reads
 USER_LIST_PAGE_SIZE = 250
+STREAMING_CHUNK_SIZE = 500  # Rows fetched and serialized per chunk of a streamed list
 FILE_UPLOAD_PERMISSIONS = None  # Use default operating system file permissions
+IMAGE_DERIVATIVE_WIDTHS = [160, 480, 960, 1600]  # Resized image variants (pixels)
+IMAGE_DERIVATIVE_QUALITY = 80  # WebP/JPEG quality of image variants
+
+# Caches. The default cache is shared by every gunicorn worker, pod and the
+# run_housekeeping process, so invalidations and page version bumps made in one
+# of them reach the rest. CACHE_URL selects another backend (e.g. redis://...);
+# the database table is created by `manage.py createcachetable` in entrypoint.sh.
+CACHES = {
+    "default": env.cache(
+        "CACHE_URL", default="dbcache://spms_cache?MAX_ENTRIES=50000&CULL_FREQUENCY=4"
+    ),
+    "local": {  # Per process, for results that are cheap to rebuild
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "spms-local",
+    },
+}
 
 # URL Configuration - No trailing slashes (REST API best practice)
 APPEND_SLASH = False
 
+# Query instrumentation (Server-Timing headers, per-view query budgets)
+QUERY_INSTRUMENTATION = env.bool("QUERY_INSTRUMENTATION", default=DEBUG)
+QUERY_BUDGET_RAISE = env.bool("QUERY_BUDGET_RAISE", default=False)
+
+# Brotli/gzip compression of API responses (static files are left to WhiteNoise)
+COMPRESSION_ENABLED = env.bool("COMPRESSION_ENABLED", default=True)
+COMPRESSION_CONTENT_TYPES = ["application/json"]
+COMPRESSION_MIN_LENGTH = 1024  # Smaller bodies are sent uncompressed (bytes)
+COMPRESSION_BROTLI_QUALITY = 5  # 0-11; higher levels cost too much CPU per request
+COMPRESSION_GZIP_LEVEL = 6
+COMPRESSION_CACHE_TIMEOUT = 60 * 10  # Seconds to reuse compressed bodies per ETag
+COMPRESSION_CACHE_MAX_LENGTH = 2 * 1024 * 1024  # Larger bodies are not cached
+
+# Housekeeping jobs (common.scheduler, run by the run_housekeeping command)
+HOUSEKEEPING_INTERVAL = 60  # Seconds between passes with run_housekeeping --loop
+TEMP_FILE_PREFIX = "spms-"  # Temp files the app creates, pruned once stale
+TEMP_FILE_MAX_AGE = 60 * 60 * 24  # Seconds before a temp file counts as stale
+
+# Domain events, delivered after commit (common.events): sync, queued or batched
+EVENT_DELIVERY = env("EVENT_DELIVERY", default="sync")
+EVENT_BATCH_SIZE = 100  # Most events handed to batch subscribers at once
+EVENT_BATCH_WINDOW = 0.5  # Seconds to collect a batch before delivering it
+
+# Annual report deletion (documents.services.AnnualReportService)
+ANNUAL_REPORT_DELETE_BATCH_SIZE = 200  # Report documents deleted per transaction
+ANNUAL_REPORT_DELETE_BACKGROUND_THRESHOLD = 1000  # Larger years delete in background
+
+# Batch project provisioning (projects.services.ProjectProvisionService)
+PROJECT_PROVISION_MAX_PROJECTS = 5000  # Most projects accepted per request
+PROJECT_PROVISION_BATCH_SIZE = 500  # Rows per bulk INSERT
+
 # endregion ========================================================================================
 
 # region Internationalization ==========================================================
@@ -108,6 +174,17 @@ STORAGES = {
         "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
     },
 }
+# Hand media bytes to the web server: "nginx" (X-Accel-Redirect to an internal
+# location aliased to MEDIA_ROOT), "xsendfile", or "" to stream from Django
+MEDIA_SENDFILE_BACKEND = env("MEDIA_SENDFILE_BACKEND", default="")
+MEDIA_ACCEL_REDIRECT_PREFIX = env(
+    "MEDIA_ACCEL_REDIRECT_PREFIX", default="/protected-files/"
+)
+# Access checks for /files/ (DRF permission classes, see medias.permissions)
+MEDIA_PERMISSION_CLASSES = [
+    "medias.permissions.media_permissions.IsAuthenticatedForPrivateMedia",
+]
+MEDIA_PRIVATE_PREFIXES = env.list("MEDIA_PRIVATE_PREFIXES", default=[])
 
 # endregion ========================================================================================
 
@@ -136,6 +213,27 @@ if not DEBUG:
         }
     )
 
+# Native psycopg connection pool, shared by the threads of each worker
+DATABASE_POOL = env.bool("DATABASE_POOL", default=False)
+DATABASE_POOL_MIN_SIZE = env.int("DATABASE_POOL_MIN_SIZE", default=2)
+DATABASE_POOL_MAX_SIZE = env.int("DATABASE_POOL_MAX_SIZE", default=10)
+DATABASE_POOL_TIMEOUT = env.float("DATABASE_POOL_TIMEOUT", default=10)  # Seconds
+DATABASE_POOL_MAX_IDLE = 60 * 10  # Seconds before an unused connection is closed
+DATABASE_POOL_MAX_LIFETIME = 60 * 60  # Seconds before a connection is replaced
+
+if DATABASE_POOL:
+    # Connections go back to the pool after each request instead of persisting
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    # Checked as they leave the pool, dropping any the server has closed
+    DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+    DATABASES["default"].setdefault("OPTIONS", {})["pool"] = {
+        "min_size": DATABASE_POOL_MIN_SIZE,
+        "max_size": DATABASE_POOL_MAX_SIZE,
+        "timeout": DATABASE_POOL_TIMEOUT,
+        "max_idle": DATABASE_POOL_MAX_IDLE,
+        "max_lifetime": DATABASE_POOL_MAX_LIFETIME,
+    }
+
 # endregion ========================================================================================
 
 # region Auth =========================================================
@@ -265,8 +363,11 @@ INSTALLED_APPS = SYSTEM_APPS + THIRD_PARTY_APPS + CUSTOM_APPS
 
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
+    "config.query_budget.QueryBudgetMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "config.compression.CompressionMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    "django.middleware.http.ConditionalGetMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "config.dbca_middleware.DBCAMiddleware",
@@ -277,6 +378,15 @@ MIDDLEWARE = [
 ]
 
 REST_FRAMEWORK = {
+    "DEFAULT_RENDERER_CLASSES": [
+        "common.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "common.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
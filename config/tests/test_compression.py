@@ -0,0 +1,198 @@
+"""
+Tests for compression of API responses.
+"""
+
+import gzip
+import json
+
+import brotli
+import pytest
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.test import RequestFactory
+
+from common.tests.test_helpers import projects_urls
+from config import compression
+from config.compression import CompressionMiddleware, parse_accept_encoding
+
+PAYLOAD = {"projects": [{"id": i, "title": f"Project {i}"} for i in range(200)]}
+
+
+def run_middleware(response, accept_encoding="br, gzip", path="/api/v1/projects"):
+    request = RequestFactory().get(path, HTTP_ACCEPT_ENCODING=accept_encoding)
+    return CompressionMiddleware(lambda request: response)(request)
+
+
+class TestParseAcceptEncoding:
+    """Tests for Accept-Encoding negotiation"""
+
+    @pytest.mark.parametrize(
+        "header, expected",
+        [
+            ("gzip, deflate, br", "br"),
+            ("gzip", "gzip"),
+            ("br;q=0.5, gzip;q=0.8", "gzip"),
+            ("br;q=0, gzip", "gzip"),
+            ("*", "br"),
+            ("identity", None),
+            ("", None),
+            ("gzip;q=abc", None),
+        ],
+    )
+    def test_picks_preferred_encoding(self, header, expected):
+        """Test the client's highest quality supported encoding is chosen"""
+        # Act & Assert
+        assert parse_accept_encoding(header) == expected
+
+
+class TestCompressionMiddleware:
+    """Tests for CompressionMiddleware"""
+
+    def test_brotli_response(self):
+        """Test JSON is compressed with Brotli when accepted"""
+        # Act
+        response = run_middleware(JsonResponse(PAYLOAD))
+
+        # Assert
+        assert response["Content-Encoding"] == "br"
+        assert response["Vary"] == "Accept-Encoding"
+        assert int(response["Content-Length"]) == len(response.content)
+        assert json.loads(brotli.decompress(response.content)) == PAYLOAD
+
+    def test_gzip_response(self):
+        """Test gzip is used when Brotli is not accepted"""
+        # Act
+        response = run_middleware(JsonResponse(PAYLOAD), accept_encoding="gzip")
+
+        # Assert
+        assert response["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(response.content)) == PAYLOAD
+
+    def test_no_accepted_encoding(self):
+        """Test responses are left alone without a usable Accept-Encoding"""
+        # Act
+        response = run_middleware(JsonResponse(PAYLOAD), accept_encoding="")
+
+        # Assert
+        assert not response.has_header("Content-Encoding")
+        assert response["Vary"] == "Accept-Encoding"
+        assert json.loads(response.content) == PAYLOAD
+
+    def test_small_response_not_compressed(self):
+        """Test bodies under COMPRESSION_MIN_LENGTH are sent as they are"""
+        # Act
+        response = run_middleware(JsonResponse({"ok": True}))
+
+        # Assert
+        assert not response.has_header("Content-Encoding")
+        assert response.content == b'{"ok": true}'
+
+    def test_other_content_types_not_compressed(self):
+        """Test non-JSON responses are left to other layers"""
+        # Arrange
+        body = b"x" * 5000
+
+        # Act
+        response = run_middleware(HttpResponse(body, content_type="image/png"))
+
+        # Assert
+        assert not response.has_header("Content-Encoding")
+        assert not response.has_header("Vary")
+        assert response.content == body
+
+    def test_streaming_response(self):
+        """Test streamed chunks are compressed and flushed one by one"""
+        # Arrange
+        chunks = [b"[", b'{"id": 1}', b",", b'{"id": 2}', b"]"]
+        streaming = StreamingHttpResponse(iter(chunks), content_type="application/json")
+
+        # Act
+        response = run_middleware(streaming)
+        pieces = list(response.streaming_content)
+
+        # Assert
+        assert response["Content-Encoding"] == "br"
+        assert len(pieces) == len(chunks) + 1
+        assert json.loads(brotli.decompress(b"".join(pieces))) == [
+            {"id": 1},
+            {"id": 2},
+        ]
+
+    def test_streaming_gzip_response(self):
+        """Test streamed gzip output is a single valid gzip member"""
+        # Arrange
+        chunks = [b'{"a": ', b"1}"]
+        streaming = StreamingHttpResponse(iter(chunks), content_type="application/json")
+
+        # Act
+        response = run_middleware(streaming, accept_encoding="gzip")
+        body = b"".join(response.streaming_content)
+
+        # Assert
+        assert gzip.decompress(body) == b'{"a": 1}'
+
+    def test_strong_etag_weakened(self):
+        """Test a strong ETag is made weak once the body is compressed"""
+        # Arrange
+        response = JsonResponse(PAYLOAD)
+        response["ETag"] = '"abc"'
+
+        # Act
+        response = run_middleware(response)
+
+        # Assert
+        assert response["ETag"] == 'W/"abc"'
+
+    def test_compressed_body_cached_per_etag(self, monkeypatch):
+        """Test an ETag-stable body is only compressed once per encoding"""
+        # Arrange
+        calls = []
+        original = compression.compress
+        monkeypatch.setattr(
+            compression,
+            "compress",
+            lambda data, encoding: calls.append(encoding) or original(data, encoding),
+        )
+
+        def etagged():
+            response = JsonResponse(PAYLOAD)
+            response["ETag"] = '"v1"'
+            return response
+
+        # Act
+        first = run_middleware(etagged())
+        second = run_middleware(etagged())
+        third = run_middleware(etagged(), accept_encoding="gzip")
+
+        # Assert
+        assert calls == ["br", "gzip"]
+        assert first.content == second.content
+        assert third["Content-Encoding"] == "gzip"
+
+    def test_partial_content_not_compressed(self):
+        """Test range responses are left alone"""
+        # Arrange
+        response = JsonResponse(PAYLOAD, status=206)
+        response["Content-Range"] = "bytes 0-9/100"
+
+        # Act
+        response = run_middleware(response)
+
+        # Assert
+        assert not response.has_header("Content-Encoding")
+
+    def test_api_response_compressed_with_etag(self, api_client, user, db):
+        """Test API responses are compressed and can be revalidated"""
+        # Arrange
+        api_client.force_authenticate(user=user)
+        url = projects_urls.path("smallsearch")
+
+        # Act
+        response = api_client.get(url, HTTP_ACCEPT_ENCODING="br")
+        revalidated = api_client.get(
+            url, HTTP_ACCEPT_ENCODING="br", HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert "Accept-Encoding" in response["Vary"]
+        assert revalidated.status_code == 304
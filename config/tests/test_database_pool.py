@@ -0,0 +1,77 @@
+"""
+Tests for database connection pooling support.
+"""
+
+import io
+
+from django.core.management import call_command
+from django.db import connections
+from django.db.backends.postgresql.base import DatabaseWrapper
+
+
+class TestHealthCheck:
+    """Tests for the health endpoint"""
+
+    def test_reports_no_pool_when_disabled(self, client, db):
+        """Test pool stats are null without DATABASE_POOL"""
+        # Act
+        response = client.get("/health/")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["status"] == "ok"
+        assert response.json()["database_pool"] is None
+        assert "integrations" in response.json()
+
+    def test_reports_pool_stats(self, client, monkeypatch, db):
+        """Test pool counters are reported when pooling is enabled"""
+        # Arrange
+        settings_dict = {
+            **connections["default"].settings_dict,
+            "CONN_MAX_AGE": 0,
+            "OPTIONS": {"pool": {"min_size": 1, "max_size": 2}},
+        }
+        pooled = DatabaseWrapper(settings_dict, "health_pooled")
+        pooled.ensure_connection()
+        monkeypatch.setattr(DatabaseWrapper, "pool", pooled.pool)
+
+        # Act
+        try:
+            response = client.get("/health/")
+        finally:
+            pooled.close()
+            pooled.close_pool()
+
+        # Assert
+        assert response.status_code == 200
+        stats = response.json()["database_pool"]
+        assert stats["pool_max"] == 2
+        assert stats["requests_num"] == 1
+
+
+class TestLoadtestDatabaseCommand:
+    """Tests for the loadtest_database management command"""
+
+    def test_reports_each_mode(self, db):
+        """Test the command prints latency for every connection setup"""
+        # Arrange
+        out = io.StringIO()
+
+        # Act
+        call_command(
+            "loadtest_database",
+            "--threads",
+            "2",
+            "--requests",
+            "3",
+            "--query",
+            "SELECT 1",
+            stdout=out,
+        )
+
+        # Assert
+        lines = out.getvalue().splitlines()
+        assert lines[0].split()[0] == "mode"
+        rows = {line.split()[0]: line.split() for line in lines[1:]}
+        assert set(rows) == {"direct", "persistent", "pooled"}
+        assert all(row[1] == "6" for row in rows.values())
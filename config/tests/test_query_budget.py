@@ -0,0 +1,105 @@
+"""
+Tests for per-request query instrumentation and query budgets.
+"""
+
+import pytest
+from django.contrib.auth import get_user_model
+
+from common.tests.test_helpers import assert_query_budget, projects_urls
+from config.query_budget import (
+    QueryBudgetExceeded,
+    fingerprint_sql,
+    get_query_budget,
+    track_queries,
+)
+from projects.views.search import SmallProjectSearch
+
+User = get_user_model()
+
+
+class TestFingerprintSql:
+    """Tests for SQL fingerprinting"""
+
+    def test_literals_and_in_lists_collapse(self):
+        """Test queries differing only by values share a fingerprint"""
+        # Act
+        first = fingerprint_sql("SELECT * FROM t WHERE id IN (%s, %s) AND x = 'a'")
+        second = fingerprint_sql("SELECT * FROM t WHERE id IN (%s)  AND x = 'bb'")
+
+        # Assert
+        assert first == second == "SELECT * FROM t WHERE id IN (?) AND x = ?"
+
+
+class TestTrackQueries:
+    """Tests for the track_queries context manager"""
+
+    def test_counts_queries_and_duplicates(self, user, db):
+        """Test repeated lookups are counted as duplicates"""
+        # Act
+        with track_queries() as metrics:
+            for _ in range(3):
+                User.objects.get(pk=user.pk)
+
+        # Assert
+        assert metrics.query_count == 3
+        assert metrics.duplicate_queries == 2
+        assert metrics.most_duplicated()[0][1] == 3
+        assert metrics.db_time >= 0
+
+    def test_get_query_budget_per_method(self):
+        """Test budgets can be declared per HTTP method"""
+        # Assert
+        assert get_query_budget(SmallProjectSearch, "get") == 4
+        assert get_query_budget(SmallProjectSearch, "POST") is None
+        assert get_query_budget(None, "GET") is None
+
+
+class TestQueryBudgetMiddleware:
+    """Tests for QueryBudgetMiddleware"""
+
+    def test_server_timing_header(self, api_client, user, settings, db):
+        """Test responses report database and serializer timings"""
+        # Arrange
+        settings.QUERY_INSTRUMENTATION = True
+        api_client.force_authenticate(user=user)
+
+        # Act
+        response = api_client.get(projects_urls.path("smallsearch"))
+
+        # Assert
+        assert response.status_code == 200
+        assert "db;dur=" in response["Server-Timing"]
+        assert "serializer;dur=" in response["Server-Timing"]
+
+    def test_budget_exceeded_raises(self, api_client, user, settings, monkeypatch, db):
+        """Test exceeding a declared budget raises when enforcement is on"""
+        # Arrange
+        settings.QUERY_INSTRUMENTATION = True
+        settings.QUERY_BUDGET_RAISE = True
+        monkeypatch.setattr(SmallProjectSearch, "query_budget", {"GET": 0})
+        api_client.force_authenticate(user=user)
+
+        # Act & Assert
+        with pytest.raises(QueryBudgetExceeded):
+            api_client.get(projects_urls.path("smallsearch"))
+
+
+class TestAssertQueryBudget:
+    """Tests for the assert_query_budget test helper"""
+
+    def test_within_budget(self, api_client, user, db):
+        """Test the helper passes when the view stays within its budget"""
+        # Arrange
+        api_client.force_authenticate(user=user)
+
+        # Act & Assert
+        with assert_query_budget(SmallProjectSearch, "GET"):
+            api_client.get(projects_urls.path("smallsearch"))
+
+    def test_exceeded_budget_fails(self, user, db):
+        """Test the helper fails the test when the budget is exceeded"""
+        # Act & Assert
+        with pytest.raises(pytest.fail.Exception, match="Query budget exceeded"):
+            with assert_query_budget(max_queries=1):
+                User.objects.get(pk=user.pk)
+                User.objects.get(pk=user.pk)
@@ -1,9 +1,9 @@
-from django.conf import settings
-from django.conf.urls.static import static
 from django.contrib import admin
 from django.http import JsonResponse
 from django.urls import include, path, re_path
-from django.views.static import serve
+
+from common.utils.http import get_client_stats
+from medias.views import MediaFile
 
 
 def health_check(request):
@@ -11,11 +11,21 @@ def health_check(request):
     try:
         from django.db import connections
 
-        connections["default"].cursor()
+        database = connections["default"]
+        database.cursor()
     except Exception as e:
         return JsonResponse({"status": "fail", "error": str(e)}, status=500)
 
-    return JsonResponse({"status": "ok"}, status=200)
+    # Pool counters (see psycopg_pool's ConnectionPool.get_stats), if pooling
+    pool = database.pool
+    return JsonResponse(
+        {
+            "status": "ok",
+            "database_pool": pool.get_stats() if pool else None,
+            "integrations": get_client_stats(),
+        },
+        status=200,
+    )
 
 
 urlpatterns = [
@@ -36,8 +46,5 @@ urlpatterns = [
     path("api/v1/categories/", include("categories.urls")),
     path("api/v1/adminoptions/", include("adminoptions.urls")),
     path("api/v1/caretakers/", include("caretakers.urls")),
-    re_path(r"^files/(?P<path>.*)$", serve, {"document_root": settings.MEDIA_ROOT}),
-] + static(
-    settings.MEDIA_URL,
-    document_root=settings.MEDIA_ROOT,
-)
+    re_path(r"^files/(?P<path>.*)$", MediaFile.as_view(), name="media_file"),
+]
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class DocumentsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "documents"
+
+    def ready(self):
+        """Register event subscribers when the app is ready."""
+        import documents.subscribers  # noqa: F401
@@ -0,0 +1,46 @@
+"""
+Domain events for the document approval workflow (see common.events)
+"""
+
+from dataclasses import dataclass
+
+from common.events import Event
+
+
+@dataclass(frozen=True)
+class DocumentApprovalRequested(Event):
+    document: object
+    requester: object
+
+
+@dataclass(frozen=True)
+class DocumentApproved(Event):
+    """Approval granted at one stage; stage 3 is the final approval"""
+
+    document: object
+    approver: object
+    stage: int
+
+
+@dataclass(frozen=True)
+class DocumentSentBack(Event):
+    document: object
+    sender: object
+    reason: str
+
+
+@dataclass(frozen=True)
+class DocumentRecalled(Event):
+    document: object
+    recaller: object
+    reason: str
+
+
+@dataclass(frozen=True)
+class CommentMentioned(Event):
+    """Users mentioned in a document comment; recipients are already checked"""
+
+    document: object
+    commenter_name: str
+    comment: str
+    recipients: tuple
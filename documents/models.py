@@ -129,6 +129,37 @@ class AnnualReport(CommonModel):
         verbose_name_plural = "Annual Reports"
 
 
+class AnnualReportDeletion(CommonModel):
+    """
+    Progress of a background annual report deletion.
+
+    Kept by report id rather than a foreign key, as the report itself is
+    deleted last and the progress must outlive it.
+    """
+
+    class StatusChoices(models.TextChoices):
+        RUNNING = "running", "Running"
+        COMPLETED = "completed", "Completed"
+        FAILED = "failed", "Failed"
+
+    report_id = models.PositiveIntegerField(unique=True)
+    status = models.CharField(
+        max_length=20,
+        choices=StatusChoices.choices,
+        default=StatusChoices.RUNNING,
+    )
+    deleted = models.PositiveIntegerField(default=0)
+    total = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True, default="")
+
+    def __str__(self) -> str:
+        return f"Deletion of report {self.report_id} ({self.status})"
+
+    class Meta:
+        verbose_name = "Annual Report Deletion"
+        verbose_name_plural = "Annual Report Deletions"
+
+
 # endregion ==================================
 
 
@@ -519,6 +550,10 @@ class ProgressReport(models.Model):
         help_text="Future directions for the annual activity update. Aim for 100 to 150 words. One bullet point per direction.",
     )
 
+    # Section edits save the report but not its document, so the report
+    # editor needs this to poll for changes
+    updated_at = models.DateTimeField(auto_now=True)
+
     def extract_inner_text(self, html_string):
         # Parse the HTML using BeautifulSoup
         soup = BeautifulSoup(html_string, "html.parser")
@@ -575,6 +610,9 @@ class StudentReport(models.Model):
         help_text="The year on which this progress report reports on with four digits, e.g. 2014 for FY 2013/14.",
     )
 
+    # See ProgressReport.updated_at
+    updated_at = models.DateTimeField(auto_now=True)
+
     def extract_inner_text(self, html_string):
         # Parse the HTML using BeautifulSoup
         soup = BeautifulSoup(html_string, "html.parser")
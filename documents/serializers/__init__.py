@@ -4,6 +4,8 @@ Documents serializers
 
 # Base serializers
 from .base import (
+    TINY_PROJECT_DOCUMENT_PREFETCH,
+    TINY_PROJECT_DOCUMENT_RELATED,
     AnnualReportCreateSerializer,
     AnnualReportSerializer,
     AnnualReportUpdateSerializer,
@@ -75,6 +77,8 @@ from .student_report import (
 __all__ = [
     # Base
     "TinyProjectDocumentSerializer",
+    "TINY_PROJECT_DOCUMENT_RELATED",
+    "TINY_PROJECT_DOCUMENT_PREFETCH",
     "TinyProjectDocumentSerializerWithUserDocsBelongTo",
     "ProjectDocumentSerializer",
     "ProjectDocumentCreateSerializer",
@@ -43,6 +43,19 @@ class TinyProjectDocumentSerializer(serializers.ModelSerializer):
         ]
 
 
+# Joins needed to serialize documents with TinyProjectDocumentSerializer
+# without a query per document
+TINY_PROJECT_DOCUMENT_RELATED = [
+    "pdf",
+    "project__image__uploader",
+    "project__business_area__image",
+    "project__business_area__division",
+]
+TINY_PROJECT_DOCUMENT_PREFETCH = [
+    "project__business_area__division__directorate_email_list",
+]
+
+
 class ProjectDocumentSerializer(serializers.ModelSerializer):
     """Standard project document serializer"""
 
@@ -2,6 +2,7 @@
 Documents services
 """
 
+from .annual_report_service import AnnualReportService
 from .approval_service import ApprovalService
 from .closure_service import ClosureService
 from .concept_plan_service import ConceptPlanService
@@ -23,4 +24,5 @@ __all__ = [
     "ProjectPlanService",
     "ProgressReportService",
     "ClosureService",
+    "AnnualReportService",
 ]
@@ -0,0 +1,232 @@
+"""
+Annual report service - Annual report year and deletion operations
+"""
+
+import threading
+import zlib
+
+from django.conf import settings
+from django.db import connection, connections, transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from projects.services.page_service import ProjectPageService
+
+from ..models import (
+    AnnualReport,
+    AnnualReportDeletion,
+    ProgressReport,
+    ProjectDocument,
+    StudentReport,
+)
+
+
+class AnnualReportService:
+    """Business logic for annual report operations"""
+
+    @staticmethod
+    def get_available_reports(project_id, report_model):
+        """
+        Get annual reports whose year has no report of a kind for a project
+
+        Args:
+            project_id: Project primary key
+            report_model: ProgressReport or StudentReport
+
+        Returns:
+            QuerySet of AnnualReport objects
+        """
+        return AnnualReport.objects.filter(
+            ~Exists(
+                report_model.objects.filter(
+                    document__project_id=project_id, year=OuterRef("year")
+                )
+            )
+        )
+
+    @staticmethod
+    def get_report_documents(report):
+        """
+        Get the progress and student report documents of an annual report
+
+        Args:
+            report: AnnualReport instance
+
+        Returns:
+            QuerySet of ProjectDocument objects
+        """
+        return ProjectDocument.objects.filter(
+            Exists(
+                ProgressReport.objects.filter(document=OuterRef("pk"), report=report)
+            )
+            | Exists(
+                StudentReport.objects.filter(document=OuterRef("pk"), report=report)
+            )
+        )
+
+    @staticmethod
+    def delete_report(report, batch_size=None, progress=None):
+        """
+        Delete an annual report with its progress and student report documents
+
+        Documents are deleted a batch at a time, each batch in its own
+        transaction, so a large year never holds locks on every row at once.
+        A deletion that fails part way can be run again.
+
+        Args:
+            report: AnnualReport instance
+            batch_size: Documents per batch (default:
+                ANNUAL_REPORT_DELETE_BATCH_SIZE)
+            progress: Called with (deleted, total) after each batch
+
+        Returns:
+            Number of documents deleted
+        """
+        batch_size = batch_size or settings.ANNUAL_REPORT_DELETE_BATCH_SIZE
+        document_ids = list(
+            AnnualReportService.get_report_documents(report).values_list(
+                "pk", flat=True
+            )
+        )
+        total = len(document_ids)
+        settings.LOGGER.info(f"Deleting report {report} with {total} documents")
+
+        for start in range(0, total, batch_size):
+            # One page version bump per batch, not per deleted row
+            with ProjectPageService.deferred_bumps(), transaction.atomic():
+                ProjectDocument.objects.filter(
+                    pk__in=document_ids[start : start + batch_size]
+                ).delete()
+            if progress:
+                progress(min(start + batch_size, total), total)
+
+        report.delete()
+        return total
+
+    @staticmethod
+    def start_report_deletion(report):
+        """
+        Delete an annual report on a background thread
+
+        Progress is kept in an AnnualReportDeletion row for
+        get_deletion_progress, so every worker sees it. Starting a deletion
+        that is already running does nothing. A deletion marked as running
+        whose worker died (its advisory lock is free) is started again.
+
+        Args:
+            report: AnnualReport instance
+
+        Returns:
+            Tuple of (progress dict, Thread or None if already running)
+        """
+        total = AnnualReportService.get_report_documents(report).count()
+        with transaction.atomic():
+            # Row lock, so concurrent requests decide one at a time
+            (
+                deletion,
+                created,
+            ) = AnnualReportDeletion.objects.select_for_update().get_or_create(
+                report_id=report.pk, defaults={"total": total}
+            )
+            if not created:
+                if (
+                    deletion.status == AnnualReportDeletion.StatusChoices.RUNNING
+                    and AnnualReportService._is_deletion_locked(report.pk)
+                ):
+                    return AnnualReportService._progress(deletion), None
+                deletion.status = AnnualReportDeletion.StatusChoices.RUNNING
+                deletion.deleted = 0
+                deletion.total = total
+                deletion.error = ""
+                deletion.save()
+
+        thread = threading.Thread(
+            target=AnnualReportService._run_report_deletion,
+            args=(report.pk,),
+            name=f"annual-report-deletion-{report.pk}",
+            daemon=True,
+        )
+        thread.start()
+        return AnnualReportService._progress(deletion), thread
+
+    @staticmethod
+    def get_deletion_progress(pk):
+        """
+        Get the progress of a background annual report deletion
+
+        Args:
+            pk: AnnualReport primary key
+
+        Returns:
+            Dict of status ("running", "completed" or "failed"), deleted
+            and total documents, and error when failed, or None if no
+            deletion was started
+        """
+        deletion = AnnualReportDeletion.objects.filter(report_id=pk).first()
+        return AnnualReportService._progress(deletion) if deletion else None
+
+    @staticmethod
+    def _progress(deletion):
+        progress = {
+            "status": deletion.status,
+            "deleted": deletion.deleted,
+            "total": deletion.total,
+        }
+        if deletion.status == AnnualReportDeletion.StatusChoices.FAILED:
+            progress["error"] = deletion.error
+        return progress
+
+    @staticmethod
+    def _lock_id(pk):
+        return zlib.crc32(f"annual_report_deletion:{pk}".encode())
+
+    @staticmethod
+    def _is_deletion_locked(pk):
+        # Held by the session of the worker running the deletion
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT EXISTS (SELECT 1 FROM pg_locks WHERE locktype = 'advisory'"
+                " AND classid = 0 AND objid = %s AND objsubid = 1 AND granted)",
+                [AnnualReportService._lock_id(pk)],
+            )
+            return cursor.fetchone()[0]
+
+    @staticmethod
+    def _run_report_deletion(pk):
+        deletions = AnnualReportDeletion.objects.filter(report_id=pk)
+        lock_id = AnnualReportService._lock_id(pk)
+        try:
+            # Session level, so it is held across the batch transactions
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_try_advisory_lock(%s)", [lock_id])
+                if not cursor.fetchone()[0]:
+                    settings.LOGGER.info(f"Annual report {pk} is already deleting")
+                    return
+
+            try:
+                total = AnnualReportService.delete_report(
+                    AnnualReport.objects.get(pk=pk),
+                    progress=lambda deleted, total: deletions.update(
+                        deleted=deleted, total=total, updated_at=timezone.now()
+                    ),
+                )
+            except Exception as e:
+                settings.LOGGER.exception(f"Deleting annual report {pk} failed")
+                deletions.update(
+                    status=AnnualReportDeletion.StatusChoices.FAILED,
+                    error=str(e),
+                    updated_at=timezone.now(),
+                )
+            else:
+                deletions.update(
+                    status=AnnualReportDeletion.StatusChoices.COMPLETED,
+                    deleted=total,
+                    total=total,
+                    updated_at=timezone.now(),
+                )
+            finally:
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT pg_advisory_unlock(%s)", [lock_id])
+        finally:
+            # The thread's own connection
+            connections.close_all()
@@ -6,8 +6,15 @@ from django.conf import settings
 from django.db import transaction
 from rest_framework.exceptions import PermissionDenied, ValidationError
 
+from common.events import publish
+
+from ..events import (
+    DocumentApprovalRequested,
+    DocumentApproved,
+    DocumentRecalled,
+    DocumentSentBack,
+)
 from ..models import ProjectDocument
-from .notification_service import NotificationService
 
 
 class ApprovalService:
@@ -38,8 +45,8 @@ class ApprovalService:
         document.status = ProjectDocument.StatusChoices.INAPPROVAL
         document.save()
 
-        # Notify approvers
-        NotificationService.notify_document_ready(document, requester)
+        # Approvers are notified once this commits
+        publish(DocumentApprovalRequested(document, requester))
 
     @staticmethod
     @transaction.atomic
@@ -63,8 +70,8 @@ class ApprovalService:
         document.project_lead_approval_granted = True
         document.save()
 
-        # Notify next approver
-        NotificationService.notify_document_ready(document, approver)
+        # Next approver is notified once this commits
+        publish(DocumentApproved(document, approver, stage=1))
 
     @staticmethod
     @transaction.atomic
@@ -93,8 +100,8 @@ class ApprovalService:
         document.business_area_lead_approval_granted = True
         document.save()
 
-        # Notify next approver
-        NotificationService.notify_document_ready(document, approver)
+        # Next approver is notified once this commits
+        publish(DocumentApproved(document, approver, stage=2))
 
     @staticmethod
     @transaction.atomic
@@ -128,9 +135,8 @@ class ApprovalService:
         document.status = ProjectDocument.StatusChoices.APPROVED
         document.save()
 
-        # Notify document approved
-        NotificationService.notify_document_approved(document, approver)
-        NotificationService.notify_document_approved_directorate(document, approver)
+        # Project team and directorate are notified once this commits
+        publish(DocumentApproved(document, approver, stage=3))
 
     @staticmethod
     @transaction.atomic
@@ -148,8 +154,8 @@ class ApprovalService:
         document.status = ProjectDocument.StatusChoices.REVISING
         document.save()
 
-        # Notify document sent back
-        NotificationService.notify_document_sent_back(document, sender, reason)
+        # Project team is notified once this commits
+        publish(DocumentSentBack(document, sender, reason))
 
     @staticmethod
     @transaction.atomic
@@ -171,8 +177,8 @@ class ApprovalService:
         document.status = ProjectDocument.StatusChoices.REVISING
         document.save()
 
-        # Notify document recalled
-        NotificationService.notify_document_recalled(document, recaller, reason)
+        # Project team is notified once this commits
+        publish(DocumentRecalled(document, recaller, reason))
 
     @staticmethod
     @transaction.atomic
@@ -4,10 +4,17 @@ Document service - Base document operations
 
 from django.conf import settings
 from django.db import transaction
-from django.db.models import Q
+from django.db.models import BooleanField, Case, Exists, OuterRef, Q, Value, When
 from rest_framework.exceptions import NotFound
 
-from ..models import ProjectDocument
+from ..models import (
+    ConceptPlan,
+    ProgressReport,
+    ProjectClosure,
+    ProjectDocument,
+    ProjectPlan,
+    StudentReport,
+)
 
 
 class DocumentService:
@@ -222,6 +229,72 @@ class DocumentService:
 
         return documents.distinct()
 
+    @staticmethod
+    def get_unapproved_documents_by_business_area(business_area_ids):
+        """
+        Get documents awaiting project lead approval for several business areas
+
+        Loads every business area's documents with one query, flagging those
+        without a linked details record (see ProjectDocument.has_project_document_data).
+
+        Args:
+            business_area_ids: Iterable of business area IDs
+
+        Returns:
+            Dict of business area ID to a dict of linked and unlinked documents
+        """
+        requested = {str(pk): pk for pk in business_area_ids}
+        grouped = {pk: {"linked": [], "unlinked": []} for pk in requested.values()}
+        if not requested:
+            return grouped
+
+        kinds = ProjectDocument.CategoryKindChoices
+        details_models = {
+            kinds.CONCEPTPLAN: ConceptPlan,
+            kinds.PROJECTPLAN: ProjectPlan,
+            kinds.PROGRESSREPORT: ProgressReport,
+            kinds.STUDENTREPORT: StudentReport,
+            kinds.PROJECTCLOSURE: ProjectClosure,
+        }
+        documents = (
+            ProjectDocument.objects.filter(
+                project__business_area__in=list(requested.values()),
+                project_lead_approval_granted=False,
+            )
+            .annotate(
+                has_details=Case(
+                    *[
+                        When(
+                            kind=kind,
+                            then=Exists(model.objects.filter(document=OuterRef("pk"))),
+                        )
+                        for kind, model in details_models.items()
+                    ],
+                    default=Value(False),
+                    output_field=BooleanField(),
+                )
+            )
+            .select_related(
+                "project",
+                "project__image",
+                "project__business_area",
+                "project__business_area__image",
+                "project__business_area__division",
+                "pdf",
+            )
+            .prefetch_related(
+                "project__business_area__division__directorate_email_list",
+            )
+            .order_by("pk")
+        )
+
+        for document in documents:
+            group = "linked" if document.has_details else "unlinked"
+            ba_pk = requested[str(document.project.business_area_id)]
+            grouped[ba_pk][group].append(document)
+
+        return grouped
+
     @staticmethod
     def _apply_filters(queryset, filters):
         """Apply filters to document queryset"""
@@ -6,7 +6,9 @@ making it easy to swap email providers or modify email logic.
 """
 
 from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
 from django.template.loader import render_to_string
+from django.utils.html import escape
 
 from config.helpers import send_email_with_embedded_image
 
@@ -60,6 +62,68 @@ class EmailService:
             settings.LOGGER.error(f"Email send failed: {e}")
             raise EmailSendError(f"Failed to send email: {e}")
 
+    @staticmethod
+    def send_personalised_emails(
+        template_name: str,
+        recipients: list[dict],
+        subject: str,
+        context: dict,
+        from_email: str = None,
+    ) -> int:
+        """
+        Send one HTML template to many recipients, greeting each by name
+
+        The template is rendered once with a placeholder recipient_name,
+        which is then replaced per recipient, and the messages are sent
+        over a single SMTP connection.
+
+        Args:
+            template_name: Template file name (e.g., 'document_comment_mention.html')
+            recipients: List of recipient dicts with 'name' and 'email'
+            subject: Email subject line
+            context: Template context dictionary, without recipient_name
+            from_email: Sender email (defaults to settings.DEFAULT_FROM_EMAIL)
+
+        Returns:
+            int: Number of emails sent
+
+        Raises:
+            EmailSendError: If the emails fail to send
+        """
+        if not recipients:
+            return 0
+        if from_email is None:
+            from_email = settings.DEFAULT_FROM_EMAIL
+
+        placeholder = "__spms_recipient_name__"
+        html_content = render_to_string(
+            f"./email_templates/{template_name}",
+            {**context, "recipient_name": placeholder},
+        )
+
+        messages = []
+        for recipient in recipients:
+            message = EmailMultiAlternatives(
+                subject,
+                # Plain text fallback
+                "Please view this email in an HTML-compatible email client.",
+                from_email,
+                [recipient["email"]],
+            )
+            message.attach_alternative(
+                html_content.replace(placeholder, escape(recipient["name"])),
+                "text/html",
+            )
+            messages.append(message)
+
+        try:
+            sent = get_connection().send_messages(messages) or 0
+        except Exception as e:
+            settings.LOGGER.error(f"Email send failed: {e}")
+            raise EmailSendError(f"Failed to send email: {e}")
+        settings.LOGGER.info(f"Email sent: {subject} to {sent} recipients")
+        return sent
+
     @staticmethod
     def send_document_notification(
         notification_type: str,
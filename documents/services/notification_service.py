@@ -2,6 +2,13 @@
 Notification service - Business logic for document notifications
 """
 
+from django.conf import settings
+
+from common.events import publish
+from users.models import User
+
+from ..events import CommentMentioned
+from ..utils.helpers import get_current_maintainer_id
 from .email_service import EmailService
 
 
@@ -214,6 +221,101 @@ class NotificationService:
             },
         )
 
+    @staticmethod
+    def queue_comment_mentions(document, commenter_name, comment, user_ids):
+        """
+        Email the users mentioned in a document comment once it is committed
+
+        Only active staff with a DBCA email are notified. Rendering and
+        sending happen in the CommentMentioned subscriber.
+
+        Args:
+            document: Document instance
+            commenter_name: Name of the user who made the comment
+            comment: Comment HTML
+            user_ids: Primary keys of the mentioned users
+
+        Returns:
+            Tuple of recipient dicts with 'id', 'name' and 'email'
+        """
+        recipients = tuple(
+            {
+                "id": user.pk,
+                "name": f"{user.display_first_name} {user.display_last_name}",
+                "email": user.email,
+            }
+            for user in User.objects.filter(
+                pk__in=user_ids,
+                is_active=True,
+                is_staff=True,
+                email__iendswith="@dbca.wa.gov.au",
+            ).only("pk", "display_first_name", "display_last_name", "email")
+        )
+        if recipients:
+            publish(
+                CommentMentioned(
+                    document=document,
+                    commenter_name=commenter_name,
+                    comment=comment,
+                    recipients=recipients,
+                )
+            )
+        return recipients
+
+    @staticmethod
+    def notify_comment_mentions(document, commenter_name, comment, recipients):
+        """
+        Notify every user mentioned in a document comment
+
+        Outside production only the maintainer is emailed.
+
+        Args:
+            document: Document instance
+            commenter_name: Name of the user who made the comment
+            comment: Comment HTML
+            recipients: List of recipient dicts with 'id', 'name' and 'email'
+
+        Returns:
+            int: Number of emails sent
+        """
+        if settings.ENVIRONMENT != "production":
+            maintainer_id = get_current_maintainer_id()
+            recipients = [r for r in recipients if r["id"] == maintainer_id]
+        if not recipients:
+            return 0
+
+        project = document.project
+        project_tag = project.get_project_tag()
+        kind_label = document.CategoryKindChoices(document.kind).label
+        url_safe_kind = {
+            "concept": "concept",
+            "projectplan": "project",
+            "progressreport": "progress",
+            "studentreport": "student",
+            "projectclosure": "closure",
+        }[document.kind]
+
+        return EmailService.send_personalised_emails(
+            template_name="document_comment_mention.html",
+            recipients=recipients,
+            subject=(
+                f"SPMS: You were mentioned in a comment on {kind_label} "
+                f"({project_tag})"
+            ),
+            context={
+                "commenter_name": commenter_name,
+                "document_type_title": kind_label,
+                "project_tag": project_tag,
+                "project_name": project.title,
+                "document_url": (
+                    f"{settings.SITE_URL}/projects/{project.pk}/{url_safe_kind}"
+                ),
+                "comment_content": NotificationService._clean_comment(comment),
+                "is_mention": True,
+                "site_url": settings.SITE_URL,
+            },
+        )
+
     @staticmethod
     def notify_new_cycle_open(cycle, projects):
         """
@@ -417,3 +519,25 @@ class NotificationService:
             )
 
         return recipients
+
+    @staticmethod
+    def _clean_comment(html_content):
+        """
+        Get the plain text of comment HTML, keeping mentions as their text
+
+        Returns:
+            str: Comment text, or the HTML unchanged if it can't be parsed
+        """
+        from bs4 import BeautifulSoup
+
+        if not html_content:
+            return ""
+
+        try:
+            soup = BeautifulSoup(html_content, "html.parser")
+            for span in soup.find_all("span", {"data-lexical-mention": "true"}):
+                span.replace_with(span.get_text())
+            return soup.get_text().strip()
+        except Exception as e:
+            settings.LOGGER.error(f"Error cleaning comment content: {e}")
+            return html_content
@@ -102,13 +102,17 @@ class PDFService:
         try:
             # Create temporary files
             with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".html", delete=False, encoding="utf-8"
+                mode="w",
+                prefix=settings.TEMP_FILE_PREFIX,
+                suffix=".html",
+                delete=False,
+                encoding="utf-8",
             ) as html_file:
                 html_file.write(html_content)
                 html_path = html_file.name
 
             with tempfile.NamedTemporaryFile(
-                mode="wb", suffix=".pdf", delete=False
+                mode="wb", prefix=settings.TEMP_FILE_PREFIX, suffix=".pdf", delete=False
             ) as pdf_file:
                 pdf_path = pdf_file.name
 
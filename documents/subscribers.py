@@ -0,0 +1,60 @@
+"""
+Event subscribers for the documents app.
+
+Approval and mention emails are sent once the change is committed rather
+than from inside the request's transaction (see common.events).
+"""
+
+from common.events import subscribe
+
+from .events import (
+    CommentMentioned,
+    DocumentApprovalRequested,
+    DocumentApproved,
+    DocumentRecalled,
+    DocumentSentBack,
+)
+from .services.notification_service import NotificationService
+
+
+@subscribe(DocumentApprovalRequested)
+def notify_approval_requested(event):
+    """Tell the first approver the document is ready"""
+    NotificationService.notify_document_ready(event.document, event.requester)
+
+
+@subscribe(DocumentApproved)
+def notify_document_approved(event):
+    """Tell the next approver, or everyone once the final stage is approved"""
+    if event.stage < 3:
+        NotificationService.notify_document_ready(event.document, event.approver)
+        return
+
+    NotificationService.notify_document_approved(event.document, event.approver)
+    NotificationService.notify_document_approved_directorate(
+        event.document, event.approver
+    )
+
+
+@subscribe(DocumentSentBack)
+def notify_document_sent_back(event):
+    """Tell the project team the document needs revising"""
+    NotificationService.notify_document_sent_back(
+        event.document, event.sender, event.reason
+    )
+
+
+@subscribe(DocumentRecalled)
+def notify_document_recalled(event):
+    """Tell the project team the document was recalled"""
+    NotificationService.notify_document_recalled(
+        event.document, event.recaller, event.reason
+    )
+
+
+@subscribe(CommentMentioned)
+def notify_comment_mentioned(event):
+    """Tell each mentioned user about the comment"""
+    NotificationService.notify_comment_mentions(
+        event.document, event.commenter_name, event.comment, list(event.recipients)
+    )
@@ -11,7 +11,7 @@ from django.contrib.auth import get_user_model
 from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
 
 from common.tests.factories import ProjectDocumentFactory, ProjectFactory, UserFactory
-from documents.models import ProjectDocument
+from documents.models import AnnualReport, ProgressReport, ProjectDocument
 from documents.services.approval_service import ApprovalService
 from documents.services.document_service import DocumentService
 from documents.services.email_service import EmailSendError, EmailService
@@ -343,9 +343,7 @@ class TestApprovalService:
         )
 
         # Act
-        with patch(
-            "documents.services.approval_service.NotificationService.notify_document_ready"
-        ):
+        with patch("documents.subscribers.NotificationService.notify_document_ready"):
             ApprovalService.request_approval(concept_plan.document, user)
 
         # Assert
@@ -386,9 +384,7 @@ class TestApprovalService:
         )
 
         # Act
-        with patch(
-            "documents.services.approval_service.NotificationService.notify_document_ready"
-        ):
+        with patch("documents.subscribers.NotificationService.notify_document_ready"):
             ApprovalService.approve_stage_one(document, user)
 
         # Assert
@@ -426,9 +422,7 @@ class TestApprovalService:
         )
 
         # Act
-        with patch(
-            "documents.services.approval_service.NotificationService.notify_document_ready"
-        ):
+        with patch("documents.subscribers.NotificationService.notify_document_ready"):
             ApprovalService.approve_stage_two(document, ba_lead)
 
         # Assert
@@ -467,7 +461,7 @@ class TestApprovalService:
 
         # Act
         with patch(
-            "documents.services.approval_service.NotificationService.notify_document_sent_back"
+            "documents.subscribers.NotificationService.notify_document_sent_back"
         ):
             ApprovalService.send_back(concept_plan.document, user, "Needs more detail")
 
@@ -488,7 +482,7 @@ class TestApprovalService:
 
         # Act
         with patch(
-            "documents.services.approval_service.NotificationService.notify_document_recalled"
+            "documents.subscribers.NotificationService.notify_document_recalled"
         ):
             ApprovalService.recall(concept_plan.document, user, "Need to make changes")
 
@@ -550,10 +544,10 @@ class TestApprovalService:
 
         # Act
         with patch(
-            "documents.services.approval_service.NotificationService.notify_document_approved"
+            "documents.subscribers.NotificationService.notify_document_approved"
         ):
             with patch(
-                "documents.services.approval_service.NotificationService.notify_document_approved_directorate"
+                "documents.subscribers.NotificationService.notify_document_approved_directorate"
             ):
                 ApprovalService.approve_stage_three(document, director)
 
@@ -562,6 +556,83 @@ class TestApprovalService:
         assert document.directorate_approval_granted is True
         assert document.status == ProjectDocument.StatusChoices.APPROVED
 
+    @pytest.mark.django_db
+    def test_approval_notifies_after_commit(self, django_capture_on_commit_callbacks):
+        """Test the next approver is emailed only once the approval commits"""
+        # Arrange
+        user = UserFactory()
+        project = ProjectFactory()
+        project.members.create(user=user, is_leader=True, role="supervising")
+        document = ProjectDocumentFactory(
+            project=project,
+            status=ProjectDocument.StatusChoices.INAPPROVAL,
+        )
+
+        # Act
+        with patch(
+            "documents.subscribers.NotificationService.notify_document_ready"
+        ) as notify:
+            with django_capture_on_commit_callbacks() as callbacks:
+                ApprovalService.approve_stage_one(document, user)
+            sent_before_commit = notify.call_count
+            for callback in callbacks:
+                callback()
+
+        # Assert
+        assert sent_before_commit == 0
+        notify.assert_called_once_with(document, user)
+
+    @pytest.mark.django_db
+    def test_final_approval_notifies_team_and_directorate(
+        self, django_capture_on_commit_callbacks, project_lead, ba_lead, director
+    ):
+        """Test stage 3 approval emails the project team and directorate"""
+        # Arrange
+        from common.tests.factories import BusinessAreaFactory, DivisionFactory
+
+        division = DivisionFactory(director=director)
+        business_area = BusinessAreaFactory(leader=ba_lead, division=division)
+        project = ProjectFactory(business_area=business_area)
+        document = ProjectDocumentFactory(
+            project=project,
+            status=ProjectDocument.StatusChoices.INAPPROVAL,
+            project_lead_approval_granted=True,
+            business_area_lead_approval_granted=True,
+        )
+
+        # Act
+        with (
+            patch(
+                "documents.subscribers.NotificationService.notify_document_approved"
+            ) as notify_team,
+            patch(
+                "documents.subscribers.NotificationService.notify_document_approved_directorate"
+            ) as notify_directorate,
+        ):
+            with django_capture_on_commit_callbacks(execute=True):
+                ApprovalService.approve_stage_three(document, director)
+
+        # Assert
+        notify_team.assert_called_once_with(document, director)
+        notify_directorate.assert_called_once_with(document, director)
+
+    @pytest.mark.django_db
+    def test_failed_approval_sends_nothing(self, django_capture_on_commit_callbacks):
+        """Test no email is queued when the approval is rejected"""
+        # Arrange
+        user = UserFactory()
+        concept_plan = ConceptPlanFactory(
+            document__status=ProjectDocument.StatusChoices.INAPPROVAL
+        )
+
+        # Act
+        with django_capture_on_commit_callbacks() as callbacks:
+            with pytest.raises(PermissionDenied):
+                ApprovalService.approve_stage_one(concept_plan.document, user)
+
+        # Assert
+        assert callbacks == []
+
     @pytest.mark.django_db
     def test_approve_stage_three_requires_stage_one(
         self, project_lead, ba_lead, director
@@ -675,9 +746,7 @@ class TestApprovalService:
         )
 
         # Act
-        with patch(
-            "documents.services.approval_service.NotificationService.notify_document_ready"
-        ):
+        with patch("documents.subscribers.NotificationService.notify_document_ready"):
             results = ApprovalService.batch_approve([doc1, doc2], project_lead, stage=1)
 
         # Assert
@@ -712,9 +781,7 @@ class TestApprovalService:
         )
 
         # Act
-        with patch(
-            "documents.services.approval_service.NotificationService.notify_document_ready"
-        ):
+        with patch("documents.subscribers.NotificationService.notify_document_ready"):
             results = ApprovalService.batch_approve([doc1, doc2], ba_lead, stage=2)
 
         # Assert
@@ -753,10 +820,10 @@ class TestApprovalService:
 
         # Act
         with patch(
-            "documents.services.approval_service.NotificationService.notify_document_approved"
+            "documents.subscribers.NotificationService.notify_document_approved"
         ):
             with patch(
-                "documents.services.approval_service.NotificationService.notify_document_approved_directorate"
+                "documents.subscribers.NotificationService.notify_document_approved_directorate"
             ):
                 results = ApprovalService.batch_approve([doc1, doc2], director, stage=3)
 
@@ -794,9 +861,7 @@ class TestApprovalService:
         )
 
         # Act
-        with patch(
-            "documents.services.approval_service.NotificationService.notify_document_ready"
-        ):
+        with patch("documents.subscribers.NotificationService.notify_document_ready"):
             results = ApprovalService.batch_approve([doc1, doc2], project_lead, stage=1)
 
         # Assert
@@ -2751,6 +2816,38 @@ class TestEmailService:
                 context={"key": "value"},
             )
 
+    @patch("documents.services.email_service.render_to_string")
+    def test_send_personalised_emails(self, mock_render, mailoutbox):
+        """Test the template is rendered once and each email greets its recipient"""
+        # Arrange
+        mock_render.side_effect = lambda template, context: (
+            f"<p>Hello {context['recipient_name']}</p>"
+        )
+        recipients = [
+            {"name": "Ann O'Brien", "email": "ann@dbca.wa.gov.au"},
+            {"name": "Bob", "email": "bob@dbca.wa.gov.au"},
+        ]
+
+        # Act
+        sent = EmailService.send_personalised_emails(
+            template_name="test_email.html",
+            recipients=recipients,
+            subject="Test Subject",
+            context={"key": "value"},
+        )
+
+        # Assert
+        assert sent == 2
+        mock_render.assert_called_once()
+        assert [message.to for message in mailoutbox] == [
+            ["ann@dbca.wa.gov.au"],
+            ["bob@dbca.wa.gov.au"],
+        ]
+        assert [message.alternatives[0][0] for message in mailoutbox] == [
+            "<p>Hello Ann O&#x27;Brien</p>",
+            "<p>Hello Bob</p>",
+        ]
+
     @pytest.mark.django_db
     @patch("documents.services.email_service.EmailService.send_template_email")
     def test_send_document_notification(self, mock_send):
@@ -2790,3 +2887,171 @@ class TestEmailService:
                 recipients=recipients,
                 actioning_user=user,
             )
+
+
+class TestAnnualReportService:
+    """Test AnnualReportService business logic"""
+
+    @pytest.mark.django_db
+    def test_get_available_reports(self, django_assert_num_queries):
+        """Test years already reported on for the project are left out"""
+        # Arrange
+        from documents.services.annual_report_service import AnnualReportService
+        from documents.tests.factories import AnnualReportFactory
+
+        reported = AnnualReportFactory(year=2022)
+        available = AnnualReportFactory(year=2023)
+        progress_report = ProgressReportFactory(report=reported, year=2022)
+        StudentReportFactory(
+            document__project=progress_report.document.project,
+            report=available,
+            year=2023,
+        )
+
+        # Act
+        with django_assert_num_queries(1):
+            reports = list(
+                AnnualReportService.get_available_reports(
+                    progress_report.document.project_id, ProgressReport
+                )
+            )
+
+        # Assert
+        assert reports == [available]
+
+    @pytest.mark.django_db
+    def test_delete_report_in_batches(self):
+        """Test documents are deleted a batch at a time with progress"""
+        # Arrange
+        from documents.services.annual_report_service import AnnualReportService
+        from documents.tests.factories import AnnualReportFactory
+
+        report = AnnualReportFactory(year=2022)
+        other_report = AnnualReportFactory(year=2023)
+        progress_reports = ProgressReportFactory.create_batch(
+            3, report=report, year=2022
+        )
+        student_report = StudentReportFactory(report=report, year=2022)
+        kept = ProgressReportFactory(report=other_report, year=2023)
+        progress = []
+
+        # Act
+        with patch("projects.services.page_service.cache.set_many") as set_many:
+            deleted = AnnualReportService.delete_report(
+                report,
+                batch_size=2,
+                progress=lambda done, total: progress.append((done, total)),
+            )
+
+        # Assert
+        assert deleted == 4
+        assert progress == [(2, 4), (4, 4)]
+        assert set_many.call_count == 2
+        assert not ProjectDocument.objects.filter(
+            pk__in=[pr.document_id for pr in progress_reports]
+            + [student_report.document_id]
+        ).exists()
+        assert not AnnualReport.objects.filter(pk=report.pk).exists()
+        assert ProgressReport.objects.filter(pk=kept.pk).exists()
+
+    @pytest.mark.django_db(transaction=True)
+    def test_start_report_deletion(self):
+        """Test a background deletion reports its progress"""
+        # Arrange
+        from documents.services.annual_report_service import AnnualReportService
+        from documents.tests.factories import AnnualReportFactory
+
+        report = AnnualReportFactory(year=2022)
+        ProgressReportFactory.create_batch(2, report=report, year=2022)
+
+        # Act
+        started, thread = AnnualReportService.start_report_deletion(report)
+        thread.join(timeout=10)
+
+        # Assert
+        assert started == {"status": "running", "deleted": 0, "total": 2}
+        assert AnnualReportService.get_deletion_progress(report.pk) == {
+            "status": "completed",
+            "deleted": 2,
+            "total": 2,
+        }
+        assert not AnnualReport.objects.filter(pk=report.pk).exists()
+
+    @pytest.mark.django_db
+    def test_start_report_deletion_already_running(self):
+        """Test a deletion whose worker holds the lock is not started again"""
+        # Arrange
+        from django.db import connection
+
+        from documents.models import AnnualReportDeletion
+        from documents.services.annual_report_service import AnnualReportService
+        from documents.tests.factories import AnnualReportFactory
+
+        report = AnnualReportFactory(year=2022)
+        AnnualReportDeletion.objects.create(report_id=report.pk, deleted=1, total=3)
+        lock_id = AnnualReportService._lock_id(report.pk)
+
+        # Act
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_lock(%s)", [lock_id])
+        try:
+            progress, thread = AnnualReportService.start_report_deletion(report)
+        finally:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_unlock(%s)", [lock_id])
+
+        # Assert
+        assert thread is None
+        assert progress == {"status": "running", "deleted": 1, "total": 3}
+        assert AnnualReport.objects.filter(pk=report.pk).exists()
+
+    @pytest.mark.django_db(transaction=True)
+    def test_start_report_deletion_restarts_dead_deletion(self):
+        """Test a deletion marked running with no worker is started again"""
+        # Arrange
+        from documents.models import AnnualReportDeletion
+        from documents.services.annual_report_service import AnnualReportService
+        from documents.tests.factories import AnnualReportFactory
+
+        report = AnnualReportFactory(year=2022)
+        ProgressReportFactory.create_batch(2, report=report, year=2022)
+        AnnualReportDeletion.objects.create(report_id=report.pk, deleted=1, total=3)
+
+        # Act
+        started, thread = AnnualReportService.start_report_deletion(report)
+        thread.join(timeout=10)
+
+        # Assert
+        assert started == {"status": "running", "deleted": 0, "total": 2}
+        assert AnnualReportService.get_deletion_progress(report.pk) == {
+            "status": "completed",
+            "deleted": 2,
+            "total": 2,
+        }
+
+    @pytest.mark.django_db(transaction=True)
+    def test_start_report_deletion_failure(self):
+        """Test a failed background deletion reports its error"""
+        # Arrange
+        from documents.services.annual_report_service import AnnualReportService
+        from documents.tests.factories import AnnualReportFactory
+
+        report = AnnualReportFactory(year=2022)
+
+        # Act
+        with patch.object(
+            AnnualReportService,
+            "delete_report",
+            side_effect=RuntimeError("disk full"),
+        ):
+            _, thread = AnnualReportService.start_report_deletion(report)
+            thread.join(timeout=10)
+
+        # Assert
+        assert AnnualReportService.get_deletion_progress(report.pk) == {
+            "status": "failed",
+            "deleted": 0,
+            "total": 0,
+            "error": "disk full",
+        }
+        assert AnnualReport.objects.filter(pk=report.pk).exists()
@@ -2,13 +2,16 @@
 Tests for document views
 """
 
+import json
 from unittest.mock import Mock, patch
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 
 from common.tests.factories import ProjectDocumentFactory, ProjectFactory, UserFactory
-from common.tests.test_helpers import documents_urls
+from common.tests.test_helpers import documents_urls, response_json
 from documents.models import ProgressReport, ProjectDocument
 
 # ============================================================================
@@ -1734,7 +1737,7 @@ class TestSendBumpEmails:
 class TestUserPublications:
     """Tests for user publications endpoint"""
 
-    @patch("documents.views.notifications.requests.get")
+    @patch("common.utils.http.IntegrationClient.get")
     def test_get_user_publications_authenticated(
         self, mock_get, api_client, user, staff_profile, db
     ):
@@ -1758,7 +1761,7 @@ class TestUserPublications:
         assert "libraryData" in response.data
         assert "customPublications" in response.data
 
-    @patch("documents.views.notifications.requests.get")
+    @patch("common.utils.http.IntegrationClient.get")
     def test_get_user_publications_unauthenticated(
         self, mock_get, api_client, staff_profile, db
     ):
@@ -1791,7 +1794,7 @@ class TestUserPublications:
         assert response.status_code == status.HTTP_200_OK
         assert response.data["libraryData"]["isError"] is True
 
-    @patch("documents.views.notifications.requests.get")
+    @patch("common.utils.http.IntegrationClient.get")
     def test_get_user_publications_api_error(
         self, mock_get, api_client, user, staff_profile, db
     ):
@@ -1819,7 +1822,7 @@ class TestUserPublications:
         assert response.status_code == status.HTTP_200_OK
         assert response.data["libraryData"]["isError"] is True
 
-    @patch("documents.views.notifications.requests.get")
+    @patch("common.utils.http.IntegrationClient.get")
     def test_get_user_publications_cached(
         self, mock_get, api_client, user, staff_profile, db
     ):
@@ -1853,7 +1856,7 @@ class TestUserPublications:
         assert response.data["libraryData"]["numFound"] == 5
         assert not mock_get.called  # Should not call API when cached
 
-    @patch("documents.views.notifications.requests.get")
+    @patch("common.utils.http.IntegrationClient.get")
     def test_get_user_publications_with_custom_publications(
         self, mock_get, api_client, user, staff_profile, db
     ):
@@ -1886,7 +1889,36 @@ class TestUserPublications:
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["customPublications"]) == 1
 
-    @patch("documents.views.notifications.requests.get")
+    def test_get_user_publications_from_stub_server(
+        self, api_client, user, staff_profile, stub_server, settings, db
+    ):
+        """Test publications are fetched from the library API with the bearer token"""
+        # Arrange
+        api_client.force_authenticate(user=user)
+        settings.LIBRARY_API_URL = stub_server.url("/select?q=staff_id:")
+        body = {
+            "response": {
+                "numFound": 1,
+                "start": 0,
+                "numFoundExact": True,
+                "docs": [{"title": "Library Publication"}],
+            }
+        }
+        stub_server.replies.append((200, json.dumps(body).encode()))
+
+        # Act
+        response = api_client.get(
+            documents_urls.path("publications", staff_profile.employee_id)
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["libraryData"]["numFound"] == 1
+        assert stub_server.requests[0][1] == (
+            f"/select?q=staff_id:{staff_profile.employee_id}&rows=1000"
+        )
+
+    @patch("common.utils.http.IntegrationClient.get")
     def test_get_user_publications_no_staff_profile(
         self, mock_get, api_client, user, db
     ):
@@ -2226,6 +2258,67 @@ class TestSendMentionNotification:
             response.status_code == status.HTTP_200_OK
         )  # Still returns 200 even if email fails
 
+    def test_send_mention_notification_batches_recipients(
+        self,
+        api_client,
+        user,
+        project_document,
+        project_with_lead,
+        settings,
+        mailoutbox,
+        django_capture_on_commit_callbacks,
+        db,
+    ):
+        """Test recipients are found in one query and each gets their own email"""
+        # Arrange
+        settings.ENVIRONMENT = "production"
+        settings.EVENT_DELIVERY = "sync"
+        mentioned = [
+            UserFactory(
+                is_staff=True,
+                email=f"mentioned{i}@dbca.wa.gov.au",
+                display_first_name=f"Mentioned{i}",
+                display_last_name="User",
+            )
+            for i in range(3)
+        ]
+        api_client.force_authenticate(user=user)
+
+        def post(users):
+            return api_client.post(
+                documents_urls.path("notifications", "mentions"),
+                {
+                    "documentId": project_document.pk,
+                    "projectId": project_with_lead.pk,
+                    "commenter": {"name": "Test User", "email": user.email},
+                    "mentionedUsers": [
+                        {"id": u.pk, "name": "ignored", "email": u.email} for u in users
+                    ],
+                    "commentContent": "<p>Hello</p>",
+                },
+                format="json",
+            )
+
+        # Act
+        with CaptureQueriesContext(connection) as one:
+            with django_capture_on_commit_callbacks(execute=True):
+                post(mentioned[:1])
+        mailoutbox.clear()
+        with CaptureQueriesContext(connection) as three:
+            with django_capture_on_commit_callbacks(execute=True):
+                response = post(mentioned)
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["recipients"] == 3
+        assert len(three) == len(one)
+        assert sorted(message.to[0] for message in mailoutbox) == [
+            u.email for u in mentioned
+        ]
+        for message in mailoutbox:
+            name = message.to[0].split("@")[0].title()
+            assert f"Hello {name} User" in " ".join(message.alternatives[0][0].split())
+
 
 # ============================================================================
 # ADMIN VIEW TESTS
@@ -5377,6 +5470,58 @@ class TestReportDetail:
         # Assert
         assert response.status_code == status.HTTP_204_NO_CONTENT
 
+    def test_delete_report_in_background(self, api_client, user, annual_report, db):
+        """Test background=true starts a deletion and returns its progress"""
+        # Arrange
+        api_client.force_authenticate(user=user)
+        progress = {"status": "running", "deleted": 0, "total": 0}
+
+        # Act
+        with patch(
+            "documents.views.annual_report.AnnualReportService.start_report_deletion",
+            return_value=(progress, None),
+        ) as start:
+            response = api_client.delete(
+                documents_urls.path("reports", annual_report.id) + "?background=true"
+            )
+
+        # Assert
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert response.data == progress
+        start.assert_called_once_with(annual_report)
+
+    def test_deletion_progress(self, api_client, user, annual_report, db):
+        """Test progress of a background deletion is read from the database"""
+        # Arrange
+        from documents.models import AnnualReportDeletion
+
+        api_client.force_authenticate(user=user)
+        AnnualReportDeletion.objects.create(
+            report_id=annual_report.id, deleted=200, total=500
+        )
+
+        # Act
+        response = api_client.get(
+            documents_urls.path("reports", annual_report.id, "deletion")
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {"status": "running", "deleted": 200, "total": 500}
+
+    def test_deletion_progress_not_started(self, api_client, user, annual_report, db):
+        """Test progress of a deletion that was never started"""
+        # Arrange
+        api_client.force_authenticate(user=user)
+
+        # Act
+        response = api_client.get(
+            documents_urls.path("reports", annual_report.id, "deletion")
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
     def test_delete_report_not_found(self, api_client, user, db):
         """Test deleting non-existent annual report"""
         # Arrange
@@ -5492,7 +5637,7 @@ class TestGetReportsWithPDFs:
 
         # Assert
         assert response.status_code == status.HTTP_200_OK
-        assert isinstance(response.data, list)
+        assert isinstance(response_json(response), list)
 
 
 class TestGetCompletedReports:
@@ -5552,6 +5697,107 @@ class TestLatestYearsReports:
         # Assert
         assert response.status_code in [status.HTTP_200_OK, status.HTTP_404_NOT_FOUND]
 
+    @pytest.fixture
+    def make_progress_reports(self, annual_report):
+        """Create approved BCS progress reports in the latest annual report"""
+        from common.tests.factories import BusinessAreaFactory, DivisionFactory
+
+        division = DivisionFactory(name="Biodiversity and Conservation Science")
+
+        def make(count, status="approved"):
+            reports = []
+            for _ in range(count):
+                project = ProjectFactory(
+                    business_area=BusinessAreaFactory(division=division)
+                )
+                document = ProjectDocumentFactory(
+                    project=project, kind="progressreport", status=status
+                )
+                reports.append(
+                    ProgressReport.objects.create(
+                        document=document,
+                        project=project,
+                        report=annual_report,
+                        year=annual_report.year,
+                    )
+                )
+            return reports
+
+        return make
+
+    def test_progress_reports_constant_queries(
+        self,
+        api_client,
+        user,
+        make_progress_reports,
+        django_assert_max_num_queries,
+        db,
+    ):
+        """Test the query count does not grow with the number of reports"""
+        # Arrange
+        api_client.force_authenticate(user=user)
+        make_progress_reports(1)
+        with CaptureQueriesContext(connection) as one_report:
+            api_client.get(documents_urls.path("latest_active_progress_reports"))
+        make_progress_reports(4)
+
+        # Act
+        with django_assert_max_num_queries(len(one_report)):
+            response = api_client.get(
+                documents_urls.path("latest_active_progress_reports")
+            )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data) == 5
+        assert response.data[0]["document"]["project"]["business_area"]["division"]
+
+    def test_reports_changed_since(self, api_client, user, make_progress_reports, db):
+        """Test since only returns reports whose report or document changed"""
+        # Arrange
+        from datetime import timedelta
+
+        from django.utils import timezone
+
+        api_client.force_authenticate(user=user)
+        unchanged, edited, approved = make_progress_reports(3, status="new")
+        since = timezone.now() - timedelta(hours=1)
+        earlier = since - timedelta(hours=1)
+        ProgressReport.objects.update(updated_at=earlier)
+        ProjectDocument.objects.update(updated_at=earlier)
+        ProgressReport.objects.filter(pk=edited.pk).update(updated_at=timezone.now())
+        ProjectDocument.objects.filter(pk=approved.document.pk).update(
+            status="approved", updated_at=timezone.now()
+        )
+
+        # Act
+        inactive = api_client.get(
+            documents_urls.path("latest_inactive_reports"),
+            {"since": since.isoformat()},
+        )
+        active = api_client.get(
+            documents_urls.path("latest_active_progress_reports"),
+            {"since": since.isoformat()},
+        )
+
+        # Assert
+        assert [r["id"] for r in inactive.data["progress_reports"]] == [edited.pk]
+        assert [r["id"] for r in active.data] == [approved.pk]
+
+    def test_reports_changed_since_invalid(self, api_client, user, annual_report, db):
+        """Test an invalid since value is rejected"""
+        # Arrange
+        api_client.force_authenticate(user=user)
+
+        # Act
+        response = api_client.get(
+            documents_urls.path("latest_active_student_reports"),
+            {"since": "last tuesday"},
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
     def test_get_full_latest_report(self, api_client, user, annual_report, db):
         """Test getting full latest report"""
         # Arrange
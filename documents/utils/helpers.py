@@ -191,13 +191,21 @@ def get_current_maintainer_id():
     """
     Get the current maintainer user ID
 
+    MAINTAINER_USER_ID wins if set, then the maintainer chosen in admin
+    options, then the first superuser.
+
     Returns:
         int: Maintainer user ID
     """
     from django.conf import settings
 
-    # Get maintainer ID from settings or environment
-    maintainer_id = getattr(settings, "MAINTAINER_USER_ID", None)
+    from adminoptions.services import AdminOptionsService
+
+    # Get maintainer ID from settings or environment, then admin options
+    maintainer_id = (
+        getattr(settings, "MAINTAINER_USER_ID", None)
+        or AdminOptionsService.get_maintainer_id()
+    )
 
     if not maintainer_id:
         # Fall back to first superuser
@@ -26,6 +26,7 @@ from .annual_report import (  # BeginAnnualReportDocGeneration,  # Removed dupli
     LatestYearsInactiveReports,
     LatestYearsProgressReports,
     LatestYearsStudentReports,
+    ReportDeletionProgress,
     ReportDetail,
     Reports,
 )
@@ -165,6 +166,7 @@ __all__ = [
     # Annual report
     "Reports",
     "ReportDetail",
+    "ReportDeletionProgress",
     "GetLatestReportYear",
     "GetAvailableReportYearsForStudentReport",
     "GetAvailableReportYearsForProgressReport",
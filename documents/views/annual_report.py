@@ -2,11 +2,8 @@
 Annual report views
 """
 
-import json
-
 from django.conf import settings
-from django.core.serializers.json import DjangoJSONEncoder
-from django.db.models import Max, Q
+from django.db.models import Max
 from rest_framework.exceptions import NotFound
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
@@ -20,6 +17,8 @@ from rest_framework.status import (
 )
 from rest_framework.views import APIView
 
+from common.utils import apply_changed_since_filter
+from common.views import StreamingListMixin
 from medias.models import AnnualReportPDF, LegacyAnnualReportPDF
 from medias.serializers import (
     AnnualReportPDFSerializer,
@@ -28,12 +27,15 @@ from medias.serializers import (
 
 from ..models import AnnualReport, ProgressReport, StudentReport
 from ..serializers import (
+    TINY_PROJECT_DOCUMENT_PREFETCH,
+    TINY_PROJECT_DOCUMENT_RELATED,
     AnnualReportSerializer,
     MiniAnnualReportSerializer,
     ProgressReportSerializer,
     StudentReportSerializer,
     TinyAnnualReportSerializer,
 )
+from ..services import AnnualReportService
 
 
 class Reports(APIView):
@@ -106,7 +108,14 @@ class ReportDetail(APIView):
         )
 
     def delete(self, request, pk):
-        """Delete annual report"""
+        """
+        Delete annual report with its progress and student reports
+
+        Query params:
+            background: "true" to delete on a background thread; years with
+                more than ANNUAL_REPORT_DELETE_BACKGROUND_THRESHOLD
+                documents always are
+        """
         try:
             report = AnnualReport.objects.get(pk=pk)
         except AnnualReport.DoesNotExist:
@@ -114,20 +123,30 @@ class ReportDetail(APIView):
 
         settings.LOGGER.info(f"{request.user} is deleting report {report}")
 
-        # Delete associated progress reports
-        progress_reports = ProgressReport.objects.filter(report=report).all()
-        for pr in progress_reports:
-            pr.document.delete()
-
-        # Delete associated student reports
-        student_reports = StudentReport.objects.filter(report=report).all()
-        for sr in student_reports:
-            sr.document.delete()
+        background = request.query_params.get("background") == "true" or (
+            AnnualReportService.get_report_documents(report).count()
+            > settings.ANNUAL_REPORT_DELETE_BACKGROUND_THRESHOLD
+        )
+        if background:
+            progress, _ = AnnualReportService.start_report_deletion(report)
+            return Response(progress, status=HTTP_202_ACCEPTED)
 
-        report.delete()
+        AnnualReportService.delete_report(report)
         return Response(status=HTTP_204_NO_CONTENT)
 
 
+class ReportDeletionProgress(APIView):
+    """Progress of a background annual report deletion"""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, pk):
+        progress = AnnualReportService.get_deletion_progress(pk)
+        if progress is None:
+            raise NotFound
+        return Response(progress, status=HTTP_200_OK)
+
+
 class GetLatestReportYear(APIView):
     """Get the latest annual report year"""
 
@@ -158,20 +177,9 @@ class GetAvailableReportYearsForStudentReport(APIView):
         Only returns years where a student report doesn't already exist for the project.
         """
         if project_id:
-            all_student_reports = StudentReport.objects.filter(
-                document__project_id=project_id
-            ).all()
-            list_of_years_from_student_reports = list(
-                set([report.year for report in all_student_reports])
-            )
-            all_annual_report_years = AnnualReport.objects.values_list(
-                "year", flat=True
-            ).distinct()
-
-            available_years = list(
-                set(all_annual_report_years) - set(list_of_years_from_student_reports)
+            available_reports = AnnualReportService.get_available_reports(
+                project_id, StudentReport
             )
-            available_reports = AnnualReport.objects.filter(year__in=available_years)
 
             serializer = MiniAnnualReportSerializer(
                 available_reports,
@@ -194,20 +202,9 @@ class GetAvailableReportYearsForProgressReport(APIView):
         Only returns years where a progress report doesn't already exist for the project.
         """
         if project_id:
-            all_progress_reports = ProgressReport.objects.filter(
-                document__project_id=project_id
-            ).all()
-            list_of_years_from_progress_reports = list(
-                set([report.year for report in all_progress_reports])
+            available_reports = AnnualReportService.get_available_reports(
+                project_id, ProgressReport
             )
-            all_annual_report_years = AnnualReport.objects.values_list(
-                "year", flat=True
-            ).distinct()
-
-            available_years = list(
-                set(all_annual_report_years) - set(list_of_years_from_progress_reports)
-            )
-            available_reports = AnnualReport.objects.filter(year__in=available_years)
 
             serializer = MiniAnnualReportSerializer(
                 available_reports,
@@ -250,13 +247,7 @@ class GetReportPDF(APIView):
             raise NotFound
 
         serializer = AnnualReportPDFSerializer(report_pdf_obj)
-
-        # Convert serialized data to dictionary
-        serialized_data = json.loads(json.dumps(serializer.data, cls=DjangoJSONEncoder))
-
-        # Include PDF data in response
-        serialized_data["pdf_data"] = serializer.data.get("pdf_data")
-        return Response(serialized_data, status=HTTP_200_OK)
+        return Response(serializer.data, status=HTTP_200_OK)
 
 
 class GetWithPDFs(APIView):
@@ -274,19 +265,19 @@ class GetWithPDFs(APIView):
         return Response(serializer.data, status=HTTP_200_OK)
 
 
-class GetLegacyPDFs(APIView):
+class GetLegacyPDFs(StreamingListMixin, APIView):
     """Get legacy annual report PDFs"""
 
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
         legacy_items = LegacyAnnualReportPDF.objects.all()
-        serializer = TinyLegacyAnnualReportPDFSerializer(
+        return self.list_response(
             legacy_items,
+            TinyLegacyAnnualReportPDFSerializer,
+            request,
             context={"request": request},
-            many=True,
         )
-        return Response(serializer.data, status=HTTP_200_OK)
 
 
 class GetCompletedReports(APIView):
@@ -323,25 +314,58 @@ class BeginAnnualReportDocGeneration(APIView):
         return Response({"status": "generation_started"}, status=HTTP_200_OK)
 
 
+def _get_editor_reports(model, report, since=None):
+    """
+    Get the reports of an annual report shown in the report editor
+
+    Joins everything ProgressReportSerializer/StudentReportSerializer read,
+    so the query count does not grow with the number of reports.
+
+    Args:
+        model: ProgressReport or StudentReport
+        report: AnnualReport
+        since: Only reports whose content or document changed after this
+            ISO 8601 datetime
+
+    Returns:
+        QuerySet of reports
+    """
+    reports = (
+        model.objects.filter(
+            report=report,
+            project__business_area__division__name="Biodiversity and Conservation Science",
+        )
+        .select_related(
+            *[f"document__{related}" for related in TINY_PROJECT_DOCUMENT_RELATED]
+        )
+        .prefetch_related(
+            *[f"document__{related}" for related in TINY_PROJECT_DOCUMENT_PREFETCH]
+        )
+    )
+    return apply_changed_since_filter(
+        reports, since, ["updated_at", "document__updated_at"]
+    )
+
+
 class LatestYearsProgressReports(APIView):
     """Get latest year's approved progress reports"""
 
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
+        """
+        Query params:
+            since: Only reports changed after this ISO 8601 datetime
+        """
         settings.LOGGER.info("Getting Approved Progress Reports for current year")
 
         # Get the latest year's report
         latest_report = AnnualReport.objects.order_by("-year").first()
         if latest_report:
             # Get progress report documents for approved projects
-            active_docs = ProgressReport.objects.filter(
-                Q(report=latest_report)
-                & Q(document__status="approved")
-                & Q(
-                    project__business_area__division__name="Biodiversity and Conservation Science"
-                )
-            ).exclude(Q(project__business_area__division__name__isnull=True))
+            active_docs = _get_editor_reports(
+                ProgressReport, latest_report, request.query_params.get("since")
+            ).filter(document__status="approved")
 
             serializer = ProgressReportSerializer(
                 active_docs, many=True, context={"request": request}
@@ -357,19 +381,19 @@ class LatestYearsStudentReports(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
+        """
+        Query params:
+            since: Only reports changed after this ISO 8601 datetime
+        """
         settings.LOGGER.info("Getting Approved Student Reports for current year")
 
         # Get the latest year's report
         latest_report = AnnualReport.objects.order_by("-year").first()
         if latest_report:
             # Get student report documents for approved projects
-            active_docs = StudentReport.objects.filter(
-                Q(report=latest_report)
-                & Q(document__status="approved")
-                & Q(
-                    project__business_area__division__name="Biodiversity and Conservation Science"
-                )
-            ).exclude(Q(project__business_area__division__name__isnull=True))
+            active_docs = _get_editor_reports(
+                StudentReport, latest_report, request.query_params.get("since")
+            ).filter(document__status="approved")
 
             serializer = StudentReportSerializer(
                 active_docs, many=True, context={"request": request}
@@ -385,34 +409,24 @@ class LatestYearsInactiveReports(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
+        """
+        Query params:
+            since: Only reports changed after this ISO 8601 datetime
+        """
         # Get the latest year's report
         latest_report = AnnualReport.objects.order_by("-year").first()
         if latest_report:
+            since = request.query_params.get("since")
+
             # Get non-approved student reports
-            inactive_srs = (
-                StudentReport.objects.filter(
-                    Q(report=latest_report)
-                    & Q(
-                        project__business_area__division__name="Biodiversity and Conservation Science"
-                    )
-                )
-                .exclude(document__status__in=["approved"])
-                .exclude(Q(project__business_area__division__name__isnull=True))
-                .all()
-            )
+            inactive_srs = _get_editor_reports(
+                StudentReport, latest_report, since
+            ).exclude(document__status="approved")
 
             # Get non-approved progress reports
-            inactive_prs = (
-                ProgressReport.objects.filter(
-                    Q(report=latest_report)
-                    & Q(
-                        project__business_area__division__name="Biodiversity and Conservation Science"
-                    )
-                )
-                .exclude(document__status__in=["approved"])
-                .exclude(Q(project__business_area__division__name__isnull=True))
-                .all()
-            )
+            inactive_prs = _get_editor_reports(
+                ProgressReport, latest_report, since
+            ).exclude(document__status="approved")
 
             sr_serializer = StudentReportSerializer(
                 inactive_srs, many=True, context={"request": request}
@@ -12,7 +12,11 @@ from rest_framework.status import (
 )
 from rest_framework.views import APIView
 
-from common.utils.pagination import paginate_queryset
+from common.utils.pagination import (
+    is_cursor_pagination_requested,
+    paginate_queryset,
+    paginate_queryset_by_cursor,
+)
 
 from ..serializers import (
     ProjectDocumentCreateSerializer,
@@ -34,6 +38,21 @@ class ProjectDocuments(APIView):
             user=request.user, filters=request.query_params
         )
 
+        if is_cursor_pagination_requested(request):
+            paginated = paginate_queryset_by_cursor(documents, request)
+            serializer = ProjectDocumentSerializer(
+                paginated["items"], many=True, context={"request": request}
+            )
+            return Response(
+                {
+                    "documents": serializer.data,
+                    "next_cursor": paginated["next_cursor"],
+                    "previous_cursor": paginated["previous_cursor"],
+                    "total_results": paginated["total_results"],
+                },
+                status=HTTP_200_OK,
+            )
+
         # Paginate
         paginated = paginate_queryset(documents, request)
 
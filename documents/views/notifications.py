@@ -23,6 +23,7 @@ from rest_framework.status import (
 from rest_framework.views import APIView
 
 from agencies.models import BusinessArea
+from common.utils.http import get_client
 from config.helpers import send_email_with_embedded_image
 from projects.models import Project
 from users.models import PublicStaffProfile, User
@@ -42,6 +43,7 @@ from ..serializers import (
     PublicationResponseSerializer,
     StudentReportCreateSerializer,
 )
+from ..services.notification_service import NotificationService
 from ..utils.helpers import get_current_maintainer_id, get_encoded_image
 
 
@@ -603,12 +605,12 @@ class UserPublications(APIView):
         headers = {"Authorization": f"Bearer {token}"}
 
         try:
-            response = requests.get(api_url, headers=headers, timeout=30)
-        except requests.Timeout:
+            response = get_client("library").get(api_url, headers=headers)
+        except requests.RequestException as e:
             settings.LOGGER.error(
-                f"Request to library API timed out for employee {employee_id}"
+                f"Request to library API failed for employee {employee_id}: {e}"
             )
-            raise Exception("Library API request timed out")
+            raise Exception("Library API request failed")
 
         if response.status_code != 200:
             settings.LOGGER.error(
@@ -725,50 +727,17 @@ class SendMentionNotification(APIView):
             mentioned_users = request.data.get("mentionedUsers", [])
             comment_content = request.data.get("commentContent", "")
 
-            # Fetch document and project
             try:
-                document = ProjectDocument.objects.get(pk=document_id)
-                project = Project.objects.get(pk=project_id)
-                project_tag = project.get_project_tag()
-            except (ProjectDocument.DoesNotExist, Project.DoesNotExist) as e:
+                document = ProjectDocument.objects.select_related("project").get(
+                    pk=document_id, project_id=project_id
+                )
+            except (ProjectDocument.DoesNotExist, ValueError, TypeError) as e:
                 settings.LOGGER.error(f"Document or Project not found: {e}")
                 return Response(
                     {"error": "Document or Project not found"},
                     status=HTTP_404_NOT_FOUND,
                 )
 
-            # Generate document URL
-            url_safe_kind_dict = {
-                "concept": "concept",
-                "projectplan": "project",
-                "progressreport": "progress",
-                "studentreport": "student",
-                "projectclosure": "closure",
-            }
-
-            document_url = f"{settings.SITE_URL}/projects/{project.pk}/{url_safe_kind_dict[document.kind]}"
-
-            # Clean comment content
-            def clean_comment_content(html_content):
-                from bs4 import BeautifulSoup
-
-                if not html_content:
-                    return ""
-
-                try:
-                    soup = BeautifulSoup(html_content, "html.parser")
-                    mention_spans = soup.find_all(
-                        "span", {"data-lexical-mention": "true"}
-                    )
-                    for span in mention_spans:
-                        span.replace_with(span.get_text())
-                    return soup.get_text().strip()
-                except Exception as e:
-                    settings.LOGGER.error(f"Error cleaning comment content: {e}")
-                    return html_content
-
-            cleaned_comment = clean_comment_content(comment_content)
-
             if not mentioned_users:
                 return Response(
                     {
@@ -779,87 +748,17 @@ class SendMentionNotification(APIView):
                     status=HTTP_200_OK,
                 )
 
-            # Process mentioned users
-            recipients_to_notify = []
-            for user_data in mentioned_users:
-                user_id = user_data.get("id")
-                user_name = user_data.get("name")
-                user_email = user_data.get("email")
-
-                if user_email and user_email.endswith("@dbca.wa.gov.au"):
-                    try:
-                        user = User.objects.get(pk=user_id)
-                        if user.is_active and user.is_staff:
-                            recipients_to_notify.append(
-                                {"id": user_id, "name": user_name, "email": user_email}
-                            )
-                    except User.DoesNotExist:
-                        settings.LOGGER.warning(f"Mentioned user {user_id} not found")
-                        continue
-
-            # Send emails
-            processed_users = set()
-            emails_sent = 0
-
-            for recipient in recipients_to_notify:
-                user_id = recipient.get("id")
-                user_name = recipient.get("name")
-                user_email = recipient.get("email")
-
-                if user_id in processed_users:
-                    continue
-
-                processed_users.add(user_id)
-
-                # Skip if not in production and not test user
-                maintainer_id = get_current_maintainer_id()
-                if (settings.ENVIRONMENT != "production") and user_id != maintainer_id:
-                    settings.LOGGER.info(
-                        f"TEST: Skipping mention notification to {user_name}"
-                    )
-                    continue
-
-                to_email = [user_email]
-                document_kind_string_readable = ProjectDocument.CategoryKindChoices(
-                    document.kind
-                ).label
-
-                email_subject = f"SPMS: You were mentioned in a comment on {document_kind_string_readable} ({project_tag})"
-
-                template_props = {
-                    "recipient_name": user_name,
-                    "commenter_name": commenter.get("name"),
-                    "document_type_title": document_kind_string_readable,
-                    "project_tag": project_tag,
-                    "project_name": project.title,
-                    "document_url": document_url,
-                    "comment_content": cleaned_comment,
-                    "is_mention": True,
-                    "site_url": settings.SITE_URL,
-                }
-
-                try:
-                    template_content = render_to_string(
-                        "./email_templates/document_comment_mention.html",
-                        template_props,
-                    )
-                    send_email_with_embedded_image(
-                        recipient_email=to_email,
-                        subject=email_subject,
-                        html_content=template_content,
-                    )
-                    emails_sent += 1
-                    settings.LOGGER.info(
-                        f"{'PRODUCTION' if settings.ENVIRONMENT == 'production' else 'TEST'}: "
-                        f"Sent comment notification to {user_name}"
-                    )
-                except Exception as e:
-                    settings.LOGGER.error(f"Comment Notification Email Error: {e}")
+            recipients = NotificationService.queue_comment_mentions(
+                document,
+                commenter_name=(commenter or {}).get("name"),
+                comment=comment_content,
+                user_ids={user_data.get("id") for user_data in mentioned_users},
+            )
 
             return Response(
                 {
-                    "message": f"Mention notifications sent to {emails_sent} users",
-                    "recipients": len(recipients_to_notify),
+                    "message": f"Mention notifications queued for {len(recipients)} users",
+                    "recipients": len(recipients),
                     "mentioned_users": len(mentioned_users),
                 },
                 status=HTTP_200_OK,
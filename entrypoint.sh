@@ -9,6 +9,11 @@ echo ""
 echo "=== Running Database Migrations ==="
 python manage.py migrate --noinput
 
+# Create the shared cache table (idempotent)
+echo ""
+echo "=== Creating Cache Table ==="
+python manage.py createcachetable
+
 # Run one-time caretaker data migration (idempotent - safe to run multiple times)
 echo ""
 echo "=== Checking Caretaker Data Migration ==="
@@ -1,9 +1,11 @@
 from rest_framework.serializers import ModelSerializer
 
+from common.serializers import ValuesSerializerMixin
+
 from .models import Area
 
 
-class TinyAreaSerializer(ModelSerializer):
+class TinyAreaSerializer(ValuesSerializerMixin, ModelSerializer):
     class Meta:
         model = Area
         fields = [
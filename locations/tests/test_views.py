@@ -33,6 +33,19 @@ class TestAreasView:
         assert dbca_district.name in area_names
         assert dbca_region.name in area_names
 
+    def test_list_areas_matches_serializer(
+        self, api_client, user, dbca_district, dbca_region, db
+    ):
+        """Test the values() list renders exactly what the serializer would"""
+        from locations.serializers import TinyAreaSerializer
+
+        api_client.force_authenticate(user=user)
+
+        response = api_client.get(locations_urls.list())
+
+        expected = TinyAreaSerializer(Area.objects.all(), many=True).data
+        assert response.json() == [dict(area) for area in expected]
+
     def test_list_areas_empty(self, api_client, user, db):
         """Test listing areas when none exist"""
         api_client.force_authenticate(user=user)
@@ -19,8 +19,7 @@ class DBCADistricts(APIView):
     def get(self, request):
         """Get all DBCA districts"""
         areas = AreaService.list_areas(area_type="dbcadistrict")
-        serializer = TinyAreaSerializer(areas, many=True)
-        return Response(serializer.data, status=HTTP_200_OK)
+        return Response(TinyAreaSerializer.values_data(areas), status=HTTP_200_OK)
 
 
 class DBCARegions(APIView):
@@ -31,8 +30,7 @@ class DBCARegions(APIView):
     def get(self, request):
         """Get all DBCA regions"""
         areas = AreaService.list_areas(area_type="dbcaregion")
-        serializer = TinyAreaSerializer(areas, many=True)
-        return Response(serializer.data, status=HTTP_200_OK)
+        return Response(TinyAreaSerializer.values_data(areas), status=HTTP_200_OK)
 
 
 class Imcras(APIView):
@@ -43,8 +41,7 @@ class Imcras(APIView):
     def get(self, request):
         """Get all IMCRA areas"""
         areas = AreaService.list_areas(area_type="imcra")
-        serializer = TinyAreaSerializer(areas, many=True)
-        return Response(serializer.data, status=HTTP_200_OK)
+        return Response(TinyAreaSerializer.values_data(areas), status=HTTP_200_OK)
 
 
 class Ibras(APIView):
@@ -55,8 +52,7 @@ class Ibras(APIView):
     def get(self, request):
         """Get all IBRA areas"""
         areas = AreaService.list_areas(area_type="ibra")
-        serializer = TinyAreaSerializer(areas, many=True)
-        return Response(serializer.data, status=HTTP_200_OK)
+        return Response(TinyAreaSerializer.values_data(areas), status=HTTP_200_OK)
 
 
 class Nrms(APIView):
@@ -67,5 +63,4 @@ class Nrms(APIView):
     def get(self, request):
         """Get all NRM areas"""
         areas = AreaService.list_areas(area_type="nrm")
-        serializer = TinyAreaSerializer(areas, many=True)
-        return Response(serializer.data, status=HTTP_200_OK)
+        return Response(TinyAreaSerializer.values_data(areas), status=HTTP_200_OK)
@@ -25,8 +25,7 @@ class Areas(APIView):
     def get(self, request):
         """List all areas"""
         areas = AreaService.list_areas()
-        serializer = TinyAreaSerializer(areas, many=True)
-        return Response(serializer.data, status=HTTP_200_OK)
+        return Response(TinyAreaSerializer.values_data(areas), status=HTTP_200_OK)
 
     def post(self, request):
         """Create new area"""
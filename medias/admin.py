@@ -9,6 +9,7 @@ from .models import (
     AnnualReportMedia,
     AnnualReportPDF,
     BusinessAreaPhoto,
+    ContentBlob,
     LegacyAnnualReportPDF,
     ProjectDocumentPDF,
     ProjectPhoto,
@@ -419,4 +420,23 @@ class UserAvatarAdmin(admin.ModelAdmin):
         self.message_user(request, f"Successfully updated {updated_count} photos.")
 
 
+@admin.register(ContentBlob)
+class ContentBlobAdmin(admin.ModelAdmin):
+    list_display = (
+        "name",
+        "ref_count",
+        "size_in_mb",
+        "updated_at",
+    )
+    search_fields = ("sha256", "name")
+    readonly_fields = ("sha256", "name", "size", "ref_count")
+
+    @admin.display(
+        description="Size (MB)",
+        ordering="size",
+    )
+    def size_in_mb(self, obj):
+        return "{:.2f} MB".format(obj.size / (1024 * 1024))
+
+
 # endregion ==================================================
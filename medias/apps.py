@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class MediasConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "medias"
+
+    def ready(self):
+        """Import signals when the app is ready."""
+        import medias.signals  # noqa: F401
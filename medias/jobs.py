@@ -0,0 +1,20 @@
+"""
+Housekeeping jobs for media files (see common.scheduler)
+"""
+
+from datetime import timedelta
+
+from common.scheduler import job
+
+from .services.content_store_service import ContentStoreService
+
+
+@job("collect_content_blobs", interval=timedelta(days=1))
+def collect_content_blobs(since):
+    """Recount content blob references and delete unreferenced blobs"""
+    result = ContentStoreService.collect_garbage(grace=timedelta(hours=1))
+    return {
+        "reconciled": result["reconciled"],
+        "deleted": len(result["deleted"]),
+        "freed": result["freed"],
+    }
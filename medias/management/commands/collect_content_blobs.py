@@ -0,0 +1,56 @@
+"""
+Management command to delete content addressed uploads no longer in use.
+
+Reference counts are recounted from the media rows first, so blobs left
+behind by bulk deletes or failed requests are collected too.
+
+Usage:
+    python manage.py collect_content_blobs
+    python manage.py collect_content_blobs --dry-run
+    python manage.py collect_content_blobs --grace-minutes 0
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from medias.services.content_store_service import ContentStoreService
+
+
+class Command(BaseCommand):
+    help = "Garbage-collect unreferenced content addressed uploads"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="List unreferenced blobs without deleting them",
+        )
+        parser.add_argument(
+            "--grace-minutes",
+            type=int,
+            default=60,
+            help="Keep unreferenced blobs updated within this many minutes",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        result = ContentStoreService.collect_garbage(
+            grace=timedelta(minutes=options["grace_minutes"]),
+            dry_run=dry_run,
+        )
+
+        if result["reconciled"]:
+            self.stdout.write(
+                f"Corrected reference counts of {result['reconciled']} blobs"
+            )
+        for name in result["deleted"]:
+            self.stdout.write(f"  {name}")
+
+        verb = "Would delete" if dry_run else "Deleted"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb} {len(result['deleted'])} blobs, "
+                f"freeing {result['freed']} bytes"
+            )
+        )
@@ -0,0 +1,123 @@
+"""
+Management command to generate image derivatives for existing uploads.
+
+Images are resized in a process pool; manifests are saved in bulk by the
+parent process, so workers never touch the database (or the connections
+they inherit when forked).
+
+Usage:
+    python manage.py generate_image_derivatives
+    python manage.py generate_image_derivatives --model projectphoto --workers 4
+    python manage.py generate_image_derivatives --force  # Regenerate everything
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.core.management.base import BaseCommand
+
+from medias.services.derivative_service import DERIVATIVE_MODELS, DerivativeService
+
+MODELS_BY_NAME = {model._meta.model_name: model for model in DERIVATIVE_MODELS}
+
+
+def _init_worker():
+    # Spawned (rather than forked) workers start without Django configured
+    django.setup()
+
+
+def _build_manifest(job):
+    pk, name = job
+    return pk, DerivativeService.build_manifest(name)
+
+
+class Command(BaseCommand):
+    help = "Generate resized WebP and JPEG derivatives for uploaded images"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            action="append",
+            choices=sorted(MODELS_BY_NAME),
+            help="Only process this model (repeatable, defaults to all)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Number of worker processes (1 processes inline)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Number of manifests to save per update",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Regenerate derivatives that are already current",
+        )
+
+    def handle(self, *args, **options):
+        models = [MODELS_BY_NAME[name] for name in options["model"] or []]
+        workers = max(1, options["workers"])
+
+        jobs = {}
+        for model in models or DERIVATIVE_MODELS:
+            jobs[model] = [
+                (pk, name)
+                for pk, name, derivatives in model.objects.exclude(file="")
+                .exclude(file__isnull=True)
+                .values_list("pk", "file", "derivatives")
+                .order_by("pk")
+                if options["force"] or (derivatives or {}).get("source") != name
+            ]
+
+        total = sum(len(model_jobs) for model_jobs in jobs.values())
+        self.stdout.write(f"Generating derivatives for {total} images")
+        if not total:
+            return
+
+        executor = None
+        if workers > 1:
+            executor = ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker
+            )
+        try:
+            for model, model_jobs in jobs.items():
+                if not model_jobs:
+                    continue
+                results = (
+                    executor.map(_build_manifest, model_jobs, chunksize=8)
+                    if executor
+                    else map(_build_manifest, model_jobs)
+                )
+                self._save_manifests(model, results, options["batch_size"])
+        finally:
+            if executor:
+                executor.shutdown()
+
+        self.stdout.write(self.style.SUCCESS(f"Processed {total} images"))
+
+    def _save_manifests(self, model, results, batch_size):
+        batch = []
+        failed = 0
+        for pk, manifest in results:
+            if not manifest.get("variants"):
+                failed += 1
+            batch.append(model(pk=pk, derivatives=manifest))
+            if len(batch) >= batch_size:
+                model.objects.bulk_update(batch, ["derivatives"])
+                batch = []
+        if batch:
+            model.objects.bulk_update(batch, ["derivatives"])
+
+        label = model._meta.verbose_name_plural
+        if failed:
+            self.stdout.write(
+                self.style.WARNING(f"{label}: {failed} images could not be read")
+            )
+        else:
+            self.stdout.write(f"{label}: done")
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("medias", "0008_alter_annualreportmedia_kind"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="agencyimage",
+            name="derivatives",
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name="annualreportmedia",
+            name="derivatives",
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name="businessareaphoto",
+            name="derivatives",
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name="projectphoto",
+            name="derivatives",
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name="projectplanmethodologyphoto",
+            name="derivatives",
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name="useravatar",
+            name="derivatives",
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("medias", "0009_image_derivatives"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ContentBlob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("sha256", models.CharField(max_length=64, unique=True)),
+                ("name", models.CharField(max_length=255, unique=True)),
+                ("size", models.PositiveBigIntegerField(default=0)),
+                ("ref_count", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "Content Blob",
+                "verbose_name_plural": "Content Blobs",
+            },
+        ),
+    ]
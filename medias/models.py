@@ -60,6 +60,8 @@ class AnnualReportMedia(CommonModel):
 
     file = models.ImageField(upload_to="annual_reports/images/", null=True, blank=True)
     size = models.PositiveIntegerField(default=0)  # New size field
+    # Manifest of resized variants (see medias.utils.derivatives)
+    derivatives = models.JSONField(default=dict, blank=True, editable=False)
     kind = models.CharField(
         max_length=140,
         choices=MediaTypes.choices,
@@ -221,6 +223,8 @@ class ProjectPhoto(CommonModel):
         related_name="project_photos_uploaded",
     )
     size = models.PositiveIntegerField(default=0)
+    # Manifest of resized variants (see medias.utils.derivatives)
+    derivatives = models.JSONField(default=dict, blank=True, editable=False)
 
     def save(self, *args, **kwargs):
         if self.file:
@@ -242,6 +246,8 @@ class ProjectPlanMethodologyPhoto(CommonModel):
 
     file = models.ImageField(upload_to="methodology_images/", blank=True, null=True)
     size = models.PositiveIntegerField(default=0)
+    # Manifest of resized variants (see medias.utils.derivatives)
+    derivatives = models.JSONField(default=dict, blank=True, editable=False)
     project_plan = models.OneToOneField(
         "documents.ProjectPlan",
         on_delete=models.CASCADE,
@@ -281,6 +287,8 @@ class BusinessAreaPhoto(CommonModel):
 
     file = models.ImageField(upload_to="business_areas/", blank=True, null=True)
     size = models.PositiveIntegerField(default=0)  # New size field
+    # Manifest of resized variants (see medias.utils.derivatives)
+    derivatives = models.JSONField(default=dict, blank=True, editable=False)
 
     business_area = models.OneToOneField(
         "agencies.BusinessArea",
@@ -315,6 +323,8 @@ class AgencyImage(CommonModel):
 
     file = models.ImageField(upload_to="agencies/")
     size = models.PositiveIntegerField(default=0)  # New size field
+    # Manifest of resized variants (see medias.utils.derivatives)
+    derivatives = models.JSONField(default=dict, blank=True, editable=False)
     agency = models.OneToOneField(
         "agencies.Agency",
         on_delete=models.CASCADE,
@@ -347,6 +357,8 @@ class UserAvatar(CommonModel):
 
     file = models.ImageField(upload_to="user_avatars/", blank=True, null=True)
     size = models.PositiveIntegerField(default=0)
+    # Manifest of resized variants (see medias.utils.derivatives)
+    derivatives = models.JSONField(default=dict, blank=True, editable=False)
     user = models.OneToOneField(
         "users.User",
         on_delete=models.CASCADE,
@@ -367,3 +379,32 @@ class UserAvatar(CommonModel):
 
 
 # endregion ===========================================================================================================
+
+
+# region Content Addressed Storage Model ======================================================================================================
+
+
+class ContentBlob(CommonModel):
+    """
+    Model Definition for Content Addressed Uploads
+
+    Images stored through ContentStoreService are named by the SHA-256 of
+    their bytes, so identical uploads share one file. ref_count tracks how
+    many media rows use it; unreferenced blobs are removed by the
+    collect_content_blobs command.
+    """
+
+    sha256 = models.CharField(max_length=64, unique=True)
+    name = models.CharField(max_length=255, unique=True)
+    size = models.PositiveBigIntegerField(default=0)
+    ref_count = models.PositiveIntegerField(default=0)
+
+    def __str__(self) -> str:
+        return f"{self.name} ({self.ref_count} references)"
+
+    class Meta:
+        verbose_name = "Content Blob"
+        verbose_name_plural = "Content Blobs"
+
+
+# endregion ===========================================================================================================
@@ -2,4 +2,9 @@
 Permissions for media management
 """
 
-# No custom permissions yet - using service-level checks
+from .media_permissions import IsAuthenticatedForPrivateMedia, MediaPathPermission
+
+__all__ = [
+    "MediaPathPermission",
+    "IsAuthenticatedForPrivateMedia",
+]
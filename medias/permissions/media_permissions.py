@@ -0,0 +1,67 @@
+"""
+Permission classes for serving media files
+"""
+
+from django.conf import settings
+from rest_framework.permissions import BasePermission
+
+
+class MediaPathPermission(BasePermission):
+    """
+    Base class for access checks on served media files
+
+    Subclasses implement has_path_permission and are enabled with the
+    MEDIA_PERMISSION_CLASSES setting.
+    """
+
+    def has_permission(self, request, view):
+        """
+        Check access to the requested media path
+
+        Args:
+            request: HTTP request
+            view: MediaFile view being accessed
+
+        Returns:
+            Boolean indicating permission
+        """
+        return self.has_path_permission(request, view.kwargs.get("path", ""))
+
+    def has_path_permission(self, request, path):
+        """
+        Check access to a media path
+
+        Args:
+            request: HTTP request
+            path: Media path relative to MEDIA_ROOT
+
+        Returns:
+            Boolean indicating permission
+        """
+        return True
+
+
+class IsAuthenticatedForPrivateMedia(MediaPathPermission):
+    """
+    Permission requiring a logged in user for files under any of the
+    MEDIA_PRIVATE_PREFIXES folders; everything else stays public
+    """
+
+    def has_path_permission(self, request, path):
+        if not is_private_media(path):
+            return True
+        return bool(request.user and request.user.is_authenticated)
+
+
+def is_private_media(path):
+    """
+    Check whether a media path is under a MEDIA_PRIVATE_PREFIXES folder
+
+    Args:
+        path: Media path relative to MEDIA_ROOT
+
+    Returns:
+        Boolean
+    """
+    prefixes = tuple(settings.MEDIA_PRIVATE_PREFIXES)
+    return bool(prefixes) and path.startswith(prefixes)
@@ -18,10 +18,24 @@ from .models import (
     ProjectPlanMethodologyPhoto,
     UserAvatar,
 )
+from .utils.derivatives import build_srcset
 
 # endregion Imports ===================================
 
 
+# region Image Serializer Mixins ===================================
+
+
+class SrcsetMixin:
+    """Provides get_srcset for serializers of images with derivatives"""
+
+    def get_srcset(self, obj):
+        return build_srcset(obj.derivatives)
+
+
+# endregion  ===================================
+
+
 # region Project Doc Media Serializers ===================================
 
 
@@ -58,9 +72,10 @@ class AECPDFCreateSerializer(ModelSerializer):
         return cp
 
 
-class TinyMethodologyImageSerializer(ModelSerializer):
+class TinyMethodologyImageSerializer(SrcsetMixin, ModelSerializer):
     project_plan = SerializerMethodField(read_only=True)
     uploader = SerializerMethodField(read_only=True)
+    srcset = SerializerMethodField(read_only=True)
 
     class Meta:
         model = ProjectPlanMethodologyPhoto
@@ -69,6 +84,7 @@ class TinyMethodologyImageSerializer(ModelSerializer):
             "file",
             "project_plan",
             "uploader",
+            "srcset",
         ]
 
     def get_project_plan(self, obj):
@@ -93,9 +109,10 @@ class MethodologyImageCreateSerializer(ModelSerializer):
         fields = "__all__"
 
 
-class MethodologyImageSerializer(ModelSerializer):
+class MethodologyImageSerializer(SrcsetMixin, ModelSerializer):
     project_plan = SerializerMethodField(read_only=True)
     uploader = SerializerMethodField(read_only=True)
+    srcset = SerializerMethodField(read_only=True)
 
     class Meta:
         model = ProjectPlanMethodologyPhoto
@@ -123,8 +140,9 @@ class MethodologyImageSerializer(ModelSerializer):
 # region Annual Report Media Serializers ===================================
 
 
-class TinyAnnualReportMediaSerializer(ModelSerializer):
+class TinyAnnualReportMediaSerializer(SrcsetMixin, ModelSerializer):
     report = SerializerMethodField(read_only=True)
+    srcset = SerializerMethodField(read_only=True)
 
     class Meta:
         model = AnnualReportMedia
@@ -133,6 +151,7 @@ class TinyAnnualReportMediaSerializer(ModelSerializer):
             "kind",
             "file",
             "report",
+            "srcset",
         ]
 
     def get_report(self, obj):
@@ -145,8 +164,9 @@ class TinyAnnualReportMediaSerializer(ModelSerializer):
         return None
 
 
-class AnnualReportMediaSerializer(ModelSerializer):
+class AnnualReportMediaSerializer(SrcsetMixin, ModelSerializer):
     report = SerializerMethodField(read_only=True)
+    srcset = SerializerMethodField(read_only=True)
 
     class Meta:
         model = AnnualReportMedia
@@ -303,9 +323,10 @@ class TinyBusinessAreaPhotoSerializer(ModelSerializer):
             }
 
 
-class BusinessAreaPhotoSerializer(ModelSerializer):
+class BusinessAreaPhotoSerializer(SrcsetMixin, ModelSerializer):
     business_area = TinyBusinessAreaSerializer(read_only=True)
     uploader = SerializerMethodField(read_only=True)
+    srcset = SerializerMethodField(read_only=True)
 
     class Meta:
         model = BusinessAreaPhoto
@@ -334,9 +355,10 @@ class BusinessAreaPhotoCreateSerializer(ModelSerializer):
 # region Project Photo Serializers ===================================
 
 
-class TinyProjectPhotoSerializer(ModelSerializer):
+class TinyProjectPhotoSerializer(SrcsetMixin, ModelSerializer):
     project = SerializerMethodField(read_only=True)
     uploader = SerializerMethodField(read_only=True)
+    srcset = SerializerMethodField(read_only=True)
 
     class Meta:
         model = ProjectPhoto
@@ -345,6 +367,7 @@ class TinyProjectPhotoSerializer(ModelSerializer):
             "file",
             "project",
             "uploader",
+            "srcset",
         ]
 
     def get_project(self, obj):
@@ -366,9 +389,10 @@ class TinyProjectPhotoSerializer(ModelSerializer):
         return None  # Add explicit return for None case
 
 
-class ProjectPhotoSerializer(ModelSerializer):
+class ProjectPhotoSerializer(SrcsetMixin, ModelSerializer):
     project = SerializerMethodField(read_only=True)
     uploader = SerializerMethodField(read_only=True)
+    srcset = SerializerMethodField(read_only=True)
 
     class Meta:
         model = ProjectPhoto
@@ -405,9 +429,10 @@ class ProjectPhotoCreateSerializer(ModelSerializer):
 # region Agency Photo Serializers ===================================
 
 
-class TinyAgencyPhotoSerializer(ModelSerializer):
+class TinyAgencyPhotoSerializer(SrcsetMixin, ModelSerializer):
     agency = SerializerMethodField(read_only=True)
     file = SerializerMethodField()
+    srcset = SerializerMethodField(read_only=True)
 
     class Meta:
         model = AgencyImage
@@ -415,6 +440,7 @@ class TinyAgencyPhotoSerializer(ModelSerializer):
             "id",
             "file",
             "agency",
+            "srcset",
         ]
 
     def get_agency(self, obj):
@@ -431,9 +457,10 @@ class TinyAgencyPhotoSerializer(ModelSerializer):
             return file.url
 
 
-class AgencyPhotoSerializer(ModelSerializer):
+class AgencyPhotoSerializer(SrcsetMixin, ModelSerializer):
     agency = SerializerMethodField(read_only=True)
     file = SerializerMethodField()
+    srcset = SerializerMethodField(read_only=True)
 
     class Meta:
         model = AgencyImage
@@ -467,8 +494,9 @@ class AgencyPhotoCreateSerializer(ModelSerializer):
 # region User Avatar Serializers ===================================
 
 
-class TinyUserAvatarSerializer(ModelSerializer):
+class TinyUserAvatarSerializer(SrcsetMixin, ModelSerializer):
     user = SerializerMethodField(read_only=True)
+    srcset = SerializerMethodField(read_only=True)
 
     class Meta:
         model = UserAvatar
@@ -476,6 +504,7 @@ class TinyUserAvatarSerializer(ModelSerializer):
             "id",
             "file",
             "user",
+            "srcset",
         ]
 
     def get_user(self, obj):
@@ -487,8 +516,9 @@ class TinyUserAvatarSerializer(ModelSerializer):
             }
 
 
-class UserAvatarSerializer(ModelSerializer):
+class UserAvatarSerializer(SrcsetMixin, ModelSerializer):
     user = SerializerMethodField(read_only=True)
+    srcset = SerializerMethodField(read_only=True)
 
     class Meta:
         model = UserAvatar
@@ -511,8 +541,9 @@ class UserAvatarCreateSerializer(ModelSerializer):
         fields = "__all__"
 
 
-class StaffProfileAvatarSerializer(ModelSerializer):
+class StaffProfileAvatarSerializer(SrcsetMixin, ModelSerializer):
     user = SerializerMethodField(read_only=True)
+    srcset = SerializerMethodField(read_only=True)
 
     class Meta:
         model = UserAvatar
@@ -520,6 +551,7 @@ class StaffProfileAvatarSerializer(ModelSerializer):
             "id",
             "file",
             "user",
+            "srcset",
         ]
 
     def get_user(self, obj):
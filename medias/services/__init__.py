@@ -2,6 +2,8 @@
 Services for media management
 """
 
+from .content_store_service import ContentStoreService
+from .derivative_service import DerivativeService
 from .media_service import MediaService
 
-__all__ = ["MediaService"]
+__all__ = ["MediaService", "DerivativeService", "ContentStoreService"]
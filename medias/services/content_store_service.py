@@ -0,0 +1,179 @@
+"""
+Content store service - Deduplicating, content addressed upload storage
+"""
+
+import hashlib
+import posixpath
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+from medias.models import ContentBlob
+
+# Media file fields holding content addressed names
+CONTENT_REFERENCES = [
+    ("medias.ProjectPhoto", "file"),
+    ("medias.BusinessAreaPhoto", "file"),
+]
+
+
+class ContentStoreService:
+    """Business logic for content addressed uploads"""
+
+    @staticmethod
+    def store(upload, subfolder):
+        """
+        Store an upload under the SHA-256 of its contents
+
+        The upload is streamed to a temporary file in chunks while it is
+        hashed, then moved into place. If the same bytes were stored before
+        the existing file is reused and its reference count incremented, so
+        repeated uploads cost no extra disk or writes.
+
+        Args:
+            upload: Uploaded file
+            subfolder: Storage folder, e.g. "projects"
+
+        Returns:
+            Storage name string, e.g. "projects/<sha256>.jpg"
+        """
+        source, digest, size = ContentStoreService._hash_to_disk(upload)
+        extension = posixpath.splitext(upload.name or "")[1].lower()
+        name = f"{subfolder}/{digest}{extension}"
+
+        try:
+            with transaction.atomic():
+                blob, created = ContentBlob.objects.select_for_update().get_or_create(
+                    sha256=digest, defaults={"name": name, "size": size}
+                )
+                if not default_storage.exists(blob.name):
+                    blob.name = default_storage.save(blob.name, source)
+                    settings.LOGGER.info(f"Stored new content blob {blob.name}")
+                blob.ref_count = F("ref_count") + 1
+                blob.save(update_fields=["name", "ref_count", "updated_at"])
+        finally:
+            if source is not upload:
+                source.close()
+
+        return blob.name
+
+    @staticmethod
+    def release(name):
+        """
+        Drop one reference to a stored blob
+
+        Names that are not content addressed are ignored. The file itself is
+        left for collect_garbage, so a blob re-uploaded in the meantime is
+        not written twice.
+
+        Args:
+            name: Storage name that is no longer referenced by a row
+        """
+        if name:
+            ContentBlob.objects.filter(name=name).update(
+                ref_count=Greatest(F("ref_count") - 1, 0)
+            )
+
+    @staticmethod
+    def reconcile_ref_counts():
+        """
+        Recount blob references from the media rows that use them
+
+        Catches references dropped without a release, e.g. by bulk deletes.
+
+        Returns:
+            Number of blobs whose count changed
+        """
+        counts = None
+        for label, field_name in CONTENT_REFERENCES:
+            references = (
+                apps.get_model(label)
+                .objects.filter(**{field_name: OuterRef("name")})
+                .order_by()
+                .values(field_name)
+                .annotate(count=Count("pk"))
+                .values("count")
+            )
+            count = Coalesce(Subquery(references), Value(0))
+            counts = count if counts is None else counts + count
+
+        return (
+            ContentBlob.objects.annotate(actual=counts)
+            .exclude(ref_count=F("actual"))
+            .update(ref_count=counts)
+        )
+
+    @staticmethod
+    def collect_garbage(grace=timedelta(hours=1), dry_run=False):
+        """
+        Delete blobs no media row references
+
+        Blobs touched within the grace period are kept, as an upload may be
+        stored moments before the row that references it is saved.
+
+        Args:
+            grace: Minimum age of an unreferenced blob before removal
+            dry_run: Only report what would be deleted
+
+        Returns:
+            Dict with reconciled count, deleted blob names and bytes freed
+        """
+        reconciled = 0 if dry_run else ContentStoreService.reconcile_ref_counts()
+        unreferenced = ContentBlob.objects.filter(
+            ref_count=0, updated_at__lt=timezone.now() - grace
+        ).order_by("pk")
+
+        deleted = []
+        freed = 0
+        for blob in unreferenced:
+            if not dry_run:
+                default_storage.delete(blob.name)
+                blob.delete()
+            deleted.append(blob.name)
+            freed += blob.size
+
+        settings.LOGGER.info(
+            f"{'Would delete' if dry_run else 'Deleted'} {len(deleted)} "
+            f"unreferenced content blobs ({freed} bytes)"
+        )
+        return {"reconciled": reconciled, "deleted": deleted, "freed": freed}
+
+    @staticmethod
+    def _hash_to_disk(upload):
+        """
+        Hash an upload in chunks, spooling it to a temporary file if needed
+
+        Returns:
+            Tuple of (file on disk, hex digest, size in bytes)
+        """
+        hasher = hashlib.sha256()
+        size = 0
+
+        if hasattr(upload, "temporary_file_path"):
+            # Large uploads are already on disk, so only hash them
+            for chunk in upload.chunks():
+                hasher.update(chunk)
+                size += len(chunk)
+            upload.seek(0)
+            return upload, hasher.hexdigest(), size
+
+        spooled = TemporaryUploadedFile(
+            upload.name,
+            getattr(upload, "content_type", None),
+            0,
+            getattr(upload, "charset", None),
+        )
+        for chunk in upload.chunks():
+            hasher.update(chunk)
+            spooled.write(chunk)
+            size += len(chunk)
+        spooled.size = size
+        spooled.seek(0)
+        return spooled, hasher.hexdigest(), size
@@ -0,0 +1,99 @@
+"""
+Derivative service - Resized variants of uploaded images
+"""
+
+from django.conf import settings
+from PIL import Image
+
+from medias.models import (
+    AgencyImage,
+    AnnualReportMedia,
+    BusinessAreaPhoto,
+    ProjectPhoto,
+    ProjectPlanMethodologyPhoto,
+    UserAvatar,
+)
+from medias.utils.derivatives import delete_derivatives, generate_derivatives
+
+# Image models that keep a derivative manifest beside the original upload
+DERIVATIVE_MODELS = [
+    ProjectPhoto,
+    BusinessAreaPhoto,
+    AgencyImage,
+    UserAvatar,
+    AnnualReportMedia,
+    ProjectPlanMethodologyPhoto,
+]
+
+
+class DerivativeService:
+    """Business logic for image derivative generation"""
+
+    @staticmethod
+    def build_manifest(name):
+        """
+        Generate derivatives for an image
+
+        Unreadable images are logged and recorded with no variants, so they
+        are not retried until the file changes.
+
+        Args:
+            name: Storage name of the original image
+
+        Returns:
+            Manifest dict (empty if there is no file)
+        """
+        if not name:
+            return {}
+        try:
+            return generate_derivatives(name)
+        except (OSError, ValueError, Image.DecompressionBombError) as e:
+            settings.LOGGER.warning(f"Could not generate derivatives for {name}: {e}")
+            return {"source": name, "variants": {}}
+
+    @staticmethod
+    def refresh_derivatives(instance, force=False):
+        """
+        Bring a media row's derivatives in line with its file
+
+        Does nothing if the manifest already describes the current file,
+        unless forced. The manifest is written with an UPDATE so no save
+        signals fire again.
+
+        Args:
+            instance: Media model instance with file and derivatives fields
+            force: Regenerate even if the manifest is current
+
+        Returns:
+            The instance's manifest
+        """
+        name = instance.file.name if instance.file else ""
+        current = instance.derivatives or {}
+        if not force and current.get("source", "") == name:
+            return current
+
+        DerivativeService.release_derivatives(current, exclude=instance)
+        manifest = DerivativeService.build_manifest(name)
+        type(instance)._base_manager.filter(pk=instance.pk).update(derivatives=manifest)
+        instance.derivatives = manifest
+        return manifest
+
+    @staticmethod
+    def release_derivatives(manifest, exclude=None):
+        """
+        Delete a manifest's files unless another media row uses the same source
+
+        Args:
+            manifest: Manifest of the derivatives to release
+            exclude: Media instance giving up the derivatives
+        """
+        source = (manifest or {}).get("source")
+        if not source:
+            return
+        for model in DERIVATIVE_MODELS:
+            others = model._base_manager.filter(file=source)
+            if isinstance(exclude, model):
+                others = others.exclude(pk=exclude.pk)
+            if others.exists():
+                return
+        delete_derivatives(manifest)
@@ -172,7 +172,9 @@ class MediaService:
     @staticmethod
     def list_business_area_photos():
         """List all business area photos"""
-        return BusinessAreaPhoto.objects.all()
+        return BusinessAreaPhoto.objects.select_related(
+            "business_area__image", "business_area__division", "uploader"
+        )
 
     @staticmethod
     def get_business_area_photo(pk):
@@ -223,7 +225,7 @@ class MediaService:
     @staticmethod
     def list_project_photos():
         """List all project photos"""
-        return ProjectPhoto.objects.all()
+        return ProjectPhoto.objects.select_related("project", "uploader")
 
     @staticmethod
     def get_project_photo(pk):
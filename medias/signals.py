@@ -0,0 +1,39 @@
+"""
+Django signals for the medias app.
+
+Generates resized WebP and JPEG derivatives when an image is uploaded or
+replaced, and removes them with their media row. Deleted rows also drop their
+reference to a content addressed upload.
+"""
+
+from django.db.models.signals import post_delete, post_save
+
+from .services.content_store_service import CONTENT_REFERENCES, ContentStoreService
+from .services.derivative_service import DERIVATIVE_MODELS, DerivativeService
+
+
+def refresh_image_derivatives(sender, instance, raw=False, **kwargs):
+    """New or replaced uploads get a fresh set of derivatives"""
+    if raw:
+        return
+    DerivativeService.refresh_derivatives(instance)
+
+
+def delete_image_derivatives(sender, instance, **kwargs):
+    """Derivatives go with the last media row using their source image"""
+    DerivativeService.release_derivatives(instance.derivatives, exclude=instance)
+
+
+for model in DERIVATIVE_MODELS:
+    post_save.connect(refresh_image_derivatives, sender=model)
+    post_delete.connect(delete_image_derivatives, sender=model)
+
+
+def release_content_blob(sender, instance, **kwargs):
+    """The blob is kept until collect_content_blobs finds it unreferenced"""
+    if instance.file:
+        ContentStoreService.release(instance.file.name)
+
+
+for label, _ in CONTENT_REFERENCES:
+    post_delete.connect(release_content_blob, sender=label)
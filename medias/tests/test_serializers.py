@@ -416,6 +416,15 @@ class TestProjectPhotoSerializers:
         assert data["project"]["title"] == project_photo.project.title
         assert data["uploader"]["id"] == project_photo.uploader.id
 
+    def test_tiny_project_photo_serializer_srcset(self, project_photo, db):
+        """Test TinyProjectPhotoSerializer exposes derivative srcsets"""
+        project_photo.refresh_from_db()
+        data = TinyProjectPhotoSerializer(project_photo).data
+
+        variant = project_photo.derivatives["variants"]["webp"][0]
+        assert data["srcset"]["webp"] == f"/files/{variant['name']} 10w"
+        assert data["srcset"]["jpeg"].endswith("_10w.jpeg 10w")
+
     def test_tiny_project_photo_serializer_no_project(self, db):
         """Test TinyProjectPhotoSerializer with no project - COVERS LINE 357"""
         from medias.models import ProjectPhoto
@@ -855,3 +855,306 @@ class TestUserAvatarService:
         # Act & Assert
         with pytest.raises(PermissionDenied):
             MediaService.delete_user_avatar(user_avatar.id, other_user)
+
+
+class TestDerivativeService:
+    """Tests for image derivative generation"""
+
+    @pytest.fixture(autouse=True)
+    def media_root(self, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        settings.IMAGE_DERIVATIVE_WIDTHS = [160, 480, 960]
+        return tmp_path
+
+    @staticmethod
+    def make_image(name="photo.png", size=(640, 320), mode="RGBA"):
+        from io import BytesIO
+
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from PIL import Image
+
+        buffer = BytesIO()
+        Image.new(mode, size, color="green").save(buffer, format="PNG")
+        return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/png")
+
+    def test_upload_generates_derivatives(self, project, user, db):
+        """Test an upload gets WebP and JPEG variants below its own width"""
+        from django.core.files.storage import default_storage
+
+        # Act
+        photo = ProjectPhoto.objects.create(
+            file=self.make_image(), project=project, uploader=user
+        )
+
+        # Assert
+        photo.refresh_from_db()
+        manifest = photo.derivatives
+        assert manifest["source"] == photo.file.name
+        assert (manifest["width"], manifest["height"]) == (640, 320)
+        for key in ("webp", "jpeg"):
+            variants = manifest["variants"][key]
+            assert [v["width"] for v in variants] == [160, 480]
+            assert [v["height"] for v in variants] == [80, 240]
+            assert all(default_storage.exists(v["name"]) for v in variants)
+        assert manifest["variants"]["webp"][0]["name"].endswith("_160w.webp")
+
+    def test_small_image_gets_single_variant(self, project, user, db):
+        """Test an image narrower than every width is re-encoded once"""
+        # Act
+        photo = ProjectPhoto.objects.create(
+            file=self.make_image(size=(100, 50), mode="RGB"),
+            project=project,
+            uploader=user,
+        )
+
+        # Assert
+        assert [v["width"] for v in photo.derivatives["variants"]["jpeg"]] == [100]
+
+    def test_replacing_file_regenerates_derivatives(self, project, user, db):
+        """Test a new upload replaces the previous derivatives"""
+        from django.core.files.storage import default_storage
+
+        # Arrange
+        photo = ProjectPhoto.objects.create(
+            file=self.make_image("old.png"), project=project, uploader=user
+        )
+        old_names = [v["name"] for v in photo.derivatives["variants"]["webp"]]
+
+        # Act
+        photo.file = self.make_image("new.png", size=(1200, 600))
+        photo.save()
+
+        # Assert
+        photo.refresh_from_db()
+        assert photo.derivatives["source"] == photo.file.name
+        assert [v["width"] for v in photo.derivatives["variants"]["webp"]] == [
+            160,
+            480,
+            960,
+        ]
+        assert not any(default_storage.exists(name) for name in old_names)
+
+    def test_resaving_does_not_regenerate(self, project, user, db):
+        """Test saving without a new file leaves the derivatives alone"""
+        from unittest.mock import patch
+
+        # Arrange
+        photo = ProjectPhoto.objects.create(
+            file=self.make_image(), project=project, uploader=user
+        )
+
+        # Act
+        with patch(
+            "medias.services.derivative_service.generate_derivatives"
+        ) as generate:
+            photo.save()
+
+        # Assert
+        generate.assert_not_called()
+
+    def test_unreadable_image_records_no_variants(self, project, user, db):
+        """Test a file Pillow cannot read is logged, not raised"""
+        from django.core.files.uploadedfile import SimpleUploadedFile
+
+        from medias.serializers import ProjectPhotoSerializer
+
+        # Act
+        photo = ProjectPhoto.objects.create(
+            file=SimpleUploadedFile("broken.jpg", b"not an image"),
+            project=project,
+            uploader=user,
+        )
+
+        # Assert
+        assert photo.derivatives == {"source": photo.file.name, "variants": {}}
+        assert ProjectPhotoSerializer(photo).data["srcset"] is None
+
+    def test_delete_removes_derivatives(self, project, user, db):
+        """Test deleting a media row removes its derivative files"""
+        from django.core.files.storage import default_storage
+
+        # Arrange
+        photo = ProjectPhoto.objects.create(
+            file=self.make_image(), project=project, uploader=user
+        )
+        names = [v["name"] for v in photo.derivatives["variants"]["jpeg"]]
+
+        # Act
+        photo.delete()
+
+        # Assert
+        assert names
+        assert not any(default_storage.exists(name) for name in names)
+
+    def test_same_stem_uploads_keep_their_own_derivatives(self, user, superuser, db):
+        """Test originals sharing a stem don't overwrite each other's variants"""
+        from django.core.files.storage import default_storage
+        from PIL import Image
+
+        # Arrange
+        png = UserAvatar.objects.create(
+            file=self.make_image("photo.png", size=(640, 320)), user=user
+        )
+        jpg = UserAvatar.objects.create(
+            file=self.make_image("photo.jpg", size=(1200, 1200)), user=superuser
+        )
+
+        def names(avatar):
+            return [
+                variant["name"]
+                for variants in avatar.derivatives["variants"].values()
+                for variant in variants
+            ]
+
+        # Act
+        png.delete()
+
+        # Assert
+        assert not set(names(png)) & set(names(jpg))
+        assert all(default_storage.exists(name) for name in names(jpg))
+        variant = jpg.derivatives["variants"]["webp"][1]
+        with default_storage.open(variant["name"], "rb") as f:
+            assert Image.open(f).size == (480, 480)
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_backfill_command(self, project, user, workers, db):
+        """Test the backfill command fills in missing manifests"""
+        from io import StringIO
+
+        from django.core.management import call_command
+
+        # Arrange
+        photo = ProjectPhoto.objects.create(
+            file=self.make_image(), project=project, uploader=user
+        )
+        ProjectPhoto.objects.filter(pk=photo.pk).update(derivatives={})
+
+        # Act
+        out = StringIO()
+        call_command(
+            "generate_image_derivatives",
+            model=["projectphoto"],
+            workers=workers,
+            stdout=out,
+        )
+
+        # Assert
+        photo.refresh_from_db()
+        assert photo.derivatives["source"] == photo.file.name
+        assert len(photo.derivatives["variants"]["webp"]) == 2
+        assert "Processed 1 images" in out.getvalue()
+
+
+class TestContentStoreService:
+    """Tests for content addressed upload storage"""
+
+    @pytest.fixture(autouse=True)
+    def media_root(self, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        return tmp_path
+
+    def test_store_streams_large_upload(self, media_root, db):
+        """Test an upload already spooled to disk is hashed and moved in"""
+        # Arrange
+        import hashlib
+
+        from django.core.files.uploadedfile import TemporaryUploadedFile
+
+        from medias.models import ContentBlob
+        from medias.services.content_store_service import ContentStoreService
+
+        content = b"x" * (3 * 1024 * 1024)
+        upload = TemporaryUploadedFile("large.png", "image/png", len(content), None)
+        upload.write(content)
+        upload.seek(0)
+
+        # Act
+        name = ContentStoreService.store(upload, "business_areas")
+
+        # Assert
+        digest = hashlib.sha256(content).hexdigest()
+        assert name == f"business_areas/{digest}.png"
+        assert (media_root / name).stat().st_size == len(content)
+        blob = ContentBlob.objects.get(sha256=digest)
+        assert (blob.size, blob.ref_count) == (len(content), 1)
+
+    def test_store_rewrites_missing_file(self, media_root, db):
+        """Test a blob whose file went missing is written again"""
+        # Arrange
+        from django.core.files.uploadedfile import SimpleUploadedFile
+
+        from medias.services.content_store_service import ContentStoreService
+
+        name = ContentStoreService.store(
+            SimpleUploadedFile("a.jpg", b"abc"), "projects"
+        )
+        (media_root / name).unlink()
+
+        # Act
+        again = ContentStoreService.store(
+            SimpleUploadedFile("b.jpg", b"abc"), "projects"
+        )
+
+        # Assert
+        assert again == name
+        assert (media_root / name).read_bytes() == b"abc"
+
+    def test_release_and_collect_garbage(self, project, user, media_root, db):
+        """Test blobs are collected once no media row references them"""
+        # Arrange
+        from datetime import timedelta
+
+        from django.core.files.uploadedfile import SimpleUploadedFile
+
+        from medias.models import ContentBlob
+        from medias.services.content_store_service import ContentStoreService
+
+        name = ContentStoreService.store(
+            SimpleUploadedFile("a.jpg", b"abc"), "projects"
+        )
+        photo = ProjectPhoto.objects.create(file=name, project=project, uploader=user)
+        orphan = ContentStoreService.store(
+            SimpleUploadedFile("b.jpg", b"def"), "projects"
+        )
+
+        # Act
+        kept = ContentStoreService.collect_garbage(grace=timedelta(0))
+        photo.delete()
+        released = ContentBlob.objects.get(name=name).ref_count
+        collected = ContentStoreService.collect_garbage(grace=timedelta(0))
+
+        # Assert
+        assert kept["deleted"] == [orphan]
+        assert kept["reconciled"] == 1
+        assert released == 0
+        assert collected["deleted"] == [name]
+        assert collected["freed"] == 3
+        assert not (media_root / name).exists()
+        assert not ContentBlob.objects.exists()
+
+    def test_collect_garbage_keeps_recent_blobs(self, media_root, db):
+        """Test unreferenced blobs inside the grace period survive"""
+        # Arrange
+        from io import StringIO
+
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from django.core.management import call_command
+
+        from medias.models import ContentBlob
+        from medias.services.content_store_service import ContentStoreService
+
+        name = ContentStoreService.store(
+            SimpleUploadedFile("a.jpg", b"abc"), "projects"
+        )
+        ContentStoreService.release(name)
+
+        # Act
+        out = StringIO()
+        call_command("collect_content_blobs", stdout=out)
+        call_command("collect_content_blobs", grace_minutes=0, dry_run=True, stdout=out)
+
+        # Assert
+        assert "Deleted 0 blobs" in out.getvalue()
+        assert "Would delete 1 blobs" in out.getvalue()
+        assert ContentBlob.objects.filter(name=name).exists()
+        assert (media_root / name).exists()
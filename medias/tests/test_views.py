@@ -17,11 +17,13 @@ URL Mapping:
 - Methodology Photos: /api/v1/medias/methodology_photos, /api/v1/medias/methodology_photos/<int:pk>
 - Agency Photos: /api/v1/medias/agency_photos, /api/v1/medias/agency_photos/<int:pk>
 - Project Document PDFs: NOT IN urls.py - needs to be added
+- Media files: /files/<path> (config/urls.py)
 """
 
+import pytest
 from rest_framework import status
 
-from common.tests.test_helpers import medias_urls
+from common.tests.test_helpers import medias_urls, response_json
 from medias.models import (
     AgencyImage,
     AnnualReportMedia,
@@ -538,7 +540,7 @@ class TestBusinessAreaPhotoViews:
 
         # Assert
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 1
+        assert len(response_json(response)) == 1
 
     def test_create_business_area_photo_valid_data(
         self, api_client, user, business_area, mock_image, db
@@ -670,7 +672,41 @@ class TestProjectPhotoViews:
 
         # Assert
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 1
+        assert len(response_json(response)) == 1
+
+    def test_list_project_photos_streams_with_bounded_queries(
+        self, api_client, user, project_photo, db
+    ):
+        """Test the streamed list runs the same queries for any number of rows"""
+        # Arrange
+        from common.tests.test_helpers import assert_query_budget
+
+        api_client.force_authenticate(user=user)
+
+        # Act
+        with assert_query_budget(max_queries=6):
+            response = api_client.get(medias_urls.path("project_photos"))
+            data = response_json(response)
+
+        # Assert
+        assert response.streaming
+        assert data[0]["project"]["id"] == project_photo.project.id
+        assert data[0]["uploader"]["id"] == project_photo.uploader.id
+
+    def test_list_project_photos_paginated(self, api_client, user, project_photo, db):
+        """Test pagination is used when the client asks for a page"""
+        # Arrange
+        api_client.force_authenticate(user=user)
+
+        # Act
+        response = api_client.get(
+            medias_urls.path("project_photos"), {"page": 1, "page_size": 10}
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["total_results"] == 1
+        assert response.data["results"][0]["id"] == project_photo.id
 
     def test_create_project_photo_valid_data(
         self, api_client, user, project, mock_image, db
@@ -1050,3 +1086,158 @@ class TestProjectDocumentPDFViews:
 
         # Assert
         assert response.status_code == status.HTTP_201_CREATED
+
+
+class TestMediaFileView:
+    """Tests for MediaFile view serving /files/"""
+
+    DIGEST = "ab" * 32
+
+    @pytest.fixture(autouse=True)
+    def media_root(self, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        settings.MEDIA_SENDFILE_BACKEND = ""
+        settings.MEDIA_PRIVATE_PREFIXES = []
+        (tmp_path / "projects").mkdir()
+        (tmp_path / "projects" / "photo.jpg").write_bytes(b"0123456789")
+        (tmp_path / "projects" / f"{self.DIGEST}.jpg").write_bytes(b"abcdef")
+        return tmp_path
+
+    def test_serves_file_with_validators(self, api_client, db):
+        """Test a whole file is streamed with ETag and revalidation headers"""
+        # Act
+        response = api_client.get("/files/projects/photo.jpg")
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert b"".join(response.streaming_content) == b"0123456789"
+        assert response["Content-Type"] == "image/jpeg"
+        assert response["Accept-Ranges"] == "bytes"
+        assert response["Cache-Control"] == "public, no-cache"
+        assert response["ETag"]
+        assert response["Last-Modified"]
+
+    def test_content_addressed_file_is_immutable(self, api_client, db):
+        """Test content addressed files use their digest and cache forever"""
+        # Act
+        response = api_client.get(f"/files/projects/{self.DIGEST}.jpg")
+
+        # Assert
+        assert response["ETag"] == f'"{self.DIGEST}"'
+        assert "immutable" in response["Cache-Control"]
+
+    def test_conditional_get(self, api_client, db):
+        """Test a matching If-None-Match returns 304 without a body"""
+        # Arrange
+        etag = api_client.get("/files/projects/photo.jpg")["ETag"]
+
+        # Act
+        response = api_client.get("/files/projects/photo.jpg", HTTP_IF_NONE_MATCH=etag)
+
+        # Assert
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+
+    @pytest.mark.parametrize(
+        "header,expected,content_range",
+        [
+            ("bytes=2-5", b"2345", "bytes 2-5/10"),
+            ("bytes=7-", b"789", "bytes 7-9/10"),
+            ("bytes=-3", b"789", "bytes 7-9/10"),
+            ("bytes=8-100", b"89", "bytes 8-9/10"),
+        ],
+    )
+    def test_range_request(self, api_client, header, expected, content_range, db):
+        """Test single byte ranges return 206 partial content"""
+        # Act
+        response = api_client.get("/files/projects/photo.jpg", HTTP_RANGE=header)
+
+        # Assert
+        assert response.status_code == status.HTTP_206_PARTIAL_CONTENT
+        assert b"".join(response.streaming_content) == expected
+        assert response["Content-Range"] == content_range
+        assert response["Content-Length"] == str(len(expected))
+
+    @pytest.mark.parametrize("header", ["bytes=0-1,4-5", "bytes=5-2", "items=0-1"])
+    def test_unsupported_range_serves_whole_file(self, api_client, header, db):
+        """Test multiple or malformed ranges are ignored"""
+        # Act
+        response = api_client.get("/files/projects/photo.jpg", HTTP_RANGE=header)
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert b"".join(response.streaming_content) == b"0123456789"
+
+    def test_unsatisfiable_range(self, api_client, db):
+        """Test a range past the end of the file returns 416"""
+        # Act
+        response = api_client.get("/files/projects/photo.jpg", HTTP_RANGE="bytes=10-")
+
+        # Assert
+        assert response.status_code == status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+        assert response["Content-Range"] == "bytes */10"
+
+    def test_stale_if_range_serves_whole_file(self, api_client, db):
+        """Test a range is ignored when If-Range no longer matches"""
+        # Act
+        response = api_client.get(
+            "/files/projects/photo.jpg",
+            HTTP_RANGE="bytes=0-1",
+            HTTP_IF_RANGE='"stale"',
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_nginx_accel_redirect(self, api_client, settings, db):
+        """Test nginx mode hands the file to the web server"""
+        # Arrange
+        settings.MEDIA_SENDFILE_BACKEND = "nginx"
+        settings.MEDIA_ACCEL_REDIRECT_PREFIX = "/protected-files/"
+
+        # Act
+        response = api_client.get("/files/projects/photo.jpg")
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response["X-Accel-Redirect"] == "/protected-files/projects/photo.jpg"
+        assert response.content == b""
+        assert response["Content-Type"] == "image/jpeg"
+
+    def test_xsendfile(self, api_client, settings, media_root, db):
+        """Test xsendfile mode passes the absolute path"""
+        # Arrange
+        settings.MEDIA_SENDFILE_BACKEND = "xsendfile"
+
+        # Act
+        response = api_client.get("/files/projects/photo.jpg")
+
+        # Assert
+        assert response["X-Sendfile"] == str(media_root / "projects" / "photo.jpg")
+
+    @pytest.mark.parametrize(
+        "path",
+        ["projects/missing.jpg", "projects", "../settings.py", "projects/photo.jpg%00"],
+    )
+    def test_missing_or_outside_paths_return_404(self, api_client, path, db):
+        """Test missing files, folders, traversal attempts and NUL bytes get a 404"""
+        # Act
+        response = api_client.get(f"/files/{path}")
+
+        # Assert
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_private_prefix_requires_login(self, api_client, user, settings, db):
+        """Test files under a private prefix need an authenticated user"""
+        # Arrange
+        settings.MEDIA_PRIVATE_PREFIXES = ["projects/"]
+
+        # Act
+        anonymous = api_client.get("/files/projects/photo.jpg")
+        api_client.force_authenticate(user=user)
+        authenticated = api_client.get("/files/projects/photo.jpg")
+
+        # Assert
+        assert anonymous.status_code == status.HTTP_403_FORBIDDEN
+        assert authenticated.status_code == status.HTTP_200_OK
+        assert authenticated["Cache-Control"] == "private, no-cache"
@@ -2,4 +2,16 @@
 Utilities for media management
 """
 
-# No utilities yet
+from .derivatives import (
+    build_srcset,
+    delete_derivatives,
+    derivative_name,
+    generate_derivatives,
+)
+
+__all__ = [
+    "build_srcset",
+    "delete_derivatives",
+    "derivative_name",
+    "generate_derivatives",
+]
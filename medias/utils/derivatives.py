@@ -0,0 +1,159 @@
+"""
+Image derivatives - resized WebP and JPEG variants of uploaded images
+"""
+
+import posixpath
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps
+
+# Manifest key and Pillow format for each derivative format, preferred first
+DERIVATIVE_FORMATS = (
+    ("webp", "WEBP"),
+    ("jpeg", "JPEG"),
+)
+
+
+def derivative_name(name, width, extension):
+    """
+    Get the storage name of a derivative, kept beside the original
+
+    e.g. "projects/photo.png" -> "projects/derivatives/photo.png_480w.webp"
+
+    The original's extension is kept, so originals sharing a stem (photo.png
+    and photo.jpg) never write over each other's derivatives.
+
+    Args:
+        name: Storage name of the original image
+        width: Derivative width in pixels
+        extension: Derivative file extension
+
+    Returns:
+        Storage name string
+    """
+    directory, filename = posixpath.split(name)
+    return posixpath.join(directory, "derivatives", f"{filename}_{width}w.{extension}")
+
+
+def generate_derivatives(name, widths=None, storage=None):
+    """
+    Write resized WebP and JPEG copies of an image
+
+    Widths at or above the original's are skipped; an image narrower than
+    every configured width gets a single re-encoded copy at its own width.
+    Only touches storage, so it is safe to run in worker processes.
+
+    Args:
+        name: Storage name of the original image
+        widths: Target widths (defaults to IMAGE_DERIVATIVE_WIDTHS)
+        storage: Storage backend (defaults to default_storage)
+
+    Returns:
+        Manifest dict with the source name, original dimensions and, per
+        format, a list of variants with width, height, name and size
+
+    Raises:
+        OSError: If the file cannot be read or is not an image
+    """
+    storage = storage or default_storage
+    widths = widths or settings.IMAGE_DERIVATIVE_WIDTHS
+
+    with storage.open(name, "rb") as source:
+        image = Image.open(source)
+        image = ImageOps.exif_transpose(image)
+        image.load()
+
+    original_width, original_height = image.size
+    targets = sorted({width for width in widths if width < original_width})
+    if not targets:
+        targets = [original_width]
+
+    has_alpha = image.mode in ("RGBA", "LA") or "transparency" in image.info
+    image = image.convert("RGBA" if has_alpha else "RGB")
+
+    manifest = {
+        "source": name,
+        "width": original_width,
+        "height": original_height,
+        "variants": {key: [] for key, _ in DERIVATIVE_FORMATS},
+    }
+    for width in targets:
+        height = max(1, round(original_height * width / original_width))
+        resized = (
+            image
+            if width == original_width
+            else image.resize((width, height), Image.Resampling.LANCZOS)
+        )
+        for key, image_format in DERIVATIVE_FORMATS:
+            content = _encode(resized, image_format)
+            path = derivative_name(name, width, key)
+            if storage.exists(path):
+                storage.delete(path)
+            manifest["variants"][key].append(
+                {
+                    "width": width,
+                    "height": height,
+                    "name": storage.save(path, ContentFile(content)),
+                    "size": len(content),
+                }
+            )
+    return manifest
+
+
+def delete_derivatives(manifest, storage=None):
+    """
+    Remove the files listed in a derivative manifest
+
+    Args:
+        manifest: Manifest returned by generate_derivatives
+        storage: Storage backend (defaults to default_storage)
+    """
+    storage = storage or default_storage
+    for variants in (manifest or {}).get("variants", {}).values():
+        for variant in variants:
+            storage.delete(variant["name"])
+
+
+def build_srcset(manifest, storage=None):
+    """
+    Format a manifest's variants as srcset strings
+
+    Args:
+        manifest: Manifest returned by generate_derivatives
+        storage: Storage backend (defaults to default_storage)
+
+    Returns:
+        Dict of format to srcset string, e.g.
+        {"webp": "/files/a_160w.webp 160w, ...", "jpeg": "..."},
+        or None if the manifest has no variants
+    """
+    storage = storage or default_storage
+    variants = (manifest or {}).get("variants")
+    if not variants:
+        return None
+    return {
+        key: ", ".join(
+            f"{storage.url(variant['name'])} {variant['width']}w"
+            for variant in variants.get(key, [])
+        )
+        for key, _ in DERIVATIVE_FORMATS
+    }
+
+
+def _encode(image, image_format):
+    if image_format == "JPEG" and image.mode == "RGBA":
+        # JPEG has no alpha channel, so flatten onto white
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel("A"))
+        image = background
+    buffer = BytesIO()
+    image.save(
+        buffer,
+        format=image_format,
+        quality=settings.IMAGE_DERIVATIVE_QUALITY,
+        optimize=image_format == "JPEG",
+    )
+    return buffer.getvalue()
@@ -0,0 +1,86 @@
+"""
+Media serving helpers - byte ranges, validators and cache policy
+"""
+
+import posixpath
+import re
+
+# Names written by ContentStoreService, e.g. "projects/<sha256>.jpg"
+_CONTENT_ADDRESSED = re.compile(r"^[0-9a-f]{64}$")
+_BYTE_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeNotSatisfiable(Exception):
+    """Raised when a Range header lies entirely outside the file"""
+
+
+def content_hash(path):
+    """
+    Get the SHA-256 a content addressed path is named after
+
+    Args:
+        path: Media path relative to MEDIA_ROOT
+
+    Returns:
+        Hex digest string, or None if the path is not content addressed
+    """
+    stem = posixpath.splitext(posixpath.basename(path))[0]
+    return stem if _CONTENT_ADDRESSED.match(stem) else None
+
+
+def file_etag(path, stat):
+    """
+    Get a strong ETag for a media file
+
+    Content addressed files use their digest, so the tag survives copies
+    between servers; other files combine modification time and size.
+
+    Args:
+        path: Media path relative to MEDIA_ROOT
+        stat: os.stat_result of the file
+
+    Returns:
+        Quoted ETag string
+    """
+    digest = content_hash(path)
+    if digest:
+        return f'"{digest}"'
+    return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+
+def parse_byte_range(header, size):
+    """
+    Parse a single-range Range header
+
+    Multiple ranges and malformed headers are ignored (the whole file is
+    served), as RFC 9110 allows.
+
+    Args:
+        header: Range header value, e.g. "bytes=0-499"
+        size: File size in bytes
+
+    Returns:
+        Inclusive (start, end) tuple, or None to serve the whole file
+
+    Raises:
+        RangeNotSatisfiable: If the range starts beyond the end of the file
+    """
+    match = _BYTE_RANGE.match(header.strip())
+    if not match or match.group(1) == match.group(2) == "":
+        return None
+
+    first, last = match.groups()
+    if first == "":
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0:
+            raise RangeNotSatisfiable(header)
+        return max(size - length, 0), size - 1
+
+    start = int(first)
+    if last != "" and int(last) < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable(header)
+    end = size - 1 if last == "" else min(int(last), size - 1)
+    return start, end
@@ -14,6 +14,7 @@ from .annual_reports import (
     LegacyAnnualReportPDFs,
 )
 from .avatars import UserAvatarDetail, UserAvatars
+from .files import MediaFile
 from .photos import (
     AgencyPhotoDetail,
     AgencyPhotos,
@@ -51,4 +52,6 @@ __all__ = [
     # Avatars
     "UserAvatars",
     "UserAvatarDetail",
+    # Files
+    "MediaFile",
 ]
@@ -0,0 +1,152 @@
+"""
+Media file serving views
+"""
+
+import mimetypes
+import os
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from django.utils.module_loading import import_string
+from rest_framework.renderers import JSONRenderer
+from rest_framework.views import APIView
+
+from ..permissions.media_permissions import is_private_media
+from ..utils.serving import (
+    RangeNotSatisfiable,
+    content_hash,
+    file_etag,
+    parse_byte_range,
+)
+
+# Seconds content addressed files may be cached; their bytes never change
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+RANGE_CHUNK_SIZE = 64 * 1024
+
+
+class MediaFile(APIView):
+    """
+    Serve a file from MEDIA_ROOT
+
+    With MEDIA_SENDFILE_BACKEND set to "nginx" or "xsendfile" the bytes are
+    handed to the web server (X-Accel-Redirect / X-Sendfile). Otherwise the
+    file is streamed with FileResponse, honouring single byte ranges and
+    conditional requests. Access is decided by MEDIA_PERMISSION_CLASSES.
+    """
+
+    renderer_classes = [JSONRenderer]
+    throttle_classes = []
+
+    def get_permissions(self):
+        return [import_string(path)() for path in settings.MEDIA_PERMISSION_CLASSES]
+
+    def get(self, request, path):
+        # The OS rejects NUL bytes in paths with a ValueError
+        if "\x00" in path:
+            raise Http404("File not found")
+        try:
+            full_path = safe_join(settings.MEDIA_ROOT, path)
+        except SuspiciousFileOperation:
+            raise Http404("File not found")
+        try:
+            stat = os.stat(full_path)
+        except (FileNotFoundError, NotADirectoryError):
+            raise Http404("File not found")
+        if not os.path.isfile(full_path):
+            raise Http404("File not found")
+
+        etag = file_etag(path, stat)
+        headers = {
+            "ETag": etag,
+            "Last-Modified": http_date(stat.st_mtime),
+            "Cache-Control": self._cache_control(path),
+            "Accept-Ranges": "bytes",
+        }
+
+        response = get_conditional_response(
+            request._request, etag=etag, last_modified=int(stat.st_mtime)
+        )
+        if response is None:
+            backend = settings.MEDIA_SENDFILE_BACKEND
+            if backend == "nginx":
+                response = self._accel_redirect_response(path)
+            elif backend == "xsendfile":
+                response = HttpResponse(content_type=self._content_type(path))
+                response["X-Sendfile"] = full_path
+            else:
+                response = self._file_response(request, full_path, stat, headers)
+
+        for header, value in headers.items():
+            response[header] = value
+        return response
+
+    def _file_response(self, request, full_path, stat, headers):
+        """Whole-file or single-range response streamed by Django"""
+        size = stat.st_size
+        byte_range = None
+        range_header = request.META.get("HTTP_RANGE")
+        if range_header and self._if_range_matches(request, headers):
+            try:
+                byte_range = parse_byte_range(range_header, size)
+            except RangeNotSatisfiable:
+                response = HttpResponse(status=416)
+                response["Content-Range"] = f"bytes */{size}"
+                return response
+
+        if byte_range is None or byte_range == (0, size - 1):
+            return FileResponse(open(full_path, "rb"))
+
+        start, end = byte_range
+        response = StreamingHttpResponse(
+            self._read_range(full_path, start, end),
+            status=206,
+            content_type=self._content_type(full_path),
+        )
+        response["Content-Length"] = str(end - start + 1)
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+        return response
+
+    @staticmethod
+    def _if_range_matches(request, headers):
+        """A stale If-Range validator means the whole file must be sent"""
+        if_range = request.META.get("HTTP_IF_RANGE")
+        return if_range is None or if_range in (
+            headers["ETag"],
+            headers["Last-Modified"],
+        )
+
+    @staticmethod
+    def _read_range(full_path, start, end):
+        with open(full_path, "rb") as file:
+            file.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                chunk = file.read(min(RANGE_CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+    def _accel_redirect_response(self, path):
+        response = HttpResponse(content_type=self._content_type(path))
+        prefix = settings.MEDIA_ACCEL_REDIRECT_PREFIX.rstrip("/")
+        response["X-Accel-Redirect"] = f"{prefix}/{quote(path)}"
+        return response
+
+    @staticmethod
+    def _cache_control(path):
+        scope = "private" if is_private_media(path) else "public"
+        if content_hash(path):
+            return f"{scope}, max-age={IMMUTABLE_MAX_AGE}, immutable"
+        # Names can be reused, so revalidate with the ETag each time
+        return f"{scope}, no-cache"
+
+    @staticmethod
+    def _content_type(path):
+        content_type, _ = mimetypes.guess_type(path)
+        return content_type or "application/octet-stream"
@@ -12,6 +12,8 @@ from rest_framework.status import (
 )
 from rest_framework.views import APIView
 
+from common.views import StreamingListMixin
+
 from ..serializers import (
     AgencyPhotoCreateSerializer,
     AgencyPhotoSerializer,
@@ -31,17 +33,19 @@ from ..services.media_service import MediaService
 # endregion ========================================================================================================
 
 
-class BusinessAreaPhotos(APIView):
+class BusinessAreaPhotos(StreamingListMixin, APIView):
     """List and create business area photos"""
 
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
         photos = MediaService.list_business_area_photos()
-        serializer = TinyBusinessAreaPhotoSerializer(
-            photos, many=True, context={"request": request}
+        return self.list_response(
+            photos,
+            TinyBusinessAreaPhotoSerializer,
+            request,
+            context={"request": request},
         )
-        return Response(serializer.data, status=HTTP_200_OK)
 
     def post(self, request):
         settings.LOGGER.info(f"{request.user} is posting a business area photo")
@@ -102,17 +106,16 @@ class BusinessAreaPhotoDetail(APIView):
         return Response(status=HTTP_204_NO_CONTENT)
 
 
-class ProjectPhotos(APIView):
+class ProjectPhotos(StreamingListMixin, APIView):
     """List and create project photos"""
 
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
         photos = MediaService.list_project_photos()
-        serializer = TinyProjectPhotoSerializer(
-            photos, many=True, context={"request": request}
+        return self.list_response(
+            photos, TinyProjectPhotoSerializer, request, context={"request": request}
         )
-        return Response(serializer.data, status=HTTP_200_OK)
 
     def post(self, request):
         settings.LOGGER.info(f"{request.user} is posting a project photo")
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class ProjectsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "projects"
+
+    def ready(self):
+        """Import signals and event subscribers when the app is ready."""
+        import projects.signals  # noqa: F401
+        import projects.subscribers  # noqa: F401
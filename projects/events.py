@@ -0,0 +1,13 @@
+"""
+Domain events for projects (see common.events)
+"""
+
+from dataclasses import dataclass
+
+from common.events import Event
+
+
+@dataclass(frozen=True)
+class MemberAdded(Event):
+    member: object
+    added_by: object
@@ -0,0 +1,20 @@
+"""
+Housekeeping jobs for projects (see common.scheduler)
+"""
+
+from datetime import timedelta
+
+from common.scheduler import job
+
+from .services.analytics_service import ProjectAnalyticsService
+
+
+@job("refresh_project_health", interval=timedelta(hours=1), shared_cache=True)
+def refresh_project_health(since):
+    """Rebuild the project health aggregate in the shared cache"""
+    ProjectAnalyticsService.invalidate_project_health()
+    health = ProjectAnalyticsService.get_project_health()
+    return {
+        "projects": len(health),
+        "without_leader": sum(1 for row in health if not row["leader_count"]),
+    }
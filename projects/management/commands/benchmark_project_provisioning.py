@@ -0,0 +1,180 @@
+"""
+Management command to benchmark importing many projects.
+
+Creates the same synthetic projects twice, once a project at a time
+through the serializers used by the create project view and once with
+ProjectProvisionService, and reports the time and query count of each.
+Every write is rolled back.
+
+Usage:
+    python manage.py benchmark_project_provisioning
+    python manage.py benchmark_project_provisioning --count 5000 --batch-size 1000
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from agencies.models import BusinessArea
+from locations.models import Area
+from projects.models import Project
+from projects.serializers import (
+    CreateProjectSerializer,
+    ExternalProjectDetailSerializer,
+    ProjectAreaSerializer,
+    ProjectDetailSerializer,
+    ProjectMemberSerializer,
+    ProvisionProjectsSerializer,
+    StudentProjectDetailSerializer,
+)
+from projects.services import ProjectProvisionService
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = "Benchmark importing projects one at a time against in bulk"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--count",
+            type=int,
+            default=1000,
+            help="Number of projects to import",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="Rows per bulk INSERT (default: PROJECT_PROVISION_BATCH_SIZE)",
+        )
+
+    def handle(self, *args, **options):
+        user = User.objects.filter(is_active=True).order_by("pk").first()
+        if user is None:
+            raise CommandError("At least one active user is needed as project lead")
+
+        projects = self.build_projects(options["count"], user)
+        paths = {
+            "serializers": lambda: [
+                self.create_with_serializers(data, user) for data in projects
+            ],
+            "bulk": lambda: self.provision(projects, user, options["batch_size"]),
+        }
+
+        self.stdout.write(f"{'path':<12} {'projects':>8} {'queries':>8} {'ms':>10}")
+        for name, run in paths.items():
+            created, queries, elapsed = self.measure(run)
+            self.stdout.write(
+                f"{name:<12} {len(created):>8} {queries:>8} {elapsed:>10.1f}"
+            )
+
+    @staticmethod
+    def build_projects(count, user):
+        """Synthetic provisioning payloads spread over the project kinds"""
+        kinds = [choice for choice, _ in Project.CategoryKindChoices.choices]
+        business_area = BusinessArea.objects.values_list("pk", flat=True).first()
+        areas = list(Area.objects.values_list("pk", flat=True)[:2])
+        year = timezone.now().year
+        return [
+            {
+                "kind": kinds[i % len(kinds)],
+                "year": year,
+                "title": f"<p>Benchmark project {i}</p>",
+                "description": "<p>Imported for benchmarking</p>",
+                "keywords": ["benchmark", f"batch {i // 100}"],
+                "business_area": business_area,
+                "areas": areas,
+                "members": [
+                    {"user": user.pk, "role": "supervising", "is_leader": True}
+                ],
+                "organisation": "Benchmark University",
+                "collaboration_with": "Benchmark Partner",
+            }
+            for i in range(count)
+        ]
+
+    @staticmethod
+    def provision(projects, user, batch_size):
+        """Validate and provision the projects as the provision view does"""
+        serializer = ProvisionProjectsSerializer(data={"projects": projects})
+        serializer.is_valid(raise_exception=True)
+        return ProjectProvisionService.provision_projects(
+            serializer.validated_data["projects"], user, batch_size=batch_size
+        )
+
+    @staticmethod
+    def create_with_serializers(data, user):
+        """Create one project the way the create project view does"""
+        serializer = CreateProjectSerializer(
+            data={
+                "kind": data["kind"],
+                "status": "new",
+                "year": data["year"],
+                "title": data["title"],
+                "description": data["description"],
+                "tagline": "",
+                "keywords": ",".join(data["keywords"]),
+                "business_area": data["business_area"],
+            }
+        )
+        serializer.is_valid(raise_exception=True)
+        with transaction.atomic():
+            project = serializer.save()
+            related = [
+                (ProjectAreaSerializer, {"areas": data["areas"]}),
+                (
+                    ProjectMemberSerializer,
+                    {"user": user.pk, "is_leader": True, "role": "supervising"},
+                ),
+                (
+                    ProjectDetailSerializer,
+                    {"creator": user.pk, "modifier": user.pk, "owner": user.pk},
+                ),
+            ]
+            if data["kind"] == "student":
+                related.append(
+                    (
+                        StudentProjectDetailSerializer,
+                        {"organisation": data["organisation"]},
+                    )
+                )
+            elif data["kind"] == "external":
+                related.append(
+                    (
+                        ExternalProjectDetailSerializer,
+                        {"collaboration_with": data["collaboration_with"]},
+                    )
+                )
+            for serializer_class, fields in related:
+                related_serializer = serializer_class(
+                    data={"project": project.pk, **fields}
+                )
+                related_serializer.is_valid(raise_exception=True)
+                related_serializer.save()
+        return project
+
+    @staticmethod
+    def measure(run):
+        """
+        Run a function in a transaction that is rolled back
+
+        Returns:
+            Tuple of (result, query count, time in milliseconds)
+        """
+        queries = 0
+
+        # Counted directly; the debug query log stops growing at 9000
+        def count_query(execute, sql, params, many, context):
+            nonlocal queries
+            queries += 1
+            return execute(sql, params, many, context)
+
+        with transaction.atomic():
+            with connection.execute_wrapper(count_query):
+                start = time.perf_counter()
+                result = run()
+                elapsed = (time.perf_counter() - start) * 1000
+            transaction.set_rollback(True)
+        return result, queries, elapsed
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-19 07:39
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0014_remove_old_id_fields"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="project",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.search.SearchVector("title", config="english"),
+                name="project_title_search_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                fields=["kind", "year", "number"], name="project_tag_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:25
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("agencies", "0006_remove_old_id_fields"),
+        ("projects", "0015_project_search_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="project",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["hidden_from_staff_profiles"], name="project_hidden_staff_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="projectarea",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["areas"], name="projectarea_areas_gin"
+            ),
+        ),
+    ]
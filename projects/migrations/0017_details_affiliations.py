@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("agencies", "0006_remove_old_id_fields"),
+        ("projects", "0016_array_gin_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="externalprojectdetails",
+            name="affiliations",
+            field=models.ManyToManyField(
+                blank=True,
+                help_text="Affiliations named in collaboration_with, which is kept as a cache of their names.",
+                related_name="external_projects",
+                to="agencies.affiliation",
+            ),
+        ),
+        migrations.AddField(
+            model_name="studentprojectdetails",
+            name="affiliations",
+            field=models.ManyToManyField(
+                blank=True,
+                help_text="Affiliations named in organisation, which is kept as a cache of their names.",
+                related_name="student_projects",
+                to="agencies.affiliation",
+            ),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-19 10:51
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0017_details_affiliations"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="project",
+            name="project_title_search_idx",
+        ),
+        migrations.AddIndex(
+            model_name="project",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.search.SearchVector(
+                    "title", "tagline", "keywords", "description", config="simple"
+                ),
+                name="project_text_search_idx",
+            ),
+        ),
+    ]
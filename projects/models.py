@@ -1,9 +1,12 @@
 # region IMPORTS ==============================================
 
+from collections import Counter
 from datetime import datetime as dt
 
 from bs4 import BeautifulSoup
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
 from django.forms import ValidationError
@@ -215,6 +218,26 @@ class Project(CommonModel):
     def __str__(self) -> str:
         return f"({self.kind.upper()}) {self.extract_inner_text(self.title)}"
 
+    class Meta:
+        indexes = [
+            # Full text index used by the project typeahead search. The
+            # "simple" config doesn't stem or drop stopwords, so prefixes of
+            # partly typed words still match.
+            GinIndex(
+                SearchVector(
+                    "title", "tagline", "keywords", "description", config="simple"
+                ),
+                name="project_text_search_idx",
+            ),
+            # Project tag lookups (e.g. CF-2022-12)
+            models.Index(fields=["kind", "year", "number"], name="project_tag_idx"),
+            # Array containment (hidden_from_staff_profiles__contains=[pk])
+            GinIndex(
+                fields=["hidden_from_staff_profiles"],
+                name="project_hidden_staff_gin",
+            ),
+        ]
+
 
 class ProjectDetail(CommonModel):
     project = models.ForeignKey(
@@ -291,12 +314,16 @@ class ProjectArea(CommonModel):
     class Meta:
         verbose_name = "Project Area"
         verbose_name_plural = "Project Areas"
+        indexes = [
+            # Projects by area (areas__contains / areas__overlap)
+            GinIndex(fields=["areas"], name="projectarea_areas_gin"),
+        ]
 
     def save(self, *args, **kwargs):
         # Check for duplicate primary keys in the areas array
-        duplicate_area_ids = set(
-            [area for area in self.areas if self.areas.count(area) > 1]
-        )
+        duplicate_area_ids = {
+            area for area, count in Counter(self.areas).items() if count > 1
+        }
         if duplicate_area_ids:
             raise ValidationError(
                 {
@@ -413,6 +440,12 @@ class StudentProjectDetails(models.Model):
         null=True,
         help_text="The full name of the academic organisation.",
     )
+    affiliations = models.ManyToManyField(
+        "agencies.Affiliation",
+        blank=True,
+        related_name="student_projects",
+        help_text="Affiliations named in organisation, which is kept as a cache of their names.",
+    )
 
     class Meta:
         verbose_name = "Student Project Detail"
@@ -469,6 +502,12 @@ class ExternalProjectDetails(models.Model):
         blank=True,
         null=True,
     )
+    affiliations = models.ManyToManyField(
+        "agencies.Affiliation",
+        blank=True,
+        related_name="external_projects",
+        help_text="Affiliations named in collaboration_with, which is kept as a cache of their names.",
+    )
     budget = models.CharField(
         max_length=1000,
         default="<p>NO BUDGET SET</p>",
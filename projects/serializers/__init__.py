@@ -3,7 +3,7 @@ Project serializers
 """
 
 # Project area serializers
-from .areas import ProjectAreaSerializer
+from .areas import AreaProjectSerializer, ProjectAreaSerializer
 
 # Base project serializers
 from .base import (
@@ -43,6 +43,13 @@ from .members import (
     TinyProjectMemberSerializer,
 )
 
+# Batch provisioning serializers
+from .provision import (
+    ProvisionMemberSerializer,
+    ProvisionProjectSerializer,
+    ProvisionProjectsSerializer,
+)
+
 __all__ = [
     # Base
     "CreateProjectSerializer",
@@ -67,9 +74,14 @@ __all__ = [
     "MiniUserSerializer",
     # Areas
     "ProjectAreaSerializer",
+    "AreaProjectSerializer",
     # Export
     "ARProjectSerializer",
     "ARExternalProjectSerializer",
     "TinyStudentProjectARSerializer",
     "ProjectDataTableSerializer",
+    # Provisioning
+    "ProvisionProjectsSerializer",
+    "ProvisionProjectSerializer",
+    "ProvisionMemberSerializer",
 ]
@@ -2,12 +2,14 @@
 Project area serializers
 """
 
+from django.db.models import F
 from rest_framework import serializers
 
+from common.serializers import ValuesSerializerMixin
 from locations.models import Area
 from locations.serializers import TinyAreaSerializer
 
-from ..models import ProjectArea
+from ..models import Project, ProjectArea
 
 
 class ProjectAreaSerializer(serializers.ModelSerializer):
@@ -32,3 +34,23 @@ class ProjectAreaSerializer(serializers.ModelSerializer):
             representation["areas"] = []
 
         return representation
+
+
+class AreaProjectSerializer(ValuesSerializerMixin, serializers.ModelSerializer):
+    """Project row with its area IDs, read through values()"""
+
+    areas = serializers.ListField(child=serializers.IntegerField(), read_only=True)
+
+    class Meta:
+        model = Project
+        fields = [
+            "id",
+            "title",
+            "kind",
+            "status",
+            "year",
+            "number",
+            "business_area",
+            "areas",
+        ]
+        values_fields = {"areas": F("area__areas")}
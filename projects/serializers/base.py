@@ -39,9 +39,14 @@ class ProjectSerializer(ModelSerializer):
         fields = "__all__"
 
     def get_deletion_request_id(self, instance):
+        # Annotated by ProjectPageService
+        if hasattr(instance, "pending_deletion_task_id"):
+            return instance.pending_deletion_task_id
         return instance.get_deletion_request_id()
 
     def get_areas(self, instance):
+        if hasattr(instance, "area_list"):
+            return instance.area_list
         area_ids = instance.area.areas
         if area_ids:
             areas = Area.objects.filter(id__in=area_ids)
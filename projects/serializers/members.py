@@ -89,6 +89,10 @@ class MiniUserSerializer(ModelSerializer):
         ]
 
     def get_caretakers(self, obj):
+        # Precomputed by ProjectPageService
+        if hasattr(obj, "active_caretakers"):
+            return obj.active_caretakers
+
         caretakers = obj.get_caretakers()
         caretakers_data = [
             {
@@ -0,0 +1,108 @@
+"""
+Batch project provisioning serializers
+
+IDs are plain integers here; ProjectProvisionService checks that they
+exist with one query per model for the whole batch.
+"""
+
+from django.conf import settings
+from rest_framework import serializers
+
+from ..models import Project, ProjectMember, StudentProjectDetails
+
+
+class ProvisionMemberSerializer(serializers.Serializer):
+    """A team member of a provisioned project"""
+
+    user = serializers.IntegerField()
+    role = serializers.ChoiceField(choices=ProjectMember.RoleChoices.choices)
+    is_leader = serializers.BooleanField(default=False)
+    time_allocation = serializers.FloatField(
+        default=0, min_value=0, max_value=1, allow_null=True
+    )
+    position = serializers.IntegerField(default=100, allow_null=True)
+    short_code = serializers.CharField(
+        max_length=500, required=False, allow_blank=True, allow_null=True
+    )
+
+
+class ProvisionProjectSerializer(serializers.Serializer):
+    """A project with its team, areas and details"""
+
+    kind = serializers.ChoiceField(choices=Project.CategoryKindChoices.choices)
+    status = serializers.ChoiceField(
+        choices=Project.StatusChoices.choices, default=Project.StatusChoices.NEW
+    )
+    year = serializers.IntegerField(min_value=1000, max_value=9999)
+    title = serializers.CharField(max_length=500)
+    description = serializers.CharField(allow_blank=True, default="")
+    keywords = serializers.ListField(
+        child=serializers.CharField(allow_blank=False), default=list
+    )
+    start_date = serializers.DateField(required=False, allow_null=True)
+    end_date = serializers.DateField(required=False, allow_null=True)
+    business_area = serializers.IntegerField(required=False, allow_null=True)
+    areas = serializers.ListField(child=serializers.IntegerField(), default=list)
+    members = ProvisionMemberSerializer(many=True)
+
+    # Base details
+    service = serializers.IntegerField(required=False, allow_null=True)
+    data_custodian = serializers.IntegerField(required=False, allow_null=True)
+
+    # Student project details
+    level = serializers.ChoiceField(
+        choices=StudentProjectDetails.StudentLevelChoices.choices,
+        required=False,
+        allow_null=True,
+    )
+    organisation = serializers.CharField(
+        required=False, allow_blank=True, allow_null=True
+    )
+
+    # External project details
+    collaboration_with = serializers.CharField(
+        max_length=1500, required=False, allow_blank=True, allow_null=True
+    )
+    budget = serializers.CharField(
+        max_length=1000, required=False, allow_blank=True, allow_null=True
+    )
+    external_description = serializers.CharField(
+        max_length=10000, required=False, allow_blank=True, allow_null=True
+    )
+    aims = serializers.CharField(
+        max_length=5000, required=False, allow_blank=True, allow_null=True
+    )
+
+    def validate_areas(self, value):
+        if len(set(value)) != len(value):
+            raise serializers.ValidationError("Areas must not repeat.")
+        return value
+
+    def validate_members(self, value):
+        if sum(member["is_leader"] for member in value) != 1:
+            raise serializers.ValidationError("Exactly one member must be leader.")
+        if len({member["user"] for member in value}) != len(value):
+            raise serializers.ValidationError("Members must not repeat.")
+        return value
+
+    def validate(self, attrs):
+        start_date, end_date = attrs.get("start_date"), attrs.get("end_date")
+        if start_date and end_date and end_date < start_date:
+            raise serializers.ValidationError(
+                {"end_date": "End date must not be before the start date."}
+            )
+        return attrs
+
+
+class ProvisionProjectsSerializer(serializers.Serializer):
+    """A batch of projects to provision together"""
+
+    projects = ProvisionProjectSerializer(many=True, allow_empty=False)
+
+    def validate_projects(self, value):
+        if len(value) > settings.PROJECT_PROVISION_MAX_PROJECTS:
+            raise serializers.ValidationError(
+                f"At most {settings.PROJECT_PROVISION_MAX_PROJECTS} projects "
+                "can be provisioned at once."
+            )
+        return value
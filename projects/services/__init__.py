@@ -2,11 +2,14 @@
 Project services
 """
 
+from .analytics_service import ProjectAnalyticsService
 from .area_service import AreaService
 from .details_service import DetailsService
 from .export_service import ExportService
 from .member_service import MemberService
+from .page_service import ProjectPageService
 from .project_service import ProjectService
+from .provision_service import ProjectProvisionService
 
 __all__ = [
     "ProjectService",
@@ -14,4 +17,7 @@ __all__ = [
     "DetailsService",
     "AreaService",
     "ExportService",
+    "ProjectAnalyticsService",
+    "ProjectPageService",
+    "ProjectProvisionService",
 ]
@@ -0,0 +1,184 @@
+"""
+Analytics service - Project health classification
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from ..models import Project, ProjectMember
+
+PROJECT_HEALTH_CACHE_KEY = "project_health_analysis"
+
+# Statuses the admin problematic projects view reports on
+OPEN_STATUSES = (Project.StatusChoices.ACTIVE, Project.StatusChoices.UPDATING)
+
+
+class ProjectAnalyticsService:
+    """Business logic for problematic project analysis"""
+
+    @staticmethod
+    def get_project_health():
+        """
+        Get member and leader counts for every project
+
+        Computed with a single grouped aggregate and kept in the shared
+        cache until a project membership or status changes (see
+        projects.signals). Queryset updates send no signals, so the result
+        is also only kept for PROJECT_HEALTH_CACHE_TIMEOUT.
+
+        Returns:
+            List of dicts with id, business_area, status, member_count,
+            leader_count, supervising_count and external_leader
+        """
+        health = cache.get(PROJECT_HEALTH_CACHE_KEY)
+        if health is not None:
+            return health
+
+        rows = (
+            Project.objects.order_by()
+            .values("id", "business_area_id", "status")
+            .annotate(
+                member_count=Count("members"),
+                leader_count=Count("members", filter=Q(members__is_leader=True)),
+                supervising_count=Count(
+                    "members",
+                    filter=Q(members__role=ProjectMember.RoleChoices.SUPERVISING),
+                ),
+                external_leader_count=Count(
+                    "members",
+                    filter=Q(members__is_leader=True, members__user__is_staff=False),
+                ),
+            )
+            .order_by("id")
+        )
+        health = [
+            {
+                "id": row["id"],
+                "business_area": row["business_area_id"],
+                "status": row["status"],
+                "member_count": row["member_count"],
+                "leader_count": row["leader_count"],
+                "supervising_count": row["supervising_count"],
+                "external_leader": row["external_leader_count"] > 0,
+            }
+            for row in rows
+        ]
+
+        cache.set(
+            PROJECT_HEALTH_CACHE_KEY,
+            health,
+            settings.PROJECT_HEALTH_CACHE_TIMEOUT,
+        )
+        return health
+
+    @staticmethod
+    def invalidate_project_health():
+        """Drop the cached project health analysis"""
+        cache.delete(PROJECT_HEALTH_CACHE_KEY)
+
+    @staticmethod
+    def get_business_area_problems(business_area_ids):
+        """
+        Classify problematic projects for each business area
+
+        Leadership is judged by the "supervising" role tag. Projects with
+        members are also reported when led by a non-staff user.
+
+        Args:
+            business_area_ids: Iterable of business area IDs
+
+        Returns:
+            Dict of business area ID to a dict of no_members, no_leader,
+            external_leader and multiple_leads Project lists
+        """
+        requested = {str(pk): pk for pk in business_area_ids}
+        problems = {
+            pk: {
+                "no_members": [],
+                "no_leader": [],
+                "external_leader": [],
+                "multiple_leads": [],
+            }
+            for pk in requested.values()
+        }
+
+        for row in ProjectAnalyticsService.get_project_health():
+            ba_pk = requested.get(str(row["business_area"]))
+            if ba_pk is None:
+                continue
+            groups = problems[ba_pk]
+
+            if row["member_count"] < 1:
+                groups["no_members"].append(row["id"])
+                continue
+            if row["external_leader"]:
+                groups["external_leader"].append(row["id"])
+            if row["supervising_count"] == 0:
+                groups["no_leader"].append(row["id"])
+            elif row["supervising_count"] > 1:
+                groups["multiple_leads"].append(row["id"])
+
+        return ProjectAnalyticsService._load_projects(problems)
+
+    @staticmethod
+    def get_open_project_problems():
+        """
+        Classify open (active or updating) projects across all business areas
+
+        Leadership is judged by the is_leader flag.
+
+        Returns:
+            Dict of memberless, leaderless, multiple_leaders and
+            external_leaders Project lists
+        """
+        groups = {
+            "memberless": [],
+            "leaderless": [],
+            "multiple_leaders": [],
+            "external_leaders": [],
+        }
+
+        for row in ProjectAnalyticsService.get_project_health():
+            if row["status"] not in OPEN_STATUSES:
+                continue
+            if row["member_count"] == 0:
+                groups["memberless"].append(row["id"])
+            if row["leader_count"] == 0:
+                groups["leaderless"].append(row["id"])
+            elif row["leader_count"] > 1:
+                groups["multiple_leaders"].append(row["id"])
+            if row["external_leader"]:
+                groups["external_leaders"].append(row["id"])
+
+        return ProjectAnalyticsService._load_projects({None: groups})[None]
+
+    @staticmethod
+    def _load_projects(problems):
+        """
+        Replace the project IDs in classified groups with Project instances
+
+        Loads every referenced project with one query.
+
+        Args:
+            problems: Dict of key to dict of group name to project ID lists
+
+        Returns:
+            The same structure holding Project instances
+        """
+        project_ids = {
+            pk for groups in problems.values() for ids in groups.values() for pk in ids
+        }
+        projects = {}
+        if project_ids:
+            projects = Project.objects.select_related("business_area", "image").in_bulk(
+                project_ids
+            )
+
+        return {
+            key: {
+                name: [projects[pk] for pk in ids if pk in projects]
+                for name, ids in groups.items()
+            }
+            for key, groups in problems.items()
+        }
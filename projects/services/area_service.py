@@ -6,7 +6,7 @@ from django.conf import settings
 from django.db import transaction
 from rest_framework.exceptions import NotFound
 
-from ..models import ProjectArea
+from ..models import Project, ProjectArea
 
 
 class AreaService:
@@ -137,3 +137,22 @@ class AreaService:
     def list_all_areas():
         """List all project areas"""
         return ProjectArea.objects.all()
+
+    @staticmethod
+    def get_projects_by_area(area_ids, match_all=False):
+        """
+        Get projects located in any (or all) of the given areas
+
+        Served by the GIN index on ProjectArea.areas.
+
+        Args:
+            area_ids: List of area IDs
+            match_all: Only projects in every given area
+
+        Returns:
+            QuerySet of Project objects, newest first
+        """
+        lookup = "area__areas__contains" if match_all else "area__areas__overlap"
+        return Project.objects.filter(**{lookup: list(area_ids)}).order_by(
+            "-year", "-number"
+        )
@@ -339,14 +339,22 @@ class DetailsService:
     @staticmethod
     def list_all_project_details():
         """List all project details"""
-        return ProjectDetail.objects.all()
+        return ProjectDetail.objects.select_related(
+            "project",
+            "service",
+            "creator",
+            "modifier",
+            "owner",
+            "data_custodian",
+            "site_custodian",
+        )
 
     @staticmethod
     def list_all_student_details():
         """List all student project details"""
-        return StudentProjectDetails.objects.all()
+        return StudentProjectDetails.objects.select_related("project")
 
     @staticmethod
     def list_all_external_details():
         """List all external project details"""
-        return ExternalProjectDetails.objects.all()
+        return ExternalProjectDetails.objects.select_related("project")
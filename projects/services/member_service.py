@@ -6,6 +6,9 @@ from django.conf import settings
 from django.db import IntegrityError, transaction
 from rest_framework.exceptions import NotFound, ValidationError
 
+from common.events import publish
+
+from ..events import MemberAdded
 from ..models import Project, ProjectMember
 
 
@@ -150,10 +153,12 @@ class MemberService:
                 short_code=data.get("short_code"),
                 comments=data.get("comments"),
             )
-            return member
         except IntegrityError:
             raise ValidationError("This user is already a member of this project")
 
+        publish(MemberAdded(member, requesting_user))
+        return member
+
     @staticmethod
     @transaction.atomic
     def update_member(project_id, user_id, data, requesting_user):
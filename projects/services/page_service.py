@@ -0,0 +1,296 @@
+"""
+Page service - Project page read model
+"""
+
+import threading
+from contextlib import contextmanager
+from uuid import uuid4
+
+from django.conf import settings
+from django.contrib.postgres.expressions import ArraySubquery
+from django.core.cache import cache
+from django.db.models import (
+    BooleanField,
+    F,
+    FilteredRelation,
+    Func,
+    JSONField,
+    OuterRef,
+    Q,
+    Subquery,
+)
+from django.db.models.functions import JSONObject
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
+
+from ..models import Project, ProjectMember
+
+# Project IDs collected by ProjectPageService.deferred_bumps, per thread
+_deferred = threading.local()
+
+
+class _EqualsAny(Func):
+    """``value = ANY(array)``, e.g. to match rows against an outer array column"""
+
+    output_field = BooleanField()
+
+    def as_sql(self, compiler, connection):
+        value, value_params = compiler.compile(self.source_expressions[0])
+        array, array_params = compiler.compile(self.source_expressions[1])
+        return f"{value} = ANY({array})", (*value_params, *array_params)
+
+
+class ProjectPageService:
+    """Business logic for assembling the project page"""
+
+    @staticmethod
+    def get_project_page(pk):
+        """
+        Get the project page data, cached per project version
+
+        The version changes whenever the project or anything shown on it
+        changes, including its business area and its members' names (see
+        projects.signals), so a cached page is only reused while it is
+        current. Versions are kept in the shared cache, so a bump made by one
+        worker or housekeeping job applies to every worker.
+
+        Args:
+            pk: Project primary key
+
+        Returns:
+            Dict with project, details, documents and members
+
+        Raises:
+            NotFound: If project doesn't exist
+        """
+        key = f"project_page_{pk}_{ProjectPageService.get_version(pk)}"
+        page = cache.get(key)
+        if page is None:
+            page = ProjectPageService.build_project_page(pk)
+            cache.set(key, page, settings.PROJECT_PAGE_CACHE_TIMEOUT)
+        return page
+
+    @staticmethod
+    def get_version(pk):
+        """
+        Get the current cache version of a project page
+
+        Args:
+            pk: Project primary key
+
+        Returns:
+            Version string
+        """
+        key = f"project_page_version_{pk}"
+        version = cache.get(key)
+        if version is None:
+            version = uuid4().hex
+            if not cache.add(key, version, None):
+                version = cache.get(key, version)
+        return version
+
+    @staticmethod
+    def bump_versions(project_ids):
+        """
+        Invalidate cached pages by moving projects to a new version
+
+        Args:
+            project_ids: Iterable of project primary keys
+        """
+        deferred = getattr(_deferred, "project_ids", None)
+        if deferred is not None:
+            deferred.update(project_ids)
+            return
+        cache.set_many(
+            {f"project_page_version_{pk}": uuid4().hex for pk in project_ids if pk},
+            None,
+        )
+
+    @staticmethod
+    @contextmanager
+    def deferred_bumps():
+        """
+        Collect the version bumps made in the block and apply them at the end
+
+        For bulk writes, whose signals would otherwise bump versions one row
+        at a time. Nested blocks are merged into the outermost.
+        """
+        if getattr(_deferred, "project_ids", None) is not None:
+            yield
+            return
+        _deferred.project_ids = set()
+        try:
+            yield
+        finally:
+            project_ids, _deferred.project_ids = _deferred.project_ids, None
+            ProjectPageService.bump_versions(project_ids)
+
+    @staticmethod
+    def build_project_page(pk):
+        """
+        Assemble the project page with three queries
+
+        The project, its base/student/external details, document summaries,
+        areas and pending deletion request come back in one row; members
+        with their active caretakers in a second query; the division's
+        directorate email list in a third.
+
+        Args:
+            pk: Project primary key
+
+        Returns:
+            Dict with project, details, documents and members
+
+        Raises:
+            NotFound: If project doesn't exist
+        """
+        from ..serializers import (
+            MiniProjectMemberSerializer,
+            ProjectDetailViewSerializer,
+            ProjectSerializer,
+            TinyExternalProjectDetailSerializer,
+            TinyStudentProjectDetailSerializer,
+        )
+
+        try:
+            project = ProjectPageService._project_queryset().get(pk=pk)
+        except Project.DoesNotExist:
+            raise NotFound(f"Project {pk} not found")
+
+        base_detail = getattr(project, "base_detail", None)
+        student_detail = getattr(project, "student_project_info", None)
+        external_detail = getattr(project, "external_project_info", None)
+
+        members = list(ProjectPageService._member_queryset(project))
+        for member in members:
+            member.project = project
+            member.user.active_caretakers = member.active_caretakers
+
+        return {
+            "project": ProjectSerializer(project).data,
+            "details": {
+                "base": (
+                    ProjectDetailViewSerializer(base_detail).data
+                    if base_detail
+                    else None
+                ),
+                "external": (
+                    TinyExternalProjectDetailSerializer(external_detail).data
+                    if external_detail
+                    else []
+                ),
+                "student": (
+                    TinyStudentProjectDetailSerializer(student_detail).data
+                    if student_detail
+                    else []
+                ),
+            },
+            "documents": {
+                "concept_plan": project.concept_plan_summary,
+                "project_plan": project.project_plan_summary,
+                "progress_reports": project.progress_report_summaries,
+                "student_reports": project.student_report_summaries,
+                "project_closure": project.project_closure_summary,
+            },
+            "members": (
+                MiniProjectMemberSerializer(members, many=True).data
+                if members
+                else None
+            ),
+        }
+
+    @staticmethod
+    def _project_queryset():
+        from adminoptions.models import AdminTask
+        from documents.models import (
+            ConceptPlan,
+            ProgressReport,
+            ProjectClosure,
+            ProjectPlan,
+            StudentReport,
+        )
+        from locations.models import Area
+
+        def summary(model):
+            return model.objects.filter(project=OuterRef("pk")).values(
+                summary=JSONObject(id="id", status="document__status")
+            )
+
+        return (
+            Project.objects.annotate(base_detail=FilteredRelation("details"))
+            .select_related(
+                "business_area",
+                "business_area__division",
+                "business_area__image",
+                "image",
+                "image__uploader",
+                "area",
+                "student_project_info",
+                "external_project_info",
+                "base_detail",
+                "base_detail__creator",
+                "base_detail__modifier",
+                "base_detail__owner",
+                "base_detail__data_custodian",
+                "base_detail__site_custodian",
+                "base_detail__service",
+            )
+            .prefetch_related("business_area__division__directorate_email_list")
+            .annotate(
+                pending_deletion_task_id=Subquery(
+                    AdminTask.objects.filter(
+                        action=AdminTask.ActionTypes.DELETEPROJECT,
+                        project=OuterRef("pk"),
+                        status=AdminTask.TaskStatus.PENDING,
+                    ).values("id")[:1]
+                ),
+                area_list=ArraySubquery(
+                    Area.objects.filter(_EqualsAny(F("id"), OuterRef("area__areas")))
+                    .order_by("id")
+                    .values(
+                        json=JSONObject(id="id", name="name", area_type="area_type")
+                    )
+                ),
+                concept_plan_summary=Subquery(
+                    summary(ConceptPlan)[:1], output_field=JSONField()
+                ),
+                project_plan_summary=Subquery(
+                    summary(ProjectPlan)[:1], output_field=JSONField()
+                ),
+                project_closure_summary=Subquery(
+                    summary(ProjectClosure)[:1], output_field=JSONField()
+                ),
+                progress_report_summaries=ArraySubquery(
+                    summary(ProgressReport).order_by("-year", "-id")
+                ),
+                student_report_summaries=ArraySubquery(
+                    summary(StudentReport).order_by("-id")
+                ),
+            )
+        )
+
+    @staticmethod
+    def _member_queryset(project):
+        from caretakers.models import Caretaker
+
+        active_caretakers = (
+            Caretaker.objects.filter(user=OuterRef("user"))
+            .filter(Q(end_date__isnull=True) | Q(end_date__gt=timezone.now()))
+            .order_by("id")
+            .values(
+                json=JSONObject(
+                    id="caretaker_id",
+                    display_first_name="caretaker__display_first_name",
+                    display_last_name="caretaker__display_last_name",
+                    email="caretaker__email",
+                )
+            )
+        )
+        return (
+            ProjectMember.objects.filter(project=project)
+            .select_related(
+                "user", "user__profile", "user__work", "user__work__affiliation"
+            )
+            .annotate(active_caretakers=ArraySubquery(active_caretakers))
+            .order_by("position")
+        )
@@ -2,16 +2,17 @@
 Project service - Core project operations
 """
 
-import os
+import re
 
 from django.conf import settings
-from django.core.files.base import ContentFile
-from django.core.files.storage import default_storage
+from django.contrib.postgres.search import SearchQuery, SearchVector
 from django.db import transaction
 from django.db.models import Case, CharField, IntegerField, Q, Value, When
 from django.db.models.functions import Cast
 from rest_framework.exceptions import NotFound
 
+from medias.services.content_store_service import ContentStoreService
+
 from ..models import Project
 
 
@@ -238,6 +239,154 @@ class ProjectService:
 
         return projects
 
+    @staticmethod
+    def search_projects_typeahead(filters, limit=20):
+        """
+        Lightweight project search for autocomplete inputs
+
+        Matches word prefixes in the title, tagline, keywords and description
+        through the project text index, or project tag prefixes (e.g.
+        "CF-2022-1") through the tag index, and loads only what
+        TinyProjectSerializer renders.
+
+        Args:
+            filters: Dict of filter parameters (same keys as list_projects)
+            limit: Maximum number of results
+
+        Returns:
+            List of Project objects
+        """
+        projects = Project.objects.all()
+
+        search_term = (filters.get("searchTerm") or "").strip()
+        other_filters = {
+            key: value for key, value in filters.items() if key != "searchTerm"
+        }
+        projects = ProjectService._apply_filters(projects, other_filters)
+
+        if search_term:
+            if ProjectService._is_project_tag_search(search_term):
+                projects = ProjectService._filter_tag_prefix(projects, search_term)
+            else:
+                projects = ProjectService._filter_word_prefix(projects, search_term)
+
+        if other_filters.get("selected_user"):
+            # Member join can return the same project more than once
+            projects = projects.distinct()
+
+        projects = (
+            projects.select_related(
+                "business_area",
+                "business_area__division",
+                "business_area__image",
+                "image",
+                "image__uploader",
+            )
+            .prefetch_related("business_area__division__directorate_email_list")
+            .only(
+                "id",
+                "title",
+                "status",
+                "kind",
+                "year",
+                "number",
+                "business_area",
+                "business_area__name",
+                "business_area__slug",
+                "business_area__focus",
+                "business_area__introduction",
+                "business_area__leader",
+                "business_area__caretaker",
+                "business_area__finance_admin",
+                "business_area__data_custodian",
+                "business_area__is_active",
+                "business_area__division__name",
+                "business_area__division__slug",
+                "business_area__division__director",
+                "business_area__division__approver",
+                "business_area__image__file",
+                "image__file",
+                "image__uploader__username",
+            )
+            .annotate(
+                custom_ordering=Case(
+                    When(
+                        status__in=["suspended", "completed", "terminated"],
+                        then=Value(1),
+                    ),
+                    default=Value(0),
+                    output_field=IntegerField(),
+                )
+            )
+            .order_by("custom_ordering", "-year", "id")
+        )
+
+        return list(projects[:limit])
+
+    @staticmethod
+    def _filter_word_prefix(queryset, search_term):
+        """
+        Filter by word prefixes in the project text (uses project_text_search_idx)
+
+        The vector must match the index expression exactly.
+        """
+        words = re.findall(r"\w+", search_term)
+        if not words:
+            return queryset.none()
+
+        query = SearchQuery(
+            " & ".join(f"{word}:*" for word in words),
+            search_type="raw",
+            config="simple",
+        )
+        condition = Q(text_search=query)
+        if search_term.isdigit():
+            queryset = queryset.annotate(
+                number_as_text=Cast("number", output_field=CharField())
+            )
+            condition |= Q(number_as_text__startswith=search_term)
+
+        return queryset.annotate(
+            text_search=SearchVector(
+                "title", "tagline", "keywords", "description", config="simple"
+            )
+        ).filter(condition)
+
+    @staticmethod
+    def _filter_tag_prefix(queryset, search_term):
+        """
+        Filter by project tag prefix (e.g. "SP-2023-1" matches SP-2023-12)
+
+        Uses project_tag_idx for the kind and full year parts.
+        """
+        parts = search_term.split("-")
+        db_kind = ProjectService._determine_db_kind(parts[0].upper())
+        if not db_kind:
+            return queryset.none()
+
+        queryset = queryset.filter(kind=db_kind)
+
+        year_part = parts[1].strip() if len(parts) > 1 else ""
+        if year_part:
+            if not year_part.isdigit():
+                return queryset.none()
+            if len(year_part) == 4:
+                queryset = queryset.filter(year=int(year_part))
+            else:
+                queryset = queryset.annotate(
+                    year_as_text=Cast("year", output_field=CharField())
+                ).filter(year_as_text__startswith=year_part)
+
+        number_part = parts[2].strip() if len(parts) > 2 else ""
+        if number_part:
+            if not number_part.isdigit():
+                return queryset.none()
+            queryset = queryset.annotate(
+                number_as_text=Cast("number", output_field=CharField())
+            ).filter(number_as_text__startswith=number_part)
+
+        return queryset
+
     @staticmethod
     def get_project(pk):
         """
@@ -351,6 +500,9 @@ class ProjectService:
         """
         Handle project image upload
 
+        Identical uploads share one content addressed file (see
+        ContentStoreService.store).
+
         Args:
             image: Uploaded image file
 
@@ -363,23 +515,24 @@ class ProjectService:
         if image is None:
             return None
 
-        original_filename = image.name
-        subfolder = "projects"
-        file_path = f"{subfolder}/{original_filename}"
-
-        # Check if file already exists with same size
-        if default_storage.exists(file_path):
-            full_file_path = default_storage.path(file_path)
-            if os.path.exists(full_file_path):
-                existing_file_size = os.path.getsize(full_file_path)
-                new_file_size = image.size
-                if existing_file_size == new_file_size:
-                    return file_path
-
-        # Save new file
-        content = ContentFile(image.read())
-        file_path = default_storage.save(file_path, content)
-        return file_path
+        return ContentStoreService.store(image, "projects")
+
+    @staticmethod
+    def list_projects_of_kind(kind):
+        """
+        List projects of one kind with what TinyProjectSerializer reads
+
+        Args:
+            kind: Project kind, e.g. "science"
+
+        Returns:
+            QuerySet of projects
+        """
+        return Project.objects.filter(kind=kind).select_related(
+            "business_area__image",
+            "business_area__division",
+            "image__uploader",
+        )
 
     @staticmethod
     def get_project_years():
@@ -0,0 +1,239 @@
+"""
+Provision service - Batch project creation for imports
+"""
+
+import zlib
+from itertools import count
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Max
+from rest_framework.exceptions import ValidationError
+
+from agencies.models import BusinessArea, DepartmentalService
+from agencies.services import AgencyService
+from locations.models import Area
+from users.models import User
+
+from ..models import (
+    ExternalProjectDetails,
+    Project,
+    ProjectArea,
+    ProjectDetail,
+    ProjectMember,
+    StudentProjectDetails,
+)
+from .analytics_service import ProjectAnalyticsService
+
+
+class ProjectProvisionService:
+    """Business logic for creating many projects at once"""
+
+    @staticmethod
+    def provision_projects(projects, user, batch_size=None):
+        """
+        Create projects with their members, areas and details
+
+        Every row is written with bulk_create in one transaction, so the
+        query count depends on the number of tables, not projects. Save
+        signals don't run; the project health cache is invalidated and
+        affiliation links are created here instead.
+
+        Args:
+            projects: List of validated ProvisionProjectSerializer data
+            user: User creating the projects, recorded as their creator
+            batch_size: Rows per INSERT (default: PROJECT_PROVISION_BATCH_SIZE)
+
+        Returns:
+            List of created Project objects, in input order
+
+        Raises:
+            ValidationError: If a project refers to a missing user, business
+                area, service or area
+        """
+        batch_size = batch_size or settings.PROJECT_PROVISION_BATCH_SIZE
+        ProjectProvisionService.check_references(projects)
+        settings.LOGGER.info(f"{user} is provisioning {len(projects)} projects")
+
+        with transaction.atomic():
+            numbers = ProjectProvisionService._reserve_numbers(projects)
+            created = Project.objects.bulk_create(
+                [
+                    Project(
+                        kind=data["kind"],
+                        status=data["status"],
+                        year=data["year"],
+                        number=next(numbers[data["year"]]),
+                        title=data["title"],
+                        description=data["description"],
+                        tagline="",
+                        keywords=",".join(data["keywords"]),
+                        start_date=data.get("start_date"),
+                        end_date=data.get("end_date"),
+                        business_area_id=data.get("business_area"),
+                    )
+                    for data in projects
+                ],
+                batch_size=batch_size,
+            )
+            pairs = list(zip(created, projects))
+
+            ProjectDetail.objects.bulk_create(
+                [
+                    ProjectDetail(
+                        project=project,
+                        creator=user,
+                        modifier=user,
+                        owner=user,
+                        service_id=data.get("service"),
+                        data_custodian_id=data.get("data_custodian"),
+                    )
+                    for project, data in pairs
+                ],
+                batch_size=batch_size,
+            )
+            ProjectArea.objects.bulk_create(
+                [
+                    ProjectArea(project=project, areas=data["areas"])
+                    for project, data in pairs
+                ],
+                batch_size=batch_size,
+            )
+            ProjectMember.objects.bulk_create(
+                [
+                    ProjectMember(
+                        project=project,
+                        user_id=member["user"],
+                        role=member["role"],
+                        is_leader=member["is_leader"],
+                        time_allocation=member["time_allocation"],
+                        position=member["position"],
+                        short_code=member.get("short_code"),
+                    )
+                    for project, data in pairs
+                    for member in data["members"]
+                ],
+                batch_size=batch_size,
+            )
+
+            students = StudentProjectDetails.objects.bulk_create(
+                [
+                    StudentProjectDetails(
+                        project=project,
+                        **ProjectProvisionService._present(
+                            data, level="level", organisation="organisation"
+                        ),
+                    )
+                    for project, data in pairs
+                    if data["kind"] == Project.CategoryKindChoices.STUDENT
+                ],
+                batch_size=batch_size,
+            )
+            externals = ExternalProjectDetails.objects.bulk_create(
+                [
+                    ExternalProjectDetails(
+                        project=project,
+                        **ProjectProvisionService._present(
+                            data,
+                            collaboration_with="collaboration_with",
+                            budget="budget",
+                            aims="aims",
+                            description="external_description",
+                        ),
+                    )
+                    for project, data in pairs
+                    if data["kind"] == Project.CategoryKindChoices.EXTERNAL
+                ],
+                batch_size=batch_size,
+            )
+            AgencyService.link_affiliations("student", students, batch_size)
+            AgencyService.link_affiliations("external", externals, batch_size)
+
+        ProjectAnalyticsService.invalidate_project_health()
+        return created
+
+    @staticmethod
+    def check_references(projects):
+        """
+        Check the IDs a batch of projects refers to exist
+
+        One query per referenced model, whatever the batch size.
+
+        Args:
+            projects: List of validated ProvisionProjectSerializer data
+
+        Raises:
+            ValidationError: With the errors of each project, in input order
+        """
+        references = {
+            "business_area": (BusinessArea, lambda data: [data.get("business_area")]),
+            "service": (DepartmentalService, lambda data: [data.get("service")]),
+            "data_custodian": (User, lambda data: [data.get("data_custodian")]),
+            "members": (User, lambda data: [m["user"] for m in data["members"]]),
+            "areas": (Area, lambda data: data["areas"]),
+        }
+
+        wanted = {}
+        for model, ids_of in references.values():
+            wanted.setdefault(model, set()).update(
+                pk for data in projects for pk in ids_of(data) if pk is not None
+            )
+        existing = {
+            model: set(model.objects.filter(pk__in=ids).values_list("pk", flat=True))
+            for model, ids in wanted.items()
+            if ids
+        }
+
+        errors = []
+        for data in projects:
+            project_errors = {}
+            for field, (model, ids_of) in references.items():
+                missing = sorted(
+                    pk
+                    for pk in ids_of(data)
+                    if pk is not None and pk not in existing.get(model, ())
+                )
+                if missing:
+                    project_errors[field] = [
+                        f"{model._meta.verbose_name} {pk} not found" for pk in missing
+                    ]
+            errors.append(project_errors)
+
+        if any(errors):
+            raise ValidationError({"projects": errors})
+
+    @staticmethod
+    def _reserve_numbers(projects):
+        """
+        Get the next free project numbers of each year in the batch
+
+        Must be called in a transaction. Holds a lock per year until it
+        ends, so concurrent provisioning can't hand out the same numbers.
+
+        Returns:
+            Dict of year to an iterator of numbers
+        """
+        years = sorted({data["year"] for data in projects})
+        with connection.cursor() as cursor:
+            for year in years:
+                cursor.execute(
+                    "SELECT pg_advisory_xact_lock(%s)",
+                    [zlib.crc32(f"project_number:{year}".encode())],
+                )
+
+        highest = dict(
+            Project.objects.filter(year__in=years)
+            .values("year")
+            .annotate(highest=Max("number"))
+            .values_list("year", "highest")
+        )
+        return {year: count(highest.get(year, 0) + 1) for year in years}
+
+    @staticmethod
+    def _present(data, **fields):
+        """Model field values for the data keys that were sent and are not None"""
+        return {
+            field: data[key]
+            for field, key in fields.items()
+            if data.get(key) is not None
+        }
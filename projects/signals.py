@@ -0,0 +1,124 @@
+"""
+Django signals for the projects app.
+
+Keeps the cached project health analysis used by the problematic project
+views in step with project membership and status changes, and moves cached
+project pages to a new version when anything shown on them changes.
+"""
+
+from django.conf import settings
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .models import Project, ProjectDetail, ProjectMember
+from .services.analytics_service import ProjectAnalyticsService
+from .services.page_service import ProjectPageService
+
+# Models shown on the project page, each with a project foreign key
+PROJECT_PAGE_MODELS = [
+    "projects.Project",
+    "projects.ProjectDetail",
+    "projects.StudentProjectDetails",
+    "projects.ExternalProjectDetails",
+    "projects.ProjectArea",
+    "projects.ProjectMember",
+    "medias.ProjectPhoto",
+    "documents.ProjectDocument",
+    "documents.ConceptPlan",
+    "documents.ProjectPlan",
+    "documents.ProgressReport",
+    "documents.StudentReport",
+    "documents.ProjectClosure",
+    "adminoptions.AdminTask",
+]
+
+# User fields shown on the project page, for members and base detail users
+PROJECT_PAGE_USER_FIELDS = {
+    "username",
+    "email",
+    "first_name",
+    "last_name",
+    "display_first_name",
+    "display_last_name",
+    "is_active",
+    "is_staff",
+    "is_superuser",
+}
+
+
+@receiver(post_save, sender=ProjectMember)
+@receiver(post_delete, sender=ProjectMember)
+def invalidate_project_health_on_membership_change(sender, instance, **kwargs):
+    """Membership changes alter member, leader and external leader counts"""
+    ProjectAnalyticsService.invalidate_project_health()
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def invalidate_project_health_on_project_save(sender, instance, **kwargs):
+    """Status and business area changes move projects between groups"""
+    ProjectAnalyticsService.invalidate_project_health()
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def invalidate_project_health_on_staff_change(sender, instance, **kwargs):
+    """A user's staff flag decides whether they count as an external leader"""
+    update_fields = kwargs.get("update_fields")
+    if update_fields and "is_staff" not in update_fields:
+        return
+    ProjectAnalyticsService.invalidate_project_health()
+
+
+def invalidate_project_page(sender, instance, **kwargs):
+    """Changes to a project or anything on its page start a new page version"""
+    project_id = instance.pk if sender is Project else instance.project_id
+    ProjectPageService.bump_versions([project_id])
+
+
+for model in PROJECT_PAGE_MODELS:
+    post_save.connect(invalidate_project_page, sender=model)
+    post_delete.connect(invalidate_project_page, sender=model)
+
+
+@receiver(post_save, sender="caretakers.Caretaker")
+@receiver(post_delete, sender="caretakers.Caretaker")
+def invalidate_project_page_on_caretaker_change(sender, instance, **kwargs):
+    """Members are shown with their active caretakers"""
+    ProjectPageService.bump_versions(
+        ProjectMember.objects.filter(user_id=instance.user_id).values_list(
+            "project_id", flat=True
+        )
+    )
+
+
+@receiver(post_save, sender="agencies.BusinessArea")
+@receiver(pre_delete, sender="agencies.BusinessArea")
+def invalidate_project_page_on_business_area_change(sender, instance, **kwargs):
+    """Projects are shown with their business area's name, image and division"""
+    ProjectPageService.bump_versions(
+        Project.objects.filter(business_area=instance).values_list("pk", flat=True)
+    )
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def invalidate_project_page_on_user_change(sender, instance, created, **kwargs):
+    """Members and base detail users are shown with their names"""
+    update_fields = kwargs.get("update_fields")
+    if created or kwargs.get("raw"):
+        return
+    if update_fields and not PROJECT_PAGE_USER_FIELDS.intersection(update_fields):
+        return
+    project_ids = set(
+        ProjectMember.objects.filter(user=instance).values_list("project_id", flat=True)
+    )
+    project_ids.update(
+        ProjectDetail.objects.filter(
+            Q(creator=instance)
+            | Q(modifier=instance)
+            | Q(owner=instance)
+            | Q(data_custodian=instance)
+            | Q(site_custodian=instance)
+        ).values_list("project_id", flat=True)
+    )
+    ProjectPageService.bump_versions(project_ids)
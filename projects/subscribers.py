@@ -0,0 +1,20 @@
+"""
+Event subscribers for the projects app.
+
+The membership signals invalidate inside the writing transaction, so a
+read in between can cache the old membership again. Once the change is
+committed the caches are invalidated once more (see common.events).
+"""
+
+from common.events import subscribe
+
+from .events import MemberAdded
+from .services.analytics_service import ProjectAnalyticsService
+from .services.page_service import ProjectPageService
+
+
+@subscribe(MemberAdded, batch=True)
+def refresh_membership_caches(events):
+    """Drop project health and move the members' project pages to a new version"""
+    ProjectAnalyticsService.invalidate_project_health()
+    ProjectPageService.bump_versions({event.member.project_id for event in events})
@@ -278,6 +278,19 @@ class TestProjectArea:
 
         assert "Duplicate primary keys found in areas" in str(exc_info.value)
 
+    def test_areas_lookup_uses_gin_index(self, db):
+        """Test area membership queries can use the GIN index"""
+        # Arrange
+        from django.db import connection
+
+        # Act
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        plan = ProjectArea.objects.filter(areas__overlap=[1, 2]).explain()
+
+        # Assert
+        assert "projectarea_areas_gin" in plan
+
     def test_save_succeeds_with_unique_areas(self, db):
         """Test save succeeds when all area IDs are unique"""
         # Arrange
@@ -6,14 +6,22 @@ from unittest.mock import patch
 
 import pytest
 from django.contrib.auth import get_user_model
-from rest_framework.exceptions import NotFound
+from django.core.cache import cache
+from rest_framework.exceptions import NotFound, ValidationError
 
 from projects.models import Project, ProjectArea, ProjectMember
+from projects.serializers import ProvisionProjectsSerializer
+from projects.services.analytics_service import (
+    PROJECT_HEALTH_CACHE_KEY,
+    ProjectAnalyticsService,
+)
 from projects.services.area_service import AreaService
 from projects.services.details_service import DetailsService
 from projects.services.export_service import ExportService
 from projects.services.member_service import MemberService
+from projects.services.page_service import ProjectPageService
 from projects.services.project_service import ProjectService
+from projects.services.provision_service import ProjectProvisionService
 
 User = get_user_model()
 
@@ -306,6 +314,26 @@ class TestMemberService:
         assert member.role == "supervising"
         assert member.is_leader is False
 
+    def test_add_member_refreshes_caches_after_commit(
+        self, project, user, superuser, django_capture_on_commit_callbacks, db
+    ):
+        """Test project health and page version move on once the member commits"""
+        # Arrange
+        data = {"role": "research"}
+        with django_capture_on_commit_callbacks() as callbacks:
+            MemberService.add_member(project.pk, user.pk, data, superuser)
+        # A read between the save and the commit re-caches old counts
+        cache.set(PROJECT_HEALTH_CACHE_KEY, [])
+        version = ProjectPageService.get_version(project.pk)
+
+        # Act
+        for callback in callbacks:
+            callback()
+
+        # Assert
+        assert cache.get(PROJECT_HEALTH_CACHE_KEY) is None
+        assert ProjectPageService.get_version(project.pk) != version
+
     def test_add_member_with_all_fields(self, project, user, superuser, db):
         """Test adding member with all optional fields"""
         # Arrange
@@ -1239,44 +1267,21 @@ class TestProjectServiceAdditional:
         # Assert
         assert result is None
 
-    @patch("projects.services.project_service.default_storage")
-    def test_handle_project_image_existing_file(self, mock_storage, db):
-        """Test handling project image when file already exists with same size"""
-        # Arrange
-        from django.core.files.uploadedfile import SimpleUploadedFile
-
-        image = SimpleUploadedFile(
-            "test.jpg", b"file_content", content_type="image/jpeg"
-        )
-
-        mock_storage.exists.return_value = True
-        mock_storage.path.return_value = "/path/to/test.jpg"
-
-        with patch("os.path.exists", return_value=True):
-            with patch("os.path.getsize", return_value=len(b"file_content")):
-                # Act
-                result = ProjectService.handle_project_image(image)
-
-                # Assert
-                assert result == "projects/test.jpg"
-
-    @patch("projects.services.project_service.default_storage")
-    def test_handle_project_image_new_file(self, mock_storage, db):
+    def test_handle_project_image_new_file(self, settings, tmp_path, db):
         """Test handling new project image upload"""
         # Arrange
         from django.core.files.uploadedfile import SimpleUploadedFile
 
+        settings.MEDIA_ROOT = str(tmp_path)
         image = SimpleUploadedFile("new.jpg", b"new_content", content_type="image/jpeg")
 
-        mock_storage.exists.return_value = False
-        mock_storage.save.return_value = "projects/new.jpg"
-
         # Act
         result = ProjectService.handle_project_image(image)
 
         # Assert
-        assert result == "projects/new.jpg"
-        mock_storage.save.assert_called_once()
+        assert result.startswith("projects/")
+        assert result.endswith(".jpg")
+        assert (tmp_path / result).read_bytes() == b"new_content"
 
 
 # Additional tests for DetailsService to reach 100% coverage
@@ -1433,3 +1438,232 @@ class TestDetailsServiceAdditional:
         assert details.creator == user
         assert details.modifier == user
         assert details.owner == user
+
+
+class TestProjectAnalyticsService:
+    """Tests for ProjectAnalyticsService"""
+
+    @pytest.fixture(autouse=True)
+    def clear_project_health(self):
+        ProjectAnalyticsService.invalidate_project_health()
+        yield
+        ProjectAnalyticsService.invalidate_project_health()
+
+    def test_get_business_area_problems(
+        self, business_area, project_factory, user_factory, db
+    ):
+        """Test classifying projects by membership and leader tags"""
+        # Arrange
+        staff = user_factory(is_staff=True)
+        external = user_factory(is_staff=False)
+        healthy = project_factory(business_area=business_area, members=[])
+        healthy.members.create(user=staff, is_leader=True, role="supervising")
+        memberless = project_factory(business_area=business_area, members=[])
+        externally_led = project_factory(business_area=business_area, members=[])
+        externally_led.members.create(user=external, is_leader=True, role="supervising")
+        multiple = project_factory(business_area=business_area, members=[])
+        multiple.members.create(user=staff, is_leader=True, role="supervising")
+        multiple.members.create(user=external, role="supervising")
+        untagged = project_factory(business_area=business_area, members=[])
+        untagged.members.create(user=staff, is_leader=True, role="research")
+
+        # Act
+        problems = ProjectAnalyticsService.get_business_area_problems(
+            [business_area.pk]
+        )
+
+        # Assert
+        groups = problems[business_area.pk]
+        assert groups["no_members"] == [memberless]
+        assert groups["external_leader"] == [externally_led]
+        assert groups["multiple_leads"] == [multiple]
+        assert groups["no_leader"] == [untagged]
+        assert all(healthy not in projects for projects in groups.values())
+
+    def test_get_open_project_problems(self, business_area, project_factory, db):
+        """Test only active and updating projects are reported"""
+        # Arrange
+        active = project_factory(
+            business_area=business_area, status="active", members=[]
+        )
+        project_factory(business_area=business_area, status="new", members=[])
+
+        # Act
+        problems = ProjectAnalyticsService.get_open_project_problems()
+
+        # Assert
+        assert problems["memberless"] == [active]
+        assert problems["leaderless"] == [active]
+        assert problems["multiple_leaders"] == []
+        assert problems["external_leaders"] == []
+
+    def test_project_health_cached_until_membership_change(
+        self, project, user, django_assert_num_queries, db
+    ):
+        """Test the analysis is cached and invalidated by membership changes"""
+        # Arrange
+        health = ProjectAnalyticsService.get_project_health()
+        before = next(row for row in health if row["id"] == project.pk)
+
+        # Act
+        with django_assert_num_queries(0):
+            ProjectAnalyticsService.get_project_health()
+        ProjectMember.objects.create(project=project, user=user, role="research")
+        health = ProjectAnalyticsService.get_project_health()
+
+        # Assert
+        after = next(row for row in health if row["id"] == project.pk)
+        assert after["member_count"] == before["member_count"] + 1
+
+    def test_project_health_invalidated_by_status_change(self, project, db):
+        """Test saving a project invalidates the cached analysis"""
+        # Arrange
+        ProjectAnalyticsService.get_project_health()
+
+        # Act
+        project.status = Project.StatusChoices.ACTIVE
+        project.save()
+        health = ProjectAnalyticsService.get_project_health()
+
+        # Assert
+        row = next(row for row in health if row["id"] == project.pk)
+        assert row["status"] == Project.StatusChoices.ACTIVE
+
+
+class TestProjectProvisionService:
+    """Tests for batch project provisioning"""
+
+    @staticmethod
+    def validated(projects):
+        """Validate payloads as the provision view does"""
+        serializer = ProvisionProjectsSerializer(data={"projects": projects})
+        serializer.is_valid(raise_exception=True)
+        return serializer.validated_data["projects"]
+
+    @staticmethod
+    def payload(lead, **overrides):
+        return {
+            "kind": "science",
+            "year": 2031,
+            "title": "Imported project",
+            "members": [{"user": lead.pk, "role": "supervising", "is_leader": True}],
+            **overrides,
+        }
+
+    def test_provision_projects(self, user, project_lead, business_area, area, db):
+        """Test projects are created with their team, areas and details"""
+        # Arrange
+        from agencies.models import Affiliation
+        from common.tests.factories import ProjectFactory
+
+        ProjectFactory(year=2031, number=7)
+        affiliation = Affiliation.objects.create(name="Partner University")
+        projects = self.validated(
+            [
+                self.payload(
+                    project_lead,
+                    business_area=business_area.pk,
+                    areas=[area.pk],
+                    keywords=["fire", "fauna"],
+                    members=[
+                        {
+                            "user": project_lead.pk,
+                            "role": "supervising",
+                            "is_leader": True,
+                        },
+                        {"user": user.pk, "role": "research"},
+                    ],
+                ),
+                self.payload(
+                    project_lead,
+                    kind="student",
+                    level="phd",
+                    organisation=affiliation.name,
+                ),
+                self.payload(
+                    project_lead,
+                    kind="external",
+                    collaboration_with=f"{affiliation.name}; Other Org",
+                    aims="<p>Aims</p>",
+                ),
+            ]
+        )
+
+        # Act
+        created = ProjectProvisionService.provision_projects(projects, user)
+
+        # Assert
+        science, student, external = created
+        assert [project.number for project in created] == [8, 9, 10]
+        assert science.keywords == "fire,fauna"
+        assert science.business_area == business_area
+        assert science.area.areas == [area.pk]
+        assert science.details.get().creator == user
+        assert set(science.members.values_list("user", "is_leader")) == {
+            (project_lead.pk, True),
+            (user.pk, False),
+        }
+        assert student.student_project_info.level == "phd"
+        assert external.external_project_info.aims == "<p>Aims</p>"
+        assert set(affiliation.student_projects.all()) == {student.student_project_info}
+        assert set(affiliation.external_projects.all()) == {
+            external.external_project_info
+        }
+
+    def test_provision_query_count_independent_of_batch(self, project_lead, db):
+        """Test provisioning more projects doesn't take more queries"""
+        # Arrange
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        def provision(count):
+            projects = self.validated(
+                [
+                    self.payload(project_lead, kind=kind, organisation="Uni")
+                    for kind in ["science", "student", "external"] * count
+                ]
+            )
+            with CaptureQueriesContext(connection) as queries:
+                ProjectProvisionService.provision_projects(projects, project_lead)
+            return len(queries)
+
+        # Act
+        few = provision(1)
+        many = provision(20)
+
+        # Assert
+        assert many == few
+
+    def test_provision_missing_references(self, project_lead, db):
+        """Test unknown IDs are reported per project and nothing is created"""
+        # Arrange
+        projects = self.validated(
+            [
+                self.payload(project_lead),
+                self.payload(project_lead, business_area=999999, areas=[999998]),
+            ]
+        )
+
+        # Act & Assert
+        with pytest.raises(ValidationError) as error:
+            ProjectProvisionService.provision_projects(projects, project_lead)
+        assert error.value.detail["projects"][0] == {}
+        assert set(error.value.detail["projects"][1]) == {"business_area", "areas"}
+        assert not Project.objects.filter(year=2031).exists()
+
+    def test_benchmark_command(self, project_lead, db):
+        """Test the benchmark reports both paths and rolls back its writes"""
+        # Arrange
+        import io
+
+        from django.core.management import call_command
+
+        out = io.StringIO()
+
+        # Act
+        call_command("benchmark_project_provisioning", "--count", "8", stdout=out)
+
+        # Assert
+        rows = [line.split() for line in out.getvalue().splitlines()[1:]]
+        assert [row[:2] for row in rows] == [["serializers", "8"], ["bulk", "8"]]
+        assert not Project.objects.exists()
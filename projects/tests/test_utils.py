@@ -552,103 +552,67 @@ class TestFiles:
         # Assert
         assert result is None
 
-    def test_handle_project_image_upload(self):
+    def test_handle_project_image_upload(self, settings, tmp_path, db):
         """Test handling project image upload"""
         # Arrange
-        from unittest.mock import patch
+        import hashlib
 
+        from django.core.files.storage import default_storage
         from django.core.files.uploadedfile import SimpleUploadedFile
 
         from projects.utils.files import handle_project_image
 
-        # Create a mock uploaded file
+        settings.MEDIA_ROOT = str(tmp_path)
+        content = b"fake image content"
         image = SimpleUploadedFile(
-            name="test_image.jpg",
-            content=b"fake image content",
+            name="test_image.JPG",
+            content=content,
             content_type="image/jpeg",
         )
 
-        # Mock default_storage
-        with patch("projects.utils.files.default_storage") as mock_storage:
-            mock_storage.exists.return_value = False
-            mock_storage.save.return_value = "projects/test_image.jpg"
-
-            # Act
-            result = handle_project_image(image)
+        # Act
+        result = handle_project_image(image)
 
-            # Assert
-            assert result == "projects/test_image.jpg"
-            mock_storage.save.assert_called_once()
+        # Assert
+        assert result == f"projects/{hashlib.sha256(content).hexdigest()}.jpg"
+        with default_storage.open(result, "rb") as stored:
+            assert stored.read() == content
 
-    def test_handle_project_image_existing_file_same_size(self):
-        """Test handling project image when file exists with same size"""
+    def test_handle_project_image_same_content(self, settings, tmp_path, db):
+        """Test re-uploading the same bytes under a new name reuses the file"""
         # Arrange
-        from unittest.mock import patch
-
         from django.core.files.uploadedfile import SimpleUploadedFile
 
+        from medias.models import ContentBlob
         from projects.utils.files import handle_project_image
 
-        # Create a mock uploaded file
-        image = SimpleUploadedFile(
-            name="test_image.jpg",
-            content=b"fake image content",
-            content_type="image/jpeg",
-        )
-
-        # Mock default_storage and os.path
-        with (
-            patch("projects.utils.files.default_storage") as mock_storage,
-            patch("projects.utils.files.os.path.exists") as mock_exists,
-            patch("projects.utils.files.os.path.getsize") as mock_getsize,
-        ):
-
-            mock_storage.exists.return_value = True
-            mock_storage.path.return_value = "/path/to/projects/test_image.jpg"
-            mock_exists.return_value = True
-            mock_getsize.return_value = len(b"fake image content")
+        settings.MEDIA_ROOT = str(tmp_path)
+        first = SimpleUploadedFile("first.jpg", b"fake image content")
+        second = SimpleUploadedFile("renamed.jpg", b"fake image content")
 
-            # Act
-            result = handle_project_image(image)
+        # Act
+        first_path = handle_project_image(first)
+        second_path = handle_project_image(second)
 
-            # Assert
-            assert result == "projects/test_image.jpg"
-            # Should not call save since file exists with same size
-            mock_storage.save.assert_not_called()
+        # Assert
+        assert second_path == first_path
+        assert len(list((tmp_path / "projects").iterdir())) == 1
+        assert ContentBlob.objects.get(name=first_path).ref_count == 2
 
-    def test_handle_project_image_existing_file_different_size(self):
-        """Test handling project image when file exists with different size"""
+    def test_handle_project_image_different_content(self, settings, tmp_path, db):
+        """Test same-sized uploads with different bytes are stored separately"""
         # Arrange
-        from unittest.mock import patch
-
         from django.core.files.uploadedfile import SimpleUploadedFile
 
         from projects.utils.files import handle_project_image
 
-        # Create a mock uploaded file
-        image = SimpleUploadedFile(
-            name="test_image.jpg",
-            content=b"fake image content",
-            content_type="image/jpeg",
-        )
+        settings.MEDIA_ROOT = str(tmp_path)
+        first = SimpleUploadedFile("test_image.jpg", b"fake image content")
+        second = SimpleUploadedFile("test_image.jpg", b"fake image CONTENT")
+
+        # Act
+        first_path = handle_project_image(first)
+        second_path = handle_project_image(second)
 
-        # Mock default_storage and os.path
-        with (
-            patch("projects.utils.files.default_storage") as mock_storage,
-            patch("projects.utils.files.os.path.exists") as mock_exists,
-            patch("projects.utils.files.os.path.getsize") as mock_getsize,
-        ):
-
-            mock_storage.exists.return_value = True
-            mock_storage.path.return_value = "/path/to/projects/test_image.jpg"
-            mock_exists.return_value = True
-            mock_getsize.return_value = 999  # Different size
-            mock_storage.save.return_value = "projects/test_image.jpg"
-
-            # Act
-            result = handle_project_image(image)
-
-            # Assert
-            assert result == "projects/test_image.jpg"
-            # Should call save since file size is different
-            mock_storage.save.assert_called_once()
+        # Assert
+        assert first_path != second_path
@@ -2,10 +2,11 @@
 Tests for project views
 """
 
+import pytest
 from rest_framework import status
 
-from common.tests.test_helpers import projects_urls
-from projects.models import Project, ProjectMember
+from common.tests.test_helpers import projects_urls, response_json
+from projects.models import Project, ProjectArea, ProjectMember
 
 
 class TestProjects:
@@ -48,6 +49,179 @@ class TestProjects:
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["projects"]) >= 0
 
+    def test_list_projects_cursor_pagination(self, api_client, user, business_area, db):
+        """Test walking projects with cursors matches the offset ordering"""
+        # Arrange
+        from common.tests.factories import ProjectFactory
+        from projects.models import ProjectArea
+
+        for index in range(7):
+            created = ProjectFactory(
+                business_area=business_area,
+                year=2020 + (index % 3),
+                status="completed" if index % 2 else "active",
+                members=[],
+            )
+            ProjectArea.objects.create(project=created, areas=[])
+        api_client.force_authenticate(user=user)
+        expected_ids = [
+            pk
+            for pk in Project.objects.filter(status="active")
+            .order_by("-year", "id")
+            .values_list("id", flat=True)
+        ] + [
+            pk
+            for pk in Project.objects.filter(status="completed")
+            .order_by("-year", "id")
+            .values_list("id", flat=True)
+        ]
+
+        # Act
+        seen_ids = []
+        response = api_client.get(
+            projects_urls.list(), {"pagination": "cursor", "page_size": 3}
+        )
+        pages = [response]
+        while response.data["next_cursor"]:
+            response = api_client.get(
+                projects_urls.list(),
+                {"cursor": response.data["next_cursor"], "page_size": 3},
+            )
+            pages.append(response)
+        for page in pages:
+            seen_ids.extend(project["id"] for project in page.data["projects"])
+
+        previous = api_client.get(
+            projects_urls.list(),
+            {"cursor": pages[-1].data["previous_cursor"], "page_size": 3},
+        )
+
+        # Assert
+        assert all(page.status_code == status.HTTP_200_OK for page in pages)
+        assert seen_ids == expected_ids
+        assert len(pages) == 3
+        assert pages[0].data["previous_cursor"] is None
+        assert "total_pages" not in pages[0].data
+        assert [p["id"] for p in previous.data["projects"]] == [
+            p["id"] for p in pages[-2].data["projects"]
+        ]
+
+    def test_list_projects_cursor_approximate_count(
+        self, api_client, user, project, db
+    ):
+        """Test cursor pagination can include a planner estimated count"""
+        # Arrange
+        api_client.force_authenticate(user=user)
+
+        # Act
+        response = api_client.get(
+            projects_urls.list(),
+            {"pagination": "cursor", "approximate_count": "true"},
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert isinstance(response.data["total_results"], int)
+
+    def test_list_projects_invalid_cursor(self, api_client, user, project, db):
+        """Test a malformed cursor is rejected"""
+        # Arrange
+        api_client.force_authenticate(user=user)
+
+        # Act
+        response = api_client.get(projects_urls.list(), {"cursor": "not-a-cursor"})
+
+        # Assert
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestProvisionProjects:
+    """Tests for the batch project provisioning endpoint"""
+
+    @staticmethod
+    def payload(lead, **overrides):
+        return {
+            "kind": "science",
+            "year": 2031,
+            "title": "Imported project",
+            "members": [{"user": lead.pk, "role": "supervising", "is_leader": True}],
+            **overrides,
+        }
+
+    def test_provision_projects(self, api_client, superuser, project_lead, db):
+        """Test an admin can create many projects in one request"""
+        # Arrange
+        api_client.force_authenticate(user=superuser)
+        data = {
+            "projects": [
+                self.payload(project_lead, title=f"Imported {i}") for i in range(3)
+            ]
+        }
+
+        # Act
+        response = api_client.post(projects_urls.path("provision"), data, format="json")
+
+        # Assert
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["created"] == 3
+        assert [p["title"] for p in response.data["projects"]] == [
+            "Imported 0",
+            "Imported 1",
+            "Imported 2",
+        ]
+        assert response.data["projects"][0]["tag"].startswith("SP-2031-")
+        assert (
+            ProjectMember.objects.filter(
+                project__year=2031, user=project_lead, is_leader=True
+            ).count()
+            == 3
+        )
+
+    def test_provision_projects_invalid(self, api_client, superuser, project_lead, db):
+        """Test a batch with an invalid project creates nothing"""
+        # Arrange
+        api_client.force_authenticate(user=superuser)
+        data = {
+            "projects": [
+                self.payload(project_lead),
+                self.payload(
+                    project_lead,
+                    members=[
+                        {
+                            "user": project_lead.pk,
+                            "role": "supervising",
+                            "is_leader": False,
+                        }
+                    ],
+                ),
+            ]
+        }
+
+        # Act
+        response = api_client.post(projects_urls.path("provision"), data, format="json")
+
+        # Assert
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "members" in response.data["projects"][1]
+        assert not Project.objects.filter(year=2031).exists()
+
+    def test_provision_projects_requires_admin(
+        self, api_client, user, project_lead, db
+    ):
+        """Test regular users can't provision projects"""
+        # Arrange
+        api_client.force_authenticate(user=user)
+
+        # Act
+        response = api_client.post(
+            projects_urls.path("provision"),
+            {"projects": [self.payload(project_lead)]},
+            format="json",
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
 
 class TestProjectDetails:
     """Tests for ProjectDetails view (get, update, delete)"""
@@ -88,6 +262,103 @@ class TestProjectDetails:
         # Assert
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
+    def test_get_project_query_budget_and_cache(
+        self, api_client, user, project_with_members, db
+    ):
+        """Test the project page is built with three queries and then cached"""
+        # Arrange
+        from django.core.cache import cache
+
+        from common.tests.test_helpers import assert_query_budget
+        from config.query_budget import track_queries
+
+        cache.clear()
+        api_client.force_authenticate(user=user)
+        url = projects_urls.detail(project_with_members.pk)
+
+        # Act
+        with assert_query_budget(max_queries=3):
+            first = api_client.get(url)
+        with track_queries() as metrics:
+            second = api_client.get(url)
+
+        # Assert
+        assert first.status_code == status.HTTP_200_OK
+        assert len(first.data["members"]) == project_with_members.members.count()
+        assert second.data == first.data
+        assert metrics.query_count == 0
+
+    def test_get_project_cache_invalidated_on_member_change(
+        self, api_client, user, project_with_members, db
+    ):
+        """Test a membership change is reflected on the next page load"""
+        # Arrange
+        from django.core.cache import cache
+
+        cache.clear()
+        api_client.force_authenticate(user=user)
+        url = projects_urls.detail(project_with_members.pk)
+        before = api_client.get(url)
+        member = project_with_members.members.exclude(is_leader=True).first()
+
+        def role(response):
+            return next(
+                m["role"]
+                for m in response.data["members"]
+                if m["user"]["id"] == member.user_id
+            )
+
+        # Act
+        member.role = ProjectMember.RoleChoices.CONSULTED
+        member.save()
+        after = api_client.get(url)
+
+        # Assert
+        assert role(before) != "consulted"
+        assert role(after) == "consulted"
+
+    def test_get_project_cache_invalidated_on_business_area_rename(
+        self, api_client, user, project_with_members, db
+    ):
+        """Test a business area rename is reflected on the next page load"""
+        # Arrange
+        api_client.force_authenticate(user=user)
+        url = projects_urls.detail(project_with_members.pk)
+        api_client.get(url)
+        business_area = project_with_members.business_area
+
+        # Act
+        business_area.name = "Renamed Business Area"
+        business_area.save()
+        response = api_client.get(url)
+
+        # Assert
+        assert response.data["project"]["business_area"]["name"] == (
+            "Renamed Business Area"
+        )
+
+    def test_get_project_cache_invalidated_on_member_name_change(
+        self, api_client, user, project_with_members, db
+    ):
+        """Test a member's display name change is reflected on the next page load"""
+        # Arrange
+        api_client.force_authenticate(user=user)
+        url = projects_urls.detail(project_with_members.pk)
+        api_client.get(url)
+        member = project_with_members.members.first().user
+
+        # Act
+        member.display_first_name = "Renamed"
+        member.save(update_fields=["display_first_name"])
+        response = api_client.get(url)
+
+        # Assert
+        names = {
+            m["user"]["id"]: m["user"]["display_first_name"]
+            for m in response.data["members"]
+        }
+        assert names[member.pk] == "Renamed"
+
     def test_update_project_as_leader(
         self, api_client, project_with_lead, project_lead, db
     ):
@@ -374,7 +645,7 @@ class TestProjectAdditional:
 
         # Assert
         assert response.status_code == status.HTTP_200_OK
-        assert isinstance(response.data, list)
+        assert isinstance(response_json(response), list)
 
     def test_create_project_detail(self, api_client, project, user, db):
         """Test creating project detail"""
@@ -746,7 +1017,7 @@ class TestStudentProjectAdditional:
 
         # Assert
         assert response.status_code == status.HTTP_200_OK
-        assert isinstance(response.data, list)
+        assert isinstance(response_json(response), list)
 
     def test_create_student_detail(self, api_client, user, project, db):
         """Test creating student project detail"""
@@ -844,7 +1115,7 @@ class TestExternalProjectAdditional:
 
         # Assert
         assert response.status_code == status.HTTP_200_OK
-        assert isinstance(response.data, list)
+        assert isinstance(response_json(response), list)
 
     def test_create_external_detail(self, api_client, user, project, db):
         """Test creating external project detail"""
@@ -983,6 +1254,83 @@ class TestProjectAreas:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
+class TestProjectsByArea:
+    """Tests for ProjectsByArea view"""
+
+    @pytest.fixture
+    def located_projects(self, project_factory, db):
+        """Three projects in areas 1 and 2, 1 only, and 2 only"""
+        from common.tests.factories import AreaFactory
+
+        first, second = AreaFactory(), AreaFactory()
+        both, only_first, only_second = (
+            project_factory(),
+            project_factory(),
+            project_factory(),
+        )
+        for project, areas in [
+            (both, [first.pk, second.pk]),
+            (only_first, [first.pk]),
+            (only_second, [second.pk]),
+        ]:
+            ProjectArea.objects.update_or_create(
+                project=project, defaults={"areas": areas}
+            )
+        return first, second, both, only_first, only_second
+
+    def test_projects_in_any_area(self, api_client, user, located_projects):
+        """Test projects in either area are returned and grouped by area"""
+        # Arrange
+        api_client.force_authenticate(user=user)
+        first, second, both, only_first, only_second = located_projects
+
+        # Act
+        response = api_client.get(
+            projects_urls.path("project_areas", "projects"),
+            {"areas": f"{first.pk},{second.pk}"},
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert {p["id"] for p in response.data["projects"]} == {
+            both.pk,
+            only_first.pk,
+            only_second.pk,
+        }
+        assert set(response.data["by_area"][first.pk]) == {both.pk, only_first.pk}
+        assert set(response.data["by_area"][second.pk]) == {both.pk, only_second.pk}
+
+    def test_projects_in_all_areas(self, api_client, user, located_projects):
+        """Test match=all only returns projects in every area"""
+        # Arrange
+        api_client.force_authenticate(user=user)
+        first, second, both, _, _ = located_projects
+
+        # Act
+        response = api_client.get(
+            projects_urls.path("project_areas", "projects"),
+            {"areas": f"{first.pk},{second.pk}", "match": "all"},
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert [p["id"] for p in response.data["projects"]] == [both.pk]
+
+    @pytest.mark.parametrize("areas", ["", "1,north"])
+    def test_invalid_areas(self, api_client, user, areas, db):
+        """Test missing or non-numeric area IDs are rejected"""
+        # Arrange
+        api_client.force_authenticate(user=user)
+
+        # Act
+        response = api_client.get(
+            projects_urls.path("project_areas", "projects"), {"areas": areas}
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
 class TestProjectAreaDetail:
     """Tests for ProjectAreaDetail view"""
 
@@ -1171,6 +1519,103 @@ class TestSmallProjectSearch:
         assert response.status_code == status.HTTP_200_OK
         assert isinstance(response.data, list)
 
+    def test_small_search_title_word_prefix(self, api_client, user, project, db):
+        """Test the typeahead matches word prefixes in the title"""
+        # Arrange
+        project.title = "<p>Marine turtle monitoring</p>"
+        project.save()
+        api_client.force_authenticate(user=user)
+
+        # Act
+        response = api_client.get(
+            projects_urls.path("smallsearch"), {"searchTerm": "turt monit"}
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert [p["id"] for p in response.data] == [project.pk]
+
+    @pytest.mark.parametrize("search_term", ["monitori", "Studie", "the", "of the"])
+    def test_small_search_partly_typed_words(
+        self, api_client, user, project, search_term, db
+    ):
+        """Test prefixes of partly typed words and stopwords are not stemmed away"""
+        # Arrange
+        project.title = "<p>Studies of the marine turtle monitoring</p>"
+        project.save()
+        api_client.force_authenticate(user=user)
+
+        # Act
+        response = api_client.get(
+            projects_urls.path("smallsearch"), {"searchTerm": search_term}
+        )
+
+        # Assert
+        assert [p["id"] for p in response.data] == [project.pk]
+
+    @pytest.mark.parametrize("search_term", ["seagr", "dugo", "coastal hab"])
+    def test_small_search_matches_other_text_fields(
+        self, api_client, user, project, search_term, db
+    ):
+        """Test the typeahead also matches the description, keywords and tagline"""
+        # Arrange
+        project.description = "<p>Seagrass mapping</p>"
+        project.keywords = "dugong,survey"
+        project.tagline = "<p>Coastal habitats</p>"
+        project.save()
+        api_client.force_authenticate(user=user)
+
+        # Act
+        response = api_client.get(
+            projects_urls.path("smallsearch"), {"searchTerm": search_term}
+        )
+
+        # Assert
+        assert [p["id"] for p in response.data] == [project.pk]
+
+    def test_small_search_tag_prefix(self, api_client, user, project, db):
+        """Test the typeahead matches project tag prefixes"""
+        # Arrange
+        project.number = 123
+        project.save()
+        api_client.force_authenticate(user=user)
+
+        # Act
+        matching = api_client.get(
+            projects_urls.path("smallsearch"), {"searchTerm": "SP-2023-12"}
+        )
+        other_year = api_client.get(
+            projects_urls.path("smallsearch"), {"searchTerm": "SP-2022-12"}
+        )
+
+        # Assert
+        assert [p["id"] for p in matching.data] == [project.pk]
+        assert other_year.data == []
+
+    def test_small_search_query_budget_and_cache(
+        self, api_client, user, project_with_members, db
+    ):
+        """Test the typeahead stays within its budget and caches per user"""
+        # Arrange
+        from django.core.cache import cache
+
+        from common.tests.test_helpers import assert_query_budget
+        from config.query_budget import track_queries
+
+        cache.clear()
+        api_client.force_authenticate(user=user)
+
+        # Act
+        with assert_query_budget(max_queries=2):
+            first = api_client.get(projects_urls.path("smallsearch"))
+        with track_queries() as metrics:
+            second = api_client.get(projects_urls.path("smallsearch"))
+
+        # Assert
+        assert len(first.data) == 1
+        assert second.data == first.data
+        assert metrics.query_count == 0
+
 
 class TestMyProjects:
     """Tests for MyProjects view"""
@@ -1284,7 +1729,7 @@ class TestProjectKindGetters:
 
         # Assert
         assert response.status_code == status.HTTP_200_OK
-        assert isinstance(response.data, list)
+        assert isinstance(response_json(response), list)
 
     def test_get_science_projects(self, api_client, user, project_factory, db):
         """Test getting science projects"""
@@ -1297,7 +1742,7 @@ class TestProjectKindGetters:
 
         # Assert
         assert response.status_code == status.HTTP_200_OK
-        assert isinstance(response.data, list)
+        assert isinstance(response_json(response), list)
 
     def test_get_student_projects(self, api_client, user, project_factory, db):
         """Test getting student projects"""
@@ -1310,7 +1755,7 @@ class TestProjectKindGetters:
 
         # Assert
         assert response.status_code == status.HTTP_200_OK
-        assert isinstance(response.data, list)
+        assert isinstance(response_json(response), list)
 
     def test_get_external_projects(self, api_client, user, project_factory, db):
         """Test getting external projects"""
@@ -1323,4 +1768,4 @@ class TestProjectKindGetters:
 
         # Assert
         assert response.status_code == status.HTTP_200_OK
-        assert isinstance(response.data, list)
+        assert isinstance(response_json(response), list)
@@ -5,6 +5,7 @@ from . import views
 urlpatterns = [
     # BASE URLS - Using explicit "list" instead of "" to avoid trailing slash on base URL
     path("list", views.Projects.as_view()),
+    path("provision", views.ProvisionProjects.as_view()),
     # String patterns MUST come before <int:pk> to avoid matching conflicts
     path("map", views.ProjectMap.as_view()),
     path("mine", views.MyProjects.as_view()),
@@ -48,6 +49,7 @@ urlpatterns = [
     # PROJECT AREAS
     path("project_areas", views.ProjectAreas.as_view()),
     path("project_areas/<int:pk>", views.ProjectAreaDetail.as_view()),
+    path("project_areas/projects", views.ProjectsByArea.as_view()),
     # Getters
     path("external", views.ExternalProjects.as_view()),
     path("student", views.StudentProjects.as_view()),
@@ -11,8 +11,8 @@ from .admin import (
     RemedyOpenClosed,
     UnapprovedThisFY,
 )
-from .areas import AreasForProject, ProjectAreaDetail, ProjectAreas
-from .crud import ProjectDetails, Projects
+from .areas import AreasForProject, ProjectAreaDetail, ProjectAreas, ProjectsByArea
+from .crud import ProjectDetails, Projects, ProvisionProjects
 from .details import (
     ExternalProjectAdditional,
     ExternalProjectAdditionalDetail,
@@ -47,6 +47,7 @@ __all__ = [
     # CRUD
     "Projects",
     "ProjectDetails",
+    "ProvisionProjects",
     # Map
     "ProjectMap",
     # Search
@@ -70,6 +71,7 @@ __all__ = [
     "ProjectAreas",
     "ProjectAreaDetail",
     "AreasForProject",
+    "ProjectsByArea",
     # Admin
     "UnapprovedThisFY",
     "ProblematicProjects",
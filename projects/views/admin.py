@@ -11,6 +11,7 @@ from rest_framework.views import APIView
 
 from ..models import Project
 from ..serializers import ProblematicProjectSerializer, TinyProjectSerializer
+from ..services import ProjectAnalyticsService
 
 
 class UnapprovedThisFY(APIView):
@@ -65,78 +66,22 @@ class ProblematicProjects(APIView):
             .exclude(Q(closure__isnull=True) | Q(closure__document__status="new"))
             .select_related(
                 "business_area",
-            )
-            .prefetch_related(
-                "members",
+                "image",
             )
             .distinct()
         )
 
-        # Projects with no members
-        memberless = (
-            Project.objects.annotate(member_count=Count("members"))
-            .filter(member_count=0, status__in=["active", "updating"])
-            .select_related(
-                "business_area",
-            )
-        )
-
-        # Projects with no leader
-        leaderless = (
-            Project.objects.filter(status__in=["active", "updating"])
-            .exclude(members__is_leader=True)
-            .select_related(
-                "business_area",
-            )
-            .prefetch_related(
-                "members",
-            )
-            .distinct()
-        )
-
-        # Projects with multiple leaders
-        multiple_leaders = (
-            Project.objects.annotate(
-                leader_count=Count("members", filter=Q(members__is_leader=True))
-            )
-            .filter(leader_count__gt=1, status__in=["active", "updating"])
-            .select_related(
-                "business_area",
-            )
-            .prefetch_related(
-                "members",
-            )
-        )
-
-        # Projects with external leaders
-        external_leaders = (
-            Project.objects.filter(
-                members__is_leader=True,
-                members__user__is_staff=False,
-                status__in=["active", "updating"],
-            )
-            .select_related(
-                "business_area",
-            )
-            .prefetch_related(
-                "members",
-                "members__user",
-            )
-            .distinct()
-        )
+        # Member and leader problems share one cached aggregate
+        problems = ProjectAnalyticsService.get_open_project_problems()
 
         response_data = {
             "open_with_closure": ProblematicProjectSerializer(
                 open_with_closure, many=True
             ).data,
-            "memberless": ProblematicProjectSerializer(memberless, many=True).data,
-            "leaderless": ProblematicProjectSerializer(leaderless, many=True).data,
-            "multiple_leaders": ProblematicProjectSerializer(
-                multiple_leaders, many=True
-            ).data,
-            "external_leaders": ProblematicProjectSerializer(
-                external_leaders, many=True
-            ).data,
+            **{
+                name: ProblematicProjectSerializer(projects, many=True).data
+                for name, projects in problems.items()
+            },
         }
 
         return Response(response_data, status=HTTP_200_OK)
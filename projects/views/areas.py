@@ -14,7 +14,7 @@ from rest_framework.status import (
 )
 from rest_framework.views import APIView
 
-from ..serializers import ProjectAreaSerializer
+from ..serializers import AreaProjectSerializer, ProjectAreaSerializer
 from ..services.area_service import AreaService
 
 
@@ -85,3 +85,49 @@ class AreasForProject(APIView):
         area = AreaService.get_project_area(pk)
         serializer = ProjectAreaSerializer(area)
         return Response(serializer.data, status=HTTP_200_OK)
+
+
+class ProjectsByArea(APIView):
+    """Projects located in the given areas"""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """
+        Get projects by area
+
+        Query params:
+            areas: Comma separated area IDs (required)
+            match: "any" (default) or "all" of the areas
+        """
+        try:
+            area_ids = [
+                int(pk) for pk in request.query_params.get("areas", "").split(",") if pk
+            ]
+        except ValueError:
+            return Response(
+                {"error": "areas must be a comma separated list of IDs"},
+                status=HTTP_400_BAD_REQUEST,
+            )
+        if not area_ids:
+            return Response(
+                {"error": "areas query parameter is required"},
+                status=HTTP_400_BAD_REQUEST,
+            )
+        match_all = request.query_params.get("match") == "all"
+
+        settings.LOGGER.info(f"{request.user} is viewing projects in areas {area_ids}")
+
+        projects = AreaProjectSerializer.values_data(
+            AreaService.get_projects_by_area(area_ids, match_all=match_all)
+        )
+        by_area = {pk: [] for pk in area_ids}
+        for project in projects:
+            for pk in project["areas"]:
+                if pk in by_area:
+                    by_area[pk].append(project["id"])
+
+        return Response(
+            {"projects": projects, "by_area": by_area},
+            status=HTTP_200_OK,
+        )
@@ -18,25 +18,29 @@ from rest_framework.status import (
 )
 from rest_framework.views import APIView
 
-from common.utils.pagination import paginate_queryset
+from common.permissions import IsAdminUser
+from common.utils.pagination import (
+    is_cursor_pagination_requested,
+    paginate_queryset,
+    paginate_queryset_by_cursor,
+)
 from medias.models import ProjectPhoto
 
 from ..permissions.project_permissions import CanEditProject
 from ..serializers import (
     CreateProjectSerializer,
     ExternalProjectDetailSerializer,
-    MiniProjectMemberSerializer,
     ProjectAreaSerializer,
     ProjectDetailSerializer,
-    ProjectDetailViewSerializer,
     ProjectMemberSerializer,
     ProjectSerializer,
     ProjectUpdateSerializer,
+    ProvisionProjectsSerializer,
     StudentProjectDetailSerializer,
-    TinyExternalProjectDetailSerializer,
-    TinyStudentProjectDetailSerializer,
 )
+from ..services.page_service import ProjectPageService
 from ..services.project_service import ProjectService
+from ..services.provision_service import ProjectProvisionService
 
 
 class Projects(APIView):
@@ -51,6 +55,24 @@ class Projects(APIView):
             user=request.user, filters=request.query_params
         )
 
+        # Opt-in keyset pagination skips the count and deep OFFSET scans
+        if is_cursor_pagination_requested(request):
+            paginated = paginate_queryset_by_cursor(projects, request)
+            serializer = ProjectSerializer(
+                paginated["items"],
+                many=True,
+                context={"request": request, "projects": paginated["items"]},
+            )
+            return Response(
+                {
+                    "projects": serializer.data,
+                    "next_cursor": paginated["next_cursor"],
+                    "previous_cursor": paginated["previous_cursor"],
+                    "total_results": paginated["total_results"],
+                },
+                status=HTTP_200_OK,
+            )
+
         # Paginate results
         paginated = paginate_queryset(projects, request)
 
@@ -215,153 +237,47 @@ class Projects(APIView):
         return Response(result_serializer.data, status=HTTP_201_CREATED)
 
 
-class ProjectDetails(APIView):
-    """Get, update, and delete a specific project"""
-
-    permission_classes = [IsAuthenticated]
+class ProvisionProjects(APIView):
+    """Create many projects with their teams, areas and details at once"""
 
-    def get(self, request, pk):
-        """Get full project details including project, details, documents, and members"""
-        from documents.models import (
-            ConceptPlan,
-            ProgressReport,
-            ProjectClosure,
-            ProjectPlan,
-            StudentReport,
-        )
+    permission_classes = [IsAuthenticated, IsAdminUser]
 
-        from ..models import (
-            ExternalProjectDetails,
-            ProjectDetail,
-            ProjectMember,
-            StudentProjectDetails,
-        )
+    def post(self, request):
+        """Provision a batch of projects, all or none"""
+        serializer = ProvisionProjectsSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=HTTP_400_BAD_REQUEST)
 
-        # Get project
-        project = ProjectService.get_project(pk)
-        project_data = ProjectSerializer(project).data
-
-        # Get project details (base)
-        try:
-            base_detail = ProjectDetail.objects.select_related(
-                "creator",
-                "modifier",
-                "owner",
-                "data_custodian",
-                "site_custodian",
-                "service",
-            ).get(project=project)
-            base_data = ProjectDetailViewSerializer(base_detail).data
-        except ProjectDetail.DoesNotExist:
-            base_data = None
-
-        # Get student details if applicable
-        try:
-            student_detail = StudentProjectDetails.objects.get(project=project)
-            student_data = TinyStudentProjectDetailSerializer(student_detail).data
-        except StudentProjectDetails.DoesNotExist:
-            student_data = []
-
-        # Get external details if applicable
-        try:
-            external_detail = ExternalProjectDetails.objects.get(project=project)
-            external_data = TinyExternalProjectDetailSerializer(external_detail).data
-        except ExternalProjectDetails.DoesNotExist:
-            external_data = []
-
-        # Get project members
-        members = (
-            ProjectMember.objects.filter(project=project)
-            .select_related(
-                "user", "user__profile", "user__work", "user__work__affiliation"
-            )
-            .prefetch_related("user__caretakers")
-            .order_by("position")
+        projects = ProjectProvisionService.provision_projects(
+            serializer.validated_data["projects"], request.user
         )
-        members_data = (
-            MiniProjectMemberSerializer(members, many=True).data
-            if members.exists()
-            else None
+        return Response(
+            {
+                "created": len(projects),
+                "projects": [
+                    {
+                        "id": project.pk,
+                        "tag": project.get_project_tag(),
+                        "title": project.title,
+                    }
+                    for project in projects
+                ],
+            },
+            status=HTTP_201_CREATED,
         )
 
-        # Get documents
-        documents = {
-            "concept_plan": None,
-            "project_plan": None,
-            "progress_reports": [],
-            "student_reports": [],
-            "project_closure": None,
-        }
 
-        # Get concept plan
-        try:
-            concept_plan = ConceptPlan.objects.select_related("document").get(
-                project=project
-            )
-            documents["concept_plan"] = {
-                "id": concept_plan.id,
-                "status": concept_plan.document.status,
-            }
-        except ConceptPlan.DoesNotExist:
-            pass
+class ProjectDetails(APIView):
+    """Get, update, and delete a specific project"""
 
-        # Get project plan
-        try:
-            project_plan = ProjectPlan.objects.select_related("document").get(
-                project=project
-            )
-            documents["project_plan"] = {
-                "id": project_plan.id,
-                "status": project_plan.document.status,
-            }
-        except ProjectPlan.DoesNotExist:
-            pass
-
-        # Get progress reports
-        progress_reports = (
-            ProgressReport.objects.filter(project=project)
-            .select_related("document")
-            .order_by("-year", "-id")
-        )
-        documents["progress_reports"] = [
-            {"id": pr.id, "status": pr.document.status} for pr in progress_reports
-        ]
-
-        # Get student reports
-        student_reports = (
-            StudentReport.objects.filter(project=project)
-            .select_related("document")
-            .order_by("-id")
-        )
-        documents["student_reports"] = [
-            {"id": sr.id, "status": sr.document.status} for sr in student_reports
-        ]
-
-        # Get project closure
-        try:
-            project_closure = ProjectClosure.objects.select_related("document").get(
-                project=project
-            )
-            documents["project_closure"] = {
-                "id": project_closure.id,
-                "status": project_closure.document.status,
-            }
-        except ProjectClosure.DoesNotExist:
-            pass
-
-        # Construct full response
-        response_data = {
-            "project": project_data,
-            "details": {
-                "base": base_data,
-                "external": external_data,
-                "student": student_data,
-            },
-            "documents": documents,
-            "members": members_data,
-        }
+    permission_classes = [IsAuthenticated]
+    # Session and user lookups plus the three page queries on a cache miss
+    query_budget = {"GET": 5}
 
-        return Response(response_data, status=HTTP_200_OK)
+    def get(self, request, pk):
+        """Get full project details including project, details, documents, and members"""
+        page = ProjectPageService.get_project_page(pk)
+        return Response(page, status=HTTP_200_OK)
 
     def get_permissions(self):
         """
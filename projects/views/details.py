@@ -15,6 +15,8 @@ from rest_framework.status import (
 )
 from rest_framework.views import APIView
 
+from common.views import StreamingListMixin
+
 from ..models import ProjectDetail
 from ..serializers import (
     ExternalProjectDetailSerializer,
@@ -27,16 +29,15 @@ from ..serializers import (
 from ..services.details_service import DetailsService
 
 
-class ProjectAdditional(APIView):
+class ProjectAdditional(StreamingListMixin, APIView):
     """List and create project details"""
 
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        """Get all project details"""
+        """Get all project details, streamed unless paginated"""
         details = DetailsService.list_all_project_details()
-        serializer = ProjectDetailViewSerializer(details, many=True)
-        return Response(serializer.data, status=HTTP_200_OK)
+        return self.list_response(details, ProjectDetailViewSerializer, request)
 
     def post(self, request):
         """Create project detail"""
@@ -109,14 +110,13 @@ class ProjectAdditionalDetail(APIView):
         return Response(status=HTTP_204_NO_CONTENT)
 
 
-class StudentProjectAdditional(APIView):
+class StudentProjectAdditional(StreamingListMixin, APIView):
     """List and create student project details"""
 
     def get(self, request):
-        """Get all student project details"""
+        """Get all student project details, streamed unless paginated"""
         details = DetailsService.list_all_student_details()
-        serializer = TinyStudentProjectDetailSerializer(details, many=True)
-        return Response(serializer.data, status=HTTP_200_OK)
+        return self.list_response(details, TinyStudentProjectDetailSerializer, request)
 
     def post(self, request):
         """Create student project detail"""
@@ -176,14 +176,13 @@ class StudentProjectAdditionalDetail(APIView):
         return Response(status=HTTP_204_NO_CONTENT)
 
 
-class ExternalProjectAdditional(APIView):
+class ExternalProjectAdditional(StreamingListMixin, APIView):
     """List and create external project details"""
 
     def get(self, request):
-        """Get all external project details"""
+        """Get all external project details, streamed unless paginated"""
         details = DetailsService.list_all_external_details()
-        serializer = TinyExternalProjectDetailSerializer(details, many=True)
-        return Response(serializer.data, status=HTTP_200_OK)
+        return self.list_response(details, TinyExternalProjectDetailSerializer, request)
 
     def post(self, request):
         """Create external project detail"""
@@ -2,7 +2,11 @@
 Project search views
 """
 
+import hashlib
+from urllib.parse import urlencode
+
 from django.conf import settings
+from django.core.cache import cache
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.status import HTTP_200_OK
@@ -17,18 +21,31 @@ class SmallProjectSearch(APIView):
     """Small project search for autocomplete"""
 
     permission_classes = [IsAuthenticated]
+    # Typeahead query and directorate email prefetch, plus session/user lookups
+    query_budget = {"GET": 4}
 
     def get(self, request):
-        """Search projects with minimal data"""
-        projects = ProjectService.list_projects(
-            user=request.user, filters=request.query_params
+        """Search projects with minimal data (cached briefly per user)"""
+        params = urlencode(sorted(request.query_params.items()))
+        cache_key = (
+            f"project_typeahead_{request.user.pk}_"
+            f"{hashlib.md5(params.encode(), usedforsecurity=False).hexdigest()}"
         )
-
-        # Limit to 20 results for autocomplete
-        projects = projects[:20]
-
-        serializer = TinyProjectSerializer(projects, many=True)
-        return Response(serializer.data, status=HTTP_200_OK)
+        data = cache.get(cache_key)
+
+        if data is None:
+            # Limit to 20 results for autocomplete
+            projects = ProjectService.search_projects_typeahead(
+                filters=request.query_params, limit=20
+            )
+            data = TinyProjectSerializer(projects, many=True).data
+            cache.set(
+                cache_key,
+                data,
+                getattr(settings, "PROJECT_TYPEAHEAD_CACHE_TIMEOUT", 30),
+            )
+
+        return Response(data, status=HTTP_200_OK)
 
 
 class MyProjects(APIView):
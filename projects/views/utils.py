@@ -8,10 +8,10 @@ from rest_framework.response import Response
 from rest_framework.status import HTTP_200_OK, HTTP_202_ACCEPTED
 from rest_framework.views import APIView
 
+from common.views import StreamingListMixin
 from documents.models import ProjectDocument
 from documents.serializers import ProjectDocumentSerializer
 
-from ..models import Project
 from ..serializers import TinyProjectSerializer
 from ..services.project_service import ProjectService
 
@@ -74,41 +74,37 @@ class ToggleUserProfileVisibilityForProject(APIView):
         return Response(serializer.data, status=HTTP_202_ACCEPTED)
 
 
-class CoreFunctionProjects(APIView):
+class CoreFunctionProjects(StreamingListMixin, APIView):
     """Get core function projects"""
 
     def get(self, request):
-        """Get all core function projects"""
-        projects = Project.objects.filter(kind="core_function").all()
-        serializer = TinyProjectSerializer(projects, many=True)
-        return Response(serializer.data, status=HTTP_200_OK)
+        """Get all core function projects, streamed unless paginated"""
+        projects = ProjectService.list_projects_of_kind("core_function")
+        return self.list_response(projects, TinyProjectSerializer, request)
 
 
-class ScienceProjects(APIView):
+class ScienceProjects(StreamingListMixin, APIView):
     """Get science projects"""
 
     def get(self, request):
-        """Get all science projects"""
-        projects = Project.objects.filter(kind="science").all()
-        serializer = TinyProjectSerializer(projects, many=True)
-        return Response(serializer.data, status=HTTP_200_OK)
+        """Get all science projects, streamed unless paginated"""
+        projects = ProjectService.list_projects_of_kind("science")
+        return self.list_response(projects, TinyProjectSerializer, request)
 
 
-class StudentProjects(APIView):
+class StudentProjects(StreamingListMixin, APIView):
     """Get student projects"""
 
     def get(self, request):
-        """Get all student projects"""
-        projects = Project.objects.filter(kind="student").all()
-        serializer = TinyProjectSerializer(projects, many=True)
-        return Response(serializer.data, status=HTTP_200_OK)
+        """Get all student projects, streamed unless paginated"""
+        projects = ProjectService.list_projects_of_kind("student")
+        return self.list_response(projects, TinyProjectSerializer, request)
 
 
-class ExternalProjects(APIView):
+class ExternalProjects(StreamingListMixin, APIView):
     """Get external projects"""
 
     def get(self, request):
-        """Get all external projects"""
-        projects = Project.objects.filter(kind="external").all()
-        serializer = TinyProjectSerializer(projects, many=True)
-        return Response(serializer.data, status=HTTP_200_OK)
+        """Get all external projects, streamed unless paginated"""
+        projects = ProjectService.list_projects_of_kind("external")
+        return self.list_response(projects, TinyProjectSerializer, request)
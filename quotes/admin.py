@@ -2,6 +2,7 @@
 import os
 import tempfile
 
+from django.conf import settings
 from django.contrib import admin
 
 from .models import Quote
@@ -71,7 +72,7 @@ def generate_quotes(model_admin, req, selected):
 def export_selected_quotes_txt(model_admin, req, selected):
     # Use tempfile to create a temporary file
     with tempfile.NamedTemporaryFile(
-        delete=False, mode="w", encoding="utf-8"
+        delete=False, mode="w", encoding="utf-8", prefix=settings.TEMP_FILE_PREFIX
     ) as temp_file:
         for quote in selected:
             text = quote.text
@@ -91,7 +92,7 @@ def export_all_quotes_txt(model_admin, req, selected):
         return
     # Use tempfile to create a temporary file
     with tempfile.NamedTemporaryFile(
-        delete=False, mode="w", encoding="utf-8"
+        delete=False, mode="w", encoding="utf-8", prefix=settings.TEMP_FILE_PREFIX
     ) as temp_file:
         saved_quotes = Quote.objects.all()
         for quote in saved_quotes:
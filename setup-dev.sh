@@ -62,7 +62,7 @@ echo "✅ Development environment setup complete!"
 echo ""
 echo "📝 Next steps:"
 echo "   1. Edit .env with your database and other settings"
-echo "   2. Run migrations: poetry run python manage.py migrate"
+echo "   2. Run migrations: poetry run python manage.py migrate && poetry run python manage.py createcachetable"
 echo "   3. Create superuser: poetry run python manage.py createsuperuser"
 echo "   4. Run tests: poetry run pytest"
 echo "   5. Start development server: poetry run python manage.py runserver"
@@ -14,6 +14,7 @@ from agencies.serializers import (
     TinyBranchSerializer,
     TinyBusinessAreaSerializer,
 )
+from common.utils.http import get_client
 from projects.models import ProjectMember
 from users.serializers import TinyUserSerializer
 
@@ -130,10 +131,9 @@ def generate_active_staff_csv(model_admin, request, selected):
 
     # Fetch IT Assets data
     try:
-        response_it = requests.get(
+        response_it = get_client("it_assets").get(
             settings.IT_ASSETS_URL,
             auth=(settings.IT_ASSETS_USER, settings.IT_ASSETS_ACCESS_TOKEN),
-            timeout=30,
         )
 
         if response_it.status_code == 200:
@@ -206,16 +206,15 @@ def set_it_assets_id(model_admin, req, selected):
     # Call the API to retrieve the list of users
     api_url = settings.IT_ASSETS_URL
     try:
-        response = requests.get(
+        response = get_client("it_assets").get(
             api_url,
             auth=(
                 settings.IT_ASSETS_USER,
                 settings.IT_ASSETS_ACCESS_TOKEN,
             ),
-            timeout=30,
         )
-    except requests.Timeout:
-        settings.LOGGER.error("Request to IT Assets API timed out")
+    except requests.RequestException as e:
+        settings.LOGGER.error(f"Request to IT Assets API failed: {e}")
         return
 
     if response.status_code != 200:
@@ -8,6 +8,7 @@ from rest_framework import serializers
 
 from caretakers.models import Caretaker
 from common.models import CommonModel
+from common.utils.http import get_client
 from medias.models import UserAvatar
 
 # endregion =======================================
@@ -518,17 +519,16 @@ class PublicStaffProfile(CommonModel):
             api_url = settings.IT_ASSETS_URL
 
         try:
-            response = requests.get(
+            response = get_client("it_assets").get(
                 api_url,
                 auth=(
                     settings.IT_ASSETS_USER,
                     settings.IT_ASSETS_ACCESS_TOKEN,
                 ),
-                timeout=30,
             )
-        except requests.Timeout:
+        except requests.RequestException as e:
             settings.LOGGER.error(
-                f"Request to IT Assets API timed out for profile {self.pk}"
+                f"Request to IT Assets API failed for profile {self.pk}: {e}"
             )
             return None
 
@@ -581,17 +581,16 @@ class PublicStaffProfile(CommonModel):
             api_url = settings.IT_ASSETS_URL
 
         try:
-            response = requests.get(
+            response = get_client("it_assets").get(
                 api_url,
                 auth=(
                     settings.IT_ASSETS_USER,
                     settings.IT_ASSETS_ACCESS_TOKEN,
                 ),
-                timeout=30,
             )
-        except requests.Timeout:
+        except requests.RequestException as e:
             settings.LOGGER.error(
-                f"Request to IT Assets API timed out for profile {self.pk}"
+                f"Request to IT Assets API failed for profile {self.pk}: {e}"
             )
             return self.email
 
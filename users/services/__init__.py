@@ -4,6 +4,7 @@ User services
 
 from .entry_service import EducationService, EmploymentService
 from .export_service import ExportService
+from .merge_service import UserMergeService
 from .profile_service import ProfileService
 from .user_service import UserService
 
@@ -13,4 +14,5 @@ __all__ = [
     "EmploymentService",
     "EducationService",
     "ExportService",
+    "UserMergeService",
 ]
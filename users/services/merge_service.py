@@ -0,0 +1,296 @@
+"""
+Merge service - Set-based merging of duplicate user accounts
+"""
+
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, Exists, F, Func, OuterRef, Q, Value, When
+from rest_framework.exceptions import NotFound, ValidationError
+
+from users.models import User
+
+# Integer arrays holding user IDs, which introspection cannot find
+USER_ID_ARRAY_FIELDS = [
+    ("projects.Project", "hidden_from_staff_profiles"),
+]
+
+
+class UserMergeService:
+    """Business logic for merging secondary users into a primary user"""
+
+    @staticmethod
+    def merge_users(primary_user_id, secondary_user_ids, dry_run=False):
+        """
+        Merge secondary users into a primary user
+
+        Every foreign key and many-to-many row pointing at a secondary user
+        is reassigned with one UPDATE per field, then the secondary users are
+        deleted. Rows that would break a unique constraint are removed first,
+        keeping the primary user's row. Project memberships keep the highest
+        leadership held by any of the merged users.
+
+        Args:
+            primary_user_id: ID of the user to keep
+            secondary_user_ids: IDs of the users to merge and delete
+            dry_run: Roll back after counting the affected rows
+
+        Returns:
+            Dict report with reassigned and removed row counts per table
+
+        Raises:
+            NotFound: If the primary user does not exist
+            ValidationError: If no secondary users exist or the primary
+                user is listed as a secondary user
+        """
+        try:
+            primary_user = User.objects.get(pk=primary_user_id)
+        except User.DoesNotExist:
+            raise NotFound(f"User {primary_user_id} not found")
+
+        secondary_ids = list(
+            User.objects.filter(pk__in=secondary_user_ids)
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+        if primary_user.pk in secondary_ids:
+            raise ValidationError("Primary user cannot also be a secondary user")
+        if not secondary_ids:
+            raise ValidationError("No secondary users found to merge")
+
+        settings.LOGGER.info(
+            f"{'Dry run: m' if dry_run else 'M'}erging users {secondary_ids} into {primary_user}"
+        )
+
+        report = {
+            "primary_user": primary_user.pk,
+            "secondary_users": secondary_ids,
+            "dry_run": dry_run,
+            "tables": {},
+            "deleted": {},
+        }
+
+        with transaction.atomic():
+            UserMergeService._merge_memberships(
+                primary_user, secondary_ids, report["tables"]
+            )
+            for model, field in UserMergeService.get_user_relations():
+                UserMergeService._merge_relation(
+                    model, field, primary_user.pk, secondary_ids, report["tables"]
+                )
+            for label, field_name in USER_ID_ARRAY_FIELDS:
+                UserMergeService._merge_id_array(
+                    apps.get_model(label),
+                    field_name,
+                    primary_user.pk,
+                    secondary_ids,
+                    report["tables"],
+                )
+
+            _, deleted = User.objects.filter(pk__in=secondary_ids).delete()
+            report["deleted"] = {
+                label: count for label, count in deleted.items() if count
+            }
+
+            if dry_run:
+                transaction.set_rollback(True)
+
+        if not dry_run:
+            # Bulk updates bypass the signals that normally drop this cache
+            from projects.services import ProjectAnalyticsService
+
+            ProjectAnalyticsService.invalidate_project_health()
+
+        return report
+
+    @staticmethod
+    def get_user_relations():
+        """
+        Find every concrete foreign key (and many-to-many through table
+        column) referencing the user model
+
+        Project memberships are excluded as they are merged separately.
+
+        Returns:
+            List of (model, field) tuples
+        """
+        ProjectMember = apps.get_model("projects", "ProjectMember")
+        relations = []
+        for model in apps.get_models(include_auto_created=True):
+            if model is ProjectMember or model._meta.proxy:
+                continue
+            for field in model._meta.concrete_fields:
+                if field.is_relation and field.related_model is User:
+                    relations.append((model, field))
+        return relations
+
+    @staticmethod
+    def _merge_memberships(primary_user, secondary_ids, tables):
+        """
+        Merge project memberships with set-based statements
+
+        For each project one membership survives: the primary user's if they
+        have one, otherwise the merged user's lowest ID. The survivor takes
+        leadership from any merged membership, the rest are deleted, and the
+        surviving secondary memberships move to the primary user with a role
+        suited to their staff status.
+        """
+        ProjectMember = apps.get_model("projects", "ProjectMember")
+        roles = ProjectMember.RoleChoices
+        user_ids = [primary_user.pk, *secondary_ids]
+        merged = ProjectMember.objects.filter(user_id__in=user_ids)
+
+        redundant = ProjectMember.objects.filter(user_id__in=secondary_ids).filter(
+            Exists(
+                ProjectMember.objects.filter(project=OuterRef("project")).filter(
+                    Q(user_id=primary_user.pk)
+                    | Q(user_id__in=secondary_ids, pk__lt=OuterRef("pk"))
+                )
+            )
+        )
+        project_memberships = merged.filter(project=OuterRef("project"))
+
+        # Fold leadership into the surviving membership of each project
+        leadership = {
+            "is_leader": Case(
+                When(
+                    Exists(project_memberships.filter(is_leader=True)),
+                    then=Value(True),
+                ),
+                default=F("is_leader"),
+            )
+        }
+        if primary_user.is_staff:
+            leadership["role"] = Case(
+                When(
+                    Exists(project_memberships.filter(role=roles.SUPERVISING)),
+                    then=Value(roles.SUPERVISING),
+                ),
+                default=F("role"),
+            )
+        merged.filter(Exists(project_memberships.exclude(pk=OuterRef("pk")))).exclude(
+            pk__in=redundant.values("pk")
+        ).update(**leadership)
+
+        removed, _ = redundant.delete()
+
+        if primary_user.is_staff:
+            role = Case(
+                When(role__in=ProjectMember.STAFF_ROLES, then=F("role")),
+                default=Value(roles.RESEARCH),
+            )
+        else:
+            role = Case(
+                When(role__in=ProjectMember.STAFF_ROLES, then=Value(roles.EXTERNALCOL)),
+                default=F("role"),
+            )
+        reassigned = ProjectMember.objects.filter(user_id__in=secondary_ids).update(
+            user=primary_user, role=role
+        )
+
+        UserMergeService._record(
+            tables, "projects.ProjectMember.user", reassigned, removed
+        )
+
+    @staticmethod
+    def _merge_relation(model, field, primary_id, secondary_ids, tables):
+        """
+        Reassign one foreign key column from the secondary users to the primary
+
+        Rows that would collide with a unique constraint are deleted first:
+        for one-to-one fields the secondary rows are kept only when the primary
+        user has none, and for unique sets the primary user's (or the earliest)
+        row wins.
+        """
+        manager = model._base_manager
+        rows = manager.filter(**{f"{field.attname}__in": secondary_ids})
+        removed = 0
+
+        if field.unique:
+            if manager.filter(**{field.attname: primary_id}).exists():
+                # Left for the user deletion to cascade
+                return
+            keep = rows.order_by("pk").values_list("pk", flat=True).first()
+            rows = rows.filter(pk=keep)
+        else:
+            for unique_set in UserMergeService._unique_sets(model, field):
+                others = {
+                    name: OuterRef(name) for name in unique_set if name != field.attname
+                }
+                removed += manager.filter(
+                    pk__in=rows.filter(
+                        Exists(
+                            manager.filter(**others).filter(
+                                Q(**{field.attname: primary_id})
+                                | Q(
+                                    **{
+                                        f"{field.attname}__in": secondary_ids,
+                                        "pk__lt": OuterRef("pk"),
+                                    }
+                                )
+                            )
+                        )
+                    ).values("pk")
+                ).delete()[0]
+
+        reassigned = rows.update(**{field.attname: primary_id})
+
+        # Unique sets of two user columns (e.g. user/caretaker) can now
+        # point at the primary user twice
+        for unique_set in UserMergeService._unique_sets(model, field):
+            user_columns = [
+                f.attname
+                for f in model._meta.concrete_fields
+                if f.attname in unique_set and f.is_relation and f.related_model is User
+            ]
+            if len(user_columns) > 1:
+                removed += manager.filter(
+                    **{column: primary_id for column in user_columns}
+                ).delete()[0]
+
+        UserMergeService._record(
+            tables, UserMergeService._label(model, field), reassigned, removed
+        )
+
+    @staticmethod
+    def _merge_id_array(model, field_name, primary_id, secondary_ids, tables):
+        """Replace secondary user IDs with the primary user's in an integer array"""
+        reassigned = 0
+        for secondary_id in secondary_ids:
+            reassigned += model._base_manager.filter(
+                **{f"{field_name}__contains": [secondary_id]}
+            ).update(
+                **{
+                    field_name: Func(
+                        F(field_name),
+                        Value(secondary_id),
+                        Value(primary_id),
+                        function="array_replace",
+                    )
+                }
+            )
+        UserMergeService._record(
+            tables, f"{model._meta.label}.{field_name}", reassigned, 0
+        )
+
+    @staticmethod
+    def _unique_sets(model, field):
+        """Unique field sets of a model that include the given field"""
+        unique_sets = [
+            [model._meta.get_field(name).attname for name in names]
+            for names in model._meta.unique_together
+        ]
+        unique_sets += [
+            [model._meta.get_field(name).attname for name in constraint.fields]
+            for constraint in model._meta.total_unique_constraints
+        ]
+        return [names for names in unique_sets if field.attname in names]
+
+    @staticmethod
+    def _label(model, field):
+        return f"{model._meta.label}.{field.name}"
+
+    @staticmethod
+    def _record(tables, label, reassigned, removed):
+        if reassigned or removed:
+            tables[label] = {"reassigned": reassigned, "removed": removed}
@@ -321,7 +321,7 @@ class TestSetItAssetsId:
             # Assert
             mock_print.assert_called_once_with("PLEASE SELECT ONLY ONE")
 
-    @patch("users.admin.requests.get")
+    @patch("common.utils.http.IntegrationClient.get")
     def test_sets_it_asset_id_from_api(self, mock_get, staff_profile, db):
         """Test action sets IT asset ID from API response"""
         # Arrange
@@ -350,7 +350,7 @@ class TestSetItAssetsId:
         staff_profile.refresh_from_db()
         assert staff_profile.it_asset_id == 12345
 
-    @patch("users.admin.requests.get")
+    @patch("common.utils.http.IntegrationClient.get")
     def test_handles_api_failure(self, mock_get, staff_profile, db):
         """Test action handles API failure gracefully"""
         # Arrange
@@ -397,7 +397,7 @@ class TestGenerateActiveStaffCSV:
             # Assert
             mock_print.assert_called_once_with("PLEASE SELECT ONLY ONE")
 
-    @patch("users.admin.requests.get")
+    @patch("common.utils.http.IntegrationClient.get")
     def test_generates_csv_from_it_assets_api(self, mock_get, staff_user, db):
         """Test action generates CSV from IT Assets API data"""
         # Arrange
@@ -445,7 +445,7 @@ class TestGenerateActiveStaffCSV:
         content = response.content.decode("utf-8")
         assert staff_user.email in content
 
-    @patch("users.admin.requests.get")
+    @patch("common.utils.http.IntegrationClient.get")
     def test_handles_api_failure_gracefully(self, mock_get, staff_user, db):
         """Test action handles IT Assets API failure"""
         # Arrange
@@ -2,6 +2,7 @@
 Tests for user models
 """
 
+import json
 from datetime import timedelta
 from unittest.mock import Mock, patch
 
@@ -502,7 +503,7 @@ class TestPublicStaffProfileModel:
         assert tag1 in staff_profile.keyword_tags.all()
         assert tag2 in staff_profile.keyword_tags.all()
 
-    @patch("users.models.requests.get")
+    @patch("common.utils.http.IntegrationClient.get")
     def test_get_it_asset_data_success(self, mock_get, staff_profile, db):
         """Test getting IT asset data successfully"""
         # Arrange
@@ -529,7 +530,7 @@ class TestPublicStaffProfileModel:
         assert result["title"] == "Test Title"
         assert result["division"] == "Test Division"
 
-    @patch("users.models.requests.get")
+    @patch("common.utils.http.IntegrationClient.get")
     def test_get_it_asset_data_failure(self, mock_get, staff_profile, db):
         """Test getting IT asset data when API fails"""
         # Arrange
@@ -544,7 +545,47 @@ class TestPublicStaffProfileModel:
         # Assert
         assert result is None
 
-    @patch("users.models.requests.get")
+    def test_get_it_asset_data_from_stub_server(
+        self, staff_profile, stub_server, settings, db
+    ):
+        """Test IT asset data is fetched through the pooled client"""
+        # Arrange
+        settings.IT_ASSETS_URL = stub_server.url("/api/v3/departmentuser/")
+        record = {"id": 7, "email": staff_profile.user.email, "title": "Ecologist"}
+        stub_server.replies.extend([(503, b""), (200, json.dumps([record]).encode())])
+
+        # Act
+        result = staff_profile.get_it_asset_data()
+
+        # Assert
+        assert result["id"] == 7
+        assert result["title"] == "Ecologist"
+        assert [path for _, path, _ in stub_server.requests] == [
+            "/api/v3/departmentuser/"
+        ] * 2
+        staff_profile.refresh_from_db()
+        assert staff_profile.it_asset_id == 7
+
+    def test_get_it_asset_data_upstream_down(
+        self, staff_profile, stub_server, settings, db
+    ):
+        """Test an unavailable IT Assets API returns None"""
+        # Arrange
+        settings.IT_ASSETS_URL = stub_server.url("/api/v3/departmentuser/")
+        settings.INTEGRATION_RETRY_BACKOFF = 0
+        settings.INTEGRATION_CIRCUIT_FAILURES = 1
+        stub_server.default = (503, b"")
+
+        # Act
+        first = staff_profile.get_it_asset_data()
+        second = staff_profile.get_it_asset_data()
+
+        # Assert
+        assert first is None
+        assert second is None
+        assert len(stub_server.requests) == 1
+
+    @patch("common.utils.http.IntegrationClient.get")
     def test_get_it_asset_email_success(self, mock_get, staff_profile, db):
         """Test getting IT asset email successfully"""
         # Arrange
@@ -566,7 +607,7 @@ class TestPublicStaffProfileModel:
         # Assert
         assert result == "it.asset@example.com"
 
-    @patch("users.models.requests.get")
+    @patch("common.utils.http.IntegrationClient.get")
     def test_get_it_asset_email_failure(self, mock_get, staff_profile, db):
         """Test getting IT asset email when API fails"""
         # Arrange
@@ -11,6 +11,7 @@ from rest_framework.exceptions import NotFound, ValidationError
 from users.models import EducationEntry, EmploymentEntry, PublicStaffProfile
 from users.services.entry_service import EducationService, EmploymentService
 from users.services.export_service import ExportService
+from users.services.merge_service import UserMergeService
 from users.services.profile_service import ProfileService
 from users.services.user_service import UserService
 
@@ -845,3 +846,120 @@ class TestExportService:
         assert "First Name" in content
         assert "Last Name" in content
         assert "Email" in content
+
+
+class TestUserMergeService:
+    """Tests for UserMergeService"""
+
+    def test_merge_users_reassigns_foreign_keys(self, staff_user, user, db):
+        """Test rows pointing at the secondary user move to the primary user"""
+        # Arrange
+        from documents.tests.factories import ProjectDocumentFactory
+
+        document = ProjectDocumentFactory(creator=user, modifier=user)
+
+        # Act
+        report = UserMergeService.merge_users(staff_user.pk, [user.pk])
+
+        # Assert
+        document.refresh_from_db()
+        assert document.creator == staff_user
+        assert document.modifier == staff_user
+        assert not User.objects.filter(pk=user.pk).exists()
+        assert report["tables"]["documents.ProjectDocument.creator"] == {
+            "reassigned": 1,
+            "removed": 0,
+        }
+
+    def test_merge_users_resolves_membership_conflicts(
+        self, staff_user, user, user_factory, db
+    ):
+        """Test shared projects keep one membership with the merged leadership"""
+        # Arrange
+        from common.tests.factories import ProjectFactory
+        from projects.models import ProjectMember
+
+        other = user_factory()
+        shared = ProjectFactory(members=[])
+        shared.members.create(user=staff_user, role="research")
+        shared.members.create(user=user, role="supervising", is_leader=True)
+        shared.members.create(user=other, role="technical")
+        solo = ProjectFactory(members=[])
+        solo.members.create(user=other, role="externalcol")
+
+        # Act
+        report = UserMergeService.merge_users(staff_user.pk, [user.pk, other.pk])
+
+        # Assert
+        membership = ProjectMember.objects.get(project=shared)
+        assert membership.user == staff_user
+        assert membership.is_leader is True
+        assert membership.role == "supervising"
+        moved = ProjectMember.objects.get(project=solo)
+        assert moved.user == staff_user
+        assert moved.role == "research"
+        assert report["tables"]["projects.ProjectMember.user"] == {
+            "reassigned": 1,
+            "removed": 2,
+        }
+
+    def test_merge_users_removes_self_caretaking(self, staff_user, user, db):
+        """Test a caretaker relationship between merged users is dropped"""
+        # Arrange
+        from caretakers.models import Caretaker
+
+        Caretaker.objects.create(user=user, caretaker=staff_user)
+
+        # Act
+        UserMergeService.merge_users(staff_user.pk, [user.pk])
+
+        # Assert
+        assert not Caretaker.objects.exists()
+
+    def test_merge_users_dry_run(self, staff_user, user, db):
+        """Test a dry run reports counts without changing anything"""
+        # Arrange
+        from documents.tests.factories import ProjectDocumentFactory
+
+        document = ProjectDocumentFactory(creator=user)
+
+        # Act
+        report = UserMergeService.merge_users(staff_user.pk, [user.pk], dry_run=True)
+
+        # Assert
+        document.refresh_from_db()
+        assert document.creator == user
+        assert User.objects.filter(pk=user.pk).exists()
+        assert report["dry_run"] is True
+        assert report["tables"]["documents.ProjectDocument.creator"]["reassigned"] == 1
+        assert report["deleted"]["users.User"] == 1
+
+    def test_merge_users_query_count_independent_of_rows(
+        self, staff_user, user, user_factory, db
+    ):
+        """Test merging runs the same statements however many rows move"""
+        # Arrange
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        from documents.tests.factories import ProjectDocumentFactory
+
+        other = user_factory()
+        ProjectDocumentFactory(creator=user)
+        for _ in range(10):
+            ProjectDocumentFactory(creator=other)
+
+        # Act
+        with CaptureQueriesContext(connection) as few:
+            UserMergeService.merge_users(staff_user.pk, [user.pk], dry_run=True)
+        with CaptureQueriesContext(connection) as many:
+            UserMergeService.merge_users(staff_user.pk, [other.pk], dry_run=True)
+
+        # Assert
+        assert len(many) == len(few)
+
+    def test_merge_users_primary_in_secondary(self, user, db):
+        """Test the primary user cannot be merged into itself"""
+        # Act & Assert
+        with pytest.raises(ValidationError):
+            UserMergeService.merge_users(user.pk, [user.pk])
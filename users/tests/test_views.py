@@ -131,6 +131,29 @@ class TestUserViews:
         assert "users" in response.data
         assert len(response.data["users"]) > 0
 
+    def test_list_users_cursor_pagination(self, api_client, user, user_factory, db):
+        """Test listing users with cursor pagination visits every user once"""
+        # Arrange
+        user_factory.create_batch(4)
+        api_client.force_authenticate(user=user)
+
+        # Act
+        first = api_client.get(
+            users_urls.list(), {"pagination": "cursor", "page_size": 3}
+        )
+        second = api_client.get(
+            users_urls.list(), {"cursor": first.data["next_cursor"], "page_size": 3}
+        )
+
+        # Assert
+        assert first.status_code == status.HTTP_200_OK
+        assert len(first.data["users"]) == 3
+        assert len(second.data["users"]) == 2
+        assert second.data["next_cursor"] is None
+        assert second.data["previous_cursor"] is not None
+        ids = [u["id"] for u in first.data["users"] + second.data["users"]]
+        assert ids == sorted(ids)
+
     def test_list_users_unauthenticated(self, api_client, db):
         """Test listing users without authentication"""
         # Act
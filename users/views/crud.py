@@ -13,7 +13,11 @@ from rest_framework.status import (
 )
 from rest_framework.views import APIView
 
-from common.utils import paginate_queryset
+from common.utils import (
+    is_cursor_pagination_requested,
+    paginate_queryset,
+    paginate_queryset_by_cursor,
+)
 from users.serializers import TinyUserSerializer, UserSerializer
 from users.services import UserService
 
@@ -28,6 +32,18 @@ class Users(APIView):
         # Delegate filtering to service (pass all query params)
         users = UserService.list_users(filters=request.query_params)
 
+        if is_cursor_pagination_requested(request):
+            paginated = paginate_queryset_by_cursor(users, request)
+            serializer = TinyUserSerializer(paginated["items"], many=True)
+            return Response(
+                {
+                    "users": serializer.data,
+                    "next_cursor": paginated["next_cursor"],
+                    "previous_cursor": paginated["previous_cursor"],
+                    "total_results": paginated["total_results"],
+                }
+            )
+
         # Paginate results
         paginated = paginate_queryset(users, request)
 
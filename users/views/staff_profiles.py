@@ -21,7 +21,11 @@ from rest_framework.status import (
 )
 from rest_framework.views import APIView
 
-from common.utils import paginate_queryset
+from common.utils import (
+    is_cursor_pagination_requested,
+    paginate_queryset,
+    paginate_queryset_by_cursor,
+)
 from projects.models import ProjectMember
 from projects.serializers import ProjectDataTableSerializer
 from users.models import PublicStaffProfile
@@ -50,6 +54,19 @@ class StaffProfiles(APIView):
         filters = {k: v for k, v in filters.items() if v is not None}
 
         profiles = ProfileService.list_staff_profiles(filters=filters, search=search)
+
+        if is_cursor_pagination_requested(request):
+            paginated = paginate_queryset_by_cursor(profiles, request)
+            serializer = TinyStaffProfileSerializer(paginated["items"], many=True)
+            return Response(
+                {
+                    "profiles": serializer.data,
+                    "next_cursor": paginated["next_cursor"],
+                    "previous_cursor": paginated["previous_cursor"],
+                    "total_results": paginated["total_results"],
+                }
+            )
+
         paginated = paginate_queryset(profiles, request)
 
         serializer = TinyStaffProfileSerializer(paginated["items"], many=True)